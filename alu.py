@@ -0,0 +1,182 @@
+import hashlib
+import sys
+from array import array
+
+from romcache import ROMCache
+
+# Reference definitions of the 8-bit ALU operations.
+# Each returns (result, F) and is only used to build the lookup tables below,
+# the CPU then does one table lookup per operation instead of computing flags.
+#
+# Tables hold (result << 8) | F, indexed as follows:
+#   ADD, SUB     - (carry << 16) | (a << 8) | operand, also used for ADC, SBC and CP
+#   INC, DEC     - value, the carry flag is not included and must be kept from F
+#   DAA          - ((F >> 4) << 8) | a
+#   RL, RR       - (carry << 8) | value
+#   RLC, RRC, SLA, SRA, SRL, SWAP - value
+
+def flags(zero, subtract, half_carry, carry):
+    """
+    >>> bin(flags(True, False, True, False))
+    '0b10100000'
+    """
+    return (bool(zero) << 7) | (bool(subtract) << 6) | (bool(half_carry) << 5) | (bool(carry) << 4)
+
+def add(a, b, carry):
+    """
+    >>> add(0x0F, 0x01, 0) == (0x10, flags(False, False, True, False))
+    True
+    >>> add(0xFF, 0x00, 1) == (0x00, flags(True, False, True, True))
+    True
+    """
+    value = a + b + carry
+    half_carry = (a & 0xF) + (b & 0xF) + carry > 0xF
+    return value & 0xFF, flags((value & 0xFF) == 0, False, half_carry, value > 0xFF)
+
+def sub(a, b, carry):
+    """
+    >>> sub(0x10, 0x01, 0) == (0x0F, flags(False, True, True, False))
+    True
+    >>> sub(0x00, 0x00, 1) == (0xFF, flags(False, True, True, True))
+    True
+    >>> sub(0x3E, 0x3E, 0) == (0x00, flags(True, True, False, False))
+    True
+    """
+    value = a - b - carry
+    half_carry = (a & 0xF) - (b & 0xF) - carry < 0
+    return value & 0xFF, flags((value & 0xFF) == 0, True, half_carry, value < 0)
+
+def inc(value):
+    """
+    >>> inc(0xFF) == (0x00, flags(True, False, True, False))
+    True
+    """
+    result = (value + 1) & 0xFF
+    return result, flags(result == 0, False, (value & 0xF) == 0xF, False)
+
+def dec(value):
+    """
+    >>> dec(0x10) == (0x0F, flags(False, True, True, False))
+    True
+    >>> dec(0x01) == (0x00, flags(True, True, False, False))
+    True
+    """
+    result = (value - 1) & 0xFF
+    return result, flags(result == 0, True, (value & 0xF) == 0, False)
+
+def daa(a, f):
+    """
+    >>> daa(0x0A, 0)[0] == 0x10
+    True
+    >>> daa(0x9A, 0) == (0x00, flags(True, False, False, True))
+    True
+    >>> daa(0x0F, flags(False, True, True, False))[0] == 0x09
+    True
+    """
+    subtract = bool(f & 0x40)
+    half_carry = bool(f & 0x20)
+    carry = bool(f & 0x10)
+
+    if subtract:
+        if carry:
+            a -= 0x60
+        if half_carry:
+            a -= 0x06
+    else:
+        if carry or a > 0x99:
+            a += 0x60
+            carry = True
+        if half_carry or (a & 0xF) > 0x9:
+            a += 0x06
+
+    a &= 0xFF
+    return a, flags(a == 0, subtract, False, carry)
+
+def shiftFlags(result, carry):
+    return result, flags(result == 0, False, False, carry)
+
+def rlc(value):
+    return shiftFlags(((value << 1) | (value >> 7)) & 0xFF, value & 0x80)
+
+def rrc(value):
+    return shiftFlags((value >> 1) | ((value & 1) << 7), value & 1)
+
+def rl(value, carry):
+    """
+    >>> rl(0x80, 0) == (0x00, flags(True, False, False, True))
+    True
+    """
+    return shiftFlags(((value << 1) | carry) & 0xFF, value & 0x80)
+
+def rr(value, carry):
+    """
+    >>> rr(0x01, 1) == (0x80, flags(False, False, False, True))
+    True
+    """
+    return shiftFlags((value >> 1) | (carry << 7), value & 1)
+
+def sla(value):
+    return shiftFlags((value << 1) & 0xFF, value & 0x80)
+
+def sra(value):
+    return shiftFlags((value >> 1) | (value & 0x80), value & 1)
+
+def srl(value):
+    return shiftFlags(value >> 1, value & 1)
+
+def swap(value):
+    """
+    >>> swap(0xF1)[0] == 0x1F
+    True
+    """
+    return shiftFlags(((value & 0x0F) << 4) | (value >> 4), False)
+
+def pack(result):
+    return (result[0] << 8) | result[1]
+
+NAMES = ["ADD", "SUB", "INC", "DEC", "DAA", "RLC", "RRC", "RL", "RR", "SLA", "SRA", "SRL", "SWAP"]
+CACHE_KIND = "alu-" + sys.byteorder # the tables are stored in native byte order
+
+def buildTables():
+    "Every table worked out from the definitions above, most of a tenth of a second"
+    return {
+        "ADD": array("H", [pack(add(a, b, carry)) for carry in (0, 1) for a in range(0x100) for b in range(0x100)]),
+        "SUB": array("H", [pack(sub(a, b, carry)) for carry in (0, 1) for a in range(0x100) for b in range(0x100)]),
+        "INC": array("H", [pack(inc(value)) for value in range(0x100)]),
+        "DEC": array("H", [pack(dec(value)) for value in range(0x100)]),
+        "DAA": array("H", [pack(daa(a, f << 4)) for f in range(0x10) for a in range(0x100)]),
+        "RLC": array("H", [pack(rlc(value)) for value in range(0x100)]),
+        "RRC": array("H", [pack(rrc(value)) for value in range(0x100)]),
+        "RL": array("H", [pack(rl(value, carry)) for carry in (0, 1) for value in range(0x100)]),
+        "RR": array("H", [pack(rr(value, carry)) for carry in (0, 1) for value in range(0x100)]),
+        "SLA": array("H", [pack(sla(value)) for value in range(0x100)]),
+        "SRA": array("H", [pack(sra(value)) for value in range(0x100)]),
+        "SRL": array("H", [pack(srl(value)) for value in range(0x100)]),
+        "SWAP": array("H", [pack(swap(value)) for value in range(0x100)]),
+    }
+
+def loadTables():
+    """
+    The tables in NAMES order, from the ROM cache when this alu.py has
+    built them before. They are stored under the SHA-1 of this file, so
+    changing a definition can't leave stale tables behind.
+    """
+    try:
+        with open(__file__, "rb") as source:
+            digest = hashlib.sha1(source.read()).hexdigest()
+    except OSError:
+        digest = None
+    cache = ROMCache()
+    stored = cache.load(digest, CACHE_KIND, 1) if digest else None
+    if stored is None or sorted(stored) != sorted(NAMES):
+        tables = buildTables()
+        if digest:
+            cache.store(digest, CACHE_KIND, 1, {name: table.tobytes() for name, table in tables.items()})
+        return [tables[name] for name in NAMES]
+    return [array("H", stored[name]) for name in NAMES]
+
+ADD, SUB, INC, DEC, DAA, RLC, RRC, RL, RR, SLA, SRA, SRL, SWAP = loadTables()
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,88 @@
+import wave
+
+import numpy as np
+
+from synth import SAMPLE_RATE
+
+BUFFER_SAMPLES = 1 << 16 # output samples held before they are written, under 1.5 s at 44.1 kHz
+SAMPLE_TYPE = np.dtype("<i2") # files hold little endian signed 16 bit (left, right) pairs
+
+class Resampler:
+    """
+    Converts blocks of samples from SAMPLE_RATE to rate by linear interpolation.
+    The last input sample and the position between samples carry over to
+    the next block, so splitting the input differently gives the same output.
+    """
+    def __init__(self, rate):
+        self.step = SAMPLE_RATE / rate # input samples per output sample
+        self.position = 0.0 # of the next output sample, counted from the start of the next block's data
+        self.last = np.empty((0, 2), dtype=np.int16)
+
+    def convert(self, samples):
+        data = np.concatenate((self.last, samples))
+        end = len(data) - 1
+        if end < self.position:
+            if len(data):
+                self.last = data[-1:]
+                self.position -= end
+            return np.empty((0, 2), dtype=np.int16)
+
+        count = int((end - self.position) // self.step) + 1
+        positions = self.position + self.step * np.arange(count)
+        index = positions.astype(np.int64)
+        fraction = (positions - index)[:, None]
+        following = np.minimum(index + 1, end)
+        output = data[index] * (1 - fraction) + data[following] * fraction
+
+        self.position += count * self.step - end
+        self.last = data[-1:]
+        return np.round(output).astype(np.int16)
+
+class FileSink:
+    """
+    Writes the samples of Sound.addSink() to a file as they arrive,
+    through a fixed size buffer so memory use stays flat however long it runs.
+    A path ending in .wav gets a WAV file, anything else raw PCM.
+    """
+    def __init__(self, path, rate=SAMPLE_RATE):
+        self.rate = rate
+        self.resampler = Resampler(rate) if rate != SAMPLE_RATE else None
+        self.buffer = np.empty((BUFFER_SAMPLES, 2), dtype=SAMPLE_TYPE)
+        self.count = 0
+        self.written = 0 # samples written to the file so far
+        if path.lower().endswith(".wav"):
+            self.wav = wave.open(path, "wb")
+            self.wav.setnchannels(2)
+            self.wav.setsampwidth(2)
+            self.wav.setframerate(rate)
+            self.file = None
+        else:
+            self.wav = None
+            self.file = open(path, "wb")
+
+    def write(self, samples):
+        if self.resampler is not None:
+            samples = self.resampler.convert(samples)
+        while len(samples):
+            count = min(len(samples), BUFFER_SAMPLES - self.count)
+            self.buffer[self.count:self.count + count] = samples[:count]
+            self.count += count
+            samples = samples[count:]
+            if self.count == BUFFER_SAMPLES:
+                self.flush()
+
+    def flush(self):
+        data = self.buffer[:self.count].tobytes()
+        if self.wav is not None:
+            self.wav.writeframes(data) # keeps the header lengths up to date
+        else:
+            self.file.write(data)
+        self.written += self.count
+        self.count = 0
+
+    def close(self):
+        self.flush()
+        if self.wav is not None:
+            self.wav.close()
+        else:
+            self.file.close()
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import numpy as np
+import pygame
+
+from audiofile import Resampler
+
+DEFAULT_RATE = 44100
+DEFAULT_LATENCY = 0.1 # seconds of sound kept buffered ahead of the device
+MAX_ADJUST = 0.005 # most the resampling ratio is nudged to keep the buffer at the target
+SMOOTHING = 0.05 # weight of each new fill level in the running average rate control follows
+CHUNK = 1024 # samples handed to the mixer at a time
+
+class RingBuffer:
+    """
+    Single producer, single consumer ring of stereo int16 samples.
+    Each side only ever changes its own counter, and the producer only
+    publishes new samples once they are copied in, so neither needs a lock.
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = np.zeros((capacity, 2), dtype=np.int16)
+        self.written = 0 # samples ever written, only changed by the producer
+        self.consumed = 0 # samples ever read, only changed by the consumer
+        self.overruns = 0 # writes that didn't fit and lost samples
+        self.underruns = 0 # reads that ran out and were padded with silence
+
+    def fill(self):
+        return self.written - self.consumed
+
+    def write(self, samples):
+        free = self.capacity - self.fill()
+        if len(samples) > free:
+            self.overruns += 1
+            samples = samples[:free]
+        start = self.written % self.capacity
+        first = min(len(samples), self.capacity - start)
+        self.data[start:start + first] = samples[:first]
+        self.data[:len(samples) - first] = samples[first:]
+        self.written += len(samples)
+
+    def read(self, count):
+        "count samples, silence where there aren't enough"
+        output = np.zeros((count, 2), dtype=np.int16)
+        available = min(count, self.fill())
+        start = self.consumed % self.capacity
+        first = min(available, self.capacity - start)
+        output[:first] = self.data[start:start + first]
+        output[first:available] = self.data[:available - first]
+        self.consumed += available
+        if available < count:
+            self.underruns += 1
+        return output
+
+class Playback:
+    """
+    Sound sink for live output.
+    write() is called by the emulator once a frame, resamples to the device
+    rate and queues the samples in a ring buffer. read() is called from the
+    audio side, by the mixer thread started with start() or by any callback
+    based output. The resampling ratio is nudged by up to MAX_ADJUST to hold
+    the buffer at latency seconds, so small differences between emulated
+    and device time never build up into gaps or lag.
+    """
+    def __init__(self, rate=DEFAULT_RATE, latency=DEFAULT_LATENCY):
+        self.rate = rate
+        self.latency = latency
+        self.target = latency * rate # samples to keep buffered
+        self.ring = RingBuffer(int(4 * self.target) + CHUNK)
+        self.resampler = Resampler(rate)
+        self.base_step = self.resampler.step
+        self.average = self.target
+        self.primed = False # playing, rather than waiting for the buffer to fill to the target
+        self.thread = None
+        self.running = False
+
+    def write(self, samples):
+        fill = self.ring.fill()
+        self.average += SMOOTHING * (fill - self.average)
+        error = max(-1.0, min(1.0, (self.average - self.target) / self.target))
+        self.resampler.step = self.base_step * (1 + MAX_ADJUST * error) # more buffered, consume faster
+        self.ring.write(self.resampler.convert(samples))
+
+    def read(self, count):
+        "count samples for the device, silence until the buffer has filled up again after running dry"
+        if not self.primed:
+            if self.ring.fill() < self.target:
+                return np.zeros((count, 2), dtype=np.int16)
+            self.primed = True
+        underruns = self.ring.underruns
+        samples = self.ring.read(count)
+        if self.ring.underruns != underruns:
+            self.primed = False
+        return samples
+
+    def bufferedTime(self):
+        "Seconds of sound waiting to be played"
+        return self.ring.fill() / self.rate
+
+    def stats(self):
+        return {
+            "latency": self.bufferedTime(),
+            "underruns": self.ring.underruns,
+            "overruns": self.ring.overruns,
+            "ratio": self.base_step / self.resampler.step,
+        }
+
+    def start(self):
+        "Play through pygame.mixer from a thread of its own"
+        pygame.mixer.init(frequency=self.rate, size=-16, channels=2, buffer=CHUNK)
+        self.running = True
+        self.thread = threading.Thread(target=self.feedMixer, daemon=True)
+        self.thread.start()
+
+    def feedMixer(self):
+        channel = pygame.mixer.Channel(0)
+        pause = CHUNK / self.rate / 4
+        while self.running:
+            if not channel.get_busy():
+                channel.play(pygame.sndarray.make_sound(self.read(CHUNK)))
+            elif channel.get_queue() is None:
+                channel.queue(pygame.sndarray.make_sound(self.read(CHUNK)))
+            else:
+                time.sleep(pause)
+
+    def close(self):
+        if self.thread is not None:
+            self.running = False
+            self.thread.join()
+            self.thread = None
+            pygame.mixer.quit()
@@ -0,0 +1,180 @@
+#!/bin/env python3
+
+import os
+import subprocess
+import sys
+import time
+
+from cpu import CPU
+from header import Header
+from interrupts import Interrupts
+from memory import Memory
+
+help = """
+Usage: benchmark [instructions]
+       benchmark startup [budget]
+       benchmark trace [instructions]
+
+Runs the synthetic workloads on the CPU with table driven flags, with
+lazy flags and with the generated interpreter and prints instructions per
+second for each.
+[instructions]: instructions to run per workload, default 200000
+
+trace: runs the workloads on the generated interpreter with and without
+a trace buffer attached and prints the slowdown recording causes.
+
+startup: measures how long a fresh interpreter takes to import each of the
+programs with python -X importtime, lists the slowest modules and fails if
+any program takes longer than budget milliseconds, default 100.
+"""
+
+STARTUP_PROGRAMS = ["gametoy", "conformance", "catalogue"] # started as short lived processes
+STARTUP_BUDGET = 100 # milliseconds
+STARTUP_RUNS = 5 # the fastest counts, after one run to fill the bytecode and ROM caches
+SLOWEST_SHOWN = 5
+
+def loop(body):
+    "Append a JR back to the start of body"
+    return body + [0x18, (-(len(body) + 2)) & 0xFF]
+
+# Small programs placed at $0150, each one loops forever
+WORKLOADS = {
+    # Arithmetic whose flags are almost never read
+    "alu": [0x3E, 0x00, 0x06, 0x03] + loop([
+        0x80,       # ADD A,B
+        0x89,       # ADC A,C
+        0xD6, 0x01, # SUB $01
+        0x9A,       # SBC A,D
+        0x0C,       # INC C
+        0x15,       # DEC D
+        0xFE, 0x07, # CP $07
+    ]),
+    # Counting loops where every flag result is read by a conditional jump
+    "branch": loop([
+        0x06, 0x20, # LD B,$20
+        0x05,       # DEC B
+        0x20, 0xFD, # JR NZ,-3
+        0x0C,       # INC C
+        0xF5,       # PUSH AF
+        0xF1,       # POP AF
+    ]),
+    # Block copies through HL and DE
+    "memory": loop([
+        0x21, 0x00, 0xC0, # LD HL,$C000
+        0x11, 0x00, 0xD0, # LD DE,$D000
+        0x0E, 0x10,       # LD C,$10
+        0x2A,             # LDI A,(HL)
+        0x12,             # LD (DE),A
+        0x13,             # INC DE
+        0x0D,             # DEC C
+        0x20, 0xFA,       # JR NZ,-6
+    ]),
+}
+
+def makeROM(code):
+    "A 32KB ROM only cartridge that jumps straight to code at $0150"
+    rom = bytearray(0x8000)
+    rom[0x100:0x104] = bytes([0x00, 0xC3, 0x50, 0x01]) # NOP, JP $0150
+    rom[0x134:0x13C] = b"BENCH"
+    checksum = 0
+    for byte in rom[0x134:0x14D]:
+        checksum = (checksum - byte - 1) & 0xFF
+    rom[0x14D] = checksum
+    rom[0x150:0x150 + len(code)] = bytes(code)
+    return bytes(rom)
+
+def runWorkload(code, instructions, lazy_flags, fast=False):
+    "Returns instructions per second"
+    rom = makeROM(code)
+    mem = Memory(rom, Header(rom, False))
+    cpu = CPU(mem, Interrupts(), False, False, lazy_flags, fast)
+    run = cpu.run
+
+    start = time.perf_counter()
+    for i in range(instructions):
+        run()
+    return instructions / (time.perf_counter() - start)
+
+def runTraced(code, instructions, traced):
+    "Instructions per second of the generated interpreter, with a Trace attached if traced"
+    from gameboy import GameBoy
+    from tracebuffer import Trace
+    rom = makeROM(code)
+    gameboy = GameBoy(rom, Header(rom, False), headless=True, fast=True)
+    if traced:
+        Trace().attach(gameboy)
+    run = gameboy.cpu.run
+
+    start = time.perf_counter()
+    for i in range(instructions):
+        run()
+    return instructions / (time.perf_counter() - start)
+
+def traceOverhead(instructions):
+    print("{:<10}{:>14}{:>14}{:>10}{:>14}".format("workload", "fast/s", "traced/s", "slowdown", "ns/record"))
+    for name, code in WORKLOADS.items():
+        plain = max(runTraced(code, instructions, False) for i in range(3))
+        traced = max(runTraced(code, instructions, True) for i in range(3))
+        print("{:<10}{:>14.0f}{:>14.0f}{:>9.1f}%{:>14.0f}".format(
+            name, plain, traced, (plain / traced - 1) * 100, (1 / traced - 1 / plain) * 1e9))
+
+def importTimes(module):
+    """
+    {module name: (self, cumulative) microseconds} for importing module in a
+    fresh interpreter, the fastest of STARTUP_RUNS
+    """
+    environment = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None) # measure loading, not compiling
+    command = [sys.executable, "-X", "importtime", "-c", "import " + module]
+    directory = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for run in range(STARTUP_RUNS + 1):
+        output = subprocess.run(command, cwd=directory, env=environment, capture_output=True, text=True, check=True).stderr
+        times = {}
+        for line in output.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                own, cumulative, name = line[len("import time:"):].split("|")
+                if own.strip().isdigit():
+                    times[name.strip()] = (int(own), int(cumulative))
+        if run and (best is None or times[module][1] < best[module][1]):
+            best = times
+    return best
+
+def startup(budget):
+    "Returns True if every program imports within budget milliseconds"
+    within = True
+    for program in STARTUP_PROGRAMS:
+        times = importTimes(program)
+        total = times[program][1] / 1000
+        slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:SLOWEST_SHOWN]
+        status = "ok" if total <= budget else "OVER BUDGET"
+        print("{:<14}{:>8.1f} ms  {}".format(program, total, status))
+        for name, (own, cumulative) in slowest:
+            print("    {:<30}{:>8.1f} ms".format(name, own / 1000))
+        within = within and total <= budget
+    return within
+
+def main():
+    instructions = 200000
+    if len(sys.argv) > 1 and sys.argv[1] == "startup":
+        budget = float(sys.argv[2]) if len(sys.argv) > 2 else STARTUP_BUDGET
+        return 0 if startup(budget) else 1
+    if len(sys.argv) > 1 and sys.argv[1] == "trace":
+        traceOverhead(int(sys.argv[2]) if len(sys.argv) > 2 else instructions)
+        return 0
+    if len(sys.argv) > 1:
+        if not sys.argv[1].isdigit():
+            print(help)
+            return
+        instructions = int(sys.argv[1])
+
+    print("{:<10}{:>14}{:>14}{:>10}{:>14}{:>10}".format("workload", "table/s", "lazy/s", "lazy", "fast/s", "fast"))
+    for name, code in WORKLOADS.items():
+        table = runWorkload(code, instructions, False)
+        lazy = runWorkload(code, instructions, True)
+        fast = runWorkload(code, instructions, False, True)
+        print("{:<10}{:>14.0f}{:>14.0f}{:>9.1f}%{:>14.0f}{:>9.1f}%".format(
+            name, table, lazy, (lazy / table - 1) * 100, fast, (fast / table - 1) * 100))
+
+if __name__ == "__main__":
+    sys.exit(main())
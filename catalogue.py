@@ -0,0 +1,158 @@
+#!/bin/env python3
+
+import concurrent.futures
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from header import Header
+
+help = """
+Usage: catalogue directory index [options]
+
+Reads the header of every ROM under directory, in parallel and without
+loading the rest of the file, into index: a JSON file if its name ends in
+.json, an SQLite database otherwise. ROMs already in the index whose size
+and modification time haven't changed are not read again, and ROMs that
+are gone are dropped.
+[options]:
+    --jobs=N          processes to run, default one per CPU
+"""
+
+OPTIONS = ["jobs"]
+EXTENSIONS = (".gb", ".gbc", ".sgb")
+CHUNK = 256 # ROMs handed to a process at a time
+
+# Entry fields in index order, and their SQLite column types
+FIELDS = [
+    ("path", "TEXT PRIMARY KEY"),
+    ("size", "INTEGER"),
+    ("mtime", "REAL"),
+    ("title", "TEXT"),
+    ("cartridge_type", "INTEGER"),
+    ("mbc", "TEXT"),
+    ("ram", "INTEGER"),
+    ("battery", "INTEGER"),
+    ("timer", "INTEGER"),
+    ("rumble", "INTEGER"),
+    ("rom_size", "INTEGER"),
+    ("ram_size", "INTEGER"),
+    ("japanese", "INTEGER"),
+    ("header_checksum_ok", "INTEGER"),
+    ("global_checksum", "INTEGER"),
+    ("problems", "TEXT"),
+]
+
+def findROMs(root):
+    "(path relative to root, size, mtime) of every ROM file under root"
+    found = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if name.lower().endswith(EXTENSIONS):
+                path = os.path.join(directory, name)
+                stat = os.stat(path)
+                found.append((os.path.relpath(path, root), stat.st_size, stat.st_mtime))
+    return found
+
+def readEntry(root, rom):
+    path, size, mtime = rom
+    entry = {"path": path, "size": size, "mtime": mtime}
+    try:
+        header = Header.fromFile(os.path.join(root, path))
+    except OSError as error:
+        entry["problems"] = str(error)
+        return entry
+    entry.update({
+        "title": header.name,
+        "cartridge_type": header.cartridge_type,
+        "mbc": header.mbc,
+        "ram": header.ram,
+        "battery": header.battery,
+        "timer": header.timer,
+        "rumble": header.rumble,
+        "rom_size": header.rom_size,
+        "ram_size": header.ram_size,
+        "japanese": header.japanese,
+        "header_checksum_ok": header.header_checksum_ok,
+        "global_checksum": header.global_checksum,
+        "problems": "; ".join(header.problems),
+    })
+    if size != header.rom_size:
+        entry["problems"] = "; ".join(filter(None, [entry["problems"], "File is {}KB, the header says {}KB".format(size // 1024, header.rom_size // 1024)]))
+    return entry
+
+def readEntries(root, roms):
+    return [readEntry(root, rom) for rom in roms]
+
+def readAll(root, roms, jobs=None):
+    "Entries for roms, read in a process pool a chunk at a time"
+    chunks = [roms[start:start + CHUNK] for start in range(0, len(roms), CHUNK)]
+    entries = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        for chunk in pool.map(readEntries, [root] * len(chunks), chunks):
+            entries.extend(chunk)
+    return entries
+
+def load(index):
+    "Entries of an existing index by path, empty if there isn't one"
+    if not os.path.exists(index):
+        return {}
+    if index.endswith(".json"):
+        with open(index) as f:
+            return {entry["path"]: entry for entry in json.load(f)}
+    db = sqlite3.connect(index)
+    db.row_factory = sqlite3.Row
+    try:
+        return {row["path"]: dict(row) for row in db.execute("SELECT * FROM roms")}
+    except sqlite3.OperationalError: # no roms table yet
+        return {}
+    finally:
+        db.close()
+
+def save(index, entries):
+    entries = sorted(entries, key=lambda entry: entry["path"])
+    if index.endswith(".json"):
+        temporary = index + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump([{name: entry.get(name) for name, _ in FIELDS} for entry in entries], f, indent=1)
+        os.replace(temporary, index)
+        return
+    db = sqlite3.connect(index)
+    with db: # one transaction, the old table stays until the new one is complete
+        db.execute("DROP TABLE IF EXISTS roms")
+        db.execute("CREATE TABLE roms ({})".format(", ".join(name + " " + kind for name, kind in FIELDS)))
+        db.executemany(
+            "INSERT INTO roms VALUES ({})".format(", ".join("?" * len(FIELDS))),
+            ([entry.get(name) for name, _ in FIELDS] for entry in entries))
+    db.close()
+
+def update(root, index, jobs=None):
+    "Bring index up to date with the ROMs under root, returns (entries, ROMs read)"
+    known = load(index)
+    roms = findROMs(root)
+    stale = [rom for rom in roms if rom[0] not in known or (known[rom[0]]["size"], known[rom[0]]["mtime"]) != rom[1:]]
+    fresh = {entry["path"]: entry for entry in readAll(root, stale, jobs)}
+    entries = [fresh.get(rom[0]) or known[rom[0]] for rom in roms]
+    save(index, entries)
+    return entries, len(stale)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    args = [arg for arg in argv if not arg.startswith("--")]
+    options = dict(arg[2:].partition("=")[::2] for arg in argv if arg.startswith("--"))
+    if len(args) != 2 or any(name not in OPTIONS for name in options):
+        print(help)
+        return 2
+
+    jobs = int(options["jobs"]) if options.get("jobs") else None
+    start = time.perf_counter()
+    entries, read = update(args[0], args[1], jobs)
+    seconds = time.perf_counter() - start
+    problems = sum(bool(entry.get("problems")) for entry in entries)
+    print("{} ROMs, {} read, {} with problems, in {:.1f}s".format(len(entries), read, problems, seconds))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
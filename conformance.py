@@ -0,0 +1,159 @@
+#!/bin/env python3
+
+import concurrent.futures
+import json
+import os
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ElementTree
+
+from gameboy import GameBoy
+from header import Header
+
+help = """
+Usage: conformance tests [options]
+
+Runs test ROMs headlessly in parallel and reports which pass.
+[tests]: a directory of .gb files, expected to print "Passed" over the
+    serial port, or a JSON manifest listing tests as objects with
+        rom     - path to the ROM, relative to the manifest
+        name    - name in reports, defaults to the ROM file name
+        budget  - machine cycles before the test counts as hung
+        serial  - text the ROM prints over the serial port when it passes
+        fail    - text the ROM prints when it fails, default "Failed"
+        screen  - SHA-1 of the screen the ROM shows when it passes
+[options]:
+    --jobs=N          processes to run, default one per CPU
+    --junit=FILE      write a JUnit XML report to FILE
+    --fast            run the generated interpreter
+"""
+
+MACHINE_CYCLES_PER_SECOND = 1048576
+DEFAULT_BUDGET = 60 * MACHINE_CYCLES_PER_SECOND # a minute of emulated time
+PASS_TEXT = "Passed"
+FAIL_TEXT = "Failed"
+CHECK_FRAMES = 30 # only every this many frames is drawn, and checked against screen
+OPTIONS = ["jobs", "junit", "fast"]
+
+def loadTests(path):
+    "List of test dicts from a manifest or a directory of ROMs"
+    if os.path.isdir(path):
+        names = sorted(name for name in os.listdir(path) if name.endswith((".gb", ".gbc")))
+        tests = [{"rom": os.path.join(path, name)} for name in names]
+    else:
+        with open(path) as f:
+            tests = json.load(f)
+        base = os.path.dirname(os.path.abspath(path))
+        for test in tests:
+            test["rom"] = os.path.join(base, test["rom"])
+
+    for test in tests:
+        test.setdefault("name", os.path.splitext(os.path.basename(test["rom"]))[0])
+        test.setdefault("budget", DEFAULT_BUDGET)
+        test.setdefault("fail", FAIL_TEXT)
+        if "screen" not in test:
+            test.setdefault("serial", PASS_TEXT)
+    return tests
+
+def runTest(test, fast=False):
+    """
+    Run one test until it passes, fails or uses up its budget.
+    Returns a dict of name, passed, reason, cycles, seconds and serial output.
+    """
+    start = time.perf_counter()
+    result = {"name": test["name"], "passed": False, "reason": "", "cycles": 0, "serial": ""}
+    try:
+        with open(test["rom"], "rb") as rom_file:
+            rom = rom_file.read()
+        gameboy = GameBoy(rom, Header(rom, False), headless=True, fast=fast)
+        gameboy.lcdc.setFrameSkip(CHECK_FRAMES - 1, CHECK_FRAMES)
+        link = gameboy.link
+        cpu = gameboy.cpu
+        lcdc = gameboy.lcdc
+        budget = test["budget"]
+        cycles = 0
+        sent = 0
+
+        while True:
+            cycles += gameboy.runFrame(budget - cycles)
+            if len(link.output) != sent:
+                sent = len(link.output)
+                text = link.text()
+                if "serial" in test and test["serial"] in text:
+                    result["passed"] = True
+                    break
+                if test["fail"] in text:
+                    result["reason"] = "printed " + test["fail"]
+                    break
+            if "screen" in test and lcdc.frame_count % CHECK_FRAMES == CHECK_FRAMES - 1:
+                if lcdc.screenHash() == test["screen"]:
+                    result["passed"] = True
+                    break
+            if cpu.run_state == "QUIT":
+                result["reason"] = "CPU stopped"
+                break
+            if cycles >= budget:
+                result["reason"] = "no result after {} machine cycles".format(budget)
+                break
+        result["cycles"] = cycles
+        result["serial"] = link.text()
+    except Exception:
+        result["reason"] = traceback.format_exc().strip().split("\n")[-1]
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def junitReport(results, seconds):
+    suite = ElementTree.Element("testsuite", {
+        "name": "conformance",
+        "tests": str(len(results)),
+        "failures": str(sum(not result["passed"] for result in results)),
+        "time": "{:.3f}".format(seconds),
+    })
+    for result in results:
+        case = ElementTree.SubElement(suite, "testcase", {
+            "classname": "conformance",
+            "name": result["name"],
+            "time": "{:.3f}".format(result["seconds"]),
+        })
+        if not result["passed"]:
+            failure = ElementTree.SubElement(case, "failure", {"message": result["reason"]})
+            failure.text = result["reason"]
+        if result["serial"]:
+            ElementTree.SubElement(case, "system-out").text = result["serial"]
+    return ElementTree.ElementTree(suite)
+
+def runAll(tests, jobs=None, fast=False):
+    "Run tests in a process pool, printing each result as it arrives. Returns the results in test order."
+    results = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(runTest, test, fast): index for index, test in enumerate(tests)}
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            status = "PASS" if result["passed"] else "FAIL"
+            reason = " - " + result["reason"] if result["reason"] else ""
+            print("{} {} ({:.1f}s){}".format(status, result["name"], result["seconds"], reason))
+    return [results[index] for index in range(len(tests))]
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    options = dict(arg[2:].partition("=")[::2] for arg in sys.argv[1:] if arg.startswith("--"))
+    if len(args) != 1 or any(name not in OPTIONS for name in options):
+        print(help)
+        return 2
+
+    tests = loadTests(args[0])
+    jobs = int(options["jobs"]) if options.get("jobs") else None
+    start = time.perf_counter()
+    results = runAll(tests, jobs, "fast" in options)
+    seconds = time.perf_counter() - start
+
+    passed = sum(result["passed"] for result in results)
+    print("{} of {} passed in {:.1f}s".format(passed, len(results), seconds))
+    if options.get("junit"):
+        junitReport(results, seconds).write(options["junit"], encoding="utf-8", xml_declaration=True)
+    return 0 if passed == len(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,633 +1,673 @@
 import registers
 import interrupts
 import memory
-
-class CPU:
-    def __init__(self, mem, interrupts, debug_instructions, debug_registers):
-        self.debug_instructions = debug_instructions
-        self.debug_registers = debug_registers
-        self.run_state = "RUN" # possible values: RUN, HALT, STOP, QUIT
-        self.mem = mem
-        self.cycles = 0 # machine cycles
-        self.op_desc = "" # Stores a human readable string of the current operation for debugging
-
-        self.a      = registers.RegisterByte(0x0, "A")
-        self.f      = registers.RegisterFlag(0xB0, "F")
-        self.b      = registers.RegisterByte(0x0, "B")
-        self.c      = registers.RegisterByte(0x13, "C")
-        self.d      = registers.RegisterByte(0x0, "D")
-        self.e      = registers.RegisterByte(0xD8, "E")
-        self.h      = registers.RegisterByte(0x1, "H")
-        self.l      = registers.RegisterByte(0x4D, "L")
-        self.af     = registers.RegisterWord(self.a, self.f, "AF")
-        self.bc     = registers.RegisterWord(self.b, self.c, "BC")
-        self.de     = registers.RegisterWord(self.d, self.e, "DE")
-        self.hl     = registers.RegisterWord(self.h, self.l, "HL")
-        self.pc     = registers.RegisterWord.fromValue(0x100, "PC")
-        self.sp     = registers.RegisterWord.fromValue(0xFFFE, "SP")
-
-        self.interrupts = interrupts
-        interrupts.setCall(self.callBase)
-
-        self.op_table = {
-            0x00:         self.nop,
-            0x76:         self.halt,
-            0x10:         self.stop,
+import alu
+import cpu_fast
+
+# Flag conditions as (mask, expected value of F & mask)
+CONDITIONS = {
+    "NZ":     (0x80, 0x00),
+    "Z":      (0x80, 0x80),
+    "NC":     (0x10, 0x00),
+    "C":      (0x10, 0x10),
+    "Always": (0x00, 0x00),
+}
+
+OP_TABLE = None # opcode -> function(cpu) for the classic interpreter, see opTables()
+CB_OP_TABLE = None # the same for the opcodes after $CB
+
+def opTables():
+    """
+    The tables CPU.run() dispatches through. Nothing in them belongs to one
+    CPU, so they are built the first time any CPU needs them and shared by
+    every CPU after that. Those running the generated interpreter never do.
+    """
+    global OP_TABLE, CB_OP_TABLE
+    if OP_TABLE is None:
+        OP_TABLE = {
+            0x00:         CPU.nop,
+            0x76:         CPU.halt,
+            0x10:         CPU.stop,
 
             # Interrupts
-            0xF3:         self.di,
-            0xFB:         self.ei,
+            0xF3:         CPU.di,
+            0xFB:         CPU.ei,
 
             # Loads
-            0x08:         self.ld_Wx,
-
-            0x7F: lambda: self.ld_rr(self.a, self.a),
-            0x78: lambda: self.ld_rr(self.a, self.b),
-            0x79: lambda: self.ld_rr(self.a, self.c),
-            0x7A: lambda: self.ld_rr(self.a, self.d),
-            0x7B: lambda: self.ld_rr(self.a, self.e),
-            0x7C: lambda: self.ld_rr(self.a, self.h),
-            0x7D: lambda: self.ld_rr(self.a, self.l),
-            0x7E: lambda: self.ld_rX(self.a, self.hl),
-            0x0A: lambda: self.ld_rX(self.a, self.bc),
-            0x1A: lambda: self.ld_rX(self.a, self.de),
-            0xFA: lambda: self.ld_rW(self.a),
-            0xEA: lambda: self.ld_Wr(self.a),
-
-            0x47: lambda: self.ld_rr(self.b, self.a),
-            0x40: lambda: self.ld_rr(self.b, self.b),
-            0x41: lambda: self.ld_rr(self.b, self.c),
-            0x42: lambda: self.ld_rr(self.b, self.d),
-            0x43: lambda: self.ld_rr(self.b, self.e),
-            0x44: lambda: self.ld_rr(self.b, self.h),
-            0x45: lambda: self.ld_rr(self.b, self.l),
-            0x46: lambda: self.ld_rX(self.b, self.hl),
-
-            0x4F: lambda: self.ld_rr(self.c, self.a),
-            0x48: lambda: self.ld_rr(self.c, self.b),
-            0x49: lambda: self.ld_rr(self.c, self.c),
-            0x4A: lambda: self.ld_rr(self.c, self.d),
-            0x4B: lambda: self.ld_rr(self.c, self.e),
-            0x4C: lambda: self.ld_rr(self.c, self.h),
-            0x4D: lambda: self.ld_rr(self.c, self.l),
-            0x4E: lambda: self.ld_rX(self.c, self.hl),
-
-            0x57: lambda: self.ld_rr(self.d, self.a),
-            0x50: lambda: self.ld_rr(self.d, self.b),
-            0x51: lambda: self.ld_rr(self.d, self.c),
-            0x52: lambda: self.ld_rr(self.d, self.d),
-            0x53: lambda: self.ld_rr(self.d, self.e),
-            0x54: lambda: self.ld_rr(self.d, self.h),
-            0x55: lambda: self.ld_rr(self.d, self.l),
-            0x56: lambda: self.ld_rX(self.d, self.hl),
-
-            0x5F: lambda: self.ld_rr(self.e, self.a),
-            0x58: lambda: self.ld_rr(self.e, self.b),
-            0x59: lambda: self.ld_rr(self.e, self.c),
-            0x5A: lambda: self.ld_rr(self.e, self.d),
-            0x5B: lambda: self.ld_rr(self.e, self.e),
-            0x5C: lambda: self.ld_rr(self.e, self.h),
-            0x5D: lambda: self.ld_rr(self.e, self.l),
-            0x5E: lambda: self.ld_rX(self.e, self.hl),
-
-            0x67: lambda: self.ld_rr(self.h, self.a),
-            0x60: lambda: self.ld_rr(self.h, self.b),
-            0x61: lambda: self.ld_rr(self.h, self.c),
-            0x62: lambda: self.ld_rr(self.h, self.d),
-            0x63: lambda: self.ld_rr(self.h, self.e),
-            0x64: lambda: self.ld_rr(self.h, self.h),
-            0x65: lambda: self.ld_rr(self.h, self.l),
-            0x66: lambda: self.ld_rX(self.h, self.hl),
-
-            0x6F: lambda: self.ld_rr(self.l, self.a),
-            0x68: lambda: self.ld_rr(self.l, self.b),
-            0x69: lambda: self.ld_rr(self.l, self.c),
-            0x6A: lambda: self.ld_rr(self.l, self.d),
-            0x6B: lambda: self.ld_rr(self.l, self.e),
-            0x6C: lambda: self.ld_rr(self.l, self.h),
-            0x6D: lambda: self.ld_rr(self.l, self.l),
-            0x6E: lambda: self.ld_rX(self.l, self.hl),
-
-            0x77: lambda: self.ld_Xr(self.hl, self.a),
-            0x70: lambda: self.ld_Xr(self.hl, self.b),
-            0x71: lambda: self.ld_Xr(self.hl, self.c),
-            0x72: lambda: self.ld_Xr(self.hl, self.d),
-            0x73: lambda: self.ld_Xr(self.hl, self.e),
-            0x74: lambda: self.ld_Xr(self.hl, self.h),
-            0x75: lambda: self.ld_Xr(self.hl, self.l),
-
-            0x3E: lambda: self.ld_rb(self.a),
-            0x06: lambda: self.ld_rb(self.b),
-            0x0E: lambda: self.ld_rb(self.c),
-            0x16: lambda: self.ld_rb(self.d),
-            0x1E: lambda: self.ld_rb(self.e),
-            0x26: lambda: self.ld_rb(self.h),
-            0x2E: lambda: self.ld_rb(self.l),
-            0xE0:         self.ldh_br,
-            0xF0:         self.ldh_rb,
-
-            0x36: lambda: self.ld_Xb(self.hl),
-            0x02: lambda: self.ld_Xr(self.bc, self.a),
-            0x12: lambda: self.ld_Xr(self.de, self.a),
-            0x3A:         self.ldd_rX,
-            0x32:         self.ldd_Xr,
-            0x2A:         self.ldi_rX,
-            0x22:         self.ldi_Xr,
-
-            0x01: lambda: self.ld_xw(self.bc),
-            0x11: lambda: self.ld_xw(self.de),
-            0x21: lambda: self.ld_xw(self.hl),
-            0x31: lambda: self.ld_xw(self.sp),
-            0xF9: lambda: self.ld_xx(self.sp, self.hl),
-
-            0xE2:         self.ldh_Rr,
-            0xF2:         self.ldh_rR,
+            0x08:         CPU.ld_Wx,
+
+            0x7F: lambda cpu: cpu.ld_rr(cpu.a, cpu.a),
+            0x78: lambda cpu: cpu.ld_rr(cpu.a, cpu.b),
+            0x79: lambda cpu: cpu.ld_rr(cpu.a, cpu.c),
+            0x7A: lambda cpu: cpu.ld_rr(cpu.a, cpu.d),
+            0x7B: lambda cpu: cpu.ld_rr(cpu.a, cpu.e),
+            0x7C: lambda cpu: cpu.ld_rr(cpu.a, cpu.h),
+            0x7D: lambda cpu: cpu.ld_rr(cpu.a, cpu.l),
+            0x7E: lambda cpu: cpu.ld_rX(cpu.a, cpu.hl),
+            0x0A: lambda cpu: cpu.ld_rX(cpu.a, cpu.bc),
+            0x1A: lambda cpu: cpu.ld_rX(cpu.a, cpu.de),
+            0xFA: lambda cpu: cpu.ld_rW(cpu.a),
+            0xEA: lambda cpu: cpu.ld_Wr(cpu.a),
+
+            0x47: lambda cpu: cpu.ld_rr(cpu.b, cpu.a),
+            0x40: lambda cpu: cpu.ld_rr(cpu.b, cpu.b),
+            0x41: lambda cpu: cpu.ld_rr(cpu.b, cpu.c),
+            0x42: lambda cpu: cpu.ld_rr(cpu.b, cpu.d),
+            0x43: lambda cpu: cpu.ld_rr(cpu.b, cpu.e),
+            0x44: lambda cpu: cpu.ld_rr(cpu.b, cpu.h),
+            0x45: lambda cpu: cpu.ld_rr(cpu.b, cpu.l),
+            0x46: lambda cpu: cpu.ld_rX(cpu.b, cpu.hl),
+
+            0x4F: lambda cpu: cpu.ld_rr(cpu.c, cpu.a),
+            0x48: lambda cpu: cpu.ld_rr(cpu.c, cpu.b),
+            0x49: lambda cpu: cpu.ld_rr(cpu.c, cpu.c),
+            0x4A: lambda cpu: cpu.ld_rr(cpu.c, cpu.d),
+            0x4B: lambda cpu: cpu.ld_rr(cpu.c, cpu.e),
+            0x4C: lambda cpu: cpu.ld_rr(cpu.c, cpu.h),
+            0x4D: lambda cpu: cpu.ld_rr(cpu.c, cpu.l),
+            0x4E: lambda cpu: cpu.ld_rX(cpu.c, cpu.hl),
+
+            0x57: lambda cpu: cpu.ld_rr(cpu.d, cpu.a),
+            0x50: lambda cpu: cpu.ld_rr(cpu.d, cpu.b),
+            0x51: lambda cpu: cpu.ld_rr(cpu.d, cpu.c),
+            0x52: lambda cpu: cpu.ld_rr(cpu.d, cpu.d),
+            0x53: lambda cpu: cpu.ld_rr(cpu.d, cpu.e),
+            0x54: lambda cpu: cpu.ld_rr(cpu.d, cpu.h),
+            0x55: lambda cpu: cpu.ld_rr(cpu.d, cpu.l),
+            0x56: lambda cpu: cpu.ld_rX(cpu.d, cpu.hl),
+
+            0x5F: lambda cpu: cpu.ld_rr(cpu.e, cpu.a),
+            0x58: lambda cpu: cpu.ld_rr(cpu.e, cpu.b),
+            0x59: lambda cpu: cpu.ld_rr(cpu.e, cpu.c),
+            0x5A: lambda cpu: cpu.ld_rr(cpu.e, cpu.d),
+            0x5B: lambda cpu: cpu.ld_rr(cpu.e, cpu.e),
+            0x5C: lambda cpu: cpu.ld_rr(cpu.e, cpu.h),
+            0x5D: lambda cpu: cpu.ld_rr(cpu.e, cpu.l),
+            0x5E: lambda cpu: cpu.ld_rX(cpu.e, cpu.hl),
+
+            0x67: lambda cpu: cpu.ld_rr(cpu.h, cpu.a),
+            0x60: lambda cpu: cpu.ld_rr(cpu.h, cpu.b),
+            0x61: lambda cpu: cpu.ld_rr(cpu.h, cpu.c),
+            0x62: lambda cpu: cpu.ld_rr(cpu.h, cpu.d),
+            0x63: lambda cpu: cpu.ld_rr(cpu.h, cpu.e),
+            0x64: lambda cpu: cpu.ld_rr(cpu.h, cpu.h),
+            0x65: lambda cpu: cpu.ld_rr(cpu.h, cpu.l),
+            0x66: lambda cpu: cpu.ld_rX(cpu.h, cpu.hl),
+
+            0x6F: lambda cpu: cpu.ld_rr(cpu.l, cpu.a),
+            0x68: lambda cpu: cpu.ld_rr(cpu.l, cpu.b),
+            0x69: lambda cpu: cpu.ld_rr(cpu.l, cpu.c),
+            0x6A: lambda cpu: cpu.ld_rr(cpu.l, cpu.d),
+            0x6B: lambda cpu: cpu.ld_rr(cpu.l, cpu.e),
+            0x6C: lambda cpu: cpu.ld_rr(cpu.l, cpu.h),
+            0x6D: lambda cpu: cpu.ld_rr(cpu.l, cpu.l),
+            0x6E: lambda cpu: cpu.ld_rX(cpu.l, cpu.hl),
+
+            0x77: lambda cpu: cpu.ld_Xr(cpu.hl, cpu.a),
+            0x70: lambda cpu: cpu.ld_Xr(cpu.hl, cpu.b),
+            0x71: lambda cpu: cpu.ld_Xr(cpu.hl, cpu.c),
+            0x72: lambda cpu: cpu.ld_Xr(cpu.hl, cpu.d),
+            0x73: lambda cpu: cpu.ld_Xr(cpu.hl, cpu.e),
+            0x74: lambda cpu: cpu.ld_Xr(cpu.hl, cpu.h),
+            0x75: lambda cpu: cpu.ld_Xr(cpu.hl, cpu.l),
+
+            0x3E: lambda cpu: cpu.ld_rb(cpu.a),
+            0x06: lambda cpu: cpu.ld_rb(cpu.b),
+            0x0E: lambda cpu: cpu.ld_rb(cpu.c),
+            0x16: lambda cpu: cpu.ld_rb(cpu.d),
+            0x1E: lambda cpu: cpu.ld_rb(cpu.e),
+            0x26: lambda cpu: cpu.ld_rb(cpu.h),
+            0x2E: lambda cpu: cpu.ld_rb(cpu.l),
+            0xE0:         CPU.ldh_br,
+            0xF0:         CPU.ldh_rb,
+
+            0x36: lambda cpu: cpu.ld_Xb(cpu.hl),
+            0x02: lambda cpu: cpu.ld_Xr(cpu.bc, cpu.a),
+            0x12: lambda cpu: cpu.ld_Xr(cpu.de, cpu.a),
+            0x3A:         CPU.ldd_rX,
+            0x32:         CPU.ldd_Xr,
+            0x2A:         CPU.ldi_rX,
+            0x22:         CPU.ldi_Xr,
+
+            0x01: lambda cpu: cpu.ld_xw(cpu.bc),
+            0x11: lambda cpu: cpu.ld_xw(cpu.de),
+            0x21: lambda cpu: cpu.ld_xw(cpu.hl),
+            0x31: lambda cpu: cpu.ld_xw(cpu.sp),
+            0xF9: lambda cpu: cpu.ld_xx(cpu.sp, cpu.hl),
+
+            0xE2:         CPU.ldh_Rr,
+            0xF2:         CPU.ldh_rR,
 
             # Stack operations
-            0xC5: lambda: self.push_x(self.bc),
-            0xD5: lambda: self.push_x(self.de),
-            0xE5: lambda: self.push_x(self.hl),
-            0xF5: lambda: self.push_x(self.af),
+            0xC5: lambda cpu: cpu.push_x(cpu.bc),
+            0xD5: lambda cpu: cpu.push_x(cpu.de),
+            0xE5: lambda cpu: cpu.push_x(cpu.hl),
+            0xF5: lambda cpu: cpu.push_x(cpu.af),
 
-            0xC1: lambda: self.pop_x(self.bc),
-            0xD1: lambda: self.pop_x(self.de),
-            0xE1: lambda: self.pop_x(self.hl),
-            0xF1: lambda: self.pop_x(self.af),
+            0xC1: lambda cpu: cpu.pop_x(cpu.bc),
+            0xD1: lambda cpu: cpu.pop_x(cpu.de),
+            0xE1: lambda cpu: cpu.pop_x(cpu.hl),
+            0xF1: lambda cpu: cpu.pop_x(cpu.af),
 
             # Compare
-            0xBF: lambda: self.cp_r(self.a),
-            0xB8: lambda: self.cp_r(self.b),
-            0xB9: lambda: self.cp_r(self.c),
-            0xBA: lambda: self.cp_r(self.d),
-            0xBB: lambda: self.cp_r(self.e),
-            0xBC: lambda: self.cp_r(self.h),
-            0xBD: lambda: self.cp_r(self.l),
-            0xBE: lambda: self.cp_X(self.hl),
-            0xFE:         self.cp_b,
+            0xBF: lambda cpu: cpu.cp_r(cpu.a),
+            0xB8: lambda cpu: cpu.cp_r(cpu.b),
+            0xB9: lambda cpu: cpu.cp_r(cpu.c),
+            0xBA: lambda cpu: cpu.cp_r(cpu.d),
+            0xBB: lambda cpu: cpu.cp_r(cpu.e),
+            0xBC: lambda cpu: cpu.cp_r(cpu.h),
+            0xBD: lambda cpu: cpu.cp_r(cpu.l),
+            0xBE: lambda cpu: cpu.cp_X(cpu.hl),
+            0xFE:         CPU.cp_b,
 
             # Jumps
-            0xC3:         self.jp_w,
-            0xE9: lambda: self.jp_X(self.hl),
-            0xC2: lambda: self.jp_fw("NZ"),
-            0xCA: lambda: self.jp_fw("Z"),
-            0xD2: lambda: self.jp_fw("NC"),
-            0xDA: lambda: self.jp_fw("C"),
-
-            0x18:         self.jr_b,
-            0x20: lambda: self.jr_fb("NZ"),
-            0x28: lambda: self.jr_fb("Z"),
-            0x30: lambda: self.jr_fb("NC"),
-            0x38: lambda: self.jr_fb("C"),
+            0xC3:         CPU.jp_w,
+            0xE9: lambda cpu: cpu.jp_X(cpu.hl),
+            0xC2: lambda cpu: cpu.jp_fw("NZ"),
+            0xCA: lambda cpu: cpu.jp_fw("Z"),
+            0xD2: lambda cpu: cpu.jp_fw("NC"),
+            0xDA: lambda cpu: cpu.jp_fw("C"),
+
+            0x18:         CPU.jr_b,
+            0x20: lambda cpu: cpu.jr_fb("NZ"),
+            0x28: lambda cpu: cpu.jr_fb("Z"),
+            0x30: lambda cpu: cpu.jr_fb("NC"),
+            0x38: lambda cpu: cpu.jr_fb("C"),
 
             # Calls
-            0xCD:         self.call_w,
-            0xC4: lambda: self.call_fw("NZ"),
-            0xCC: lambda: self.call_fw("Z"),
-            0xD4: lambda: self.call_fw("NC"),
-            0xDC: lambda: self.call_fw("C"),
+            0xCD:         CPU.call_w,
+            0xC4: lambda cpu: cpu.call_fw("NZ"),
+            0xCC: lambda cpu: cpu.call_fw("Z"),
+            0xD4: lambda cpu: cpu.call_fw("NC"),
+            0xDC: lambda cpu: cpu.call_fw("C"),
 
             # Returns
-            0xC9:         self.ret,
-            0xD9:         self.reti,
-            0xC0: lambda: self.ret_f("NZ"),
-            0xC8: lambda: self.ret_f("Z"),
-            0xD0: lambda: self.ret_f("NC"),
-            0xD8: lambda: self.ret_f("C"),
+            0xC9:         CPU.ret,
+            0xD9:         CPU.reti,
+            0xC0: lambda cpu: cpu.ret_f("NZ"),
+            0xC8: lambda cpu: cpu.ret_f("Z"),
+            0xD0: lambda cpu: cpu.ret_f("NC"),
+            0xD8: lambda cpu: cpu.ret_f("C"),
 
             # Restarts
-            0xC7: lambda: self.rst_b(0x00),
-            0xCF: lambda: self.rst_b(0x08),
-            0xD7: lambda: self.rst_b(0x10),
-            0xDF: lambda: self.rst_b(0x18),
-            0xE7: lambda: self.rst_b(0x20),
-            0xEF: lambda: self.rst_b(0x28),
-            0xF7: lambda: self.rst_b(0x30),
-            0xFF: lambda: self.rst_b(0x38),
+            0xC7: lambda cpu: cpu.rst_b(0x00),
+            0xCF: lambda cpu: cpu.rst_b(0x08),
+            0xD7: lambda cpu: cpu.rst_b(0x10),
+            0xDF: lambda cpu: cpu.rst_b(0x18),
+            0xE7: lambda cpu: cpu.rst_b(0x20),
+            0xEF: lambda cpu: cpu.rst_b(0x28),
+            0xF7: lambda cpu: cpu.rst_b(0x30),
+            0xFF: lambda cpu: cpu.rst_b(0x38),
 
             # ADD
-            0x87: lambda: self.add_rr(self.a),
-            0x80: lambda: self.add_rr(self.b),
-            0x81: lambda: self.add_rr(self.c),
-            0x82: lambda: self.add_rr(self.d),
-            0x83: lambda: self.add_rr(self.e),
-            0x84: lambda: self.add_rr(self.h),
-            0x85: lambda: self.add_rr(self.l),
-            0x86: lambda: self.add_rX(self.hl),
-            0xC6:         self.add_rb,
-
-            0x09: lambda: self.add_xx(self.bc),
-            0x19: lambda: self.add_xx(self.de),
-            0x29: lambda: self.add_xx(self.hl),
-            0x39: lambda: self.add_xx(self.sp),
-            0xE8:         self.add_xb,
-
-            0x8f: lambda: self.adc_rr(self.a),
-            0x88: lambda: self.adc_rr(self.b),
-            0x89: lambda: self.adc_rr(self.c),
-            0x8A: lambda: self.adc_rr(self.d),
-            0x8B: lambda: self.adc_rr(self.e),
-            0x8C: lambda: self.adc_rr(self.h),
-            0x8D: lambda: self.adc_rr(self.l),
-            0x8E: lambda: self.adc_rX(self.hl),
-            0xCE:         self.adc_rb,
+            0x87: lambda cpu: cpu.add_rr(cpu.a),
+            0x80: lambda cpu: cpu.add_rr(cpu.b),
+            0x81: lambda cpu: cpu.add_rr(cpu.c),
+            0x82: lambda cpu: cpu.add_rr(cpu.d),
+            0x83: lambda cpu: cpu.add_rr(cpu.e),
+            0x84: lambda cpu: cpu.add_rr(cpu.h),
+            0x85: lambda cpu: cpu.add_rr(cpu.l),
+            0x86: lambda cpu: cpu.add_rX(cpu.hl),
+            0xC6:         CPU.add_rb,
+
+            0x09: lambda cpu: cpu.add_xx(cpu.bc),
+            0x19: lambda cpu: cpu.add_xx(cpu.de),
+            0x29: lambda cpu: cpu.add_xx(cpu.hl),
+            0x39: lambda cpu: cpu.add_xx(cpu.sp),
+            0xE8:         CPU.add_xb,
+
+            0x8f: lambda cpu: cpu.adc_rr(cpu.a),
+            0x88: lambda cpu: cpu.adc_rr(cpu.b),
+            0x89: lambda cpu: cpu.adc_rr(cpu.c),
+            0x8A: lambda cpu: cpu.adc_rr(cpu.d),
+            0x8B: lambda cpu: cpu.adc_rr(cpu.e),
+            0x8C: lambda cpu: cpu.adc_rr(cpu.h),
+            0x8D: lambda cpu: cpu.adc_rr(cpu.l),
+            0x8E: lambda cpu: cpu.adc_rX(cpu.hl),
+            0xCE:         CPU.adc_rb,
 
             # SUB
-            0x97: lambda: self.sub_rr(self.a),
-            0x90: lambda: self.sub_rr(self.b),
-            0x91: lambda: self.sub_rr(self.c),
-            0x92: lambda: self.sub_rr(self.d),
-            0x93: lambda: self.sub_rr(self.e),
-            0x94: lambda: self.sub_rr(self.h),
-            0x95: lambda: self.sub_rr(self.l),
-            0x96: lambda: self.sub_rX(self.hl),
-            0xD6:         self.sub_rb,
-
-            0x9f: lambda: self.sub_rr(self.a),
-            0x98: lambda: self.sub_rr(self.b),
-            0x99: lambda: self.sub_rr(self.c),
-            0x9A: lambda: self.sub_rr(self.d),
-            0x9B: lambda: self.sub_rr(self.e),
-            0x9C: lambda: self.sub_rr(self.h),
-            0x9D: lambda: self.sub_rr(self.l),
-            0x9E: lambda: self.sub_rX(self.hl),
-            0xDE:         self.sub_rb,
+            0x97: lambda cpu: cpu.sub_rr(cpu.a),
+            0x90: lambda cpu: cpu.sub_rr(cpu.b),
+            0x91: lambda cpu: cpu.sub_rr(cpu.c),
+            0x92: lambda cpu: cpu.sub_rr(cpu.d),
+            0x93: lambda cpu: cpu.sub_rr(cpu.e),
+            0x94: lambda cpu: cpu.sub_rr(cpu.h),
+            0x95: lambda cpu: cpu.sub_rr(cpu.l),
+            0x96: lambda cpu: cpu.sub_rX(cpu.hl),
+            0xD6:         CPU.sub_rb,
+
+            0x9f: lambda cpu: cpu.sbc_rr(cpu.a),
+            0x98: lambda cpu: cpu.sbc_rr(cpu.b),
+            0x99: lambda cpu: cpu.sbc_rr(cpu.c),
+            0x9A: lambda cpu: cpu.sbc_rr(cpu.d),
+            0x9B: lambda cpu: cpu.sbc_rr(cpu.e),
+            0x9C: lambda cpu: cpu.sbc_rr(cpu.h),
+            0x9D: lambda cpu: cpu.sbc_rr(cpu.l),
+            0x9E: lambda cpu: cpu.sbc_rX(cpu.hl),
+            0xDE:         CPU.sbc_rb,
 
             # AND
-            0xA7: lambda: self.and_r(self.a),
-            0xA0: lambda: self.and_r(self.b),
-            0xA1: lambda: self.and_r(self.c),
-            0xA2: lambda: self.and_r(self.d),
-            0xA3: lambda: self.and_r(self.e),
-            0xA4: lambda: self.and_r(self.h),
-            0xA5: lambda: self.and_r(self.l),
-            0xA6: lambda: self.and_X(self.hl),
-            0xE6:         self.and_b,
+            0xA7: lambda cpu: cpu.and_r(cpu.a),
+            0xA0: lambda cpu: cpu.and_r(cpu.b),
+            0xA1: lambda cpu: cpu.and_r(cpu.c),
+            0xA2: lambda cpu: cpu.and_r(cpu.d),
+            0xA3: lambda cpu: cpu.and_r(cpu.e),
+            0xA4: lambda cpu: cpu.and_r(cpu.h),
+            0xA5: lambda cpu: cpu.and_r(cpu.l),
+            0xA6: lambda cpu: cpu.and_X(cpu.hl),
+            0xE6:         CPU.and_b,
 
             # OR
-            0xB7: lambda: self.or_r(self.a),
-            0xB0: lambda: self.or_r(self.b),
-            0xB1: lambda: self.or_r(self.c),
-            0xB2: lambda: self.or_r(self.d),
-            0xB3: lambda: self.or_r(self.e),
-            0xB4: lambda: self.or_r(self.h),
-            0xB5: lambda: self.or_r(self.l),
-            0xB6: lambda: self.or_X(self.hl),
-            0xF6:         self.or_b,
+            0xB7: lambda cpu: cpu.or_r(cpu.a),
+            0xB0: lambda cpu: cpu.or_r(cpu.b),
+            0xB1: lambda cpu: cpu.or_r(cpu.c),
+            0xB2: lambda cpu: cpu.or_r(cpu.d),
+            0xB3: lambda cpu: cpu.or_r(cpu.e),
+            0xB4: lambda cpu: cpu.or_r(cpu.h),
+            0xB5: lambda cpu: cpu.or_r(cpu.l),
+            0xB6: lambda cpu: cpu.or_X(cpu.hl),
+            0xF6:         CPU.or_b,
 
             # XOR
-            0xAF: lambda: self.xor_r(self.a),
-            0xA8: lambda: self.xor_r(self.b),
-            0xA9: lambda: self.xor_r(self.c),
-            0xAA: lambda: self.xor_r(self.d),
-            0xAB: lambda: self.xor_r(self.e),
-            0xAC: lambda: self.xor_r(self.h),
-            0xAD: lambda: self.xor_r(self.l),
-            0xAE: lambda: self.xor_X(self.hl),
-            0xEE:         self.xor_b,
+            0xAF: lambda cpu: cpu.xor_r(cpu.a),
+            0xA8: lambda cpu: cpu.xor_r(cpu.b),
+            0xA9: lambda cpu: cpu.xor_r(cpu.c),
+            0xAA: lambda cpu: cpu.xor_r(cpu.d),
+            0xAB: lambda cpu: cpu.xor_r(cpu.e),
+            0xAC: lambda cpu: cpu.xor_r(cpu.h),
+            0xAD: lambda cpu: cpu.xor_r(cpu.l),
+            0xAE: lambda cpu: cpu.xor_X(cpu.hl),
+            0xEE:         CPU.xor_b,
 
             # INC
-            0x3C: lambda: self.inc_r(self.a),
-            0x04: lambda: self.inc_r(self.b),
-            0x0C: lambda: self.inc_r(self.c),
-            0x14: lambda: self.inc_r(self.d),
-            0x1C: lambda: self.inc_r(self.e),
-            0x24: lambda: self.inc_r(self.h),
-            0x2C: lambda: self.inc_r(self.l),
-            0x03: lambda: self.inc_x(self.bc),
-            0x13: lambda: self.inc_x(self.de),
-            0x23: lambda: self.inc_x(self.hl),
-            0x33: lambda: self.inc_x(self.sp),
-            0x34:         self.inc_X,
+            0x3C: lambda cpu: cpu.inc_r(cpu.a),
+            0x04: lambda cpu: cpu.inc_r(cpu.b),
+            0x0C: lambda cpu: cpu.inc_r(cpu.c),
+            0x14: lambda cpu: cpu.inc_r(cpu.d),
+            0x1C: lambda cpu: cpu.inc_r(cpu.e),
+            0x24: lambda cpu: cpu.inc_r(cpu.h),
+            0x2C: lambda cpu: cpu.inc_r(cpu.l),
+            0x03: lambda cpu: cpu.inc_x(cpu.bc),
+            0x13: lambda cpu: cpu.inc_x(cpu.de),
+            0x23: lambda cpu: cpu.inc_x(cpu.hl),
+            0x33: lambda cpu: cpu.inc_x(cpu.sp),
+            0x34:         CPU.inc_X,
 
             # DEC
-            0x3D: lambda: self.dec_r(self.a),
-            0x05: lambda: self.dec_r(self.b),
-            0x0D: lambda: self.dec_r(self.c),
-            0x15: lambda: self.dec_r(self.d),
-            0x1D: lambda: self.dec_r(self.e),
-            0x25: lambda: self.dec_r(self.h),
-            0x2D: lambda: self.dec_r(self.l),
-            0x0B: lambda: self.dec_x(self.bc),
-            0x1B: lambda: self.dec_x(self.de),
-            0x2B: lambda: self.dec_x(self.hl),
-            0x3B: lambda: self.dec_x(self.sp),
-            0x35:         self.dec_X,
+            0x3D: lambda cpu: cpu.dec_r(cpu.a),
+            0x05: lambda cpu: cpu.dec_r(cpu.b),
+            0x0D: lambda cpu: cpu.dec_r(cpu.c),
+            0x15: lambda cpu: cpu.dec_r(cpu.d),
+            0x1D: lambda cpu: cpu.dec_r(cpu.e),
+            0x25: lambda cpu: cpu.dec_r(cpu.h),
+            0x2D: lambda cpu: cpu.dec_r(cpu.l),
+            0x0B: lambda cpu: cpu.dec_x(cpu.bc),
+            0x1B: lambda cpu: cpu.dec_x(cpu.de),
+            0x2B: lambda cpu: cpu.dec_x(cpu.hl),
+            0x3B: lambda cpu: cpu.dec_x(cpu.sp),
+            0x35:         CPU.dec_X,
 
             # Misc ALU
-            0x27:         self.daa,
-            0x2F:         self.cpl,
+            0x27:         CPU.daa,
+            0x2F:         CPU.cpl,
 
 
             # Rotates
-            0x07:         self.rlca,
-            0x0F:         self.rrca,
-            0x17:         self.rla,
-            0x1F:         self.rra,
-            0xCB:         self.cb_prefix,
+            0x07:         CPU.rlca,
+            0x0F:         CPU.rrca,
+            0x17:         CPU.rla,
+            0x1F:         CPU.rra,
+            0xCB:         CPU.cb_prefix,
         }
 
-        self.cb_op_table = {
+        CB_OP_TABLE = {
             # Rotates
-            0x07: lambda: self.rlc_r(self.a),
-            0x00: lambda: self.rlc_r(self.b),
-            0x01: lambda: self.rlc_r(self.c),
-            0x02: lambda: self.rlc_r(self.d),
-            0x03: lambda: self.rlc_r(self.e),
-            0x04: lambda: self.rlc_r(self.h),
-            0x05: lambda: self.rlc_r(self.l),
-            0x06:         self.rlc_X,
-
-            0x17: lambda: self.rl_r(self.a),
-            0x10: lambda: self.rl_r(self.b),
-            0x11: lambda: self.rl_r(self.c),
-            0x12: lambda: self.rl_r(self.d),
-            0x13: lambda: self.rl_r(self.e),
-            0x14: lambda: self.rl_r(self.h),
-            0x15: lambda: self.rl_r(self.l),
-            0x16:         self.rl_X,
-
-            0x0F: lambda: self.rrc_r(self.a),
-            0x08: lambda: self.rrc_r(self.b),
-            0x09: lambda: self.rrc_r(self.c),
-            0x0A: lambda: self.rrc_r(self.d),
-            0x0B: lambda: self.rrc_r(self.e),
-            0x0C: lambda: self.rrc_r(self.h),
-            0x0D: lambda: self.rrc_r(self.l),
-            0x0E:         self.rrc_X,
-
-            0x1F: lambda: self.rr_r(self.a),
-            0x18: lambda: self.rr_r(self.b),
-            0x19: lambda: self.rr_r(self.c),
-            0x1A: lambda: self.rr_r(self.d),
-            0x1B: lambda: self.rr_r(self.e),
-            0x1C: lambda: self.rr_r(self.h),
-            0x1D: lambda: self.rr_r(self.l),
-            0x1E:         self.rr_X,
+            0x07: lambda cpu: cpu.rlc_r(cpu.a),
+            0x00: lambda cpu: cpu.rlc_r(cpu.b),
+            0x01: lambda cpu: cpu.rlc_r(cpu.c),
+            0x02: lambda cpu: cpu.rlc_r(cpu.d),
+            0x03: lambda cpu: cpu.rlc_r(cpu.e),
+            0x04: lambda cpu: cpu.rlc_r(cpu.h),
+            0x05: lambda cpu: cpu.rlc_r(cpu.l),
+            0x06: lambda cpu: cpu.rlc_X(cpu.hl),
+
+            0x17: lambda cpu: cpu.rl_r(cpu.a),
+            0x10: lambda cpu: cpu.rl_r(cpu.b),
+            0x11: lambda cpu: cpu.rl_r(cpu.c),
+            0x12: lambda cpu: cpu.rl_r(cpu.d),
+            0x13: lambda cpu: cpu.rl_r(cpu.e),
+            0x14: lambda cpu: cpu.rl_r(cpu.h),
+            0x15: lambda cpu: cpu.rl_r(cpu.l),
+            0x16: lambda cpu: cpu.rl_X(cpu.hl),
+
+            0x0F: lambda cpu: cpu.rrc_r(cpu.a),
+            0x08: lambda cpu: cpu.rrc_r(cpu.b),
+            0x09: lambda cpu: cpu.rrc_r(cpu.c),
+            0x0A: lambda cpu: cpu.rrc_r(cpu.d),
+            0x0B: lambda cpu: cpu.rrc_r(cpu.e),
+            0x0C: lambda cpu: cpu.rrc_r(cpu.h),
+            0x0D: lambda cpu: cpu.rrc_r(cpu.l),
+            0x0E: lambda cpu: cpu.rrc_X(cpu.hl),
+
+            0x1F: lambda cpu: cpu.rr_r(cpu.a),
+            0x18: lambda cpu: cpu.rr_r(cpu.b),
+            0x19: lambda cpu: cpu.rr_r(cpu.c),
+            0x1A: lambda cpu: cpu.rr_r(cpu.d),
+            0x1B: lambda cpu: cpu.rr_r(cpu.e),
+            0x1C: lambda cpu: cpu.rr_r(cpu.h),
+            0x1D: lambda cpu: cpu.rr_r(cpu.l),
+            0x1E: lambda cpu: cpu.rr_X(cpu.hl),
 
             # Shifts
-            0x27: lambda: self.sla_r(self.a),
-            0x20: lambda: self.sla_r(self.b),
-            0x21: lambda: self.sla_r(self.c),
-            0x22: lambda: self.sla_r(self.d),
-            0x23: lambda: self.sla_r(self.e),
-            0x24: lambda: self.sla_r(self.h),
-            0x25: lambda: self.sla_r(self.l),
-            0x26: lambda: self.sla_X(self.hl),
-
-            0x2F: lambda: self.sra_r(self.a),
-            0x28: lambda: self.sra_r(self.b),
-            0x29: lambda: self.sra_r(self.c),
-            0x2A: lambda: self.sra_r(self.d),
-            0x2B: lambda: self.sra_r(self.e),
-            0x2C: lambda: self.sra_r(self.h),
-            0x2D: lambda: self.sra_r(self.l),
-            0x2E: lambda: self.sra_X(self.hl),
-
-            0x3F: lambda: self.srl_r(self.a),
-            0x38: lambda: self.srl_r(self.b),
-            0x39: lambda: self.srl_r(self.c),
-            0x3A: lambda: self.srl_r(self.d),
-            0x3B: lambda: self.srl_r(self.e),
-            0x3C: lambda: self.srl_r(self.h),
-            0x3D: lambda: self.srl_r(self.l),
-            0x3E: lambda: self.srl_X(self.hl),
+            0x27: lambda cpu: cpu.sla_r(cpu.a),
+            0x20: lambda cpu: cpu.sla_r(cpu.b),
+            0x21: lambda cpu: cpu.sla_r(cpu.c),
+            0x22: lambda cpu: cpu.sla_r(cpu.d),
+            0x23: lambda cpu: cpu.sla_r(cpu.e),
+            0x24: lambda cpu: cpu.sla_r(cpu.h),
+            0x25: lambda cpu: cpu.sla_r(cpu.l),
+            0x26: lambda cpu: cpu.sla_X(cpu.hl),
+
+            0x2F: lambda cpu: cpu.sra_r(cpu.a),
+            0x28: lambda cpu: cpu.sra_r(cpu.b),
+            0x29: lambda cpu: cpu.sra_r(cpu.c),
+            0x2A: lambda cpu: cpu.sra_r(cpu.d),
+            0x2B: lambda cpu: cpu.sra_r(cpu.e),
+            0x2C: lambda cpu: cpu.sra_r(cpu.h),
+            0x2D: lambda cpu: cpu.sra_r(cpu.l),
+            0x2E: lambda cpu: cpu.sra_X(cpu.hl),
+
+            0x3F: lambda cpu: cpu.srl_r(cpu.a),
+            0x38: lambda cpu: cpu.srl_r(cpu.b),
+            0x39: lambda cpu: cpu.srl_r(cpu.c),
+            0x3A: lambda cpu: cpu.srl_r(cpu.d),
+            0x3B: lambda cpu: cpu.srl_r(cpu.e),
+            0x3C: lambda cpu: cpu.srl_r(cpu.h),
+            0x3D: lambda cpu: cpu.srl_r(cpu.l),
+            0x3E: lambda cpu: cpu.srl_X(cpu.hl),
 
             # Swaps
-            0x37: lambda: self.swap_r(self.a),
-            0x30: lambda: self.swap_r(self.b),
-            0x31: lambda: self.swap_r(self.c),
-            0x32: lambda: self.swap_r(self.d),
-            0x33: lambda: self.swap_r(self.e),
-            0x34: lambda: self.swap_r(self.h),
-            0x35: lambda: self.swap_r(self.l),
-            0x36: lambda: self.swap_X,
+            0x37: lambda cpu: cpu.swap_r(cpu.a),
+            0x30: lambda cpu: cpu.swap_r(cpu.b),
+            0x31: lambda cpu: cpu.swap_r(cpu.c),
+            0x32: lambda cpu: cpu.swap_r(cpu.d),
+            0x33: lambda cpu: cpu.swap_r(cpu.e),
+            0x34: lambda cpu: cpu.swap_r(cpu.h),
+            0x35: lambda cpu: cpu.swap_r(cpu.l),
+            0x36:         CPU.swap_X,
 
             # Set Bit
-            0xC7: lambda: self.set_ir(0, self.a),
-            0xC0: lambda: self.set_ir(0, self.b),
-            0xC1: lambda: self.set_ir(0, self.c),
-            0xC2: lambda: self.set_ir(0, self.d),
-            0xC3: lambda: self.set_ir(0, self.e),
-            0xC4: lambda: self.set_ir(0, self.h),
-            0xC5: lambda: self.set_ir(0, self.l),
-            0xC6: lambda: self.set_iX(0, self.hl),
-
-            0xCF: lambda: self.set_ir(1, self.a),
-            0xC8: lambda: self.set_ir(1, self.b),
-            0xC9: lambda: self.set_ir(1, self.c),
-            0xCA: lambda: self.set_ir(1, self.d),
-            0xCB: lambda: self.set_ir(1, self.e),
-            0xCC: lambda: self.set_ir(1, self.h),
-            0xCD: lambda: self.set_ir(1, self.l),
-            0xCE: lambda: self.set_iX(1, self.hl),
-
-            0xD7: lambda: self.set_ir(2, self.a),
-            0xD0: lambda: self.set_ir(2, self.b),
-            0xD1: lambda: self.set_ir(2, self.c),
-            0xD2: lambda: self.set_ir(2, self.d),
-            0xD3: lambda: self.set_ir(2, self.e),
-            0xD4: lambda: self.set_ir(2, self.h),
-            0xD5: lambda: self.set_ir(2, self.l),
-            0xD6: lambda: self.set_iX(2, self.hl),
-
-            0xDF: lambda: self.set_ir(3, self.a),
-            0xD8: lambda: self.set_ir(3, self.b),
-            0xD9: lambda: self.set_ir(3, self.c),
-            0xDA: lambda: self.set_ir(3, self.d),
-            0xDB: lambda: self.set_ir(3, self.e),
-            0xDC: lambda: self.set_ir(3, self.h),
-            0xDD: lambda: self.set_ir(3, self.l),
-            0xDE: lambda: self.set_iX(3, self.hl),
+            0xC7: lambda cpu: cpu.set_ir(0, cpu.a),
+            0xC0: lambda cpu: cpu.set_ir(0, cpu.b),
+            0xC1: lambda cpu: cpu.set_ir(0, cpu.c),
+            0xC2: lambda cpu: cpu.set_ir(0, cpu.d),
+            0xC3: lambda cpu: cpu.set_ir(0, cpu.e),
+            0xC4: lambda cpu: cpu.set_ir(0, cpu.h),
+            0xC5: lambda cpu: cpu.set_ir(0, cpu.l),
+            0xC6: lambda cpu: cpu.set_iX(0, cpu.hl),
+
+            0xCF: lambda cpu: cpu.set_ir(1, cpu.a),
+            0xC8: lambda cpu: cpu.set_ir(1, cpu.b),
+            0xC9: lambda cpu: cpu.set_ir(1, cpu.c),
+            0xCA: lambda cpu: cpu.set_ir(1, cpu.d),
+            0xCB: lambda cpu: cpu.set_ir(1, cpu.e),
+            0xCC: lambda cpu: cpu.set_ir(1, cpu.h),
+            0xCD: lambda cpu: cpu.set_ir(1, cpu.l),
+            0xCE: lambda cpu: cpu.set_iX(1, cpu.hl),
+
+            0xD7: lambda cpu: cpu.set_ir(2, cpu.a),
+            0xD0: lambda cpu: cpu.set_ir(2, cpu.b),
+            0xD1: lambda cpu: cpu.set_ir(2, cpu.c),
+            0xD2: lambda cpu: cpu.set_ir(2, cpu.d),
+            0xD3: lambda cpu: cpu.set_ir(2, cpu.e),
+            0xD4: lambda cpu: cpu.set_ir(2, cpu.h),
+            0xD5: lambda cpu: cpu.set_ir(2, cpu.l),
+            0xD6: lambda cpu: cpu.set_iX(2, cpu.hl),
+
+            0xDF: lambda cpu: cpu.set_ir(3, cpu.a),
+            0xD8: lambda cpu: cpu.set_ir(3, cpu.b),
+            0xD9: lambda cpu: cpu.set_ir(3, cpu.c),
+            0xDA: lambda cpu: cpu.set_ir(3, cpu.d),
+            0xDB: lambda cpu: cpu.set_ir(3, cpu.e),
+            0xDC: lambda cpu: cpu.set_ir(3, cpu.h),
+            0xDD: lambda cpu: cpu.set_ir(3, cpu.l),
+            0xDE: lambda cpu: cpu.set_iX(3, cpu.hl),
             
-            0xE7: lambda: self.set_ir(4, self.a),
-            0xE0: lambda: self.set_ir(4, self.b),
-            0xE1: lambda: self.set_ir(4, self.c),
-            0xE2: lambda: self.set_ir(4, self.d),
-            0xE3: lambda: self.set_ir(4, self.e),
-            0xE4: lambda: self.set_ir(4, self.h),
-            0xE5: lambda: self.set_ir(4, self.l),
-            0xE6: lambda: self.set_iX(4, self.hl),
-
-            0xEF: lambda: self.set_ir(5, self.a),
-            0xE8: lambda: self.set_ir(5, self.b),
-            0xE9: lambda: self.set_ir(5, self.c),
-            0xEA: lambda: self.set_ir(5, self.d),
-            0xEB: lambda: self.set_ir(5, self.e),
-            0xEC: lambda: self.set_ir(5, self.h),
-            0xED: lambda: self.set_ir(5, self.l),
-            0xEE: lambda: self.set_iX(5, self.hl),
-
-            0xF7: lambda: self.set_ir(6, self.a),
-            0xF0: lambda: self.set_ir(6, self.b),
-            0xF1: lambda: self.set_ir(6, self.c),
-            0xF2: lambda: self.set_ir(6, self.d),
-            0xF3: lambda: self.set_ir(6, self.e),
-            0xF4: lambda: self.set_ir(6, self.h),
-            0xF5: lambda: self.set_ir(6, self.l),
-            0xF6: lambda: self.set_iX(6, self.hl),
-
-            0xFF: lambda: self.set_ir(7, self.a),
-            0xF8: lambda: self.set_ir(7, self.b),
-            0xF9: lambda: self.set_ir(7, self.c),
-            0xFA: lambda: self.set_ir(7, self.d),
-            0xFB: lambda: self.set_ir(7, self.e),
-            0xFC: lambda: self.set_ir(7, self.h),
-            0xFD: lambda: self.set_ir(7, self.l),
-            0xFE: lambda: self.set_iX(7, self.hl),
+            0xE7: lambda cpu: cpu.set_ir(4, cpu.a),
+            0xE0: lambda cpu: cpu.set_ir(4, cpu.b),
+            0xE1: lambda cpu: cpu.set_ir(4, cpu.c),
+            0xE2: lambda cpu: cpu.set_ir(4, cpu.d),
+            0xE3: lambda cpu: cpu.set_ir(4, cpu.e),
+            0xE4: lambda cpu: cpu.set_ir(4, cpu.h),
+            0xE5: lambda cpu: cpu.set_ir(4, cpu.l),
+            0xE6: lambda cpu: cpu.set_iX(4, cpu.hl),
+
+            0xEF: lambda cpu: cpu.set_ir(5, cpu.a),
+            0xE8: lambda cpu: cpu.set_ir(5, cpu.b),
+            0xE9: lambda cpu: cpu.set_ir(5, cpu.c),
+            0xEA: lambda cpu: cpu.set_ir(5, cpu.d),
+            0xEB: lambda cpu: cpu.set_ir(5, cpu.e),
+            0xEC: lambda cpu: cpu.set_ir(5, cpu.h),
+            0xED: lambda cpu: cpu.set_ir(5, cpu.l),
+            0xEE: lambda cpu: cpu.set_iX(5, cpu.hl),
+
+            0xF7: lambda cpu: cpu.set_ir(6, cpu.a),
+            0xF0: lambda cpu: cpu.set_ir(6, cpu.b),
+            0xF1: lambda cpu: cpu.set_ir(6, cpu.c),
+            0xF2: lambda cpu: cpu.set_ir(6, cpu.d),
+            0xF3: lambda cpu: cpu.set_ir(6, cpu.e),
+            0xF4: lambda cpu: cpu.set_ir(6, cpu.h),
+            0xF5: lambda cpu: cpu.set_ir(6, cpu.l),
+            0xF6: lambda cpu: cpu.set_iX(6, cpu.hl),
+
+            0xFF: lambda cpu: cpu.set_ir(7, cpu.a),
+            0xF8: lambda cpu: cpu.set_ir(7, cpu.b),
+            0xF9: lambda cpu: cpu.set_ir(7, cpu.c),
+            0xFA: lambda cpu: cpu.set_ir(7, cpu.d),
+            0xFB: lambda cpu: cpu.set_ir(7, cpu.e),
+            0xFC: lambda cpu: cpu.set_ir(7, cpu.h),
+            0xFD: lambda cpu: cpu.set_ir(7, cpu.l),
+            0xFE: lambda cpu: cpu.set_iX(7, cpu.hl),
 
             # Reset Bit
-            0x87: lambda: self.res_ir(0, self.a),
-            0x80: lambda: self.res_ir(0, self.b),
-            0x81: lambda: self.res_ir(0, self.c),
-            0x82: lambda: self.res_ir(0, self.d),
-            0x83: lambda: self.res_ir(0, self.e),
-            0x84: lambda: self.res_ir(0, self.h),
-            0x85: lambda: self.res_ir(0, self.l),
-            0x86: lambda: self.res_iX(0, self.hl),
-
-            0x8F: lambda: self.res_ir(1, self.a),
-            0x88: lambda: self.res_ir(1, self.b),
-            0x89: lambda: self.res_ir(1, self.c),
-            0x8A: lambda: self.res_ir(1, self.d),
-            0x8B: lambda: self.res_ir(1, self.e),
-            0x8C: lambda: self.res_ir(1, self.h),
-            0x8D: lambda: self.res_ir(1, self.l),
-            0x8E: lambda: self.res_iX(1, self.hl),
-
-            0x97: lambda: self.res_ir(2, self.a),
-            0x90: lambda: self.res_ir(2, self.b),
-            0x91: lambda: self.res_ir(2, self.c),
-            0x92: lambda: self.res_ir(2, self.d),
-            0x93: lambda: self.res_ir(2, self.e),
-            0x94: lambda: self.res_ir(2, self.h),
-            0x95: lambda: self.res_ir(2, self.l),
-            0x96: lambda: self.res_iX(2, self.hl),
-
-            0x9F: lambda: self.res_ir(3, self.a),
-            0x98: lambda: self.res_ir(3, self.b),
-            0x99: lambda: self.res_ir(3, self.c),
-            0x9A: lambda: self.res_ir(3, self.d),
-            0x9B: lambda: self.res_ir(3, self.e),
-            0x9C: lambda: self.res_ir(3, self.h),
-            0x9D: lambda: self.res_ir(3, self.l),
-            0x9E: lambda: self.res_iX(3, self.hl),
+            0x87: lambda cpu: cpu.res_ir(0, cpu.a),
+            0x80: lambda cpu: cpu.res_ir(0, cpu.b),
+            0x81: lambda cpu: cpu.res_ir(0, cpu.c),
+            0x82: lambda cpu: cpu.res_ir(0, cpu.d),
+            0x83: lambda cpu: cpu.res_ir(0, cpu.e),
+            0x84: lambda cpu: cpu.res_ir(0, cpu.h),
+            0x85: lambda cpu: cpu.res_ir(0, cpu.l),
+            0x86: lambda cpu: cpu.res_iX(0, cpu.hl),
+
+            0x8F: lambda cpu: cpu.res_ir(1, cpu.a),
+            0x88: lambda cpu: cpu.res_ir(1, cpu.b),
+            0x89: lambda cpu: cpu.res_ir(1, cpu.c),
+            0x8A: lambda cpu: cpu.res_ir(1, cpu.d),
+            0x8B: lambda cpu: cpu.res_ir(1, cpu.e),
+            0x8C: lambda cpu: cpu.res_ir(1, cpu.h),
+            0x8D: lambda cpu: cpu.res_ir(1, cpu.l),
+            0x8E: lambda cpu: cpu.res_iX(1, cpu.hl),
+
+            0x97: lambda cpu: cpu.res_ir(2, cpu.a),
+            0x90: lambda cpu: cpu.res_ir(2, cpu.b),
+            0x91: lambda cpu: cpu.res_ir(2, cpu.c),
+            0x92: lambda cpu: cpu.res_ir(2, cpu.d),
+            0x93: lambda cpu: cpu.res_ir(2, cpu.e),
+            0x94: lambda cpu: cpu.res_ir(2, cpu.h),
+            0x95: lambda cpu: cpu.res_ir(2, cpu.l),
+            0x96: lambda cpu: cpu.res_iX(2, cpu.hl),
+
+            0x9F: lambda cpu: cpu.res_ir(3, cpu.a),
+            0x98: lambda cpu: cpu.res_ir(3, cpu.b),
+            0x99: lambda cpu: cpu.res_ir(3, cpu.c),
+            0x9A: lambda cpu: cpu.res_ir(3, cpu.d),
+            0x9B: lambda cpu: cpu.res_ir(3, cpu.e),
+            0x9C: lambda cpu: cpu.res_ir(3, cpu.h),
+            0x9D: lambda cpu: cpu.res_ir(3, cpu.l),
+            0x9E: lambda cpu: cpu.res_iX(3, cpu.hl),
             
-            0xA7: lambda: self.res_ir(4, self.a),
-            0xA0: lambda: self.res_ir(4, self.b),
-            0xA1: lambda: self.res_ir(4, self.c),
-            0xA2: lambda: self.res_ir(4, self.d),
-            0xA3: lambda: self.res_ir(4, self.e),
-            0xA4: lambda: self.res_ir(4, self.h),
-            0xA5: lambda: self.res_ir(4, self.l),
-            0xA6: lambda: self.res_iX(4, self.hl),
-
-            0xAF: lambda: self.res_ir(5, self.a),
-            0xA8: lambda: self.res_ir(5, self.b),
-            0xA9: lambda: self.res_ir(5, self.c),
-            0xAA: lambda: self.res_ir(5, self.d),
-            0xAB: lambda: self.res_ir(5, self.e),
-            0xAC: lambda: self.res_ir(5, self.h),
-            0xAD: lambda: self.res_ir(5, self.l),
-            0xAE: lambda: self.res_iX(5, self.hl),
-
-            0xB7: lambda: self.res_ir(6, self.a),
-            0xB0: lambda: self.res_ir(6, self.b),
-            0xB1: lambda: self.res_ir(6, self.c),
-            0xB2: lambda: self.res_ir(6, self.d),
-            0xB3: lambda: self.res_ir(6, self.e),
-            0xB4: lambda: self.res_ir(6, self.h),
-            0xB5: lambda: self.res_ir(6, self.l),
-            0xB6: lambda: self.res_iX(6, self.hl),
-
-            0xBF: lambda: self.res_ir(7, self.a),
-            0xB8: lambda: self.res_ir(7, self.b),
-            0xB9: lambda: self.res_ir(7, self.c),
-            0xBA: lambda: self.res_ir(7, self.d),
-            0xBB: lambda: self.res_ir(7, self.e),
-            0xBC: lambda: self.res_ir(7, self.h),
-            0xBD: lambda: self.res_ir(7, self.l),
-            0xBE: lambda: self.res_iX(7, self.hl),
+            0xA7: lambda cpu: cpu.res_ir(4, cpu.a),
+            0xA0: lambda cpu: cpu.res_ir(4, cpu.b),
+            0xA1: lambda cpu: cpu.res_ir(4, cpu.c),
+            0xA2: lambda cpu: cpu.res_ir(4, cpu.d),
+            0xA3: lambda cpu: cpu.res_ir(4, cpu.e),
+            0xA4: lambda cpu: cpu.res_ir(4, cpu.h),
+            0xA5: lambda cpu: cpu.res_ir(4, cpu.l),
+            0xA6: lambda cpu: cpu.res_iX(4, cpu.hl),
+
+            0xAF: lambda cpu: cpu.res_ir(5, cpu.a),
+            0xA8: lambda cpu: cpu.res_ir(5, cpu.b),
+            0xA9: lambda cpu: cpu.res_ir(5, cpu.c),
+            0xAA: lambda cpu: cpu.res_ir(5, cpu.d),
+            0xAB: lambda cpu: cpu.res_ir(5, cpu.e),
+            0xAC: lambda cpu: cpu.res_ir(5, cpu.h),
+            0xAD: lambda cpu: cpu.res_ir(5, cpu.l),
+            0xAE: lambda cpu: cpu.res_iX(5, cpu.hl),
+
+            0xB7: lambda cpu: cpu.res_ir(6, cpu.a),
+            0xB0: lambda cpu: cpu.res_ir(6, cpu.b),
+            0xB1: lambda cpu: cpu.res_ir(6, cpu.c),
+            0xB2: lambda cpu: cpu.res_ir(6, cpu.d),
+            0xB3: lambda cpu: cpu.res_ir(6, cpu.e),
+            0xB4: lambda cpu: cpu.res_ir(6, cpu.h),
+            0xB5: lambda cpu: cpu.res_ir(6, cpu.l),
+            0xB6: lambda cpu: cpu.res_iX(6, cpu.hl),
+
+            0xBF: lambda cpu: cpu.res_ir(7, cpu.a),
+            0xB8: lambda cpu: cpu.res_ir(7, cpu.b),
+            0xB9: lambda cpu: cpu.res_ir(7, cpu.c),
+            0xBA: lambda cpu: cpu.res_ir(7, cpu.d),
+            0xBB: lambda cpu: cpu.res_ir(7, cpu.e),
+            0xBC: lambda cpu: cpu.res_ir(7, cpu.h),
+            0xBD: lambda cpu: cpu.res_ir(7, cpu.l),
+            0xBE: lambda cpu: cpu.res_iX(7, cpu.hl),
 
             # Get Bit
-            0x47: lambda: self.bit_ir(0, self.a),
-            0x40: lambda: self.bit_ir(0, self.b),
-            0x41: lambda: self.bit_ir(0, self.c),
-            0x42: lambda: self.bit_ir(0, self.d),
-            0x43: lambda: self.bit_ir(0, self.e),
-            0x44: lambda: self.bit_ir(0, self.h),
-            0x45: lambda: self.bit_ir(0, self.l),
-            0x46: lambda: self.bit_iX(0, self.hl),
-
-            0x4F: lambda: self.bit_ir(1, self.a),
-            0x48: lambda: self.bit_ir(1, self.b),
-            0x49: lambda: self.bit_ir(1, self.c),
-            0x4A: lambda: self.bit_ir(1, self.d),
-            0x4B: lambda: self.bit_ir(1, self.e),
-            0x4C: lambda: self.bit_ir(1, self.h),
-            0x4D: lambda: self.bit_ir(1, self.l),
-            0x4E: lambda: self.bit_iX(1, self.hl),
-
-            0x57: lambda: self.bit_ir(2, self.a),
-            0x50: lambda: self.bit_ir(2, self.b),
-            0x51: lambda: self.bit_ir(2, self.c),
-            0x52: lambda: self.bit_ir(2, self.d),
-            0x53: lambda: self.bit_ir(2, self.e),
-            0x54: lambda: self.bit_ir(2, self.h),
-            0x55: lambda: self.bit_ir(2, self.l),
-            0x56: lambda: self.bit_iX(2, self.hl),
-
-            0x5F: lambda: self.bit_ir(3, self.a),
-            0x58: lambda: self.bit_ir(3, self.b),
-            0x59: lambda: self.bit_ir(3, self.c),
-            0x5A: lambda: self.bit_ir(3, self.d),
-            0x5B: lambda: self.bit_ir(3, self.e),
-            0x5C: lambda: self.bit_ir(3, self.h),
-            0x5D: lambda: self.bit_ir(3, self.l),
-            0x5E: lambda: self.bit_iX(3, self.hl),
-
-            0x67: lambda: self.bit_ir(4, self.a),
-            0x60: lambda: self.bit_ir(4, self.b),
-            0x61: lambda: self.bit_ir(4, self.c),
-            0x62: lambda: self.bit_ir(4, self.d),
-            0x63: lambda: self.bit_ir(4, self.e),
-            0x64: lambda: self.bit_ir(4, self.h),
-            0x65: lambda: self.bit_ir(4, self.l),
-            0x66: lambda: self.bit_iX(4, self.hl),
-
-            0x6F: lambda: self.bit_ir(5, self.a),
-            0x68: lambda: self.bit_ir(5, self.b),
-            0x69: lambda: self.bit_ir(5, self.c),
-            0x6A: lambda: self.bit_ir(5, self.d),
-            0x6B: lambda: self.bit_ir(5, self.e),
-            0x6C: lambda: self.bit_ir(5, self.h),
-            0x6D: lambda: self.bit_ir(5, self.l),
-            0x6E: lambda: self.bit_iX(5, self.hl),
-
-            0x77: lambda: self.bit_ir(6, self.a),
-            0x70: lambda: self.bit_ir(6, self.b),
-            0x71: lambda: self.bit_ir(6, self.c),
-            0x72: lambda: self.bit_ir(6, self.d),
-            0x73: lambda: self.bit_ir(6, self.e),
-            0x74: lambda: self.bit_ir(6, self.h),
-            0x75: lambda: self.bit_ir(6, self.l),
-            0x76: lambda: self.bit_iX(6, self.hl),
-
-            0x7F: lambda: self.bit_ir(7, self.a),
-            0x78: lambda: self.bit_ir(7, self.b),
-            0x79: lambda: self.bit_ir(7, self.c),
-            0x7A: lambda: self.bit_ir(7, self.d),
-            0x7B: lambda: self.bit_ir(7, self.e),
-            0x7C: lambda: self.bit_ir(7, self.h),
-            0x7D: lambda: self.bit_ir(7, self.l),
-            0x7E: lambda: self.bit_iX(7, self.hl),
+            0x47: lambda cpu: cpu.bit_ir(0, cpu.a),
+            0x40: lambda cpu: cpu.bit_ir(0, cpu.b),
+            0x41: lambda cpu: cpu.bit_ir(0, cpu.c),
+            0x42: lambda cpu: cpu.bit_ir(0, cpu.d),
+            0x43: lambda cpu: cpu.bit_ir(0, cpu.e),
+            0x44: lambda cpu: cpu.bit_ir(0, cpu.h),
+            0x45: lambda cpu: cpu.bit_ir(0, cpu.l),
+            0x46: lambda cpu: cpu.bit_iX(0, cpu.hl),
+
+            0x4F: lambda cpu: cpu.bit_ir(1, cpu.a),
+            0x48: lambda cpu: cpu.bit_ir(1, cpu.b),
+            0x49: lambda cpu: cpu.bit_ir(1, cpu.c),
+            0x4A: lambda cpu: cpu.bit_ir(1, cpu.d),
+            0x4B: lambda cpu: cpu.bit_ir(1, cpu.e),
+            0x4C: lambda cpu: cpu.bit_ir(1, cpu.h),
+            0x4D: lambda cpu: cpu.bit_ir(1, cpu.l),
+            0x4E: lambda cpu: cpu.bit_iX(1, cpu.hl),
+
+            0x57: lambda cpu: cpu.bit_ir(2, cpu.a),
+            0x50: lambda cpu: cpu.bit_ir(2, cpu.b),
+            0x51: lambda cpu: cpu.bit_ir(2, cpu.c),
+            0x52: lambda cpu: cpu.bit_ir(2, cpu.d),
+            0x53: lambda cpu: cpu.bit_ir(2, cpu.e),
+            0x54: lambda cpu: cpu.bit_ir(2, cpu.h),
+            0x55: lambda cpu: cpu.bit_ir(2, cpu.l),
+            0x56: lambda cpu: cpu.bit_iX(2, cpu.hl),
+
+            0x5F: lambda cpu: cpu.bit_ir(3, cpu.a),
+            0x58: lambda cpu: cpu.bit_ir(3, cpu.b),
+            0x59: lambda cpu: cpu.bit_ir(3, cpu.c),
+            0x5A: lambda cpu: cpu.bit_ir(3, cpu.d),
+            0x5B: lambda cpu: cpu.bit_ir(3, cpu.e),
+            0x5C: lambda cpu: cpu.bit_ir(3, cpu.h),
+            0x5D: lambda cpu: cpu.bit_ir(3, cpu.l),
+            0x5E: lambda cpu: cpu.bit_iX(3, cpu.hl),
+
+            0x67: lambda cpu: cpu.bit_ir(4, cpu.a),
+            0x60: lambda cpu: cpu.bit_ir(4, cpu.b),
+            0x61: lambda cpu: cpu.bit_ir(4, cpu.c),
+            0x62: lambda cpu: cpu.bit_ir(4, cpu.d),
+            0x63: lambda cpu: cpu.bit_ir(4, cpu.e),
+            0x64: lambda cpu: cpu.bit_ir(4, cpu.h),
+            0x65: lambda cpu: cpu.bit_ir(4, cpu.l),
+            0x66: lambda cpu: cpu.bit_iX(4, cpu.hl),
+
+            0x6F: lambda cpu: cpu.bit_ir(5, cpu.a),
+            0x68: lambda cpu: cpu.bit_ir(5, cpu.b),
+            0x69: lambda cpu: cpu.bit_ir(5, cpu.c),
+            0x6A: lambda cpu: cpu.bit_ir(5, cpu.d),
+            0x6B: lambda cpu: cpu.bit_ir(5, cpu.e),
+            0x6C: lambda cpu: cpu.bit_ir(5, cpu.h),
+            0x6D: lambda cpu: cpu.bit_ir(5, cpu.l),
+            0x6E: lambda cpu: cpu.bit_iX(5, cpu.hl),
+
+            0x77: lambda cpu: cpu.bit_ir(6, cpu.a),
+            0x70: lambda cpu: cpu.bit_ir(6, cpu.b),
+            0x71: lambda cpu: cpu.bit_ir(6, cpu.c),
+            0x72: lambda cpu: cpu.bit_ir(6, cpu.d),
+            0x73: lambda cpu: cpu.bit_ir(6, cpu.e),
+            0x74: lambda cpu: cpu.bit_ir(6, cpu.h),
+            0x75: lambda cpu: cpu.bit_ir(6, cpu.l),
+            0x76: lambda cpu: cpu.bit_iX(6, cpu.hl),
+
+            0x7F: lambda cpu: cpu.bit_ir(7, cpu.a),
+            0x78: lambda cpu: cpu.bit_ir(7, cpu.b),
+            0x79: lambda cpu: cpu.bit_ir(7, cpu.c),
+            0x7A: lambda cpu: cpu.bit_ir(7, cpu.d),
+            0x7B: lambda cpu: cpu.bit_ir(7, cpu.e),
+            0x7C: lambda cpu: cpu.bit_ir(7, cpu.h),
+            0x7D: lambda cpu: cpu.bit_ir(7, cpu.l),
+            0x7E: lambda cpu: cpu.bit_iX(7, cpu.hl),
         }
+    return OP_TABLE, CB_OP_TABLE
+
+class CPU:
+    def __init__(self, mem, interrupts, debug_instructions, debug_registers, lazy_flags=False, fast=False):
+        self.debug_instructions = debug_instructions
+        self.debug_registers = debug_registers
+        self.lazy_flags = lazy_flags # only work out flags when an instruction reads them
+        self.trace = None # tracebuffer.Trace recording each instruction, see Trace.attach()
+        self.fast_ops = cpu_fast.OPS # the generated table fast selects, a traced one while tracing
+        self.fast = fast # run the generated interpreter in cpu_fast.py, prints no debug output, see the property
+        if fast:
+            self.run = self.runFast
+        self.run_state = "RUN" # possible values: RUN, HALT, STOP, QUIT
+        self.mem = mem
+        self.cycles = 0 # machine cycles
+        self.op_desc = "" # Stores a human readable string of the current operation for debugging
+
+        self.a      = registers.RegisterByte(0x0, "A")
+        if lazy_flags:
+            self.f  = registers.LazyRegisterFlag(0xB0, "F")
+            self.addBase = self.addBaseLazy
+            self.subBase = self.subBaseLazy
+            self.cpBase = self.cpBaseLazy
+            self.inc_r = self.inc_rLazy
+            self.dec_r = self.dec_rLazy
+        else:
+            self.f  = registers.RegisterFlag(0xB0, "F")
+        self.b      = registers.RegisterByte(0x0, "B")
+        self.c      = registers.RegisterByte(0x13, "C")
+        self.d      = registers.RegisterByte(0x0, "D")
+        self.e      = registers.RegisterByte(0xD8, "E")
+        self.h      = registers.RegisterByte(0x1, "H")
+        self.l      = registers.RegisterByte(0x4D, "L")
+        self.af     = registers.RegisterWord(self.a, self.f, "AF")
+        self.bc     = registers.RegisterWord(self.b, self.c, "BC")
+        self.de     = registers.RegisterWord(self.d, self.e, "DE")
+        self.hl     = registers.RegisterWord(self.h, self.l, "HL")
+        self.pc     = registers.RegisterWord.fromValue(0x100, "PC")
+        self.sp     = registers.RegisterWord.fromValue(0xFFFE, "SP")
+
+        self.interrupts = interrupts
+        interrupts.setCall(self.callBase)
 
     def run(self):
+        if self.trace is not None:
+            self.trace.record(self)
         self.op_desc = "main_loop" #dummy value used to check if set
         instruction = self.mem.read(int(self.pc))
+        op_table = OP_TABLE or opTables()[0]
 
-        if instruction in self.op_table:
-            self.op_table[instruction]()
+        if instruction in op_table:
+            op_table[instruction](self)
         else:
             msg = "{}: Instruction {} not implemented! AAAAGH!! ... I'm dead ..."
             print(msg.format(asmHex(int(self.pc), 4), asmHex(instruction)))
@@ -641,12 +681,29 @@ class CPU:
         if self.debug_registers:
             self.displayRegisters()
 
+    def runFast(self):
+        ops = self.ops
+        if ops is None: # fast is off, the classic interpreter fetches the opcode itself
+            CPU.run(self)
+            return
+        pc = self.pc
+        ops[self.mem.read((pc.r1.value << 8) | pc.r2.value)](self)
+
+    @property
+    def fast(self):
+        return self.ops is not None
+
+    @fast.setter
+    def fast(self, fast):
+        "Clearing it makes runFast() run the classic interpreter, for whatever wrapped cpu.run in the meantime"
+        self.ops = self.fast_ops if fast else None
+
     def cb_prefix(self):
         self.pc += 1
         self.op_desc = "cb_prefix"
         instruction = self.mem.read(int(self.pc))
-        if instruction in self.cb_op_table:
-            self.cb_op_table[instruction]()
+        if instruction in CB_OP_TABLE:
+            CB_OP_TABLE[instruction](self)
         else:
             msg = "{}: Instruction $CB+{} not implemented! AAAAGH!! ... I'm dead ..."
             print(msg.format(asmHex(int(self.pc), 4), asmHex(instruction)))
@@ -680,7 +737,7 @@ class CPU:
         print("pc:", asmHex(int(self.pc), 4))
         print("sp:", asmHex(int(self.sp), 4))
         print("ROM bank", self.mem.rom_bank)
-        print("Cart RAM bank", self.mem.cart_ram_bank)
+        print("Cart RAM bank", self.mem.mbc.ram_bank)
         print("------------------------------------------------")
 
     def popCycles(self):
@@ -689,18 +746,8 @@ class CPU:
         return value
 
     def checkFlag(self, flagType):
-        if flagType == "NZ":
-            return not self.f.getZero()
-        elif flagType == "Z":
-            return self.f.getZero()
-        elif flagType == "NC":
-            return not self.f.getCarry()
-        elif flagType == "C":
-            return self.f.getCarry()
-        elif flagType == "Always":
-            return True
-        else:
-            assert(False)
+        mask, expected = CONDITIONS[flagType]
+        return (self.f.value & mask) == expected
 
     def getImmediateWord(self):
         value = self.mem.read(int(self.pc)+1) + (self.mem.read(int(self.pc)+2) << 8)
@@ -916,12 +963,10 @@ class CPU:
 
     # Compare
     def cpBase(self, byte):
-        value = int(self.a) - byte
-        new_value = value % 0x100
-        self.f.setZero(new_value == 0)
-        self.f.setSubtract(True)
-        self.f.setHalfCarry(bool(new_value & 0b00010000)) #TODO: VERIFY
-        self.f.setCarry(value != new_value)
+        self.f.value = alu.SUB[(self.a.value << 8) | byte] & 0xFF
+
+    def cpBaseLazy(self, byte):
+        self.f.defer(alu.SUB, (self.a.value << 8) | byte)
 
     def cp_r(self, r):
         self.setOpDesc("CP", r.getName())
@@ -1040,14 +1085,15 @@ class CPU:
         self.cycles += 8
 
     # ADD
-    def addBase(self, byte):
-        value = int(self.a) + byte
-        newValue = value % 0x100
-        self.a.set(newValue)
-        self.f.setZero(value == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(self.a.getBit(4))
-        self.f.setCarry(value != newValue)
+    def addBase(self, byte, carry=0):
+        result = alu.ADD[(carry << 16) | (self.a.value << 8) | byte]
+        self.a.value = result >> 8
+        self.f.value = result & 0xFF
+
+    def addBaseLazy(self, byte, carry=0):
+        index = (carry << 16) | (self.a.value << 8) | byte
+        self.a.value = (self.a.value + byte + carry) & 0xFF
+        self.f.defer(alu.ADD, index)
 
     def add_rr(self, r):
         self.setOpDesc("ADD", "A", r.getName())
@@ -1070,20 +1116,20 @@ class CPU:
 
     def adc_rr(self, r):
         self.setOpDesc("ADC", "A", r.getName())
-        self.addBase(int(r) + int(self.f.getCarry()))
+        self.addBase(int(r), int(self.f.getCarry()))
         self.pc += 1
         self.cycles += 1
 
     def adc_rX(self, X):
         self.setOpDesc("ADC", "A", "({})".format(X.getName()))
-        self.addBase(self.mem.read(int(X)) + int(self.f.getCarry()))
+        self.addBase(self.mem.read(int(X)), int(self.f.getCarry()))
         self.pc += 1
         self.cycles += 2
 
     def adc_rb(self):
         b = self.getImmediateByte()
         self.setOpDesc("ADC", "A", asmHex(b))
-        self.addBase(b + int(self.f.getCarry()))
+        self.addBase(b, int(self.f.getCarry()))
         self.pc += 2
         self.cycles += 2
 
@@ -1111,14 +1157,15 @@ class CPU:
         self.sp.set(value)
 
     # SUB
-    def subBase(self, byte):
-        value = int(self.a) - byte
-        newValue = value % 0x100
-        self.a.set(newValue)
-        self.f.setZero(value == 0)
-        self.f.setSubtract(True)
-        self.f.setHalfCarry(self.a.getBit(4)) #TODO: VERIFY
-        self.f.setCarry(value != newValue)
+    def subBase(self, byte, carry=0):
+        result = alu.SUB[(carry << 16) | (self.a.value << 8) | byte]
+        self.a.value = result >> 8
+        self.f.value = result & 0xFF
+
+    def subBaseLazy(self, byte, carry=0):
+        index = (carry << 16) | (self.a.value << 8) | byte
+        self.a.value = (self.a.value - byte - carry) & 0xFF
+        self.f.defer(alu.SUB, index)
 
     def sub_rr(self, r):
         self.setOpDesc("SUB", "A", r.getName())
@@ -1140,21 +1187,21 @@ class CPU:
         self.cycles += 2
 
     def sbc_rr(self, r):
-        self.setOpDesc("SUB", "A", r.getName())
-        self.subBase(int(r) - int(self.f.getCarry()))
+        self.setOpDesc("SBC", "A", r.getName())
+        self.subBase(int(r), int(self.f.getCarry()))
         self.pc += 1
         self.cycles += 1
 
     def sbc_rX(self, X):
-        self.setOpDesc("SUB", "A", "({})".format(X.getName()))
-        self.subBase(self.mem.read(int(X)) - int(self.f.getCarry()))
+        self.setOpDesc("SBC", "A", "({})".format(X.getName()))
+        self.subBase(self.mem.read(int(X)), int(self.f.getCarry()))
         self.pc += 1
         self.cycles += 2
 
     def sbc_rb(self):
         b = self.getImmediateByte()
-        self.setOpDesc("SUB", "A", asmHex(b))
-        self.subBase(b - int(self.f.getCarry()))
+        self.setOpDesc("SBC", "A", asmHex(b))
+        self.subBase(b, int(self.f.getCarry()))
         self.pc += 2
         self.cycles += 2
 
@@ -1245,23 +1292,27 @@ class CPU:
     # INC
     def inc_r(self, r):
         self.setOpDesc("INC", r.getName())
-        newValue = (int(r) + 1) % 0x100
-        r.set(newValue)
+        result = alu.INC[r.value]
+        r.value = result >> 8
+        self.f.value = (result & 0xE0) | (self.f.value & 0x10)
+        self.pc += 1
+        self.cycles += 1
+
+    def inc_rLazy(self, r):
+        self.setOpDesc("INC", r.getName())
+        self.f.defer(alu.INC, r.value, 0x10)
+        r.value = (r.value + 1) & 0xFF
         self.pc += 1
         self.cycles += 1
-        self.f.setZero(newValue == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(r.getBit(4))
 
     def inc_X(self):
         self.setOpDesc("INC", "(HL)")
-        newValue = (self.mem.read(int(self.hl)) + 1) % 0x100
-        self.mem.write(int(self.hl), newValue)
+        address = int(self.hl)
+        result = alu.INC[self.mem.read(address)]
+        self.mem.write(address, result >> 8)
+        self.f.value = (result & 0xE0) | (self.f.value & 0x10)
         self.pc += 1
         self.cycles += 3
-        self.f.setZero(newValue == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(bool(newValue & 0b1000))
 
     def inc_x(self, x):
         self.setOpDesc("INC", x.getName())
@@ -1272,23 +1323,27 @@ class CPU:
     # DEC
     def dec_r(self, r):
         self.setOpDesc("DEC", r.getName())
-        newValue = (int(r) - 1) % 0x100
-        r.set(newValue)
+        result = alu.DEC[r.value]
+        r.value = result >> 8
+        self.f.value = (result & 0xE0) | (self.f.value & 0x10)
+        self.pc += 1
+        self.cycles += 1
+
+    def dec_rLazy(self, r):
+        self.setOpDesc("DEC", r.getName())
+        self.f.defer(alu.DEC, r.value, 0x10)
+        r.value = (r.value - 1) & 0xFF
         self.pc += 1
         self.cycles += 1
-        self.f.setZero(newValue == 0)
-        self.f.setSubtract(True)
-        self.f.setHalfCarry(r.getBit(4))
 
     def dec_X(self):
         self.setOpDesc("DEC", "(HL)")
-        newValue = (self.mem.read(int(self.hl)) -1) % 0x100
-        self.mem.write(int(self.hl), newValue)
+        address = int(self.hl)
+        result = alu.DEC[self.mem.read(address)]
+        self.mem.write(address, result >> 8)
+        self.f.value = (result & 0xE0) | (self.f.value & 0x10)
         self.pc += 1
         self.cycles += 3
-        self.f.setZero(newValue == 0)
-        self.f.setSubtract(True)
-        self.f.setHalfCarry(bool(newValue & 0b1000))
 
     def dec_x(self, x):
         self.setOpDesc("DEC", x.getName())
@@ -1299,230 +1354,115 @@ class CPU:
     # Misc ALU
     def daa(self):
         self.setOpDesc("DAA")
-
-        addend = 6
-        if self.f.getSubtract():
-            addend *= -1
-
-        value = int(self.a)
-        if (value & 0x00FF) > 9 or self.f.getHalfCarry():
-            value += addend
-        if ((value & 0xFF00) >> 4) > 9 or self.f.getCarry():
-            value += addend * 10
-
-        modValue = value % 0x100
-
-        self.f.setCarry(value != modValue)
-        self.a.set(modValue)
+        result = alu.DAA[((self.f.value >> 4) << 8) | self.a.value]
+        self.a.value = result >> 8
+        self.f.value = result & 0xFF
         self.pc += 1
         self.cycles += 1
-        self.f.setZero(value == 0)
-        self.f.setHalfCarry(False)
 
     def cpl(self):
         self.setOpDesc("CPL")
-        self.a.set(~int(self.a))
+        self.a.set(~int(self.a) & 0xFF)
         self.pc += 1
         self.cycles += 1
         self.f.setSubtract(True)
         self.f.setHalfCarry(True)
 
     # Rotates
-    def rotateBase(self):
+    # The accumulator rotates always clear the zero flag, the $CB versions set it from the result
+    def rotateA(self, result):
+        self.a.value = result >> 8
+        self.f.value = result & 0x10
         self.pc += 1
-        self.f.setZero(self.a == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(False)
+        self.cycles += 1
 
     def rlca(self):
-        self.setOpDesc("RRCA")
-        carry = self.a.getBit(7)
-        newValue = ((int(self.a) << 1) | int(carry)) & 0xFF
-        self.f.setCarry(carry)
-        self.a.set(newValue)
-        self.cycles += 1
-        self.rotateBase()
+        self.setOpDesc("RLCA")
+        self.rotateA(alu.RLC[self.a.value])
 
     def rrca(self):
         self.setOpDesc("RRCA")
-        carry = self.a.getBit(0)
-        newValue = (int(self.a) >> 1) | (int(carry) << 7)
-        self.f.setCarry(carry)
-        self.a.set(newValue)
-        self.cycles += 1
-        self.rotateBase()
+        self.rotateA(alu.RRC[self.a.value])
 
     def rla(self):
         self.setOpDesc("RLA")
-        newValue = ((int(self.a) << 1) | int(self.f.getCarry())) & 0xFF
-        self.f.setCarry(self.a.getBit(7))
-        self.a.set(newValue)
-        self.cycles += 1
-        self.rotateBase()
+        self.rotateA(alu.RL[(int(self.f.getCarry()) << 8) | self.a.value])
 
     def rra(self):
         self.setOpDesc("RRA")
-        newValue = (int(self.a) >> 1) | (int(self.f.getCarry()) << 7)
-        self.f.setCarry(self.a.getBit(0))
-        self.a.set(newValue)
-        self.cycles += 1
-        self.rotateBase()
+        self.rotateA(alu.RR[(int(self.f.getCarry()) << 8) | self.a.value])
+
+    def shift_r(self, table, r, carry=0):
+        result = table[(carry << 8) | r.value]
+        r.value = result >> 8
+        self.f.value = result & 0xFF
+        self.pc += 1
+        self.cycles += 2
+
+    def shift_X(self, table, X, carry=0):
+        address = int(X)
+        result = table[(carry << 8) | self.mem.read(address)]
+        self.mem.write(address, result >> 8)
+        self.f.value = result & 0xFF
+        self.pc += 1
+        self.cycles += 4
 
     def rlc_r(self, r):
         self.setOpDesc("RLC", r.getName())
-        carry = r.getBit(7)
-        newValue = (int(r) << 1) | int(carry) & 0xFF
-        self.f.setCarry(carry)
-        r.set(newValue)
-        self.cycles += 2
-        self.rotateBase()
+        self.shift_r(alu.RLC, r)
 
     def rrc_r(self, r):
         self.setOpDesc("RRC", r.getName())
-        carry = r.getBit(0)
-        newValue = (int(r) >> 1) | (int(carry) << 7)
-        self.f.setCarry(carry)
-        r.set(newValue)
-        self.cycles += 2
-        self.rotateBase()
+        self.shift_r(alu.RRC, r)
 
     def rl_r(self, r):
         self.setOpDesc("RL", r.getName())
-        newValue = ((int(r) << 1) | int(self.f.getCarry())) & 0xFF
-        self.f.setCarry(r.getBit(7))
-        r.set(newValue)
-        self.cycles += 2
-        self.rotateBase()
+        self.shift_r(alu.RL, r, int(self.f.getCarry()))
 
     def rr_r(self, r):
         self.setOpDesc("RR", r.getName())
-        newValue = (int(r) >> 1) | (int(self.f.getCarry()) << 7)
-        self.f.setCarry(r.getBit(0))
-        r.set(newValue)
-        self.cycles += 2
-        self.rotateBase()
+        self.shift_r(alu.RR, r, int(self.f.getCarry()))
 
     def rlc_X(self, X):
         self.setOpDesc("RLC", "({})".format(X.getName()))
-        address = int(X)
-        value = self.mem.read(address)
-
-        carry = (value & 0b10000000) >> 7
-        newValue = ((value << 1) | int(carry)) & 0xFF
-        self.f.setCarry(carry)
-        self.mem.write(address, value)
-        self.cycles += 4
-        self.rotateBase()
+        self.shift_X(alu.RLC, X)
 
     def rrc_X(self, X):
         self.setOpDesc("RRC", "({})".format(X.getName()))
-        address = int(X)
-        value = self.mem.read(address)
-
-        carry = value & 1
-        newValue = (value >> 1) | (int(carry) << 7)
-        self.f.setCarry(carry)
-        self.mem.write(address, newValue)
-        self.cycles += 4
-        self.rotateBase()
+        self.shift_X(alu.RRC, X)
 
     def rl_X(self, X):
-        self.setOpDesc("RRA", "({})".format(X.getName()))
-        address = int(X)
-        value = self.mem.read(address)
-
-        newValue = ((value << 1) | int(self.f.getCarry())) & 0xFF
-        self.f.setCarry((value & 0b10000000) >> 7)
-        self.mem.write(address, newValue)
-        self.cycles += 4
-        self.rotateBase()
+        self.setOpDesc("RL", "({})".format(X.getName()))
+        self.shift_X(alu.RL, X, int(self.f.getCarry()))
 
     def rr_X(self, X):
-        self.setOpDesc("RRA", "({})".format(X.getName()))
-        address = int(X)
-        value = self.mem.read(address)
-
-        newValue = (value >> 1) | (int(self.f.getCarry()) << 7)
-        self.f.setCarry(value & 1)
-        self.mem.write(address, newValue)
-        self.cycles += 4
-        self.rotateBase()
+        self.setOpDesc("RR", "({})".format(X.getName()))
+        self.shift_X(alu.RR, X, int(self.f.getCarry()))
 
     # Shifts
     def sla_r(self, r):
         self.setOpDesc("SLA", r.getName())
-        self.f.setCarry(r.getBit(7))
-        r.set((int(r) << 1) & 0xFF)
-    
-        self.pc += 1
-        self.cycles += 2
-        self.f.setZero(int(r) == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(False)
+        self.shift_r(alu.SLA, r)
 
     def sla_X(self, X):
         self.setOpDesc("SLA", "({})".format(X.getName()))
-        location = int(X)
-        b = self.mem.read(location)
-        self.f.setCarry(bool(b & 0b10000000))
-        value = (b << 1) & 0xFF
-        self.mem.write(location, value)
-
-        self.pc += 1
-        self.cycles += 4
-        self.f.setZero(value == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(False)
+        self.shift_X(alu.SLA, X)
 
     def sra_r(self, r):
         self.setOpDesc("SRA", r.getName())
-        self.f.setCarry(r.getBit(0))
-        r.set((int(r) >> 1) | (int(r) & 0b10000000))
-
-        self.pc += 1
-        self.cycles += 2
-        self.f.setZero(int(r) == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(False)
+        self.shift_r(alu.SRA, r)
 
     def sra_X(self, X):
         self.setOpDesc("SRA", "({})".format(X.getName()))
-        location = int(X)
-        b = self.mem.read(location)
-        self.f.setCarry(bool(b & 1))
-        value = (b >> 1) | (b & 0b10000000)
-        self.mem.write(location, value)
-
-        self.pc += 1
-        self.cycles += 4
-        self.f.setZero(value == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(False)
+        self.shift_X(alu.SRA, X)
 
     def srl_r(self, r):
         self.setOpDesc("SRL", r.getName())
-        self.f.setCarry(r.getBit(0))
-        r.set(int(r) >> 1)
-
-        self.pc += 1
-        self.cycles += 2
-        self.f.setZero(int(r) == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(False)
+        self.shift_r(alu.SRL, r)
 
     def srl_X(self, X):
         self.setOpDesc("SRL", "({})".format(X.getName()))
-        location = int(X)
-        b = self.mem.read(location)
-        self.f.setCarry(bool(b & 1))
-        value = b >> 1
-        self.mem.write(location, value)
-
-        self.pc += 1
-        self.cycles += 4
-        self.f.setZero(value == 0)
-        self.f.setSubtract(False)
-        self.f.setHalfCarry(False)
+        self.shift_X(alu.SRL, X)
 
     # Set Bit
     def set_ir(self, i, r):
@@ -1585,30 +1525,11 @@ class CPU:
     # Swap
     def swap_r(self, r):
         self.setOpDesc("SWAP", "{}".format(r.getName()))
-        value = int(r)
-        newValue = ((value & 0xF0) >> 4) & ((value & 0x0F) << 4)
-        r.set(newValue)
-
-        self.f.setZero(newValue == 0)
-        self.f.setSubtract(0)
-        self.f.setHalfCarry(0)
-        self.f.setCarry(0)
-        self.pc += 1
-        self.cycles += 2
+        self.shift_r(alu.SWAP, r)
 
     def swap_X(self):
         self.setOpDesc("SWAP", "(HL)")
-        address = int(self.hl)
-        value = self.mem.read(address)
-        newValue = ((value & 0xF0) >> 4) & ((value & 0x0F) << 4)
-        self.mem.write(address, newValue)
-
-        self.f.setZero(newValue == 0)
-        self.f.setSubtract(0)
-        self.f.setHalfCarry(0)
-        self.f.setCarry(0)
-        self.pc += 1
-        self.cycles += 4
+        self.shift_X(alu.SWAP, self.hl)
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,5884 @@
+# Generated by gen_cpu.py from opcodes.py, do not edit
+
+# A specialised interpreter, one function per opcode with operands, flag
+# updates and fast paths for work RAM written out. CPU.runFast() dispatches
+# through OPS.
+
+from alu import ADD, SUB, INC, DEC, DAA, RLC, RRC, RL, RR, SLA, SRA, SRL, SWAP
+
+def push(cpu, value):
+    mem = cpu.mem
+    sp = cpu.sp
+    address = (((sp.r1.value << 8) | sp.r2.value) - 2) & 0xFFFF
+    mem.write((address + 1) & 0xFFFF, value >> 8)
+    mem.write(address, value & 0xFF)
+    sp.r1.value = address >> 8
+    sp.r2.value = address & 0xFF
+
+def pop(cpu):
+    mem = cpu.mem
+    sp = cpu.sp
+    address = (sp.r1.value << 8) | sp.r2.value
+    value = mem.read(address) | (mem.read((address + 1) & 0xFFFF) << 8)
+    address = (address + 2) & 0xFFFF
+    sp.r1.value = address >> 8
+    sp.r2.value = address & 0xFF
+    return value
+
+def invalid(cpu):
+    address = (cpu.pc.r1.value << 8) | cpu.pc.r2.value
+    print("${:04X}: Invalid instruction ${:02X}".format(address, cpu.mem.read(address)))
+    cpu.run_state = "QUIT"
+
+def op_cb(cpu):
+    pc = cpu.pc
+    address = (((pc.r1.value << 8) | pc.r2.value) + 1) & 0xFFFF
+    CB_OPS[cpu.mem.read(address)](cpu)
+
+def op_00(cpu):
+    "NOP"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_01(cpu):
+    "LD BC,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_02(cpu):
+    "LD (BC),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    bc = (cpu.b.value << 8) | cpu.c.value
+    if 0xC000 <= bc < 0xE000:
+        mem.internal_ram[bc - 0xC000] = cpu.a.value
+    else:
+        mem.write(bc, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_03(cpu):
+    "INC BC"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.b.value << 8) | cpu.c.value) + 1) & 0xFFFF
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_04(cpu):
+    "INC B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = INC[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_05(cpu):
+    "DEC B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DEC[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_06(cpu):
+    "LD B,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.b.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_07(cpu):
+    "RLCA"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = RLC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_08(cpu):
+    "LD (a16),SP"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    value = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    mem.write(imm16, value & 0xFF)
+    mem.write((imm16 + 1) & 0xFFFF, value >> 8)
+    cpu.cycles += 5
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_09(cpu):
+    "ADD HL,BC"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.b.value << 8) | cpu.c.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0a(cpu):
+    "LD A,(BC)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    bc = (cpu.b.value << 8) | cpu.c.value
+    cpu.a.value = (mem.internal_ram[bc - 0xC000] if 0xC000 <= bc < 0xE000 else mem.read(bc))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0b(cpu):
+    "DEC BC"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.b.value << 8) | cpu.c.value) - 1) & 0xFFFF
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0c(cpu):
+    "INC C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = INC[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0d(cpu):
+    "DEC C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DEC[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0e(cpu):
+    "LD C,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.c.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0f(cpu):
+    "RRCA"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = RRC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_10(cpu):
+    "STOP"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.run_state = "STOP"
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_11(cpu):
+    "LD DE,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_12(cpu):
+    "LD (DE),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    de = (cpu.d.value << 8) | cpu.e.value
+    if 0xC000 <= de < 0xE000:
+        mem.internal_ram[de - 0xC000] = cpu.a.value
+    else:
+        mem.write(de, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_13(cpu):
+    "INC DE"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.d.value << 8) | cpu.e.value) + 1) & 0xFFFF
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_14(cpu):
+    "INC D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = INC[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_15(cpu):
+    "DEC D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DEC[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_16(cpu):
+    "LD D,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.d.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_17(cpu):
+    "RLA"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_18(cpu):
+    "JR r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    next_pc = (next_pc + offset) & 0xFFFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_19(cpu):
+    "ADD HL,DE"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.d.value << 8) | cpu.e.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1a(cpu):
+    "LD A,(DE)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    de = (cpu.d.value << 8) | cpu.e.value
+    cpu.a.value = (mem.internal_ram[de - 0xC000] if 0xC000 <= de < 0xE000 else mem.read(de))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1b(cpu):
+    "DEC DE"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.d.value << 8) | cpu.e.value) - 1) & 0xFFFF
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1c(cpu):
+    "INC E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = INC[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1d(cpu):
+    "DEC E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DEC[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1e(cpu):
+    "LD E,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.e.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1f(cpu):
+    "RRA"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_20(cpu):
+    "JR NZ,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if not cpu.f.value & 0x80:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_21(cpu):
+    "LD HL,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_22(cpu):
+    "LD (HL+),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.a.value
+    else:
+        mem.write(hl, cpu.a.value)
+    hl = (hl + 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_23(cpu):
+    "INC HL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.h.value << 8) | cpu.l.value) + 1) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_24(cpu):
+    "INC H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = INC[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_25(cpu):
+    "DEC H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DEC[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_26(cpu):
+    "LD H,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.h.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_27(cpu):
+    "DAA"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DAA[((cpu.f.value >> 4) << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_28(cpu):
+    "JR Z,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if cpu.f.value & 0x80:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_29(cpu):
+    "ADD HL,HL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.h.value << 8) | cpu.l.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2a(cpu):
+    "LD A,(HL+)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.a.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    hl = (hl + 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2b(cpu):
+    "DEC HL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.h.value << 8) | cpu.l.value) - 1) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2c(cpu):
+    "INC L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = INC[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2d(cpu):
+    "DEC L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DEC[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2e(cpu):
+    "LD L,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.l.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2f(cpu):
+    "CPL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value ^= 0xFF
+    cpu.f.value |= 0x60
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_30(cpu):
+    "JR NC,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if not cpu.f.value & 0x10:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_31(cpu):
+    "LD SP,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_32(cpu):
+    "LD (HL-),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.a.value
+    else:
+        mem.write(hl, cpu.a.value)
+    hl = (hl - 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_33(cpu):
+    "INC SP"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.sp.r1.value << 8) | cpu.sp.r2.value) + 1) & 0xFFFF
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_34(cpu):
+    "INC (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = INC[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_35(cpu):
+    "DEC (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = DEC[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_36(cpu):
+    "LD (HL),d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = imm8
+    else:
+        mem.write(hl, imm8)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_37(cpu):
+    "SCF"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x80) | 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_38(cpu):
+    "JR C,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if cpu.f.value & 0x10:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_39(cpu):
+    "ADD HL,SP"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3a(cpu):
+    "LD A,(HL-)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.a.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    hl = (hl - 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3b(cpu):
+    "DEC SP"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = (((cpu.sp.r1.value << 8) | cpu.sp.r2.value) - 1) & 0xFFFF
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3c(cpu):
+    "INC A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = INC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3d(cpu):
+    "DEC A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = DEC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3e(cpu):
+    "LD A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.a.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3f(cpu):
+    "CCF"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x90) ^ 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_40(cpu):
+    "LD B,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.b.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_41(cpu):
+    "LD B,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.b.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_42(cpu):
+    "LD B,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.b.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_43(cpu):
+    "LD B,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.b.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_44(cpu):
+    "LD B,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.b.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_45(cpu):
+    "LD B,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.b.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_46(cpu):
+    "LD B,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.b.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_47(cpu):
+    "LD B,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.b.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_48(cpu):
+    "LD C,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.c.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_49(cpu):
+    "LD C,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.c.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4a(cpu):
+    "LD C,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.c.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4b(cpu):
+    "LD C,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.c.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4c(cpu):
+    "LD C,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.c.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4d(cpu):
+    "LD C,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.c.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4e(cpu):
+    "LD C,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.c.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4f(cpu):
+    "LD C,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.c.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_50(cpu):
+    "LD D,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.d.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_51(cpu):
+    "LD D,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.d.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_52(cpu):
+    "LD D,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.d.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_53(cpu):
+    "LD D,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.d.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_54(cpu):
+    "LD D,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.d.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_55(cpu):
+    "LD D,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.d.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_56(cpu):
+    "LD D,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.d.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_57(cpu):
+    "LD D,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.d.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_58(cpu):
+    "LD E,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.e.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_59(cpu):
+    "LD E,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.e.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5a(cpu):
+    "LD E,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.e.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5b(cpu):
+    "LD E,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.e.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5c(cpu):
+    "LD E,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.e.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5d(cpu):
+    "LD E,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.e.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5e(cpu):
+    "LD E,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.e.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5f(cpu):
+    "LD E,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.e.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_60(cpu):
+    "LD H,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.h.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_61(cpu):
+    "LD H,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.h.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_62(cpu):
+    "LD H,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.h.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_63(cpu):
+    "LD H,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.h.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_64(cpu):
+    "LD H,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.h.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_65(cpu):
+    "LD H,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.h.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_66(cpu):
+    "LD H,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.h.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_67(cpu):
+    "LD H,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.h.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_68(cpu):
+    "LD L,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.l.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_69(cpu):
+    "LD L,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.l.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6a(cpu):
+    "LD L,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.l.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6b(cpu):
+    "LD L,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.l.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6c(cpu):
+    "LD L,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.l.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6d(cpu):
+    "LD L,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.l.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6e(cpu):
+    "LD L,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.l.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6f(cpu):
+    "LD L,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.l.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_70(cpu):
+    "LD (HL),B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.b.value
+    else:
+        mem.write(hl, cpu.b.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_71(cpu):
+    "LD (HL),C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.c.value
+    else:
+        mem.write(hl, cpu.c.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_72(cpu):
+    "LD (HL),D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.d.value
+    else:
+        mem.write(hl, cpu.d.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_73(cpu):
+    "LD (HL),E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.e.value
+    else:
+        mem.write(hl, cpu.e.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_74(cpu):
+    "LD (HL),H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.h.value
+    else:
+        mem.write(hl, cpu.h.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_75(cpu):
+    "LD (HL),L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.l.value
+    else:
+        mem.write(hl, cpu.l.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_76(cpu):
+    "HALT"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    if cpu.interrupts.getIME():
+        cpu.run_state = "HALT"
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_77(cpu):
+    "LD (HL),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.a.value
+    else:
+        mem.write(hl, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_78(cpu):
+    "LD A,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_79(cpu):
+    "LD A,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7a(cpu):
+    "LD A,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7b(cpu):
+    "LD A,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7c(cpu):
+    "LD A,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7d(cpu):
+    "LD A,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7e(cpu):
+    "LD A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.a.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7f(cpu):
+    "LD A,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.a.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_80(cpu):
+    "ADD A,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[(cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_81(cpu):
+    "ADD A,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[(cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_82(cpu):
+    "ADD A,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[(cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_83(cpu):
+    "ADD A,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[(cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_84(cpu):
+    "ADD A,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[(cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_85(cpu):
+    "ADD A,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[(cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_86(cpu):
+    "ADD A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = ADD[(cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_87(cpu):
+    "ADD A,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[(cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_88(cpu):
+    "ADC A,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_89(cpu):
+    "ADC A,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8a(cpu):
+    "ADC A,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8b(cpu):
+    "ADC A,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8c(cpu):
+    "ADC A,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8d(cpu):
+    "ADC A,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8e(cpu):
+    "ADC A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8f(cpu):
+    "ADC A,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_90(cpu):
+    "SUB B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[(cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_91(cpu):
+    "SUB C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[(cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_92(cpu):
+    "SUB D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[(cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_93(cpu):
+    "SUB E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[(cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_94(cpu):
+    "SUB H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[(cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_95(cpu):
+    "SUB L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[(cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_96(cpu):
+    "SUB (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SUB[(cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_97(cpu):
+    "SUB A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[(cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_98(cpu):
+    "SBC A,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_99(cpu):
+    "SBC A,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9a(cpu):
+    "SBC A,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9b(cpu):
+    "SBC A,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9c(cpu):
+    "SBC A,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9d(cpu):
+    "SBC A,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9e(cpu):
+    "SBC A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9f(cpu):
+    "SBC A,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a0(cpu):
+    "AND B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value & cpu.b.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a1(cpu):
+    "AND C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value & cpu.c.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a2(cpu):
+    "AND D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value & cpu.d.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a3(cpu):
+    "AND E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value & cpu.e.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a4(cpu):
+    "AND H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value & cpu.h.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a5(cpu):
+    "AND L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value & cpu.l.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a6(cpu):
+    "AND (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    value = cpu.a.value & (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a7(cpu):
+    "AND A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value & cpu.a.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a8(cpu):
+    "XOR B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value ^ cpu.b.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a9(cpu):
+    "XOR C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value ^ cpu.c.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_aa(cpu):
+    "XOR D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value ^ cpu.d.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ab(cpu):
+    "XOR E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value ^ cpu.e.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ac(cpu):
+    "XOR H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value ^ cpu.h.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ad(cpu):
+    "XOR L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value ^ cpu.l.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ae(cpu):
+    "XOR (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    value = cpu.a.value ^ (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_af(cpu):
+    "XOR A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value ^ cpu.a.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b0(cpu):
+    "OR B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value | cpu.b.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b1(cpu):
+    "OR C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value | cpu.c.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b2(cpu):
+    "OR D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value | cpu.d.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b3(cpu):
+    "OR E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value | cpu.e.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b4(cpu):
+    "OR H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value | cpu.h.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b5(cpu):
+    "OR L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value | cpu.l.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b6(cpu):
+    "OR (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    value = cpu.a.value | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b7(cpu):
+    "OR A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    value = cpu.a.value | cpu.a.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b8(cpu):
+    "CP B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.b.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b9(cpu):
+    "CP C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.c.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ba(cpu):
+    "CP D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.d.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bb(cpu):
+    "CP E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.e.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bc(cpu):
+    "CP H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.h.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bd(cpu):
+    "CP L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.l.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_be(cpu):
+    "CP (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = SUB[(cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))] & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bf(cpu):
+    "CP A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.a.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c0(cpu):
+    "RET NZ"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    if not cpu.f.value & 0x80:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c1(cpu):
+    "POP BC"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = pop(cpu)
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c2(cpu):
+    "JP NZ,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x80:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c3(cpu):
+    "JP a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    next_pc = imm16
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c4(cpu):
+    "CALL NZ,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x80:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c5(cpu):
+    "PUSH BC"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, ((cpu.b.value << 8) | cpu.c.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c6(cpu):
+    "ADD A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = ADD[(cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c7(cpu):
+    "RST $00"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x00
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c8(cpu):
+    "RET Z"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    if cpu.f.value & 0x80:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c9(cpu):
+    "RET"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    next_pc = pop(cpu)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ca(cpu):
+    "JP Z,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x80:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cc(cpu):
+    "CALL Z,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x80:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cd(cpu):
+    "CALL a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    push(cpu, next_pc)
+    next_pc = imm16
+    cpu.cycles += 6
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ce(cpu):
+    "ADC A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cf(cpu):
+    "RST $08"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x08
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d0(cpu):
+    "RET NC"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    if not cpu.f.value & 0x10:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d1(cpu):
+    "POP DE"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = pop(cpu)
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d2(cpu):
+    "JP NC,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x10:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d4(cpu):
+    "CALL NC,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x10:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d5(cpu):
+    "PUSH DE"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, ((cpu.d.value << 8) | cpu.e.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d6(cpu):
+    "SUB d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = SUB[(cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d7(cpu):
+    "RST $10"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x10
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d8(cpu):
+    "RET C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    if cpu.f.value & 0x10:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d9(cpu):
+    "RETI"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    next_pc = pop(cpu)
+    cpu.interrupts.setIME(True)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_da(cpu):
+    "JP C,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x10:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_dc(cpu):
+    "CALL C,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x10:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_de(cpu):
+    "SBC A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_df(cpu):
+    "RST $18"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x18
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e0(cpu):
+    "LDH (a8),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    address = 0xFF00 | imm8
+    mem.write(address, cpu.a.value)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e1(cpu):
+    "POP HL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = pop(cpu)
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e2(cpu):
+    "LD (C),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    address = 0xFF00 | cpu.c.value
+    mem.write(address, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e5(cpu):
+    "PUSH HL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, ((cpu.h.value << 8) | cpu.l.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e6(cpu):
+    "AND d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    value = cpu.a.value & imm8
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e7(cpu):
+    "RST $20"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x20
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e8(cpu):
+    "ADD SP,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    base = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    cpu.f.value = ((((base & 0xF) + (offset & 0xF)) > 0xF) << 5) | ((((base & 0xFF) + (offset & 0xFF)) > 0xFF) << 4)
+    word = (base + offset) & 0xFFFF
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e9(cpu):
+    "JP HL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    next_pc = ((cpu.h.value << 8) | cpu.l.value)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ea(cpu):
+    "LD (a16),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if 0xC000 <= imm16 < 0xE000:
+        mem.internal_ram[imm16 - 0xC000] = cpu.a.value
+    else:
+        mem.write(imm16, cpu.a.value)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ee(cpu):
+    "XOR d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    value = cpu.a.value ^ imm8
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ef(cpu):
+    "RST $28"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x28
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f0(cpu):
+    "LDH A,(a8)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    address = 0xFF00 | imm8
+    cpu.a.value = mem.read(address)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f1(cpu):
+    "POP AF"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = pop(cpu)
+    cpu.a.value = word >> 8
+    cpu.f.value = word & 0xF0
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f2(cpu):
+    "LD A,(C)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    address = 0xFF00 | cpu.c.value
+    cpu.a.value = mem.read(address)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f3(cpu):
+    "DI"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.interrupts.setIME(False)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f5(cpu):
+    "PUSH AF"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, ((cpu.a.value << 8) | cpu.f.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f6(cpu):
+    "OR d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    value = cpu.a.value | imm8
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f7(cpu):
+    "RST $30"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x30
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f8(cpu):
+    "LD HL,SP+r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    base = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    cpu.f.value = ((((base & 0xF) + (offset & 0xF)) > 0xF) << 5) | ((((base & 0xFF) + (offset & 0xFF)) > 0xFF) << 4)
+    word = (base + offset) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f9(cpu):
+    "LD SP,HL"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    word = ((cpu.h.value << 8) | cpu.l.value)
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_fa(cpu):
+    "LD A,(a16)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    cpu.a.value = (mem.internal_ram[imm16 - 0xC000] if 0xC000 <= imm16 < 0xE000 else mem.read(imm16))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_fb(cpu):
+    "EI"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    cpu.interrupts.setIME(True)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_fe(cpu):
+    "CP d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.f.value = SUB[(cpu.a.value << 8) | imm8] & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ff(cpu):
+    "RST $38"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    push(cpu, next_pc)
+    next_pc = 0x38
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb00(cpu):
+    "RLC B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RLC[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb01(cpu):
+    "RLC C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RLC[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb02(cpu):
+    "RLC D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RLC[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb03(cpu):
+    "RLC E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RLC[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb04(cpu):
+    "RLC H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RLC[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb05(cpu):
+    "RLC L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RLC[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb06(cpu):
+    "RLC (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = RLC[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb07(cpu):
+    "RLC A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RLC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb08(cpu):
+    "RRC B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RRC[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb09(cpu):
+    "RRC C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RRC[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb0a(cpu):
+    "RRC D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RRC[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb0b(cpu):
+    "RRC E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RRC[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb0c(cpu):
+    "RRC H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RRC[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb0d(cpu):
+    "RRC L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RRC[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb0e(cpu):
+    "RRC (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = RRC[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb0f(cpu):
+    "RRC A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RRC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb10(cpu):
+    "RL B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb11(cpu):
+    "RL C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb12(cpu):
+    "RL D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb13(cpu):
+    "RL E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb14(cpu):
+    "RL H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb15(cpu):
+    "RL L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb16(cpu):
+    "RL (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = RL[((cpu.f.value & 0x10) << 4) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb17(cpu):
+    "RL A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb18(cpu):
+    "RR B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb19(cpu):
+    "RR C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb1a(cpu):
+    "RR D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb1b(cpu):
+    "RR E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb1c(cpu):
+    "RR H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb1d(cpu):
+    "RR L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb1e(cpu):
+    "RR (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = RR[((cpu.f.value & 0x10) << 4) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb1f(cpu):
+    "RR A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb20(cpu):
+    "SLA B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SLA[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb21(cpu):
+    "SLA C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SLA[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb22(cpu):
+    "SLA D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SLA[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb23(cpu):
+    "SLA E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SLA[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb24(cpu):
+    "SLA H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SLA[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb25(cpu):
+    "SLA L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SLA[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb26(cpu):
+    "SLA (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SLA[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb27(cpu):
+    "SLA A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SLA[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb28(cpu):
+    "SRA B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRA[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb29(cpu):
+    "SRA C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRA[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb2a(cpu):
+    "SRA D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRA[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb2b(cpu):
+    "SRA E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRA[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb2c(cpu):
+    "SRA H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRA[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb2d(cpu):
+    "SRA L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRA[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb2e(cpu):
+    "SRA (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SRA[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb2f(cpu):
+    "SRA A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRA[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb30(cpu):
+    "SWAP B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SWAP[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb31(cpu):
+    "SWAP C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SWAP[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb32(cpu):
+    "SWAP D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SWAP[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb33(cpu):
+    "SWAP E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SWAP[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb34(cpu):
+    "SWAP H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SWAP[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb35(cpu):
+    "SWAP L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SWAP[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb36(cpu):
+    "SWAP (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SWAP[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb37(cpu):
+    "SWAP A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SWAP[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb38(cpu):
+    "SRL B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRL[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb39(cpu):
+    "SRL C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRL[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb3a(cpu):
+    "SRL D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRL[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb3b(cpu):
+    "SRL E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRL[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb3c(cpu):
+    "SRL H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRL[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb3d(cpu):
+    "SRL L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRL[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb3e(cpu):
+    "SRL (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SRL[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb3f(cpu):
+    "SRL A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    result = SRL[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb40(cpu):
+    "BIT 0,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x1 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb41(cpu):
+    "BIT 0,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x1 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb42(cpu):
+    "BIT 0,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x1 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb43(cpu):
+    "BIT 0,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x1 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb44(cpu):
+    "BIT 0,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x1 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb45(cpu):
+    "BIT 0,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x1 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb46(cpu):
+    "BIT 0,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x1 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb47(cpu):
+    "BIT 0,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x1 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb48(cpu):
+    "BIT 1,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x2 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb49(cpu):
+    "BIT 1,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x2 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb4a(cpu):
+    "BIT 1,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x2 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb4b(cpu):
+    "BIT 1,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x2 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb4c(cpu):
+    "BIT 1,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x2 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb4d(cpu):
+    "BIT 1,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x2 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb4e(cpu):
+    "BIT 1,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x2 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb4f(cpu):
+    "BIT 1,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x2 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb50(cpu):
+    "BIT 2,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x4 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb51(cpu):
+    "BIT 2,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x4 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb52(cpu):
+    "BIT 2,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x4 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb53(cpu):
+    "BIT 2,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x4 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb54(cpu):
+    "BIT 2,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x4 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb55(cpu):
+    "BIT 2,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x4 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb56(cpu):
+    "BIT 2,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x4 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb57(cpu):
+    "BIT 2,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x4 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb58(cpu):
+    "BIT 3,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x8 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb59(cpu):
+    "BIT 3,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x8 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb5a(cpu):
+    "BIT 3,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x8 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb5b(cpu):
+    "BIT 3,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x8 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb5c(cpu):
+    "BIT 3,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x8 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb5d(cpu):
+    "BIT 3,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x8 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb5e(cpu):
+    "BIT 3,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x8 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb5f(cpu):
+    "BIT 3,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x8 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb60(cpu):
+    "BIT 4,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x10 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb61(cpu):
+    "BIT 4,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x10 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb62(cpu):
+    "BIT 4,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x10 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb63(cpu):
+    "BIT 4,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x10 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb64(cpu):
+    "BIT 4,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x10 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb65(cpu):
+    "BIT 4,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x10 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb66(cpu):
+    "BIT 4,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x10 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb67(cpu):
+    "BIT 4,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x10 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb68(cpu):
+    "BIT 5,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x20 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb69(cpu):
+    "BIT 5,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x20 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb6a(cpu):
+    "BIT 5,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x20 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb6b(cpu):
+    "BIT 5,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x20 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb6c(cpu):
+    "BIT 5,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x20 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb6d(cpu):
+    "BIT 5,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x20 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb6e(cpu):
+    "BIT 5,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x20 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb6f(cpu):
+    "BIT 5,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x20 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb70(cpu):
+    "BIT 6,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x40 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb71(cpu):
+    "BIT 6,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x40 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb72(cpu):
+    "BIT 6,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x40 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb73(cpu):
+    "BIT 6,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x40 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb74(cpu):
+    "BIT 6,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x40 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb75(cpu):
+    "BIT 6,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x40 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb76(cpu):
+    "BIT 6,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x40 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb77(cpu):
+    "BIT 6,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x40 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb78(cpu):
+    "BIT 7,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.b.value & 0x80 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb79(cpu):
+    "BIT 7,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.c.value & 0x80 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb7a(cpu):
+    "BIT 7,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.d.value & 0x80 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb7b(cpu):
+    "BIT 7,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.e.value & 0x80 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb7c(cpu):
+    "BIT 7,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.h.value & 0x80 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb7d(cpu):
+    "BIT 7,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.l.value & 0x80 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb7e(cpu):
+    "BIT 7,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x80 else 0xA0)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb7f(cpu):
+    "BIT 7,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.f.value = (cpu.f.value & 0x10) | (0x20 if cpu.a.value & 0x80 else 0xA0)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb80(cpu):
+    "RES 0,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0xfe
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb81(cpu):
+    "RES 0,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0xfe
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb82(cpu):
+    "RES 0,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0xfe
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb83(cpu):
+    "RES 0,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0xfe
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb84(cpu):
+    "RES 0,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0xfe
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb85(cpu):
+    "RES 0,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0xfe
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb86(cpu):
+    "RES 0,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xfe
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xfe)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb87(cpu):
+    "RES 0,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0xfe
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb88(cpu):
+    "RES 1,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0xfd
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb89(cpu):
+    "RES 1,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0xfd
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb8a(cpu):
+    "RES 1,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0xfd
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb8b(cpu):
+    "RES 1,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0xfd
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb8c(cpu):
+    "RES 1,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0xfd
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb8d(cpu):
+    "RES 1,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0xfd
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb8e(cpu):
+    "RES 1,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xfd
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xfd)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb8f(cpu):
+    "RES 1,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0xfd
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb90(cpu):
+    "RES 2,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0xfb
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb91(cpu):
+    "RES 2,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0xfb
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb92(cpu):
+    "RES 2,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0xfb
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb93(cpu):
+    "RES 2,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0xfb
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb94(cpu):
+    "RES 2,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0xfb
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb95(cpu):
+    "RES 2,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0xfb
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb96(cpu):
+    "RES 2,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xfb
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xfb)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb97(cpu):
+    "RES 2,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0xfb
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb98(cpu):
+    "RES 3,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0xf7
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb99(cpu):
+    "RES 3,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0xf7
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb9a(cpu):
+    "RES 3,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0xf7
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb9b(cpu):
+    "RES 3,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0xf7
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb9c(cpu):
+    "RES 3,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0xf7
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb9d(cpu):
+    "RES 3,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0xf7
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb9e(cpu):
+    "RES 3,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xf7
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xf7)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cb9f(cpu):
+    "RES 3,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0xf7
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba0(cpu):
+    "RES 4,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0xef
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba1(cpu):
+    "RES 4,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0xef
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba2(cpu):
+    "RES 4,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0xef
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba3(cpu):
+    "RES 4,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0xef
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba4(cpu):
+    "RES 4,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0xef
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba5(cpu):
+    "RES 4,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0xef
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba6(cpu):
+    "RES 4,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xef
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xef)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba7(cpu):
+    "RES 4,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0xef
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba8(cpu):
+    "RES 5,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0xdf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cba9(cpu):
+    "RES 5,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0xdf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbaa(cpu):
+    "RES 5,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0xdf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbab(cpu):
+    "RES 5,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0xdf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbac(cpu):
+    "RES 5,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0xdf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbad(cpu):
+    "RES 5,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0xdf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbae(cpu):
+    "RES 5,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xdf
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xdf)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbaf(cpu):
+    "RES 5,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0xdf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb0(cpu):
+    "RES 6,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0xbf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb1(cpu):
+    "RES 6,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0xbf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb2(cpu):
+    "RES 6,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0xbf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb3(cpu):
+    "RES 6,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0xbf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb4(cpu):
+    "RES 6,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0xbf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb5(cpu):
+    "RES 6,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0xbf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb6(cpu):
+    "RES 6,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xbf
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0xbf)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb7(cpu):
+    "RES 6,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0xbf
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb8(cpu):
+    "RES 7,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value & 0x7f
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbb9(cpu):
+    "RES 7,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value & 0x7f
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbba(cpu):
+    "RES 7,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value & 0x7f
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbbb(cpu):
+    "RES 7,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value & 0x7f
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbbc(cpu):
+    "RES 7,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value & 0x7f
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbbd(cpu):
+    "RES 7,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value & 0x7f
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbbe(cpu):
+    "RES 7,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x7f
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) & 0x7f)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbbf(cpu):
+    "RES 7,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value & 0x7f
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc0(cpu):
+    "SET 0,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x1
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc1(cpu):
+    "SET 0,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x1
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc2(cpu):
+    "SET 0,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x1
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc3(cpu):
+    "SET 0,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x1
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc4(cpu):
+    "SET 0,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x1
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc5(cpu):
+    "SET 0,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x1
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc6(cpu):
+    "SET 0,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x1
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x1)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc7(cpu):
+    "SET 0,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x1
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc8(cpu):
+    "SET 1,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x2
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbc9(cpu):
+    "SET 1,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x2
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbca(cpu):
+    "SET 1,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x2
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbcb(cpu):
+    "SET 1,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x2
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbcc(cpu):
+    "SET 1,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x2
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbcd(cpu):
+    "SET 1,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x2
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbce(cpu):
+    "SET 1,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x2
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x2)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbcf(cpu):
+    "SET 1,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x2
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd0(cpu):
+    "SET 2,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x4
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd1(cpu):
+    "SET 2,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x4
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd2(cpu):
+    "SET 2,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x4
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd3(cpu):
+    "SET 2,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x4
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd4(cpu):
+    "SET 2,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x4
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd5(cpu):
+    "SET 2,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x4
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd6(cpu):
+    "SET 2,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x4
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x4)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd7(cpu):
+    "SET 2,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x4
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd8(cpu):
+    "SET 3,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbd9(cpu):
+    "SET 3,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbda(cpu):
+    "SET 3,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbdb(cpu):
+    "SET 3,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbdc(cpu):
+    "SET 3,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbdd(cpu):
+    "SET 3,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbde(cpu):
+    "SET 3,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x8
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x8)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbdf(cpu):
+    "SET 3,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe0(cpu):
+    "SET 4,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x10
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe1(cpu):
+    "SET 4,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x10
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe2(cpu):
+    "SET 4,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x10
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe3(cpu):
+    "SET 4,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x10
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe4(cpu):
+    "SET 4,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x10
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe5(cpu):
+    "SET 4,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x10
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe6(cpu):
+    "SET 4,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x10
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x10)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe7(cpu):
+    "SET 4,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x10
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe8(cpu):
+    "SET 5,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x20
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbe9(cpu):
+    "SET 5,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x20
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbea(cpu):
+    "SET 5,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x20
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbeb(cpu):
+    "SET 5,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x20
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbec(cpu):
+    "SET 5,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x20
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbed(cpu):
+    "SET 5,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x20
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbee(cpu):
+    "SET 5,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x20
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x20)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbef(cpu):
+    "SET 5,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x20
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf0(cpu):
+    "SET 6,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x40
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf1(cpu):
+    "SET 6,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x40
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf2(cpu):
+    "SET 6,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x40
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf3(cpu):
+    "SET 6,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x40
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf4(cpu):
+    "SET 6,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x40
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf5(cpu):
+    "SET 6,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x40
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf6(cpu):
+    "SET 6,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x40
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x40)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf7(cpu):
+    "SET 6,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x40
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf8(cpu):
+    "SET 7,B"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.b.value = cpu.b.value | 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbf9(cpu):
+    "SET 7,C"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.c.value = cpu.c.value | 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbfa(cpu):
+    "SET 7,D"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.d.value = cpu.d.value | 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbfb(cpu):
+    "SET 7,E"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.e.value = cpu.e.value | 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbfc(cpu):
+    "SET 7,H"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.h.value = cpu.h.value | 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbfd(cpu):
+    "SET 7,L"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.l.value = cpu.l.value | 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbfe(cpu):
+    "SET 7,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x80
+    else:
+        mem.write(hl, (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl)) | 0x80)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cbff(cpu):
+    "SET 7,A"
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    cpu.a.value = cpu.a.value | 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+OPS = (
+    op_00, op_01, op_02, op_03, op_04, op_05, op_06, op_07,
+    op_08, op_09, op_0a, op_0b, op_0c, op_0d, op_0e, op_0f,
+    op_10, op_11, op_12, op_13, op_14, op_15, op_16, op_17,
+    op_18, op_19, op_1a, op_1b, op_1c, op_1d, op_1e, op_1f,
+    op_20, op_21, op_22, op_23, op_24, op_25, op_26, op_27,
+    op_28, op_29, op_2a, op_2b, op_2c, op_2d, op_2e, op_2f,
+    op_30, op_31, op_32, op_33, op_34, op_35, op_36, op_37,
+    op_38, op_39, op_3a, op_3b, op_3c, op_3d, op_3e, op_3f,
+    op_40, op_41, op_42, op_43, op_44, op_45, op_46, op_47,
+    op_48, op_49, op_4a, op_4b, op_4c, op_4d, op_4e, op_4f,
+    op_50, op_51, op_52, op_53, op_54, op_55, op_56, op_57,
+    op_58, op_59, op_5a, op_5b, op_5c, op_5d, op_5e, op_5f,
+    op_60, op_61, op_62, op_63, op_64, op_65, op_66, op_67,
+    op_68, op_69, op_6a, op_6b, op_6c, op_6d, op_6e, op_6f,
+    op_70, op_71, op_72, op_73, op_74, op_75, op_76, op_77,
+    op_78, op_79, op_7a, op_7b, op_7c, op_7d, op_7e, op_7f,
+    op_80, op_81, op_82, op_83, op_84, op_85, op_86, op_87,
+    op_88, op_89, op_8a, op_8b, op_8c, op_8d, op_8e, op_8f,
+    op_90, op_91, op_92, op_93, op_94, op_95, op_96, op_97,
+    op_98, op_99, op_9a, op_9b, op_9c, op_9d, op_9e, op_9f,
+    op_a0, op_a1, op_a2, op_a3, op_a4, op_a5, op_a6, op_a7,
+    op_a8, op_a9, op_aa, op_ab, op_ac, op_ad, op_ae, op_af,
+    op_b0, op_b1, op_b2, op_b3, op_b4, op_b5, op_b6, op_b7,
+    op_b8, op_b9, op_ba, op_bb, op_bc, op_bd, op_be, op_bf,
+    op_c0, op_c1, op_c2, op_c3, op_c4, op_c5, op_c6, op_c7,
+    op_c8, op_c9, op_ca, op_cb, op_cc, op_cd, op_ce, op_cf,
+    op_d0, op_d1, op_d2, invalid, op_d4, op_d5, op_d6, op_d7,
+    op_d8, op_d9, op_da, invalid, op_dc, invalid, op_de, op_df,
+    op_e0, op_e1, op_e2, invalid, invalid, op_e5, op_e6, op_e7,
+    op_e8, op_e9, op_ea, invalid, invalid, invalid, op_ee, op_ef,
+    op_f0, op_f1, op_f2, op_f3, invalid, op_f5, op_f6, op_f7,
+    op_f8, op_f9, op_fa, op_fb, invalid, invalid, op_fe, op_ff,
+)
+
+CB_OPS = (
+    op_cb00, op_cb01, op_cb02, op_cb03, op_cb04, op_cb05, op_cb06, op_cb07,
+    op_cb08, op_cb09, op_cb0a, op_cb0b, op_cb0c, op_cb0d, op_cb0e, op_cb0f,
+    op_cb10, op_cb11, op_cb12, op_cb13, op_cb14, op_cb15, op_cb16, op_cb17,
+    op_cb18, op_cb19, op_cb1a, op_cb1b, op_cb1c, op_cb1d, op_cb1e, op_cb1f,
+    op_cb20, op_cb21, op_cb22, op_cb23, op_cb24, op_cb25, op_cb26, op_cb27,
+    op_cb28, op_cb29, op_cb2a, op_cb2b, op_cb2c, op_cb2d, op_cb2e, op_cb2f,
+    op_cb30, op_cb31, op_cb32, op_cb33, op_cb34, op_cb35, op_cb36, op_cb37,
+    op_cb38, op_cb39, op_cb3a, op_cb3b, op_cb3c, op_cb3d, op_cb3e, op_cb3f,
+    op_cb40, op_cb41, op_cb42, op_cb43, op_cb44, op_cb45, op_cb46, op_cb47,
+    op_cb48, op_cb49, op_cb4a, op_cb4b, op_cb4c, op_cb4d, op_cb4e, op_cb4f,
+    op_cb50, op_cb51, op_cb52, op_cb53, op_cb54, op_cb55, op_cb56, op_cb57,
+    op_cb58, op_cb59, op_cb5a, op_cb5b, op_cb5c, op_cb5d, op_cb5e, op_cb5f,
+    op_cb60, op_cb61, op_cb62, op_cb63, op_cb64, op_cb65, op_cb66, op_cb67,
+    op_cb68, op_cb69, op_cb6a, op_cb6b, op_cb6c, op_cb6d, op_cb6e, op_cb6f,
+    op_cb70, op_cb71, op_cb72, op_cb73, op_cb74, op_cb75, op_cb76, op_cb77,
+    op_cb78, op_cb79, op_cb7a, op_cb7b, op_cb7c, op_cb7d, op_cb7e, op_cb7f,
+    op_cb80, op_cb81, op_cb82, op_cb83, op_cb84, op_cb85, op_cb86, op_cb87,
+    op_cb88, op_cb89, op_cb8a, op_cb8b, op_cb8c, op_cb8d, op_cb8e, op_cb8f,
+    op_cb90, op_cb91, op_cb92, op_cb93, op_cb94, op_cb95, op_cb96, op_cb97,
+    op_cb98, op_cb99, op_cb9a, op_cb9b, op_cb9c, op_cb9d, op_cb9e, op_cb9f,
+    op_cba0, op_cba1, op_cba2, op_cba3, op_cba4, op_cba5, op_cba6, op_cba7,
+    op_cba8, op_cba9, op_cbaa, op_cbab, op_cbac, op_cbad, op_cbae, op_cbaf,
+    op_cbb0, op_cbb1, op_cbb2, op_cbb3, op_cbb4, op_cbb5, op_cbb6, op_cbb7,
+    op_cbb8, op_cbb9, op_cbba, op_cbbb, op_cbbc, op_cbbd, op_cbbe, op_cbbf,
+    op_cbc0, op_cbc1, op_cbc2, op_cbc3, op_cbc4, op_cbc5, op_cbc6, op_cbc7,
+    op_cbc8, op_cbc9, op_cbca, op_cbcb, op_cbcc, op_cbcd, op_cbce, op_cbcf,
+    op_cbd0, op_cbd1, op_cbd2, op_cbd3, op_cbd4, op_cbd5, op_cbd6, op_cbd7,
+    op_cbd8, op_cbd9, op_cbda, op_cbdb, op_cbdc, op_cbdd, op_cbde, op_cbdf,
+    op_cbe0, op_cbe1, op_cbe2, op_cbe3, op_cbe4, op_cbe5, op_cbe6, op_cbe7,
+    op_cbe8, op_cbe9, op_cbea, op_cbeb, op_cbec, op_cbed, op_cbee, op_cbef,
+    op_cbf0, op_cbf1, op_cbf2, op_cbf3, op_cbf4, op_cbf5, op_cbf6, op_cbf7,
+    op_cbf8, op_cbf9, op_cbfa, op_cbfb, op_cbfc, op_cbfd, op_cbfe, op_cbff,
+)
@@ -0,0 +1,7609 @@
+# Generated by gen_cpu.py from opcodes.py, do not edit
+
+# The interpreter in cpu_fast.py, writing a tracebuffer record into cpu.trace
+# before each instruction. Trace.attach() switches CPU.runFast() to OPS here,
+# which saves a wrapper call per instruction. $CB instructions are recorded
+# once, by op_cb, and then run untraced.
+
+import cpu_fast
+from alu import ADD, SUB, INC, DEC, DAA, RLC, RRC, RL, RR, SLA, SRA, SRL, SWAP
+from cpu_fast import push, pop, CB_OPS
+
+def invalid(cpu):
+    "Invalid instruction"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu_fast.invalid(cpu)
+
+def op_cb(cpu):
+    "CB prefix"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    CB_OPS[mem.read((pc_value + 1) & 0xFFFF)](cpu)
+
+def op_00(cpu):
+    "NOP"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_01(cpu):
+    "LD BC,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_02(cpu):
+    "LD (BC),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    bc = (cpu.b.value << 8) | cpu.c.value
+    if 0xC000 <= bc < 0xE000:
+        mem.internal_ram[bc - 0xC000] = cpu.a.value
+    else:
+        mem.write(bc, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_03(cpu):
+    "INC BC"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.b.value << 8) | cpu.c.value) + 1) & 0xFFFF
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_04(cpu):
+    "INC B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = INC[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_05(cpu):
+    "DEC B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DEC[cpu.b.value]
+    cpu.b.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_06(cpu):
+    "LD B,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.b.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_07(cpu):
+    "RLCA"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = RLC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_08(cpu):
+    "LD (a16),SP"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    value = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    mem.write(imm16, value & 0xFF)
+    mem.write((imm16 + 1) & 0xFFFF, value >> 8)
+    cpu.cycles += 5
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_09(cpu):
+    "ADD HL,BC"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.b.value << 8) | cpu.c.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0a(cpu):
+    "LD A,(BC)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    bc = (cpu.b.value << 8) | cpu.c.value
+    cpu.a.value = (mem.internal_ram[bc - 0xC000] if 0xC000 <= bc < 0xE000 else mem.read(bc))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0b(cpu):
+    "DEC BC"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.b.value << 8) | cpu.c.value) - 1) & 0xFFFF
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0c(cpu):
+    "INC C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = INC[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0d(cpu):
+    "DEC C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DEC[cpu.c.value]
+    cpu.c.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0e(cpu):
+    "LD C,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.c.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_0f(cpu):
+    "RRCA"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = RRC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_10(cpu):
+    "STOP"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.run_state = "STOP"
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_11(cpu):
+    "LD DE,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_12(cpu):
+    "LD (DE),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    de = (cpu.d.value << 8) | cpu.e.value
+    if 0xC000 <= de < 0xE000:
+        mem.internal_ram[de - 0xC000] = cpu.a.value
+    else:
+        mem.write(de, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_13(cpu):
+    "INC DE"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.d.value << 8) | cpu.e.value) + 1) & 0xFFFF
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_14(cpu):
+    "INC D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = INC[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_15(cpu):
+    "DEC D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DEC[cpu.d.value]
+    cpu.d.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_16(cpu):
+    "LD D,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.d.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_17(cpu):
+    "RLA"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = RL[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_18(cpu):
+    "JR r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    next_pc = (next_pc + offset) & 0xFFFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_19(cpu):
+    "ADD HL,DE"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.d.value << 8) | cpu.e.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1a(cpu):
+    "LD A,(DE)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    de = (cpu.d.value << 8) | cpu.e.value
+    cpu.a.value = (mem.internal_ram[de - 0xC000] if 0xC000 <= de < 0xE000 else mem.read(de))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1b(cpu):
+    "DEC DE"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.d.value << 8) | cpu.e.value) - 1) & 0xFFFF
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1c(cpu):
+    "INC E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = INC[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1d(cpu):
+    "DEC E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DEC[cpu.e.value]
+    cpu.e.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1e(cpu):
+    "LD E,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.e.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_1f(cpu):
+    "RRA"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = RR[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_20(cpu):
+    "JR NZ,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if not cpu.f.value & 0x80:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_21(cpu):
+    "LD HL,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_22(cpu):
+    "LD (HL+),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.a.value
+    else:
+        mem.write(hl, cpu.a.value)
+    hl = (hl + 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_23(cpu):
+    "INC HL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.h.value << 8) | cpu.l.value) + 1) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_24(cpu):
+    "INC H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = INC[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_25(cpu):
+    "DEC H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DEC[cpu.h.value]
+    cpu.h.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_26(cpu):
+    "LD H,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.h.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_27(cpu):
+    "DAA"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DAA[((cpu.f.value >> 4) << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_28(cpu):
+    "JR Z,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if cpu.f.value & 0x80:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_29(cpu):
+    "ADD HL,HL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.h.value << 8) | cpu.l.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2a(cpu):
+    "LD A,(HL+)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.a.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    hl = (hl + 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2b(cpu):
+    "DEC HL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.h.value << 8) | cpu.l.value) - 1) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2c(cpu):
+    "INC L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = INC[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2d(cpu):
+    "DEC L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DEC[cpu.l.value]
+    cpu.l.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2e(cpu):
+    "LD L,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.l.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_2f(cpu):
+    "CPL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value ^= 0xFF
+    cpu.f.value |= 0x60
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_30(cpu):
+    "JR NC,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if not cpu.f.value & 0x10:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_31(cpu):
+    "LD SP,d16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    word = imm16
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_32(cpu):
+    "LD (HL-),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.a.value
+    else:
+        mem.write(hl, cpu.a.value)
+    hl = (hl - 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_33(cpu):
+    "INC SP"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.sp.r1.value << 8) | cpu.sp.r2.value) + 1) & 0xFFFF
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_34(cpu):
+    "INC (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = INC[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_35(cpu):
+    "DEC (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = DEC[(mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = result >> 8
+    else:
+        mem.write(hl, result >> 8)
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_36(cpu):
+    "LD (HL),d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = imm8
+    else:
+        mem.write(hl, imm8)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_37(cpu):
+    "SCF"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = (cpu.f.value & 0x80) | 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_38(cpu):
+    "JR C,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    if cpu.f.value & 0x10:
+        next_pc = (next_pc + offset) & 0xFFFF
+        cpu.cycles += 3
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_39(cpu):
+    "ADD HL,SP"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    base = ((cpu.h.value << 8) | cpu.l.value)
+    operand = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+    word = (base + operand) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3a(cpu):
+    "LD A,(HL-)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.a.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    hl = (hl - 1) & 0xFFFF
+    cpu.h.value = hl >> 8
+    cpu.l.value = hl & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3b(cpu):
+    "DEC SP"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = (((cpu.sp.r1.value << 8) | cpu.sp.r2.value) - 1) & 0xFFFF
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3c(cpu):
+    "INC A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = INC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3d(cpu):
+    "DEC A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = DEC[cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3e(cpu):
+    "LD A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.a.value = imm8
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_3f(cpu):
+    "CCF"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = (cpu.f.value & 0x90) ^ 0x10
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_40(cpu):
+    "LD B,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.b.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_41(cpu):
+    "LD B,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.b.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_42(cpu):
+    "LD B,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.b.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_43(cpu):
+    "LD B,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.b.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_44(cpu):
+    "LD B,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.b.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_45(cpu):
+    "LD B,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.b.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_46(cpu):
+    "LD B,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.b.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_47(cpu):
+    "LD B,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.b.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_48(cpu):
+    "LD C,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.c.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_49(cpu):
+    "LD C,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.c.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4a(cpu):
+    "LD C,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.c.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4b(cpu):
+    "LD C,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.c.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4c(cpu):
+    "LD C,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.c.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4d(cpu):
+    "LD C,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.c.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4e(cpu):
+    "LD C,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.c.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_4f(cpu):
+    "LD C,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.c.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_50(cpu):
+    "LD D,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.d.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_51(cpu):
+    "LD D,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.d.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_52(cpu):
+    "LD D,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.d.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_53(cpu):
+    "LD D,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.d.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_54(cpu):
+    "LD D,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.d.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_55(cpu):
+    "LD D,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.d.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_56(cpu):
+    "LD D,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.d.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_57(cpu):
+    "LD D,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.d.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_58(cpu):
+    "LD E,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.e.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_59(cpu):
+    "LD E,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.e.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5a(cpu):
+    "LD E,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.e.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5b(cpu):
+    "LD E,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.e.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5c(cpu):
+    "LD E,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.e.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5d(cpu):
+    "LD E,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.e.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5e(cpu):
+    "LD E,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.e.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_5f(cpu):
+    "LD E,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.e.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_60(cpu):
+    "LD H,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.h.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_61(cpu):
+    "LD H,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.h.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_62(cpu):
+    "LD H,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.h.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_63(cpu):
+    "LD H,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.h.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_64(cpu):
+    "LD H,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.h.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_65(cpu):
+    "LD H,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.h.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_66(cpu):
+    "LD H,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.h.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_67(cpu):
+    "LD H,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.h.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_68(cpu):
+    "LD L,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.l.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_69(cpu):
+    "LD L,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.l.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6a(cpu):
+    "LD L,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.l.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6b(cpu):
+    "LD L,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.l.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6c(cpu):
+    "LD L,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.l.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6d(cpu):
+    "LD L,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.l.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6e(cpu):
+    "LD L,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.l.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_6f(cpu):
+    "LD L,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.l.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_70(cpu):
+    "LD (HL),B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.b.value
+    else:
+        mem.write(hl, cpu.b.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_71(cpu):
+    "LD (HL),C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.c.value
+    else:
+        mem.write(hl, cpu.c.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_72(cpu):
+    "LD (HL),D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.d.value
+    else:
+        mem.write(hl, cpu.d.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_73(cpu):
+    "LD (HL),E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.e.value
+    else:
+        mem.write(hl, cpu.e.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_74(cpu):
+    "LD (HL),H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.h.value
+    else:
+        mem.write(hl, cpu.h.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_75(cpu):
+    "LD (HL),L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.l.value
+    else:
+        mem.write(hl, cpu.l.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_76(cpu):
+    "HALT"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    if cpu.interrupts.getIME():
+        cpu.run_state = "HALT"
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_77(cpu):
+    "LD (HL),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    if 0xC000 <= hl < 0xE000:
+        mem.internal_ram[hl - 0xC000] = cpu.a.value
+    else:
+        mem.write(hl, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_78(cpu):
+    "LD A,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value = cpu.b.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_79(cpu):
+    "LD A,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value = cpu.c.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7a(cpu):
+    "LD A,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value = cpu.d.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7b(cpu):
+    "LD A,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value = cpu.e.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7c(cpu):
+    "LD A,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value = cpu.h.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7d(cpu):
+    "LD A,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value = cpu.l.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7e(cpu):
+    "LD A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.a.value = (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_7f(cpu):
+    "LD A,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.a.value = cpu.a.value
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_80(cpu):
+    "ADD A,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[(cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_81(cpu):
+    "ADD A,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[(cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_82(cpu):
+    "ADD A,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[(cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_83(cpu):
+    "ADD A,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[(cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_84(cpu):
+    "ADD A,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[(cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_85(cpu):
+    "ADD A,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[(cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_86(cpu):
+    "ADD A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = ADD[(cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_87(cpu):
+    "ADD A,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[(cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_88(cpu):
+    "ADC A,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_89(cpu):
+    "ADC A,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8a(cpu):
+    "ADC A,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8b(cpu):
+    "ADC A,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8c(cpu):
+    "ADC A,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8d(cpu):
+    "ADC A,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8e(cpu):
+    "ADC A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_8f(cpu):
+    "ADC A,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_90(cpu):
+    "SUB B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[(cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_91(cpu):
+    "SUB C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[(cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_92(cpu):
+    "SUB D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[(cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_93(cpu):
+    "SUB E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[(cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_94(cpu):
+    "SUB H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[(cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_95(cpu):
+    "SUB L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[(cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_96(cpu):
+    "SUB (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SUB[(cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_97(cpu):
+    "SUB A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[(cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_98(cpu):
+    "SBC A,B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.b.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_99(cpu):
+    "SBC A,C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.c.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9a(cpu):
+    "SBC A,D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.d.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9b(cpu):
+    "SBC A,E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.e.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9c(cpu):
+    "SBC A,H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.h.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9d(cpu):
+    "SBC A,L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.l.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9e(cpu):
+    "SBC A,(HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_9f(cpu):
+    "SBC A,A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | cpu.a.value]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a0(cpu):
+    "AND B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value & cpu.b.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a1(cpu):
+    "AND C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value & cpu.c.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a2(cpu):
+    "AND D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value & cpu.d.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a3(cpu):
+    "AND E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value & cpu.e.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a4(cpu):
+    "AND H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value & cpu.h.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a5(cpu):
+    "AND L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value & cpu.l.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a6(cpu):
+    "AND (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    value = cpu.a.value & (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a7(cpu):
+    "AND A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value & cpu.a.value
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a8(cpu):
+    "XOR B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value ^ cpu.b.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_a9(cpu):
+    "XOR C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value ^ cpu.c.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_aa(cpu):
+    "XOR D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value ^ cpu.d.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ab(cpu):
+    "XOR E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value ^ cpu.e.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ac(cpu):
+    "XOR H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value ^ cpu.h.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ad(cpu):
+    "XOR L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value ^ cpu.l.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ae(cpu):
+    "XOR (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    value = cpu.a.value ^ (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_af(cpu):
+    "XOR A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value ^ cpu.a.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b0(cpu):
+    "OR B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value | cpu.b.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b1(cpu):
+    "OR C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value | cpu.c.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b2(cpu):
+    "OR D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value | cpu.d.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b3(cpu):
+    "OR E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value | cpu.e.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b4(cpu):
+    "OR H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value | cpu.h.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b5(cpu):
+    "OR L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value | cpu.l.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b6(cpu):
+    "OR (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    value = cpu.a.value | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b7(cpu):
+    "OR A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    value = cpu.a.value | cpu.a.value
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b8(cpu):
+    "CP B"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.b.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_b9(cpu):
+    "CP C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.c.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ba(cpu):
+    "CP D"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.d.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bb(cpu):
+    "CP E"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.e.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bc(cpu):
+    "CP H"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.h.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bd(cpu):
+    "CP L"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.l.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_be(cpu):
+    "CP (HL)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    hl = (cpu.h.value << 8) | cpu.l.value
+    cpu.f.value = SUB[(cpu.a.value << 8) | (mem.internal_ram[hl - 0xC000] if 0xC000 <= hl < 0xE000 else mem.read(hl))] & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_bf(cpu):
+    "CP A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.f.value = SUB[(cpu.a.value << 8) | cpu.a.value] & 0xFF
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c0(cpu):
+    "RET NZ"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    if not cpu.f.value & 0x80:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c1(cpu):
+    "POP BC"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = pop(cpu)
+    cpu.b.value = word >> 8
+    cpu.c.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c2(cpu):
+    "JP NZ,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x80:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c3(cpu):
+    "JP a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    next_pc = imm16
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c4(cpu):
+    "CALL NZ,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x80:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c5(cpu):
+    "PUSH BC"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, ((cpu.b.value << 8) | cpu.c.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c6(cpu):
+    "ADD A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = ADD[(cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c7(cpu):
+    "RST $00"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x00
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c8(cpu):
+    "RET Z"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    if cpu.f.value & 0x80:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_c9(cpu):
+    "RET"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    next_pc = pop(cpu)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ca(cpu):
+    "JP Z,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x80:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cc(cpu):
+    "CALL Z,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x80:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cd(cpu):
+    "CALL a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    push(cpu, next_pc)
+    next_pc = imm16
+    cpu.cycles += 6
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ce(cpu):
+    "ADC A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_cf(cpu):
+    "RST $08"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x08
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d0(cpu):
+    "RET NC"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    if not cpu.f.value & 0x10:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d1(cpu):
+    "POP DE"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = pop(cpu)
+    cpu.d.value = word >> 8
+    cpu.e.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d2(cpu):
+    "JP NC,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x10:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d4(cpu):
+    "CALL NC,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if not cpu.f.value & 0x10:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d5(cpu):
+    "PUSH DE"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, ((cpu.d.value << 8) | cpu.e.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d6(cpu):
+    "SUB d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = SUB[(cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d7(cpu):
+    "RST $10"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x10
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d8(cpu):
+    "RET C"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    if cpu.f.value & 0x10:
+        next_pc = pop(cpu)
+        cpu.cycles += 5
+    else:
+        cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_d9(cpu):
+    "RETI"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    next_pc = pop(cpu)
+    cpu.interrupts.setIME(True)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_da(cpu):
+    "JP C,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x10:
+        next_pc = imm16
+        cpu.cycles += 4
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_dc(cpu):
+    "CALL C,a16"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if cpu.f.value & 0x10:
+        push(cpu, next_pc)
+        next_pc = imm16
+        cpu.cycles += 6
+    else:
+        cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_de(cpu):
+    "SBC A,d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | imm8]
+    cpu.a.value = result >> 8
+    cpu.f.value = result & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_df(cpu):
+    "RST $18"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x18
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e0(cpu):
+    "LDH (a8),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    address = 0xFF00 | imm8
+    mem.write(address, cpu.a.value)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e1(cpu):
+    "POP HL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = pop(cpu)
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e2(cpu):
+    "LD (C),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    address = 0xFF00 | cpu.c.value
+    mem.write(address, cpu.a.value)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e5(cpu):
+    "PUSH HL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, ((cpu.h.value << 8) | cpu.l.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e6(cpu):
+    "AND d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    value = cpu.a.value & imm8
+    cpu.a.value = value
+    cpu.f.value = 0x20 if value else 0xA0
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e7(cpu):
+    "RST $20"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x20
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e8(cpu):
+    "ADD SP,r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    base = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    cpu.f.value = ((((base & 0xF) + (offset & 0xF)) > 0xF) << 5) | ((((base & 0xFF) + (offset & 0xFF)) > 0xFF) << 4)
+    word = (base + offset) & 0xFFFF
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_e9(cpu):
+    "JP HL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    next_pc = ((cpu.h.value << 8) | cpu.l.value)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ea(cpu):
+    "LD (a16),A"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    if 0xC000 <= imm16 < 0xE000:
+        mem.internal_ram[imm16 - 0xC000] = cpu.a.value
+    else:
+        mem.write(imm16, cpu.a.value)
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ee(cpu):
+    "XOR d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    value = cpu.a.value ^ imm8
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ef(cpu):
+    "RST $28"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x28
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f0(cpu):
+    "LDH A,(a8)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    address = 0xFF00 | imm8
+    cpu.a.value = mem.read(address)
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f1(cpu):
+    "POP AF"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = pop(cpu)
+    cpu.a.value = word >> 8
+    cpu.f.value = word & 0xF0
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f2(cpu):
+    "LD A,(C)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    address = 0xFF00 | cpu.c.value
+    cpu.a.value = mem.read(address)
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f3(cpu):
+    "DI"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.interrupts.setIME(False)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f5(cpu):
+    "PUSH AF"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, ((cpu.a.value << 8) | cpu.f.value))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f6(cpu):
+    "OR d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    value = cpu.a.value | imm8
+    cpu.a.value = value
+    cpu.f.value = 0x00 if value else 0x80
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f7(cpu):
+    "RST $30"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x30
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f8(cpu):
+    "LD HL,SP+r8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    offset = imm8 - 0x100 if imm8 & 0x80 else imm8
+    base = ((cpu.sp.r1.value << 8) | cpu.sp.r2.value)
+    cpu.f.value = ((((base & 0xF) + (offset & 0xF)) > 0xF) << 5) | ((((base & 0xFF) + (offset & 0xFF)) > 0xFF) << 4)
+    word = (base + offset) & 0xFFFF
+    cpu.h.value = word >> 8
+    cpu.l.value = word & 0xFF
+    cpu.cycles += 3
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_f9(cpu):
+    "LD SP,HL"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    word = ((cpu.h.value << 8) | cpu.l.value)
+    cpu.sp.r1.value = word >> 8
+    cpu.sp.r2.value = word & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_fa(cpu):
+    "LD A,(a16)"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 3) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm16 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1)) | ((mem.rom[pc_value + 2] if pc_value + 2 < 0x4000 else mem.read(pc_value + 2)) << 8)
+    cpu.a.value = (mem.internal_ram[imm16 - 0xC000] if 0xC000 <= imm16 < 0xE000 else mem.read(imm16))
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_fb(cpu):
+    "EI"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    cpu.interrupts.setIME(True)
+    cpu.cycles += 1
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_fe(cpu):
+    "CP d8"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 2) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    imm8 = (mem.rom[pc_value + 1] if pc_value + 1 < 0x4000 else mem.read(pc_value + 1))
+    cpu.f.value = SUB[(cpu.a.value << 8) | imm8] & 0xFF
+    cpu.cycles += 2
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+def op_ff(cpu):
+    "RST $38"
+    mem = cpu.mem
+    pc = cpu.pc
+    pc_value = (pc.r1.value << 8) | pc.r2.value
+    next_pc = (pc_value + 1) & 0xFFFF
+    trace = cpu.trace
+    count = trace.count
+    trace.count = count + 1
+    if pc_value < 0x3FFE:
+        bank = 0
+        code = mem.rom[pc_value:pc_value + 3]
+    elif 0x4000 <= pc_value < 0x7FFE:
+        mbc = mem.mbc
+        bank = mbc.rom_bank % mbc.rom_banks
+        code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+    else:
+        bank = 0
+        code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+    sp = cpu.sp
+    cycles = trace.scheduler.cycles + cpu.cycles
+    trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+        cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+        cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+    push(cpu, next_pc)
+    next_pc = 0x38
+    cpu.cycles += 4
+    pc.r1.value = next_pc >> 8
+    pc.r2.value = next_pc & 0xFF
+
+OPS = (
+    op_00, op_01, op_02, op_03, op_04, op_05, op_06, op_07,
+    op_08, op_09, op_0a, op_0b, op_0c, op_0d, op_0e, op_0f,
+    op_10, op_11, op_12, op_13, op_14, op_15, op_16, op_17,
+    op_18, op_19, op_1a, op_1b, op_1c, op_1d, op_1e, op_1f,
+    op_20, op_21, op_22, op_23, op_24, op_25, op_26, op_27,
+    op_28, op_29, op_2a, op_2b, op_2c, op_2d, op_2e, op_2f,
+    op_30, op_31, op_32, op_33, op_34, op_35, op_36, op_37,
+    op_38, op_39, op_3a, op_3b, op_3c, op_3d, op_3e, op_3f,
+    op_40, op_41, op_42, op_43, op_44, op_45, op_46, op_47,
+    op_48, op_49, op_4a, op_4b, op_4c, op_4d, op_4e, op_4f,
+    op_50, op_51, op_52, op_53, op_54, op_55, op_56, op_57,
+    op_58, op_59, op_5a, op_5b, op_5c, op_5d, op_5e, op_5f,
+    op_60, op_61, op_62, op_63, op_64, op_65, op_66, op_67,
+    op_68, op_69, op_6a, op_6b, op_6c, op_6d, op_6e, op_6f,
+    op_70, op_71, op_72, op_73, op_74, op_75, op_76, op_77,
+    op_78, op_79, op_7a, op_7b, op_7c, op_7d, op_7e, op_7f,
+    op_80, op_81, op_82, op_83, op_84, op_85, op_86, op_87,
+    op_88, op_89, op_8a, op_8b, op_8c, op_8d, op_8e, op_8f,
+    op_90, op_91, op_92, op_93, op_94, op_95, op_96, op_97,
+    op_98, op_99, op_9a, op_9b, op_9c, op_9d, op_9e, op_9f,
+    op_a0, op_a1, op_a2, op_a3, op_a4, op_a5, op_a6, op_a7,
+    op_a8, op_a9, op_aa, op_ab, op_ac, op_ad, op_ae, op_af,
+    op_b0, op_b1, op_b2, op_b3, op_b4, op_b5, op_b6, op_b7,
+    op_b8, op_b9, op_ba, op_bb, op_bc, op_bd, op_be, op_bf,
+    op_c0, op_c1, op_c2, op_c3, op_c4, op_c5, op_c6, op_c7,
+    op_c8, op_c9, op_ca, op_cb, op_cc, op_cd, op_ce, op_cf,
+    op_d0, op_d1, op_d2, invalid, op_d4, op_d5, op_d6, op_d7,
+    op_d8, op_d9, op_da, invalid, op_dc, invalid, op_de, op_df,
+    op_e0, op_e1, op_e2, invalid, invalid, op_e5, op_e6, op_e7,
+    op_e8, op_e9, op_ea, invalid, invalid, invalid, op_ee, op_ef,
+    op_f0, op_f1, op_f2, op_f3, invalid, op_f5, op_f6, op_f7,
+    op_f8, op_f9, op_fa, op_fb, invalid, invalid, op_fe, op_ff,
+)
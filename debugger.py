@@ -0,0 +1,191 @@
+PAGE_SHIFT = 8 # watchpoints are checked per 256 byte page
+
+class Break(Exception):
+    "Raised out of GameBoy.step() when a breakpoint or watchpoint is hit"
+    def __init__(self, hits):
+        super().__init__("; ".join(hits))
+        self.hits = hits
+
+class Debugger:
+    """
+    Breakpoints on PC (optionally in one ROM bank) and read/write
+    watchpoints on address ranges.
+    Nothing is checked while none are set, cpu.run and mem.read/write are
+    only wrapped while there is something to watch. A watched access is
+    reported once the instruction making it has finished.
+    """
+    def __init__(self, gameboy):
+        self.gameboy = gameboy
+        self.cpu = gameboy.cpu
+        self.mem = gameboy.mem
+        self.breakpoints = {} # address -> set of banks, None for any bank
+        self.watches = [] # (start, end, access) with end inclusive and access "r", "w" or "rw"
+        self.read_pages = bytearray(0x10000 >> PAGE_SHIFT) # non-zero for pages with a read watch
+        self.write_pages = bytearray(0x10000 >> PAGE_SHIFT)
+        self.hits = []
+        self.resume_pc = None # breakpoint to run past once after stopping at it
+        self.instruction_pc = 0 # start of the instruction being run, for reporting watch hits
+        self.saved = None # instance attributes replaced by install(), and cpu.fast
+
+    def addBreakpoint(self, address, bank=None):
+        self.breakpoints.setdefault(address, set()).add(bank)
+        self.update()
+
+    def removeBreakpoint(self, address, bank=None):
+        banks = self.breakpoints.get(address, set())
+        banks.discard(bank)
+        if not banks:
+            self.breakpoints.pop(address, None)
+        self.update()
+
+    def addWatch(self, start, end=None, access="rw"):
+        self.watches.append((start, start if end is None else end, access))
+        self.update()
+
+    def removeWatch(self, start, end=None, access="rw"):
+        self.watches.remove((start, start if end is None else end, access))
+        self.update()
+
+    def clear(self):
+        self.breakpoints = {}
+        self.watches = []
+        self.update()
+
+    def update(self):
+        "Rebuild the page maps and install or remove the wrappers"
+        self.read_pages[:] = bytes(len(self.read_pages))
+        self.write_pages[:] = bytes(len(self.write_pages))
+        for start, end, access in self.watches:
+            for page in range(start >> PAGE_SHIFT, (end >> PAGE_SHIFT) + 1):
+                if "r" in access:
+                    self.read_pages[page] = 1
+                if "w" in access:
+                    self.write_pages[page] = 1
+
+        self.uninstall()
+        if self.breakpoints or self.watches:
+            self.install()
+
+    def install(self):
+        cpu = self.cpu
+        mem = self.mem
+        self.saved = (cpu.__dict__.get("run"), mem.__dict__.get("read"), mem.__dict__.get("write"), cpu.fast)
+        breakpoints = self.breakpoints
+        read_pages = self.read_pages
+        write_pages = self.write_pages
+        hits = self.hits
+        read = mem.read
+        write = mem.write
+        run = cpu.run # wrap whatever is there, coverage or trace recording included
+        if self.watches:
+            # The generated interpreter reads and writes work RAM directly, use the one that doesn't
+            cpu.fast = False
+
+        def debugRun():
+            pc = (cpu.pc.r1.value << 8) | cpu.pc.r2.value
+            if pc in breakpoints and pc != self.resume_pc:
+                banks = breakpoints[pc]
+                bank = 0 if pc < 0x4000 else mem.rom_bank
+                if None in banks or (pc < 0x8000 and bank in banks):
+                    raise Break(["breakpoint at {:02X}:{:04X}".format(bank, pc)])
+            self.resume_pc = None
+            self.instruction_pc = pc
+            run()
+            if hits:
+                found = hits[:]
+                del hits[:]
+                raise Break(found)
+
+        def watchedRead(location):
+            value = read(location)
+            if read_pages[location >> PAGE_SHIFT]:
+                self.check(location, "r", value)
+            return value
+
+        def watchedWrite(location, value):
+            if write_pages[location >> PAGE_SHIFT]:
+                self.check(location, "w", value)
+            write(location, value)
+
+        cpu.run = debugRun
+        if self.watches:
+            mem.read = watchedRead
+            mem.write = watchedWrite
+
+    def uninstall(self):
+        if self.saved is None:
+            return
+        for target, name, value in zip((self.cpu, self.mem, self.mem), ("run", "read", "write"), self.saved):
+            if value is None:
+                target.__dict__.pop(name, None)
+            else:
+                setattr(target, name, value)
+        self.cpu.fast = self.saved[3]
+        self.saved = None
+
+    def check(self, location, access, value):
+        for start, end, watched in self.watches:
+            if start <= location <= end and access in watched:
+                kind = "read" if access == "r" else "write"
+                self.hits.append("{} of ${:02X} at ${:04X} by ${:04X}".format(kind, value, location, self.instruction_pc))
+                return
+
+    def resume(self):
+        "Continue from a breakpoint without stopping at it again straight away"
+        self.resume_pc = (self.cpu.pc.r1.value << 8) | self.cpu.pc.r2.value
+
+    def prompt(self, error):
+        """
+        Report a Break and ask what to do.
+        Returns False if the user wants to quit.
+        """
+        for hit in error.hits:
+            print("Break:", hit)
+        while True:
+            command = input("[c]ontinue, [s]tep, [r]egisters, [q]uit? ").strip().lower()
+            if command in ("", "c"):
+                self.resume()
+                return True
+            if command == "s":
+                self.resume()
+                try:
+                    self.gameboy.step()
+                except Break as step_error:
+                    for hit in step_error.hits:
+                        print("Break:", hit)
+                print("PC: ${:04X}".format(int(self.cpu.pc)))
+            elif command == "r":
+                self.cpu.displayRegisters()
+            elif command == "q":
+                return False
+
+def parseLocation(text):
+    """
+    "0150" or "02:4000" as (address, bank)
+
+    >>> parseLocation("02:4000")
+    (16384, 2)
+    >>> parseLocation("$0150")
+    (336, None)
+    """
+    bank, _, address = text.rpartition(":")
+    return int(address.lstrip("$"), 16), int(bank, 16) if bank else None
+
+def parseWatch(text):
+    """
+    "C000-C0FF:w" as (start, end, access), access defaults to rw
+
+    >>> parseWatch("C000-C0FF:w")
+    (49152, 49407, 'w')
+    >>> parseWatch("FF40")
+    (65344, 65344, 'rw')
+    """
+    addresses, _, access = text.partition(":")
+    start, _, end = addresses.partition("-")
+    start = int(start.lstrip("$"), 16)
+    end = int(end.lstrip("$"), 16) if end else start
+    return start, end, access or "rw"
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,273 @@
+#!/bin/env python3
+
+import bisect
+import hashlib
+import sys
+
+import opinfo
+from romcache import ROMCache
+
+help = """
+Usage: disassembler path_to_rom [bank]
+
+Disassembles the code reachable from the entry point, the interrupt vectors
+and the restart vectors and prints it block by block.
+[bank]: only print this ROM bank
+
+The analysis is cached by ROM contents in $GAMETOY_CACHE, ~/.cache/gametoy
+if that isn't set, and reused by later runs on the same ROM wherever it is.
+"""
+
+VERSION = 3 # bump when the cached data or the analysis changes
+CACHE_KIND = "disasm"
+ENTRY_POINTS = [0x100, 0x40, 0x48, 0x50, 0x58, 0x60] + list(range(0x00, 0x40, 0x08))
+BANK_SIZE = 0x4000
+
+# Values in Disassembly.code
+UNKNOWN = 0
+OPCODE = 1 # first byte of an instruction
+OPERAND = 2 # later bytes of an instruction
+
+class Block:
+    "A run of instructions only entered at the start and only left at the end"
+    def __init__(self, bank, start, end, successors, exit):
+        self.bank = bank
+        self.start = start
+        self.end = end # address after the last instruction
+        self.successors = successors # list of (bank, address)
+        self.exit = exit # flow of the last instruction from opinfo, "fall" when it runs into the next block
+
+    def state(self):
+        return (self.start, self.end, tuple(self.successors), self.exit)
+
+    @classmethod
+    def fromState(cls, bank, data):
+        start, end, successors, exit = data
+        return cls(bank, start, end, list(successors), exit)
+
+class Disassembly:
+    """
+    Recursive descent disassembly of a ROM.
+    Locations are (bank, address) with address as the CPU sees it, bank is
+    0 for $0000-$3FFF. Jumps from bank 0 into $4000-$7FFF can't be followed
+    without knowing the selected bank, they're kept in unresolved until
+    explore() is given the bank.
+    """
+    def __init__(self, rom):
+        self.rom = rom
+        self.banks = max(1, (len(rom) + BANK_SIZE - 1) // BANK_SIZE)
+        self.code = [bytearray(BANK_SIZE) for bank in range(self.banks)] # OPCODE/OPERAND per byte
+        self.leaders = set() # locations that start a block
+        self.edges = {} # location of a jump or call -> location of its target
+        self.unresolved = set() # addresses in $4000-$7FFF jumped to from bank 0
+        self.blocks = [[] for bank in range(self.banks)] # sorted by start
+        self.starts = [[] for bank in range(self.banks)] # block starts for bisect
+
+    def read(self, bank, address):
+        offset = address if address < BANK_SIZE else bank * BANK_SIZE + address - BANK_SIZE
+        return self.rom[offset] if offset < len(self.rom) else 0xFF
+
+    def locate(self, bank, address):
+        "The location of address when executing in bank, None if not in ROM"
+        if address < BANK_SIZE:
+            return (0, address)
+        if address < 2 * BANK_SIZE:
+            if bank:
+                return (bank, address)
+            if self.banks <= 2: # no banking, bank 1 is always mapped
+                return (1, address)
+            self.unresolved.add(address)
+        return None
+
+    def target(self, bank, address, info):
+        "Location an instruction branches to, None if unknown or outside ROM"
+        mnemonic, operands, length = info[:3]
+        if mnemonic == "RST":
+            return (0, int(operands[0][1:], 16))
+        if mnemonic == "JR":
+            offset = self.read(bank, (address + 1) & 0xFFFF)
+            offset = offset - 0x100 if offset & 0x80 else offset
+            return self.locate(bank, (address + length + offset) & 0xFFFF)
+        if "a16" in operands:
+            word = self.read(bank, (address + 1) & 0xFFFF) | (self.read(bank, (address + 2) & 0xFFFF) << 8)
+            return self.locate(bank, word)
+        return None
+
+    def decode(self, bank, address):
+        opcode = self.read(bank, address)
+        if opcode == 0xCB:
+            return opinfo.CB_INSTRUCTIONS[self.read(bank, (address + 1) & 0xFFFF)]
+        return opinfo.INSTRUCTIONS[opcode]
+
+    def mark(self, bank, address):
+        "Record the instruction at address as code, returns its length"
+        info = self.decode(bank, address)
+        length = info[2]
+        offset = address & (BANK_SIZE - 1)
+        code = self.code[bank]
+        code[offset] = OPCODE
+        code[offset + 1:offset + length] = bytes([OPERAND]) * (length - 1)
+        if info[5] in ("jump", "jump_cc", "call", "call_cc"):
+            target = self.target(bank, address, info)
+            if target is not None:
+                self.edges[(bank, address)] = target
+        return length
+
+    def explore(self, entries=None):
+        """
+        Follow every path from entries, a list of locations, defaulting to the
+        vectors in bank 0. Can be called again with more entries.
+        """
+        if entries is None:
+            entries = [(0, address) for address in ENTRY_POINTS]
+        pending = []
+        for location in entries:
+            self.leaders.add(location)
+            pending.append(location)
+
+        while pending:
+            bank, address = pending.pop()
+            while True:
+                code = self.code[bank]
+                offset = address & (BANK_SIZE - 1)
+                if code[offset] == OPCODE:
+                    break # joined a path that was already followed
+                info = self.decode(bank, address)
+                if info is None or code[offset] == OPERAND or offset + info[2] > BANK_SIZE:
+                    break # not code after all, or runs off the end of the bank
+                length = self.mark(bank, address)
+                flow = info[5]
+                target = self.edges.get((bank, address))
+                if target is not None:
+                    self.leaders.add(target)
+                    pending.append(target)
+                if flow in ("jump", "jump_hl", "ret"):
+                    break
+                location = self.locate(bank, address + length) # running out of bank 0 goes on in $4000
+                if location is None:
+                    break # into a bank not known yet, kept in unresolved, or out of ROM
+                bank, address = location
+                if flow is not None: # execution can continue here after a branch
+                    self.leaders.add(location)
+        self.buildBlocks()
+
+    def buildBlocks(self):
+        for bank in range(self.banks):
+            code = self.code[bank]
+            base = 0 if bank == 0 else BANK_SIZE
+            blocks = []
+            offset = 0
+            while offset < BANK_SIZE:
+                if code[offset] != OPCODE:
+                    offset += 1
+                    continue
+                start = base + offset
+                address = start
+                while True:
+                    info = self.decode(bank, address)
+                    location = (bank, address)
+                    address += info[2]
+                    flow = info[5]
+                    next_offset = address - base
+                    falls = flow not in ("jump", "jump_hl", "ret")
+                    if flow is not None or next_offset >= BANK_SIZE or code[next_offset] != OPCODE or (bank, address) in self.leaders:
+                        break
+                successors = [self.edges[location]] if location in self.edges else []
+                following = self.locate(bank, address) if falls else None
+                if following is not None and self.isCode(*following):
+                    successors.append(following)
+                blocks.append(Block(bank, start, address, successors, flow or "fall"))
+                offset = next_offset
+            self.blocks[bank] = blocks
+            self.starts[bank] = [block.start for block in blocks]
+
+    def blockAt(self, bank, address):
+        "The block containing an address, None if it isn't known code"
+        if address < BANK_SIZE:
+            bank = 0
+        starts = self.starts[bank]
+        index = bisect.bisect_right(starts, address) - 1
+        if index >= 0 and address < self.blocks[bank][index].end:
+            return self.blocks[bank][index]
+        return None
+
+    def isCode(self, bank, address):
+        "True if address starts an instruction found by the disassembly"
+        if address < BANK_SIZE:
+            return self.code[0][address] == OPCODE
+        return self.code[bank][address - BANK_SIZE] == OPCODE
+
+    def listing(self, block):
+        "Lines of disassembly for a block"
+        lines = []
+        address = block.start
+        while address < block.end:
+            text, length = opinfo.disassemble(lambda a: self.read(block.bank, a), address)
+            lines.append("{:02X}:{:04X}  {}".format(block.bank, address, text))
+            address += length
+        return lines
+
+    def state(self):
+        "Everything explore() works out, in types marshal can store"
+        return {
+            "code": [bytes(code) for code in self.code],
+            "leaders": self.leaders,
+            "edges": self.edges,
+            "unresolved": self.unresolved,
+            "blocks": [[block.state() for block in blocks] for blocks in self.blocks],
+        }
+
+    def applyState(self, state):
+        "Take over a state() of the same ROM, returns False if it doesn't fit"
+        if len(state["code"]) != self.banks:
+            return False
+        self.code = [bytearray(code) for code in state["code"]]
+        self.leaders = state["leaders"]
+        self.edges = state["edges"]
+        self.unresolved = state["unresolved"]
+        for bank, blocks in enumerate(state["blocks"]):
+            self.blocks[bank] = [Block.fromState(bank, data) for data in blocks]
+            self.starts[bank] = [block.start for block in self.blocks[bank]]
+        return True
+
+def disassemble(rom, cache=None):
+    """
+    Disassembly of a ROM from its vectors.
+    With a ROMCache the result is looked up by the ROM's SHA-1, and worked
+    out and stored if it isn't there.
+    """
+    disassembly = Disassembly(rom)
+    if cache is None:
+        disassembly.explore()
+        return disassembly
+
+    digest = hashlib.sha1(rom).hexdigest()
+    state = cache.load(digest, CACHE_KIND, VERSION)
+    if state is None or not disassembly.applyState(state):
+        disassembly.explore()
+        cache.store(digest, CACHE_KIND, VERSION, disassembly.state())
+    return disassembly
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1].startswith("-"):
+        print(help)
+        return
+    path = sys.argv[1]
+    only_bank = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    with open(path, "rb") as rom_file:
+        rom = rom_file.read()
+
+    disassembly = disassemble(rom, ROMCache())
+    for bank, blocks in enumerate(disassembly.blocks):
+        if only_bank is not None and bank != only_bank:
+            continue
+        for block in blocks:
+            print("\n".join(disassembly.listing(block)))
+            successors = ", ".join("{:02X}:{:04X}".format(*successor) for successor in block.successors)
+            print("        ; {} -> {}".format(block.exit, successors or "?"))
+            print()
+    if disassembly.unresolved:
+        print("Jumps into unknown banks:", " ".join("${:04X}".format(a) for a in sorted(disassembly.unresolved)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import os
+import pickle
+import struct
+import traceback
+
+class Branch:
+    def __init__(self, pid, request_fd, result_fd):
+        self.pid = pid
+        self.request_fd = request_fd
+        self.result_fd = result_fd
+
+class ForkPool:
+    """
+    Keeps a number of forked processes waiting, each holding a copy of the
+    same snapshot. Handing a request to one of them costs no Python level
+    copying, the operating system copies pages on write instead.
+
+    worker(gameboy, request) runs in the child and its return value is sent
+    back to the parent. A child only ever serves one request because it
+    consumes its copy of the snapshot, it is replaced by a fresh fork.
+    """
+    def __init__(self, gameboy, size, worker):
+        assert(hasattr(os, "fork"))
+        assert(size > 0)
+        self.snapshot = gameboy.clone()
+        self.worker = worker
+        self.branches = []
+        self.idle = []
+        for i in range(size):
+            self.idle.append(self.spawn())
+
+    def spawn(self):
+        request_read, request_write = os.pipe()
+        result_read, result_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(request_write)
+            os.close(result_read)
+            # Drop the pipes of our siblings so they see EOF when the parent closes them
+            for branch in self.branches:
+                os.close(branch.request_fd)
+                os.close(branch.result_fd)
+            self.serve(request_read, result_write)
+
+        os.close(request_read)
+        os.close(result_write)
+        branch = Branch(pid, request_write, result_read)
+        self.branches.append(branch)
+        return branch
+
+    def serve(self, request_fd, result_fd):
+        status = 0
+        try:
+            request = receiveMessage(request_fd)
+            if request is not None:
+                try:
+                    response = (True, self.worker(self.snapshot, request[0]))
+                except Exception:
+                    response = (False, traceback.format_exc())
+                sendMessage(result_fd, response)
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+        finally:
+            os._exit(status)
+
+    def map(self, requests):
+        "Run every request on its own branch of the snapshot and return the results in order"
+        results = []
+        busy = []
+        for request in requests:
+            if not self.idle:
+                results.append(self.collect(busy.pop(0)))
+            branch = self.idle.pop()
+            sendMessage(branch.request_fd, (request,))
+            busy.append(branch)
+        for branch in busy:
+            results.append(self.collect(branch))
+        return results
+
+    def collect(self, branch):
+        response = receiveMessage(branch.result_fd)
+        self.retire(branch)
+        self.idle.append(self.spawn())
+
+        if response is None:
+            raise RuntimeError("Branch {} exited without a result".format(branch.pid))
+        success, value = response
+        if not success:
+            raise RuntimeError("Branch {} failed:\n{}".format(branch.pid, value))
+        return value
+
+    def retire(self, branch):
+        os.close(branch.request_fd)
+        os.close(branch.result_fd)
+        os.waitpid(branch.pid, 0)
+        self.branches.remove(branch)
+
+    def close(self):
+        while self.idle:
+            self.retire(self.idle.pop())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def sendMessage(fd, obj):
+    data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+    data = struct.pack("<Q", len(data)) + data
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+def receiveMessage(fd):
+    "Returns None if the other end closed the pipe"
+    header = readExactly(fd, 8)
+    if header is None:
+        return None
+    data = readExactly(fd, struct.unpack("<Q", header)[0])
+    if data is None:
+        return None
+    return pickle.loads(data)
+
+def readExactly(fd, size):
+    chunks = []
+    while size > 0:
+        chunk = os.read(fd, size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
@@ -0,0 +1,109 @@
+import mmap
+from array import array
+
+from cpu import CPU
+from interrupts import Interrupts
+from lcdc import LCDC
+from memory import Memory
+from sound import Sound
+from timer import Timer
+from link import Link
+from joypad import Joypad
+from scheduler import Scheduler
+
+# Devices whose state is copied by GameBoy.clone()
+DEVICES = ["mem", "mbc", "interrupts", "cpu", "timer", "sound", "link", "joypad", "lcdc"]
+REGISTERS = ["a", "f", "b", "c", "d", "e", "h", "l"]
+SCALARS = (int, float, bool, str, type(None))
+
+class GameBoy:
+    def __init__(self, rom, header, debug_instructions=False, debug_registers=False, headless=False, scaled=False, lazy_flags=False, fast=False):
+        self.rom = rom
+        self.header = header
+
+        self.scheduler = Scheduler()
+        self.mem = Memory(rom, header, self.scheduler)
+        self.mbc = self.mem.mbc
+        self.interrupts = Interrupts()
+        self.cpu = CPU(self.mem, self.interrupts, debug_instructions, debug_registers, lazy_flags, fast)
+        self.timer = Timer(self.interrupts, self.scheduler)
+        self.sound = Sound(self.scheduler)
+        self.link = Link(self.interrupts, self.scheduler)
+        self.joypad = Joypad()
+        self.lcdc = LCDC(self.mem, self.interrupts, self.scheduler, headless, scaled)
+        self.mem.setupIO(self.lcdc, self.interrupts, self.timer, self.sound, self.link, self.joypad)
+
+    def step(self):
+        "Run a single instruction and return how many machine cycles it took"
+        if self.interrupts.pending:
+            self.interrupts.update()
+        if self.cpu.run_state == "RUN":
+            self.cpu.run()
+        else:
+            self.cpu.cycles += 1
+
+        self.lcdc.update(self.cpu.cycles)
+        cycles = self.cpu.popCycles()
+        self.scheduler.advance(cycles)
+        return cycles
+
+    def runFrame(self, budget=-1):
+        """
+        Run until the LCD finishes a frame, the CPU quits or more than budget
+        cycles have passed. Returns the machine cycles run.
+        """
+        step = self.step
+        cpu = self.cpu
+        lcdc = self.lcdc
+        frame = lcdc.frame_count
+        cycles = 0
+        while lcdc.frame_count == frame and cpu.run_state != "QUIT":
+            cycles += step()
+            if budget >= 0 and cycles > budget:
+                break
+        return cycles
+
+    def runUntil(self, cycle):
+        "Run until the scheduler reaches cycle, returns False if the CPU quit first"
+        step = self.step
+        cpu = self.cpu
+        scheduler = self.scheduler
+        while scheduler.cycles < cycle:
+            if cpu.run_state == "QUIT":
+                return False
+            step()
+        return True
+
+    def clone(self):
+        "Return a headless copy of this machine that shares the read-only ROM"
+        cpu = self.cpu
+        other = GameBoy(self.rom, self.header, cpu.debug_instructions, cpu.debug_registers, True, lazy_flags=cpu.lazy_flags, fast=cpu.fast)
+        other.loadState(self)
+        return other
+
+    def loadState(self, source):
+        devices = {}
+        for name in DEVICES:
+            copyState(getattr(source, name), getattr(self, name))
+            devices[id(getattr(source, name))] = getattr(self, name)
+        self.scheduler.loadState(source.scheduler, devices)
+        self.mbc.remap()
+
+        for name in REGISTERS:
+            getattr(self.cpu, name).value = getattr(source.cpu, name).value
+        self.cpu.pc.set(int(source.cpu.pc))
+        self.cpu.sp.set(int(source.cpu.sp))
+        self.lcdc.decodeOAM()
+
+def copyState(source, target):
+    """
+    Copy the scalar, bytearray, array and mmap attributes of one device onto another.
+    Everything else (other devices, bound methods, pygame surfaces, caches)
+    is left alone so the target stays wired to its own machine.
+    Buffers are copied in place so anything holding a view of them stays valid.
+    """
+    for name, value in source.__dict__.items():
+        if type(value) in SCALARS:
+            target.__dict__[name] = value
+        elif type(value) in (bytearray, array, mmap.mmap):
+            target.__dict__[name][:] = value
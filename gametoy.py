@@ -2,22 +2,19 @@
 
 import os
 import sys
-import traceback
-import pygame
-import cProfile
 
-from cpu import CPU
+from gameboy import GameBoy
 from header import Header
-from interrupts import Interrupts
-from lcdc import LCDC
-from memory import Memory
-from sound import Sound
-from timer import Timer
-from link import Link
-from joypad import Joypad
+from debugger import Debugger, Break, parseLocation, parseWatch
+from pacer import Pacer
+from romcoverage import Coverage
+from tracebuffer import Trace, DEFAULT_SIZE
+from link import SocketCable
+from savefile import SaveFile, savePath
 
 help = """
-Usage: gametoy rompath [debug mode] [max cycles]
+Usage: gametoy rompath [debug mode] [max cycles] [options]
+       gametoy catalogue directory index [--jobs=N]
 
 [debug modes]: display debug info
     values: NONE, INSTRUCTIONS, REGISTERS, HEADER, TITLE, MEMORY, PROFILE, ALL
@@ -25,59 +22,145 @@ Usage: gametoy rompath [debug mode] [max cycles]
     values: integer >= 0
 
 ALL enables every debug mode except PROFILE.
+
+[options]:
+    --frameskip=N/M   skip drawing N out of every M frames
+    --frameskip=auto  skip drawing frames while running behind real time
+    --scaled          let the display hardware scale the window
+    --speed=X         run at X times real hardware speed
+    --unlimited       run as fast as possible
+    --lazyflags       only work out CPU flags when an instruction reads them
+    --fast            run the generated interpreter, no INSTRUCTIONS or REGISTERS output
+    --coverage=FILE   add the ROM code and data this run touches to FILE
+    --break=LIST      stop at these addresses, e.g. 0150,02:4000 (bank:address)
+    --watch=LIST      stop on access to these ranges, e.g. C000-C0FF:w,FF40:r
+    --trace[=N]       keep the last N instructions (default a million) and write
+                      them to rompath.trace on a crash or when F12 is pressed
+    --sound           play the sound (needs NumPy)
+    --audio=FILE      write the sound to FILE, a WAV file if it ends in .wav, raw
+                      16 bit stereo PCM otherwise (needs NumPy)
+    --audiorate=N     samples per second written by --audio, default 65536
+    --link=listen:PATH   wait for another gametoy to link up over a UNIX socket at PATH
+    --link=connect:PATH  link up with the gametoy listening at PATH
+
+catalogue reads the headers of the ROMs under directory into index, see catalogue.py.
+
+Hold TAB to run as fast as possible.
+Cartridge RAM with a battery is kept in rompath with the extension .sav.
 """
 
-def run(path, debug, max_cycles):
+OPTIONS = ["frameskip", "scaled", "speed", "unlimited", "lazyflags", "fast", "coverage", "break", "watch", "trace", "link", "audio", "audiorate", "sound"]
+MAX_AUTO_SKIP = 4 # frames skipped in a row before one is drawn anyway
+
+def run(path, debug, max_cycles, options={}):
+    import pygame
     with open(path, "rb") as rom_file:
         debug_title = debug == "TITLE"
         debug_header = debug == "HEADER" or debug == "ALL"
         debug_mem = debug == "MEMORY" or debug == "ALL"
         debug_instructions = debug == "INSTRUCTIONS" or debug == "ALL"
         debug_registers = debug == "REGISTERS" or debug == "ALL"
-        rom = [i for i in rom_file.read()]
+        rom = rom_file.read()
         
         header = Header(rom, debug_header)
-        mem = Memory(rom, header)
+        if not debug_header:
+            for problem in header.problems:
+                print("Warning: " + problem)
         if debug_title:
             print("Title: " + header.name)
         if debug_instructions:
             print("PC:    Operation")
         
-        interrupts = Interrupts()
-        cpu = CPU(mem, interrupts, debug_instructions, debug_registers)
-        timer = Timer(interrupts)
-        sound = Sound()
-        link = Link()
-        joypad = Joypad()
-        lcdc = LCDC(mem, interrupts)
-        mem.setupIO(lcdc, interrupts, timer, sound, link, joypad)
+        gameboy = GameBoy(rom, header, debug_instructions, debug_registers, scaled="scaled" in options, lazy_flags="lazyflags" in options, fast="fast" in options)
+        if "frameskip" in options:
+            frameskip = options["frameskip"]
+            if frameskip == "auto":
+                gameboy.lcdc.setAutoFrameSkip(MAX_AUTO_SKIP)
+            else:
+                skip, period = frameskip.split("/")
+                gameboy.lcdc.setFrameSkip(int(skip), int(period))
+        pacer = Pacer(float(options.get("speed") or 1.0))
+        unlimited = "unlimited" in options
+        pacer.turbo = unlimited
+        gameboy.lcdc.frame_time = pacer.frameTime()
+        coverage = None
+        if options.get("coverage"):
+            coverage = Coverage(rom)
+            coverage.attach(gameboy)
+        trace = None
+        if "trace" in options:
+            trace = Trace(int(options["trace"] or DEFAULT_SIZE))
+            trace.attach(gameboy)
+        debugger = Debugger(gameboy)
+        for location in filter(None, options.get("break", "").split(",")):
+            address, bank = parseLocation(location)
+            debugger.addBreakpoint(address, bank)
+        for watch in filter(None, options.get("watch", "").split(",")):
+            debugger.addWatch(*parseWatch(watch))
+        if options.get("link"):
+            mode, _, socket_path = options["link"].partition(":")
+            if mode == "listen":
+                print("Waiting for the other gametoy to connect to " + socket_path)
+                gameboy.link.connect(SocketCable.listen(socket_path))
+            else:
+                gameboy.link.connect(SocketCable.connectTo(socket_path))
+        audio = None
+        if options.get("audio"):
+            from audiofile import FileSink
+            from synth import SAMPLE_RATE
+            audio = FileSink(options["audio"], int(options.get("audiorate") or SAMPLE_RATE))
+            gameboy.sound.addSink(audio)
+        save = None
+        if header.battery and (len(gameboy.mbc.ram_data) or header.timer):
+            save = SaveFile(savePath(path), gameboy.mbc)
+        playback = None
+        if "sound" in options:
+            from audioplayback import Playback
+            playback = Playback()
+            playback.start()
+            gameboy.sound.addSink(playback)
+        cpu = gameboy.cpu
+        mem = gameboy.mem
         total_cycles = 0
 
         try:
             pygame.init()
             while cpu.run_state != "QUIT":
+                # Input is only sampled once per frame
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
                         cpu.run_state = "QUIT"
                     if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
-                        joypad.keyEvent(event)
-
-                interrupts.update()
-                if cpu.run_state == "RUN":
-                    cpu.run()
-                else:
-                    cpu.cycles += 1
+                        if event.key == pygame.K_TAB:
+                            pacer.turbo = unlimited or event.type == pygame.KEYDOWN
+                        if event.key == pygame.K_F12 and event.type == pygame.KEYDOWN and trace:
+                            trace.dump(path + ".trace")
+                        gameboy.joypad.keyEvent(event)
 
-                timer.update(cpu.cycles)
-                lcdc.update(cpu.cycles)
+                try:
+                    if max_cycles >= 0:
+                        total_cycles += gameboy.runFrame(max_cycles - total_cycles)
+                        if total_cycles > max_cycles:
+                            cpu.run_state = "QUIT"
+                    else:
+                        gameboy.runFrame()
+                except Break as error:
+                    if not debugger.prompt(error):
+                        cpu.run_state = "QUIT"
 
-                total_cycles += cpu.popCycles()
-                if max_cycles >= 0 and total_cycles > max_cycles:
-                    cpu.run_state = "QUIT"
+                if pacer.wait():
+                    caption = "GAMETOY - {:.0f}%".format(pacer.achieved * 100)
+                    if playback:
+                        stats = playback.stats()
+                        caption += " - sound {:.0f} ms, {} underruns".format(stats["latency"] * 1000, stats["underruns"])
+                    pygame.display.set_caption(caption)
         except AssertionError as e:
+            import traceback
             if debug_mem:
                 mem.display()
             traceback.print_tb(e.__traceback__)
+            if trace:
+                trace.dump(path + ".trace")
         except KeyboardInterrupt as e:
             if debug_mem:
                 mem.display()
@@ -85,25 +168,62 @@ def run(path, debug, max_cycles):
             if debug_mem:
                 mem.display()
 
+        gameboy.link.disconnect()
+        if save:
+            save.close()
+        if audio:
+            gameboy.sound.removeSink(audio)
+            audio.close()
+        if playback:
+            gameboy.sound.removeSink(playback)
+            playback.close()
+        if coverage:
+            coverage.accumulate(options["coverage"])
+
+def splitOptions(args):
+    "Separate --name=value options from the positional arguments"
+    positional = []
+    options = {}
+    for arg in args:
+        if arg.startswith("--"):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value
+        else:
+            positional.append(arg)
+    return positional, options
+
 def main():
-    if len(sys.argv) > 1:
-        path = os.path.abspath(sys.argv[1])
+    if sys.argv[1:2] == ["catalogue"]:
+        import catalogue
+        return catalogue.main(sys.argv[2:])
+
+    args, options = splitOptions(sys.argv[1:])
+    for name in options:
+        if name not in OPTIONS:
+            print("Unknown option: --" + name)
+            print(help)
+            return
+
+    if len(args) > 0:
+        path = os.path.abspath(args[0])
 
-        if len(sys.argv) > 2:
-            debug = sys.argv[2]
+        if len(args) > 1:
+            debug = args[1]
 
-            if len(sys.argv) > 3:
-                max_cycles = int(sys.argv[3])
-                run(path, debug, max_cycles)
+            if len(args) > 2:
+                max_cycles = int(args[2])
+                run(path, debug, max_cycles, options)
             else:
-                run(path, debug, -1)
+                run(path, debug, -1, options)
         else:
-            run(path, "NONE", -1)
+            run(path, "NONE", -1, options)
     else:
         print(help)
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2 and sys.argv[2] == "PROFILE":
+    args, options = splitOptions(sys.argv[1:])
+    if len(args) > 1 and args[1] == "PROFILE":
+        import cProfile
         cProfile.run('main()')
     else:
-        main()
+        sys.exit(main())
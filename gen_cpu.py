@@ -0,0 +1,472 @@
+#!/bin/env python3
+
+import re
+import sys
+
+from opcodes import SEMANTICS, INSTRUCTIONS, CB_INSTRUCTIONS
+
+help = """
+Usage: gen_cpu [directory]
+
+Generates cpu_fast.py, cpu_traced.py and opinfo.py from the instruction set
+in opcodes.py.
+[directory]: where to write them, default the current directory
+"""
+
+HEADER = "# Generated by gen_cpu.py from opcodes.py, do not edit\n"
+
+REGISTER_BYTES = {name: "cpu." + name.lower() for name in "ABCDEFHL"}
+REGISTER_WORDS = {
+    "AF": ("cpu.a", "cpu.f"),
+    "BC": ("cpu.b", "cpu.c"),
+    "DE": ("cpu.d", "cpu.e"),
+    "HL": ("cpu.h", "cpu.l"),
+    "SP": ("cpu.sp.r1", "cpu.sp.r2"),
+}
+CONDITION_TESTS = {
+    "NZ": "not cpu.f.value & 0x80",
+    "Z":  "cpu.f.value & 0x80",
+    "NC": "not cpu.f.value & 0x10",
+    "C":  "cpu.f.value & 0x10",
+}
+# Memory operands as (setup, address variable, address is always in $FF00-$FFFF)
+MEMORY_OPERANDS = {
+    "(BC)":  ("bc = (cpu.b.value << 8) | cpu.c.value", "bc", False),
+    "(DE)":  ("de = (cpu.d.value << 8) | cpu.e.value", "de", False),
+    "(HL)":  ("hl = (cpu.h.value << 8) | cpu.l.value", "hl", False),
+    "(HL+)": ("hl = (cpu.h.value << 8) | cpu.l.value", "hl", False),
+    "(HL-)": ("hl = (cpu.h.value << 8) | cpu.l.value", "hl", False),
+    "(a16)": (None, "imm16", False),
+    "(a8)":  ("address = 0xFF00 | imm8", "address", True),
+    "(C)":   ("address = 0xFF00 | cpu.c.value", "address", True),
+}
+IMMEDIATES = {
+    "d8":  "imm8 = {fetch1}",
+    "r8":  "imm8 = {fetch1}\noffset = imm8 - 0x100 if imm8 & 0x80 else imm8",
+    "d16": "imm16 = {fetch1} | ({fetch2} << 8)",
+    "a16": "imm16 = {fetch1} | ({fetch2} << 8)",
+}
+IMMEDIATE_VARIABLES = {"d8": "imm8", "r8": "offset", "d16": "imm16", "a16": "imm16"}
+NEEDS_IMMEDIATE = {"(a16)": "a16", "(a8)": "d8"}
+
+# A tracebuffer record of the state before the instruction runs, written in
+# place at the start of every function in cpu_traced.py once pc_value is known
+TRACE_RECORD = """
+trace = cpu.trace
+count = trace.count
+trace.count = count + 1
+if pc_value < 0x3FFE:
+    bank = 0
+    code = mem.rom[pc_value:pc_value + 3]
+elif 0x4000 <= pc_value < 0x7FFE:
+    mbc = mem.mbc
+    bank = mbc.rom_bank % mbc.rom_banks
+    code = bytes(mbc.rom_high[pc_value - 0x4000:pc_value - 0x3FFD])
+else:
+    bank = 0
+    code = bytes((mem.read(pc_value), mem.read((pc_value + 1) & 0xFFFF), mem.read((pc_value + 2) & 0xFFFF)))
+sp = cpu.sp
+cycles = trace.scheduler.cycles + cpu.cycles
+trace.pack(trace.records, count % trace.size * trace.step, pc_value, bank, code,
+    cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+    cycles & 0xFFFFFFFF, cycles >> 32, sp.r2.value, sp.r1.value)
+""".strip("\n").split("\n")
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+STORE = re.compile(r"^(\s*)\{(\w+)\} = (.*)$")
+
+def fetch(offset):
+    "Instruction bytes are nearly always in ROM bank 0"
+    address = "pc_value + {}".format(offset)
+    return "(mem.rom[{0}] if {0} < 0x4000 else mem.read({0}))".format(address)
+
+def readMemory(address, io):
+    if io:
+        return "mem.read({})".format(address)
+    # Work RAM is the only region without side effects or banking, read it directly
+    return "(mem.internal_ram[{0} - 0xC000] if 0xC000 <= {0} < 0xE000 else mem.read({0}))".format(address)
+
+def writeMemory(indent, address, io, value):
+    if io:
+        return [indent + "mem.write({}, {})".format(address, value)]
+    return [
+        indent + "if 0xC000 <= {} < 0xE000:".format(address),
+        indent + "    mem.internal_ram[{} - 0xC000] = {}".format(address, value),
+        indent + "else:",
+        indent + "    mem.write({}, {})".format(address, value),
+    ]
+
+class Instruction:
+    def __init__(self, opcode, mnemonic, operands, length, cycles, flags, semantics, prefix=""):
+        self.opcode = opcode
+        self.mnemonic = mnemonic
+        self.operands = operands
+        self.length = length
+        self.cycles = cycles
+        self.flags = flags
+        self.semantics = semantics
+        self.prefix = prefix
+
+    def name(self):
+        return "op_{}{:02x}".format(self.prefix, self.opcode)
+
+    def text(self):
+        if self.operands:
+            return self.mnemonic + " " + ",".join(self.operands)
+        return self.mnemonic
+
+    def conditional(self):
+        return type(self.cycles) == tuple
+
+    def flow(self):
+        "How the instruction affects control flow, used by the disassembler"
+        kind = {"JP": "jump", "JR": "jump", "CALL": "call", "RST": "call", "RET": "ret", "RETI": "ret"}.get(self.mnemonic)
+        if kind is None:
+            return None
+        if self.operands == ("HL",):
+            return "jump_hl"
+        if self.conditional():
+            return kind + "_cc"
+        return kind
+
+    def kind(self, name):
+        "Operand kind referred to by a placeholder"
+        if name.startswith("op") and name[2:].isdigit():
+            return self.operands[int(name[2:])]
+        return name
+
+    def read(self, kind):
+        if kind in REGISTER_BYTES:
+            return REGISTER_BYTES[kind] + ".value"
+        if kind in REGISTER_WORDS:
+            high, low = REGISTER_WORDS[kind]
+            return "(({}.value << 8) | {}.value)".format(high, low)
+        if kind in MEMORY_OPERANDS:
+            setup, address, io = MEMORY_OPERANDS[kind]
+            return readMemory(address, io)
+        if kind in IMMEDIATE_VARIABLES:
+            return IMMEDIATE_VARIABLES[kind]
+        if kind.startswith("$"):
+            return "0x" + kind[1:]
+        raise ValueError("{}: can't read operand {}".format(self.text(), kind))
+
+    def store(self, indent, kind, value):
+        if kind in REGISTER_BYTES:
+            return [indent + "{}.value = {}".format(REGISTER_BYTES[kind], value)]
+        if kind in REGISTER_WORDS:
+            high, low = REGISTER_WORDS[kind]
+            mask = "0xF0" if kind == "AF" else "0xFF" # the low nibble of F doesn't exist
+            return [
+                indent + "word = {}".format(value),
+                indent + "{}.value = word >> 8".format(high),
+                indent + "{}.value = word & {}".format(low, mask),
+            ]
+        if kind in MEMORY_OPERANDS:
+            setup, address, io = MEMORY_OPERANDS[kind]
+            return writeMemory(indent, address, io, value)
+        raise ValueError("{}: can't store to operand {}".format(self.text(), kind))
+
+    def substitute(self, text):
+        def replace(match):
+            name = match.group(1)
+            if name == "cond":
+                return CONDITION_TESTS[self.operands[0]]
+            if name == "mask":
+                return hex(1 << int(self.operands[0]))
+            if name == "inv_mask":
+                return hex(0xFF ^ (1 << int(self.operands[0])))
+            if name == "taken":
+                return str(self.cycles[0])
+            if name == "not_taken":
+                return str(self.cycles[1])
+            return self.read(self.kind(name))
+        return PLACEHOLDER.sub(replace, text)
+
+    def kinds(self, template):
+        "Every operand kind the instruction touches"
+        kinds = set(self.operands)
+        for name in PLACEHOLDER.findall(template):
+            if name not in ("cond", "mask", "inv_mask", "taken", "not_taken"):
+                kinds.add(self.kind(name))
+        for kind in list(kinds):
+            if kind in NEEDS_IMMEDIATE:
+                kinds.add(NEEDS_IMMEDIATE[kind])
+        return kinds
+
+    def body(self):
+        template = SEMANTICS[self.semantics]
+        kinds = self.kinds(template)
+
+        lines = []
+        for kind in ("d8", "r8", "d16", "a16"):
+            if kind in kinds:
+                setup = IMMEDIATES[kind].format(fetch1=fetch(1), fetch2=fetch(2))
+                if setup not in lines:
+                    lines.extend(setup.split("\n"))
+        setups = set()
+        for kind in sorted(kinds):
+            if kind in MEMORY_OPERANDS and MEMORY_OPERANDS[kind][0] not in setups:
+                setup = MEMORY_OPERANDS[kind][0]
+                if setup is not None:
+                    lines.append(setup)
+                setups.add(setup)
+
+        for line in template.strip("\n").split("\n"):
+            if not line:
+                continue
+            match = STORE.match(line)
+            if match:
+                indent, name, value = match.groups()
+                lines.extend(self.store(indent, self.kind(name), self.substitute(value)))
+            else:
+                lines.append(self.substitute(line))
+
+        if "(HL+)" in kinds or "(HL-)" in kinds:
+            step = "+ 1" if "(HL+)" in kinds else "- 1"
+            lines.append("hl = (hl {}) & 0xFFFF".format(step))
+            lines.append("cpu.h.value = hl >> 8")
+            lines.append("cpu.l.value = hl & 0xFF")
+        if not self.conditional():
+            lines.append("cpu.cycles += {}".format(self.cycles))
+        return lines
+
+    def function(self, record=[]):
+        "The function running the instruction, with the lines of record before its body"
+        body = record + self.body()
+        prologue = [
+            "pc = cpu.pc",
+            "pc_value = (pc.r1.value << 8) | pc.r2.value",
+            "next_pc = (pc_value + {}) & 0xFFFF".format(self.length),
+        ]
+        if any("mem." in line for line in body):
+            prologue.insert(0, "mem = cpu.mem")
+        epilogue = [
+            "pc.r1.value = next_pc >> 8",
+            "pc.r2.value = next_pc & 0xFF",
+        ]
+        lines = ["def {}(cpu):".format(self.name()), '    "{}"'.format(self.text())]
+        lines.extend("    " + line for line in prologue + body + epilogue)
+        return "\n".join(lines) + "\n"
+
+def instructionTable(specs, prefix=""):
+    table = [None] * 0x100
+    for spec in specs:
+        instruction = Instruction(*spec, prefix=prefix)
+        assert table[instruction.opcode] is None, "opcode ${:02X} defined twice".format(instruction.opcode)
+        table[instruction.opcode] = instruction
+    return table
+
+FAST_PREAMBLE = HEADER + '''
+# A specialised interpreter, one function per opcode with operands, flag
+# updates and fast paths for work RAM written out. CPU.runFast() dispatches
+# through OPS.
+
+from alu import ADD, SUB, INC, DEC, DAA, RLC, RRC, RL, RR, SLA, SRA, SRL, SWAP
+
+def push(cpu, value):
+    mem = cpu.mem
+    sp = cpu.sp
+    address = (((sp.r1.value << 8) | sp.r2.value) - 2) & 0xFFFF
+    mem.write((address + 1) & 0xFFFF, value >> 8)
+    mem.write(address, value & 0xFF)
+    sp.r1.value = address >> 8
+    sp.r2.value = address & 0xFF
+
+def pop(cpu):
+    mem = cpu.mem
+    sp = cpu.sp
+    address = (sp.r1.value << 8) | sp.r2.value
+    value = mem.read(address) | (mem.read((address + 1) & 0xFFFF) << 8)
+    address = (address + 2) & 0xFFFF
+    sp.r1.value = address >> 8
+    sp.r2.value = address & 0xFF
+    return value
+
+def invalid(cpu):
+    address = (cpu.pc.r1.value << 8) | cpu.pc.r2.value
+    print("${:04X}: Invalid instruction ${:02X}".format(address, cpu.mem.read(address)))
+    cpu.run_state = "QUIT"
+
+def op_cb(cpu):
+    pc = cpu.pc
+    address = (((pc.r1.value << 8) | pc.r2.value) + 1) & 0xFFFF
+    CB_OPS[cpu.mem.read(address)](cpu)
+'''
+
+def dispatchTable(name, table, special={}):
+    names = []
+    for opcode, instruction in enumerate(table):
+        if opcode in special:
+            names.append(special[opcode])
+        else:
+            names.append(instruction.name() if instruction else "invalid")
+    lines = ["{} = (".format(name)]
+    for row in range(0, 0x100, 8):
+        lines.append("    " + " ".join(entry + "," for entry in names[row:row + 8]))
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+def generateFast(table, cb_table):
+    parts = [FAST_PREAMBLE]
+    for instruction in table + cb_table:
+        if instruction is not None:
+            parts.append("\n" + instruction.function())
+    parts.append("\n" + dispatchTable("OPS", table, {0xCB: "op_cb"}))
+    parts.append("\n" + dispatchTable("CB_OPS", cb_table))
+    return "".join(parts)
+
+TRACED_PREAMBLE = HEADER + '''
+# The interpreter in cpu_fast.py, writing a tracebuffer record into cpu.trace
+# before each instruction. Trace.attach() switches CPU.runFast() to OPS here,
+# which saves a wrapper call per instruction. $CB instructions are recorded
+# once, by op_cb, and then run untraced.
+
+import cpu_fast
+from alu import ADD, SUB, INC, DEC, DAA, RLC, RRC, RL, RR, SLA, SRA, SRL, SWAP
+from cpu_fast import push, pop, CB_OPS
+'''
+
+def tracedFunction(name, text, body):
+    "A function for the traced table that records the instruction at pc, then runs body"
+    lines = ["def {}(cpu):".format(name), '    "{}"'.format(text)]
+    prologue = ["mem = cpu.mem", "pc = cpu.pc", "pc_value = (pc.r1.value << 8) | pc.r2.value"]
+    lines.extend("    " + line for line in prologue + TRACE_RECORD + body)
+    return "\n".join(lines) + "\n"
+
+def generateTraced(table):
+    parts = [
+        TRACED_PREAMBLE,
+        "\n" + tracedFunction("invalid", "Invalid instruction", ["cpu_fast.invalid(cpu)"]),
+        "\n" + tracedFunction("op_cb", "CB prefix", ["CB_OPS[mem.read((pc_value + 1) & 0xFFFF)](cpu)"]),
+    ]
+    for instruction in table:
+        if instruction is not None:
+            parts.append("\n" + instruction.function(TRACE_RECORD))
+    parts.append("\n" + dispatchTable("OPS", table, {0xCB: "op_cb"}))
+    return "".join(parts)
+
+OPINFO_PREAMBLE = HEADER + '''
+# Instruction set tables for the disassembler and anything that needs timings.
+# INSTRUCTIONS and CB_INSTRUCTIONS hold (mnemonic, operands, length, cycles, flags, flow)
+# by opcode, or None for invalid opcodes and the $CB prefix.
+#   cycles - machine cycles, (taken, not taken) for conditional instructions
+#   flags  - effect on Z N H C, see opcodes.py
+#   flow   - None, or jump, jump_cc, jump_hl, call, call_cc, ret or ret_cc
+'''
+
+OPINFO_FUNCTIONS = '''
+def operandText(operand, mnemonic, address, length, read):
+    "Fill in immediate values of an operand"
+    if "d8" in operand:
+        return operand.replace("d8", "${:02X}".format(read((address + 1) & 0xFFFF)))
+    if "a8" in operand:
+        return operand.replace("a8", "$FF{:02X}".format(read((address + 1) & 0xFFFF)))
+    if "16" in operand:
+        word = read((address + 1) & 0xFFFF) | (read((address + 2) & 0xFFFF) << 8)
+        return operand.replace("d16", "${:04X}".format(word)).replace("a16", "${:04X}".format(word))
+    if "r8" in operand:
+        offset = read((address + 1) & 0xFFFF)
+        offset = offset - 0x100 if offset & 0x80 else offset
+        if mnemonic == "JR": # show where it goes
+            return "${:04X}".format((address + length + offset) & 0xFFFF)
+        return operand.replace("+r8", "{:+d}".format(offset)).replace("r8", "{:d}".format(offset))
+    return operand
+
+def disassemble(read, address):
+    """
+    Returns (text, length) for the instruction at address, read(address) returns a byte.
+
+    >>> code = [0x3E, 0x12, 0xCB, 0x7C, 0x18, 0xFE, 0xFA, 0x00, 0xC0, 0xD3]
+    >>> read = lambda address: code[address]
+    >>> disassemble(read, 0)
+    ('LD A,$12', 2)
+    >>> disassemble(read, 2)
+    ('BIT 7,H', 2)
+    >>> disassemble(read, 4)
+    ('JR $0004', 2)
+    >>> disassemble(read, 6)
+    ('LD A,($C000)', 3)
+    >>> disassemble(read, 9)
+    ('DB $D3', 1)
+    """
+    opcode = read(address)
+    if opcode == 0xCB:
+        info = CB_INSTRUCTIONS[read((address + 1) & 0xFFFF)]
+    else:
+        info = INSTRUCTIONS[opcode]
+    if info is None:
+        return "DB ${:02X}".format(opcode), 1
+
+    mnemonic, operands, length = info[:3]
+    if not operands:
+        return mnemonic, length
+    text = ",".join(operandText(operand, mnemonic, address, length, read) for operand in operands)
+    return mnemonic + " " + text, length
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+'''
+
+def infoTable(name, table):
+    lines = ["{} = (".format(name)]
+    for opcode, instruction in enumerate(table):
+        if instruction is None:
+            lines.append("    None, # ${:02X}".format(opcode))
+        else:
+            entry = (instruction.mnemonic, instruction.operands, instruction.length,
+                     instruction.cycles, instruction.flags, instruction.flow())
+            lines.append("    {!r}, # ${:02X}".format(entry, opcode))
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+def cycleTable(name, table, taken):
+    cycles = []
+    for instruction in table:
+        if instruction is None:
+            cycles.append(0)
+        elif instruction.conditional():
+            cycles.append(instruction.cycles[0 if taken else 1])
+        else:
+            cycles.append(instruction.cycles)
+    lines = ["{} = (".format(name)]
+    for row in range(0, 0x100, 16):
+        lines.append("    " + " ".join("{},".format(value) for value in cycles[row:row + 16]))
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+def generateInfo(table, cb_table):
+    parts = [
+        OPINFO_PREAMBLE,
+        "\n" + infoTable("INSTRUCTIONS", table),
+        "\n" + infoTable("CB_INSTRUCTIONS", cb_table),
+        "\n# Machine cycles by opcode, CYCLES counts conditional instructions as not taken\n",
+        cycleTable("CYCLES", table, False),
+        "\n" + cycleTable("CYCLES_TAKEN", table, True),
+        "\n" + cycleTable("CB_CYCLES", cb_table, False),
+        OPINFO_FUNCTIONS,
+    ]
+    return "".join(parts)
+
+def main():
+    directory = "."
+    if len(sys.argv) > 1:
+        if sys.argv[1].startswith("-"):
+            print(help)
+            return
+        directory = sys.argv[1]
+
+    table = instructionTable(INSTRUCTIONS)
+    cb_table = instructionTable(CB_INSTRUCTIONS, "cb")
+    outputs = {
+        "cpu_fast.py": generateFast(table, cb_table),
+        "cpu_traced.py": generateTraced(table),
+        "opinfo.py": generateInfo(table, cb_table),
+    }
+    for name, source in outputs.items():
+        compile(source, name, "exec") # don't write out anything broken
+        with open(directory + "/" + name, "w") as f:
+            f.write(source)
+
+if __name__ == "__main__":
+    main()
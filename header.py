@@ -1,183 +1,143 @@
+HEADER_SIZE = 0x150 # the header ends at 014F, nothing past it is needed to read it
+BANK_SIZE = 0x4000
+
+# Cartridge type byte at 0147: (bank controller, RAM, battery, timer, rumble)
+CARTRIDGE_TYPES = {
+    0x00: ("ROM", False, False, False, False),
+    0x01: ("MBC1", False, False, False, False),
+    0x02: ("MBC1", True, False, False, False),
+    0x03: ("MBC1", True, True, False, False),
+    0x05: ("MBC2", False, False, False, False),
+    0x06: ("MBC2", False, True, False, False),
+    0x08: ("ROM", True, False, False, False),
+    0x09: ("ROM", True, True, False, False),
+    0x0B: ("MMM01", False, False, False, False),
+    0x0C: ("MMM01", True, False, False, False),
+    0x0D: ("MMM01", True, True, False, False),
+    0x0F: ("MBC3", False, True, True, False),
+    0x10: ("MBC3", True, True, True, False),
+    0x11: ("MBC3", False, False, False, False),
+    0x12: ("MBC3", True, False, False, False),
+    0x13: ("MBC3", True, True, False, False),
+    0x15: ("MBC4", False, False, False, False),
+    0x16: ("MBC4", True, False, False, False),
+    0x17: ("MBC4", True, True, False, False),
+    0x19: ("MBC5", False, False, False, False),
+    0x1A: ("MBC5", True, False, False, False),
+    0x1B: ("MBC5", True, True, False, False),
+    0x1C: ("MBC5", False, False, False, True),
+    0x1D: ("MBC5", True, False, False, True),
+    0x1E: ("MBC5", True, True, False, True),
+    0xFC: ("POCKET CAMERA", False, False, False, False),
+    0xFD: ("BANDAI TAMA5", False, False, False, False),
+    0xFE: ("HuC3", False, False, False, False),
+    0xFF: ("HuC1", True, True, False, False),
+}
+
+# ROM size byte at 0148: 16KB banks, 32KB doubling up to 8MB and three odd sizes
+ROM_BANKS = {code: 2 << code for code in range(9)}
+ROM_BANKS.update({0x52: 72, 0x53: 80, 0x54: 96})
+
+# RAM size byte at 0149: bytes of cartridge RAM
+RAM_SIZES = {0x00: 0, 0x01: 0x800, 0x02: 0x2000, 0x03: 0x8000, 0x04: 0x20000, 0x05: 0x10000}
+
+MBC2_RAM_SIZE = 0x200 # built into the controller, the RAM size byte is 0
+
 class Header:
-    def __init__(self, rom, debug):
-        self.cartridgeType(rom)
-        self.ramInfo(rom)
-        self.romInfo(rom)
-        self.rom_size = len(rom)
+    """
+    Cartridge details from the header at 0100-014F.
+    rom only needs to hold the first HEADER_SIZE bytes, fromFile() reads no
+    more than that. Values that don't make sense are listed in problems
+    rather than stopping anything, the bank controller falls back to ROM
+    only behaviour for types it doesn't know.
+    """
+    def __init__(self, rom, debug=False):
+        self.problems = []
+        data = bytes(rom[:HEADER_SIZE])
+        if len(data) < HEADER_SIZE:
+            self.problems.append("Only {} bytes, too short for a header".format(len(data)))
+            data += bytes(HEADER_SIZE - len(data))
+
+        self.cartridgeType(data)
+        self.ramInfo(data)
+        self.romInfo(data)
+        self.checksums(data)
+        if len(rom) > HEADER_SIZE:
+            self.checkSize(rom)
+            self.checkGlobal(rom)
 
         self.name = ""
-        for byte in rom[0x0134:0x0149]:
+        for byte in data[0x0134:0x0144]:
             if byte != 0:
                 self.name += chr(byte)
 
         self.japanese = True
-        if(rom[0x014A] == 1):
+        if(data[0x014A] == 1):
             self.japanese = False
-    
+
         if debug:
             self.display()
 
+    @classmethod
+    def fromFile(cls, path, debug=False):
+        "Header of the ROM at path, reading only the header bytes"
+        with open(path, "rb") as rom_file:
+            return cls(rom_file.read(HEADER_SIZE), debug)
+
     def cartridgeType(self, rom):
         "Store cartridge hardware flags"
-
         self.cartridge_type = rom[0x0147]
-        self.mbc = None
-        self.ram = False
-        self.battery = False
-        self.timer = False
-        self.rumble = False
-        
-        if self.cartridge_type == 0x00:
-            self.mbc = "ROM"
-        elif self.cartridge_type == 0x01:
-            self.mbc = "MBC1"
-        elif self.cartridge_type == 0x02:
-            self.mbc = "MBC1"
-            self.battery = True
-        elif self.cartridge_type == 0x03:
-            self.mbc = "MBC1"
-            self.ram = True
-            self.battery = True
-        elif self.cartridge_type == 0x05:
-            self.mbc = "MBC2"
-        elif self.cartridge_type == 0x06:
-            self.mbc = "MBC1"
-            self.battery = True
-        elif self.cartridge_type == 0x08:
-            self.mbc = "ROM"
-            self.ram = True
-        elif self.cartridge_type == 0x09:
-            self.mbc = "ROM"
-            self.ram = True
-            self.battery = True
-        elif self.cartridge_type == 0x0B:
-            self.mbc = "MMM01"
-        elif self.cartridge_type == 0x0C:
-            self.mbc = "MMM01"
-            self.ram = True
-        elif self.cartridge_type == 0x0D:
-            self.mbc = "MMM01"
-            self.ram = True
-            self.battery = True
-        elif self.cartridge_type == 0x0F:
-            self.mbc = "MBC3"
-            self.battery = True
-            self.timer = True
-        elif self.cartridge_type == 0x10:
-            self.mbc = "MBC3"
-            self.ram = True
-            self.battery = True
-            self.timer = True
-        elif self.cartridge_type == 0x11:
-            self.mbc = "MBC3"
-        elif self.cartridge_type == 0x12:
-            self.mbc = "MBC3"
-            self.ram = True
-        elif self.cartridge_type == 0x13:
-            self.mbc = "MBC3"
-            self.ram = True
-            self.battery = True
-        elif self.cartridge_type == 0x15:
-            self.mbc = "MBC4"
-        elif self.cartridge_type == 0x16:
-            self.mbc = "MBC4"
-            self.ram = True
-        elif self.cartridge_type == 0x17:
-            self.mbc = "MBC4"
-            self.ram = True
-            self.battery = True
-        elif self.cartridge_type == 0x19:
-            self.mbc = "MBC5"
-        elif self.cartridge_type == 0x1A:
-            self.mbc = "MBC5"
-            self.ram = True
-        elif self.cartridge_type == 0x1B:
-            self.mbc = "MBC5"
-            self.ram = True
-            self.battery = True
-        elif self.cartridge_type == 0x1C:
-            self.mbc = "MBC5"
-            self.rumble = True
-        elif self.cartridge_type == 0x1D:
-            self.mbc = "MBC5"
-            self.ram = True
-            self.rumble = True
-        elif self.cartridge_type == 0x1E:
-            self.mbc = "MBC5"
-            self.ram = True
-            self.battery = True
-            self.rumble = True
-        elif self.cartridge_type == 0xFC:
-            self.mbc = "POCKET CAMERA"
-        elif self.cartridge_type == 0xFD:
-            self.mbc = "BANDAI TAMA5"
-        elif self.cartridge_type == 0xFE:
-            self.mbc = "HuC3"
-        elif self.cartridge_type == 0xFF:
-            self.mbc = "HuC1"
-            self.ram = True
-            self.battery = True
+        if self.cartridge_type in CARTRIDGE_TYPES:
+            self.mbc, self.ram, self.battery, self.timer, self.rumble = CARTRIDGE_TYPES[self.cartridge_type]
         else:
-            print("Unknown cartridge type:", hex(self.cartridge_type))
-            assert(False)
-        assert(self.mbc != None)
+            self.mbc = None
+            self.ram = self.battery = self.timer = self.rumble = False
+            self.problems.append("Unknown cartridge type {:02X}".format(self.cartridge_type))
 
     def ramInfo(self, rom):
         "Must be called after cartridgeType()"
-        
-        banks_code = rom[0x149]
-        if banks_code == 1 or self.mbc == "MBC2":
-            self.ram_banks = 1
-        elif banks_code == 0:
-            self.ram_banks = 0
-        elif banks_code == 2:
-            self.ram_banks = 1
-        elif banks_code == 3:
-            self.ram_banks = 4
-        else:
-            assert(False)
-
+        code = rom[0x0149]
         if self.mbc == "MBC2":
-            self.ram_size = 0x200
-        elif banks_code == 0:
-            self.ram_size = 0x0
-        elif banks_code == 1:
-            self.ram_size = 0x800
-        elif banks_code == 2:
-            self.ram_size = 0x2000
-        elif banks_code == 3:
-            self.ram_size = 0x8000
+            self.ram_size = MBC2_RAM_SIZE
+        elif code in RAM_SIZES:
+            self.ram_size = RAM_SIZES[code]
         else:
-            assert(False)
-
+            self.ram_size = 0
+            self.problems.append("Unknown RAM size {:02X}".format(code))
+        self.ram_banks = -(-self.ram_size // 0x2000)
 
     def romInfo(self, rom):
-        banks_code = rom[0x148]
-
-        if banks_code == 0x00:
-            self.rom_banks = 1
-        elif banks_code == 0x01:
-            self.rom_banks = 4
-        elif banks_code == 0x02:
-            self.rom_banks = 8
-        elif banks_code == 0x03:
-            self.rom_banks = 16
-        elif banks_code == 0x04:
-            self.rom_banks = 32
-        elif banks_code == 0x05:
-            self.rom_banks = 64
-        elif banks_code == 0x06:
-            self.rom_banks = 128
-        elif banks_code == 0x07:
-            self.rom_banks = 128
-        elif banks_code == 0x52:
-            self.rom_banks = 72
-        elif banks_code == 0x53:
-            self.rom_banks = 80
-        elif banks_code == 0x54:
-            self.rom_banks = 96
+        code = rom[0x0148]
+        if code in ROM_BANKS:
+            self.rom_banks = ROM_BANKS[code]
         else:
-            assert(False)
+            self.rom_banks = 2
+            self.problems.append("Unknown ROM size {:02X}".format(code))
+        self.rom_size = self.rom_banks * BANK_SIZE
+
+    def checksums(self, rom):
+        "The header checksum at 014D covers 0134-014C, the boot ROM refuses carts it doesn't match"
+        self.header_checksum = rom[0x014D]
+        check = 0
+        for byte in rom[0x0134:0x014D]:
+            check = (check - byte - 1) & 0xFF
+        self.header_checksum_ok = check == self.header_checksum
+        if not self.header_checksum_ok:
+            self.problems.append("Header checksum is {:02X}, should be {:02X}".format(self.header_checksum, check))
+        self.global_checksum = (rom[0x014E] << 8) | rom[0x014F]
+        self.global_checksum_ok = None # needs the whole ROM, see checkGlobal()
+
+    def checkGlobal(self, rom):
+        "Check the sum of every byte but the checksum's own against 014E-014F, which nothing on the hardware does"
+        check = (sum(rom) - rom[0x014E] - rom[0x014F]) & 0xFFFF
+        self.global_checksum_ok = check == self.global_checksum
+        if not self.global_checksum_ok:
+            self.problems.append("Global checksum is {:04X}, should be {:04X}".format(self.global_checksum, check))
+        return self.global_checksum_ok
+
+    def checkSize(self, rom):
+        if len(rom) != self.rom_size:
+            self.problems.append("ROM is {}KB, the header says {}KB".format(len(rom) // 1024, self.rom_size // 1024))
 
     def display(self):
         print("Title:", self.name)
@@ -190,4 +150,6 @@ class Header:
         print("Battery:", self.battery)
         print("Timer:", self.timer)
         print("Rumble:", self.rumble)
+        for problem in self.problems:
+            print("Problem:", problem)
         print("****************************")
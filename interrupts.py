@@ -1,4 +1,14 @@
+# Vector of the highest priority interrupt in each combination of the five
+# request bits, the lowest set bit wins: V-Blank 0x40, LCDC 0x48, Timer 0x50,
+# Serial 0x58, Joypad 0x60
+VECTORS = [0] + [0x40 + 8 * ((mask & -mask).bit_length() - 1) for mask in range(1, 32)]
+
 class Interrupts:
+    """
+    pending is worked out again whenever IE, IF or IME change, and is only
+    non zero while there is an interrupt to dispatch or an IME change
+    waiting to take effect, so update() need not run after every instruction.
+    """
     def __init__(self):
         self.ime_counter = 0
             
@@ -6,19 +16,18 @@ class Interrupts:
         self.ime_new = True
         self.iflag = 0
         self.ie = 0
-        self.locations = [
-            0x0040, #V-Blank
-            0x0048, #LCDC
-            0x0050, #Timer
-            0x0058, #Serial
-            0x0060  #Joypad
-        ]
+        self.pending = 0
+
+    def refresh(self):
+        self.pending = self.ime_counter or (self.ime and self.ie & self.iflag & 0x1F)
 
     def setIFbit(self, bit):
         self.iflag |= (1 << bit)
+        self.refresh()
 
     def clearIFbit(self, bit):
         self.iflag &= (~(1 << bit))
+        self.refresh()
 
     def setCall(self, call):
         self.call = call
@@ -26,26 +35,25 @@ class Interrupts:
     def setIME(self, enable):
         self.ime_counter = 2
         self.ime_new = enable
+        self.pending = 2
 
     def getIME(self):
         return self.ime
 
     def update(self):
+        "Called before an instruction while pending is set"
         if self.ime_counter > 0:
             self.ime_counter -= 1
+            if self.ime_counter == 0:
+                self.ime = self.ime_new
 
-        if self.ime_counter == 0:
-            self.ime = self.ime_new
-        
         if self.ime:
-            check = self.ie & self.iflag
-
-            for i, location in enumerate(self.locations):
-                if check & (1 << i):
-                    self.ime = False
-                    self.clearIFbit(i)
-                    self.call(location)
-                    return
+            check = self.ie & self.iflag & 0x1F
+            if check:
+                self.ime = False
+                self.iflag &= ~(check & -check)
+                self.call(VECTORS[check])
+        self.refresh()
         
     def callVBlank(self):
         self.setIFbit(0)
@@ -67,9 +75,11 @@ class Interrupts:
 
     def writeIF(self, value):
         self.iflag = value
+        self.refresh()
 
     def readIE(self):
         return self.ie
 
     def writeIE(self, value):
         self.ie = value
+        self.refresh()
@@ -1,9 +1,23 @@
+import hashlib
+import time
 import pygame
 
+DMA_CYCLES = 160 # machine cycles an OAM DMA transfer takes
+FRAME_TIME = 70224 / 4194304 # seconds per frame, roughly 59.7 Hz
+# Mode lengths in machine cycles, a quarter of the dots they last
+HBLANK_CYCLES = 51
+VBLANK_CYCLES = 1140 # 10 lines
+LINE_CYCLES = 114
+OAM_SEARCH_CYCLES = 20
+TRANSFER_CYCLES = 43
+MAX_LAG = 0.25 # seconds behind real time before auto frame skip gives up catching up
+
 class LCDC:
-    def __init__(self, mem, interrupts):
+    def __init__(self, mem, interrupts, scheduler, headless=False, scaled=False):
         self.mem = mem
         self.interrupts = interrupts
+        self.scheduler = scheduler
+        self.dma_end = 0 # cycle the last OAM DMA transfer finishes
 
         # FF40 bits 7-0
         # w - window
@@ -61,9 +75,26 @@ class LCDC:
         self.obp1_color3 = 0
     
         self.tiles = {}
+        self.sprites = [(-16, -8, 0, 0)] * 40 # decoded OAM entries, see decodeSprite()
+        self.line_sprites = [[] for y in range(144)]
         self.screen = pygame.Surface((160, 144), pygame.SRCALPHA)
-        self.display = pygame.display.set_mode((160 * 4, 144 * 4))
-        pygame.display.set_caption("GAMETOY")
+        self.display = None # headless machines compose frames but never present them
+        self.scaled = scaled # let pygame scale the window instead of scaling every frame ourselves
+        if not headless:
+            if scaled:
+                self.display = pygame.display.set_mode((160, 144), pygame.SCALED)
+            else:
+                self.display = pygame.display.set_mode((160 * 4, 144 * 4))
+            pygame.display.set_caption("GAMETOY")
+
+        # Frame skipping, emulation always continues but composition and presentation are skipped
+        self.frame_count    = 0
+        self.frame_skip     = 0 # skip this many frames...
+        self.frame_period   = 1 # ...out of every frame_period frames
+        self.auto_skip      = 0 # if > 0 skip up to this many frames in a row while behind real time
+        self.skipped        = 0
+        self.frame_deadline = None
+        self.frame_time     = FRAME_TIME # real time a frame should take, changed when running faster
         self.emu_palette = [
             [224, 248, 208],
             [136, 192, 112],
@@ -71,6 +102,39 @@ class LCDC:
             [  8,  24,  32],
         ]
 
+    def setFrameSkip(self, skip, period):
+        assert(skip >= 0 and skip < period)
+        self.frame_skip = skip
+        self.frame_period = period
+        self.auto_skip = 0
+
+    def setAutoFrameSkip(self, max_skip):
+        assert(max_skip >= 0)
+        self.auto_skip = max_skip
+        self.frame_skip = 0
+        self.frame_period = 1
+        self.frame_deadline = None
+
+    def endFrame(self):
+        self.frame_count += 1
+        if not self.skipFrame():
+            self.render()
+
+    def skipFrame(self):
+        if self.auto_skip:
+            now = time.perf_counter()
+            if self.frame_deadline is None or now - self.frame_deadline > MAX_LAG:
+                self.frame_deadline = now
+            self.frame_deadline += self.frame_time
+
+            if now > self.frame_deadline and self.skipped < self.auto_skip:
+                self.skipped += 1
+                return True
+            self.skipped = 0
+            return False
+
+        return self.frame_count % self.frame_period < self.frame_skip
+
     def render(self):
         self.tiles = {}
         if self.display_enable:
@@ -86,61 +150,130 @@ class LCDC:
                 self.tiles = {}
         else:
             self.screen.fill((255, 0, 0)) # TODO: remove debug color
-        upscaled = pygame.transform.scale(self.screen, (self.screen.get_width() * 4, self.screen.get_height() * 4),)
-        self.display.blit(upscaled, (0, 0))
+        self.present()
+
+    def present(self):
+        if self.display is None:
+            return
+        if self.scaled:
+            self.display.blit(self.screen, (0, 0))
+        else:
+            upscaled = pygame.transform.scale(self.screen, (self.screen.get_width() * 4, self.screen.get_height() * 4),)
+            self.display.blit(upscaled, (0, 0))
         pygame.display.flip()
 
+    def screenHash(self):
+        "SHA-1 of the last composed frame, for recognising known screens"
+        return hashlib.sha1(pygame.image.tostring(self.screen, "RGB")).hexdigest()
+
+    def decodeSprite(self, index):
+        "Called whenever OAM changes, keeps self.sprites in step with the raw OAM bytes"
+        oam = self.mem.oam
+        address = index * 4
+        self.sprites[index] = (
+            oam[address]     - 16, # y position
+            oam[address + 1] - 8,  # x position
+            oam[address + 2],      # tile index
+            oam[address + 3],      # flags
+        )
+
+    def decodeOAM(self):
+        for index in range(40):
+            self.decodeSprite(index)
+
+    def buildLineSprites(self):
+        """
+        Pick the sprites drawn on each scanline.
+        Like the hardware, only the first 10 sprites in OAM order that cover
+        a line are kept, including ones that are off screen horizontally.
+        Each line is then sorted by drawing priority: lower x first, OAM order breaks ties.
+        """
+        height = 16 if self.sprite_size else 8
+        lines = [[] for y in range(144)]
+        for sprite in self.sprites:
+            y_pos = sprite[0]
+            for y in range(max(y_pos, 0), min(y_pos + height, 144)):
+                line = lines[y]
+                if len(line) < 10:
+                    line.append(sprite)
+
+        for line in lines:
+            if len(line) > 1:
+                line.sort(key=lambda sprite: sprite[1])
+        self.line_sprites = lines
+
     def renderSprites(self):
-        for i in range(40):
-            address = 0xFE00 + i * 4
-            y_pos      = self.mem.read(address)     - 16
-            x_pos      = self.mem.read(address + 1) - 8
-            tile_index = self.mem.read(address + 2)
-            flags      = self.mem.read(address + 3)
-
-            below_BG = bool(flags & 0b10000000)
-            y_flip   = bool(flags & 0b01000000)
-            x_flip   = bool(flags & 0b00100000)
-            palette  = bool(flags & 0b00010000)
-
-            getColor = self.getOBP1Color if palette else self.getOBP0Color
-
-            if self.sprite_size: # 8x16
-                tile0_address = 0x8000 + (tile_index & 0b11111110) * 16
-                tile1_address = 0x8000 + (tile_index | 0b00000001) * 16
-
-                tile0 = self.renderTile(tile0_address, getColor)
-                tile1 = self.renderTile(tile1_address, getColor)
-                tile0 = pygame.transform.flip(tile0, x_flip, y_flip)
-                tile1 = pygame.transform.flip(tile1, x_flip, y_flip)
-                self.blitSprite(tile0, x_pos, y_pos, below_BG)
-                self.blitSprite(tile1, x_pos, y_pos+8, below_BG)
-
-            else: # 8x8
-                tile_address = 0x8000 + tile_index * 16
-
-                tile = self.renderTile(tile_address, getColor)
-                tile = pygame.transform.flip(tile, x_flip, y_flip)
-                self.blitSprite(tile, x_pos, y_pos, below_BG)
-
-    def blitSprite(self, tile, sprite_x, sprite_y, below_BG):
-        if below_BG and self.bg_display_enable:
-            for x in range(8):
-                for y in range(8):
-                    screen_location = (sprite_x + x, sprite_y + y)
-                    if screen_location[0] >= 160:
-                        return
-                    if screen_location[1] >= 144:
-                        break;
-                    if screen_location[0] <= 0 or screen_location[1] <= 0:
-                        continue;
-
-                    print(screen_location)
-                    if self.screen.get_at(screen_location) == 0:
-                        color = tile.get_at(x, y)
-                        self.screen.set_at(screen_location, color)
+        self.buildLineSprites()
+        vram = self.mem.vram
+        set_at = self.screen.set_at
+        height = 16 if self.sprite_size else 8
+        palette = self.emu_palette
+        palettes = [
+            [None, palette[self.obp0_color1], palette[self.obp0_color2], palette[self.obp0_color3]],
+            [None, palette[self.obp1_color1], palette[self.obp1_color2], palette[self.obp1_color3]],
+        ]
+
+        for y, line in enumerate(self.line_sprites):
+            if not line:
+                continue
+            claimed = bytearray(160) # pixels already owned by a higher priority sprite
+
+            for y_pos, x_pos, tile_index, flags in line:
+                below_BG = flags & 0b10000000
+                y_flip   = flags & 0b01000000
+                x_flip   = flags & 0b00100000
+                palette  = palettes[(flags & 0b00010000) >> 4]
+
+                row = y - y_pos
+                if y_flip:
+                    row = height - 1 - row
+                if self.sprite_size: # 8x16 sprites ignore bit 0 of the tile index
+                    tile_index &= 0b11111110
+                address = tile_index * 16 + row * 2
+                low_byte  = vram[address]
+                high_byte = vram[address + 1]
+
+                for x in range(8):
+                    screen_x = x_pos + x
+                    if screen_x < 0 or screen_x >= 160 or claimed[screen_x]:
+                        continue
+                    bit = x if x_flip else 7 - x
+                    color = (((high_byte >> bit) & 1) << 1) | ((low_byte >> bit) & 1)
+                    if color == 0: # transparent
+                        continue
+
+                    # Even a sprite hidden behind the background hides lower priority sprites
+                    claimed[screen_x] = 1
+                    if below_BG and self.bgColorIndex(screen_x, y) != 0:
+                        continue
+                    set_at((screen_x, y), palette[color])
+
+    def bgColorIndex(self, x, y):
+        "Color index (before the palette) of the background or window at a screen pixel"
+        if not self.bg_display_enable:
+            return 0
+
+        if self.w_display_enable and y >= self.wy and x >= self.wx - 7:
+            map_address = 0x1C00 if self.w_tile_map_select else 0x1800
+            pixel_x = x - (self.wx - 7)
+            pixel_y = y - self.wy
+        else:
+            map_address = 0x1C00 if self.bg_tile_map_select else 0x1800
+            pixel_x = (x + self.scx) & 0xFF
+            pixel_y = (y + self.scy) & 0xFF
+
+        vram = self.mem.vram
+        tile_index = vram[map_address + (pixel_y >> 3) * 32 + (pixel_x >> 3)]
+        if self.bg_w_tile_data_select:
+            address = tile_index * 16
         else:
-            self.screen.blit(tile, (sprite_x, sprite_y))
+            if tile_index & 0b10000000:
+                tile_index -= 0x100
+            address = 0x1000 + tile_index * 16
+        address += (pixel_y & 7) * 2
+
+        bit = 7 - (pixel_x & 7)
+        return (((vram[address + 1] >> bit) & 1) << 1) | ((vram[address] >> bit) & 1)
 
     def renderBG(self):
         if self.bg_tile_map_select:
@@ -241,30 +374,30 @@ class LCDC:
     def update(self, cycles):
         self.mode_counter += cycles
         if self.mode == 0:
-            if self.mode_counter >= 204:
-                self.mode_counter = 0
+            if self.mode_counter >= HBLANK_CYCLES:
+                self.mode_counter -= HBLANK_CYCLES
                 self.ly += 1
                 if self.ly == 144: # Reached end of screen
                     self.updateInterrupts(1)
+                    self.endFrame()
                 else:
                     self.updateInterrupts(2)
         elif self.mode == 1:
-            if self.mode_counter >= 4560:
-                self.mode_counter = 0
+            if self.mode_counter >= VBLANK_CYCLES:
+                self.mode_counter -= VBLANK_CYCLES
                 self.mode = 2
                 self.updateInterrupts(2)
                 self.ly = 0
-            if self.mode_counter % 456 == 0 and self.mode_counter != 0:
-                self.ly += 1
+            else:
+                self.ly = 144 + self.mode_counter // LINE_CYCLES
         elif self.mode == 2:
-            if self.mode_counter >= 80:
-                self.mode_counter = 0
+            if self.mode_counter >= OAM_SEARCH_CYCLES:
+                self.mode_counter -= OAM_SEARCH_CYCLES
                 self.updateInterrupts(3)
         elif self.mode == 3:
-            if self.mode_counter >= 172:
-                self.mode_counter = 0
+            if self.mode_counter >= TRANSFER_CYCLES:
+                self.mode_counter -= TRANSFER_CYCLES
                 self.updateInterrupts(0)
-                self.render()
         else:
             assert(False)
 
@@ -405,7 +538,14 @@ class LCDC:
 
     def writeOAM_DMA(self, value):
         assert(value >= 0 and value < 0xF1)
-        source_address = value << 8
-        for offset in range(0xA0):
-            byte = self.mem.read(source_address + offset)
-            self.mem.write(0xFE00 + offset, byte)
+        self.mem.oam[:] = self.mem.readBlock(value << 8, 0xA0)
+        self.decodeOAM()
+
+        # The copy is done at once, but OAM stays busy for as long as the real transfer takes
+        self.mem.dma_active = True
+        self.dma_end = self.scheduler.cycles + DMA_CYCLES
+        self.scheduler.schedule(DMA_CYCLES, self.endOAM_DMA)
+
+    def endOAM_DMA(self):
+        if self.scheduler.cycles >= self.dma_end: # otherwise a newer transfer is still running
+            self.mem.dma_active = False
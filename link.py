@@ -1,3 +1,196 @@
+import os
+import socket
+import struct
+
+TRANSFER_CYCLES = 1024 # machine cycles to shift out 8 bits at 8192 Hz
+WINDOW = TRANSFER_CYCLES # machine cycles linked machines run between exchanging state
+
 class Link:
-    def dummy(self, foo=0):
-        return 0
+    """
+    Serial port.
+    A transfer started with the internal clock completes TRANSFER_CYCLES later.
+    With no cable, or nothing ready at the other end, it shifts in $FF.
+    Every byte sent is kept in output, test ROMs print their results this way.
+
+    Linked machines don't talk for every byte. They run in windows (WINDOW
+    machine cycles by default) and swap the bytes they clocked out and their
+    SB/SC state at the end of each one, see sync(). A transfer therefore
+    receives the byte the other side had in SB at the last window boundary.
+    Both sides report their state before taking in what the other clocked
+    out, so a side that clocked anything out in a window knows the other has
+    since taken it and is no longer waiting, whatever it reported.
+    """
+    def __init__(self, interrupts, scheduler):
+        self.interrupts = interrupts
+        self.scheduler = scheduler
+        self.sb = 0 # FF01 serial data
+        self.sc = 0 # FF02 serial control
+        self.output = bytearray()
+        self.transfer_event = None
+
+        self.cable = None
+        self.sent = [] # bytes clocked out since the last sync
+        self.clocked = False # whether state() found any, the other side has taken them since
+        self.partner_sb = 0xFF # the other side's SB at the last sync...
+        self.partner_ready = False # ...and whether it was waiting for our clock
+
+    def readSB(self):
+        return self.sb
+
+    def writeSB(self, value):
+        self.sb = value
+
+    def readSC(self):
+        return self.sc | 0x7E # unused bits read as 1
+
+    def writeSC(self, value):
+        self.sc = value & 0x81
+        if self.sc == 0x81 and self.transfer_event is None: # start a transfer using the internal clock
+            self.transfer_event = self.scheduler.schedule(TRANSFER_CYCLES, self.endTransfer)
+
+    def endTransfer(self):
+        self.transfer_event = None
+        if self.sc != 0x81:
+            return # stopped or switched to the external clock meanwhile
+
+        sent = self.sb
+        self.output.append(sent)
+        if self.cable is not None:
+            self.sent.append(sent)
+        if self.partner_ready:
+            self.sb = self.partner_sb
+            self.partner_ready = False
+        else:
+            self.sb = 0xFF
+        self.sc &= 0x7F
+        self.interrupts.callSerial()
+
+    def receive(self, value):
+        "The other side clocked a byte in"
+        if self.sc == 0x80: # waiting for an external clock
+            self.output.append(self.sb)
+            self.sb = value
+            self.sc &= 0x7F
+            self.interrupts.callSerial()
+
+    def state(self):
+        "What the other side needs at the end of a window"
+        sent = self.sent
+        self.sent = []
+        self.clocked = bool(sent)
+        return sent, self.sb, self.sc == 0x80
+
+    def applyState(self, state):
+        "The other side's state() from the same window boundary, after this side's state() was taken"
+        sent, sb, ready = state
+        for value in sent:
+            self.receive(value)
+        self.partner_sb = sb
+        self.partner_ready = ready and not self.clocked # it reported before taking our bytes in
+
+    def connect(self, cable):
+        self.cable = cable
+        if cable.scheduled:
+            self.scheduler.schedule(cable.window, self.sync)
+
+    def sync(self):
+        "End of a window, swap state with the other side over the cable"
+        if self.cable is None:
+            return
+        try:
+            state = self.cable.exchange(self.state())
+        except OSError as error:
+            print("Link closed:", error)
+            self.disconnect()
+            return
+        self.applyState(state)
+        if self.cable is not None:
+            self.scheduler.schedule(self.cable.window, self.sync)
+
+    def disconnect(self):
+        if self.cable is not None:
+            self.cable.close()
+        self.cable = None
+        self.partner_ready = False
+
+    def text(self):
+        "Everything sent so far as text"
+        return self.output.decode("latin-1")
+
+class PairCable:
+    """
+    Links two machines in the same process.
+    run() advances them in turn a window at a time and swaps their state in between.
+    """
+    scheduled = False # run() syncs, not a scheduler event
+
+    def __init__(self, first, second, window=WINDOW):
+        self.machines = (first, second)
+        self.window = window
+        first.link.connect(self)
+        second.link.connect(self)
+
+    def run(self, cycles):
+        "Run both machines for at least cycles machine cycles, or until either CPU quits"
+        first, second = self.machines
+        end = first.scheduler.cycles + cycles
+        while first.scheduler.cycles < end:
+            boundary = first.scheduler.cycles + self.window
+            if not first.runUntil(boundary) or not second.runUntil(boundary):
+                break
+            first_state = first.link.state()
+            second_state = second.link.state()
+            first.link.applyState(second_state)
+            second.link.applyState(first_state)
+
+    def close(self):
+        pass
+
+class SocketCable:
+    """
+    Links to a machine in another process over a local UNIX socket.
+    Both ends sync at the end of every window, the first to get there waits for the other.
+    Longer windows mean fewer round trips but staler partner state, more than one
+    transfer per window can't be answered properly.
+    """
+    scheduled = True
+    HEADER = struct.Struct("<BBH") # SB, waiting for our clock, number of bytes sent
+
+    def __init__(self, connection, window=WINDOW):
+        self.connection = connection
+        self.window = window
+
+    @classmethod
+    def listen(cls, path, window=WINDOW):
+        "Wait for the other machine to connect to a socket at path"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+        connection, address = server.accept()
+        server.close()
+        os.unlink(path)
+        return cls(connection, window)
+
+    @classmethod
+    def connectTo(cls, path, window=WINDOW):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(path)
+        return cls(connection, window)
+
+    def exchange(self, state):
+        sent, sb, ready = state
+        self.connection.sendall(self.HEADER.pack(sb, ready, len(sent)) + bytes(sent))
+        sb, ready, count = self.HEADER.unpack(self.receive(self.HEADER.size))
+        return list(self.receive(count)), sb, bool(ready)
+
+    def receive(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.connection.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("the other machine closed the link")
+            data += chunk
+        return data
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,262 @@
+import time
+
+BANK_SIZE = 0x4000 # bytes in a ROM bank
+RAM_BANK_SIZE = 0x2000
+MACHINE_CYCLES_PER_SECOND = 1048576
+DAY = 24 * 60 * 60
+RTC_DAYS = 512 # the day counter has 9 bits
+DIRTY_SHIFT = 12 # RAM writes are tracked in 4KB pages
+
+class ROMOnly:
+    """
+    Cartridge without a bank controller, and the base of the ones with.
+    The switchable ROM bank at 4000-7FFF and RAM bank at A000-BFFF are
+    memoryviews into the ROM and RAM. Switching banks only points them
+    somewhere else, Memory indexes rom_high directly.
+    """
+    ram_gate = False # RAM has to be enabled before use
+    plain_ram = True # RAM reads are the bytes of ram, Memory.readBlock slices it directly
+    rtc_select = None # clock register mapped to A000-BFFF instead of RAM, only MBC3 has one
+    timer = False # the cartridge has a battery backed clock worth saving, only some MBC3 ones
+
+    def __init__(self, rom, header, scheduler=None):
+        size = max(2 * BANK_SIZE, -(-len(rom) // BANK_SIZE) * BANK_SIZE)
+        self.rom = bytes(rom) + b"\xFF" * (size - len(rom)) # whole banks, at least two
+        self.rom_view = memoryview(self.rom)
+        self.rom_banks = len(self.rom) // BANK_SIZE
+        self.ram_data = bytearray(header.ram_size)
+        self.ram_view = memoryview(self.ram_data)
+        self.ram_banks = max(1, len(self.ram_data) // RAM_BANK_SIZE)
+        self.rom_bank = 1
+        self.ram_bank = 0
+        self.ram_enabled = not self.ram_gate
+        self.dirty = bytearray(max(1, -(-len(self.ram_data) >> DIRTY_SHIFT))) # pages written since the last save
+        self.on_ram_disable = None # called when the game disables RAM, a good time to save
+        self.remap()
+
+    def remap(self):
+        "Point the views at the selected banks"
+        bank = self.rom_bank % self.rom_banks
+        self.rom_high = self.rom_view[bank * BANK_SIZE:(bank + 1) * BANK_SIZE]
+        self.ram_start = (self.ram_bank % self.ram_banks) * RAM_BANK_SIZE
+        self.ram = self.ram_view[self.ram_start:self.ram_start + RAM_BANK_SIZE]
+
+    def useRAM(self, buffer):
+        "Keep cart RAM in buffer, an mmap of a save file for instance, instead of a bytearray of its own"
+        self.ram_data = buffer
+        self.ram_view = memoryview(buffer)
+        self.remap()
+
+    def enableRAM(self, value):
+        enabled = value & 0x0F == 0x0A
+        if self.ram_enabled and not enabled and self.on_ram_disable is not None:
+            self.on_ram_disable()
+        self.ram_enabled = enabled
+
+    def write(self, location, value):
+        "A write to 0000-7FFF"
+        pass
+
+    def readRAM(self, offset):
+        if self.ram_enabled and offset < len(self.ram):
+            return self.ram[offset]
+        return 0xFF
+
+    def writeRAM(self, offset, value):
+        if self.ram_enabled and offset < len(self.ram):
+            self.ram[offset] = value
+            self.dirty[(self.ram_start + offset) >> DIRTY_SHIFT] = 1
+
+class MBC1(ROMOnly):
+    "Up to 2MB ROM and 32KB RAM. The upper two bank bits select the RAM bank instead in RAM banking mode."
+    ram_gate = True
+
+    def __init__(self, rom, header, scheduler=None):
+        self.low_bits = 1
+        self.high_bits = 0
+        self.ram_mode = False
+        super().__init__(rom, header, scheduler)
+
+    def write(self, location, value):
+        if location < 0x2000:
+            self.enableRAM(value)
+        elif location < 0x4000:
+            self.low_bits = value & 0x1F or 1
+        elif location < 0x6000:
+            self.high_bits = value & 0x03
+        else:
+            self.ram_mode = bool(value & 1)
+        self.rom_bank = (self.high_bits << 5) | self.low_bits
+        self.ram_bank = self.high_bits if self.ram_mode else 0
+        self.remap()
+
+class MBC2(ROMOnly):
+    "Up to 256KB ROM and 512 half bytes of built in RAM, repeated across A000-BFFF"
+    ram_gate = True
+    plain_ram = False
+
+    def write(self, location, value):
+        if location < 0x4000:
+            if location & 0x100:
+                self.rom_bank = value & 0x0F or 1
+                self.remap()
+            else:
+                self.enableRAM(value)
+
+    def readRAM(self, offset):
+        if self.ram_enabled:
+            return self.ram_data[offset & 0x1FF] | 0xF0
+        return 0xFF
+
+    def writeRAM(self, offset, value):
+        if self.ram_enabled:
+            self.ram_data[offset & 0x1FF] = value & 0x0F
+            self.dirty[0] = 1
+
+class MBC3(ROMOnly):
+    """
+    Up to 2MB ROM, 32KB RAM and a real time clock.
+    The clock isn't ticked, it is rtc_seconds at clock time rtc_stamp and
+    worked out from there when latched or written. Time comes from the
+    scheduler's machine cycles when there is one, so it follows emulated
+    time, and from the wall clock otherwise.
+    """
+    ram_gate = True
+
+    def __init__(self, rom, header, scheduler=None):
+        self.scheduler = scheduler
+        self.rtc_select = None # RTC register mapped to A000-BFFF instead of RAM, 0x08-0x0C
+        self.rtc_seconds = 0 # counter value, days included, at rtc_stamp
+        self.rtc_stamp = 0.0
+        self.rtc_halt = False
+        self.rtc_carry = False # the day counter overflowed
+        self.rtc_latched = bytearray(5) # seconds, minutes, hours, days low, days high/halt/carry
+        self.latch_armed = False
+        self.timer = header.timer
+        super().__init__(rom, header, scheduler)
+        self.rtc_stamp = self.clock()
+
+    def clock(self):
+        if self.scheduler is not None:
+            return self.scheduler.cycles / MACHINE_CYCLES_PER_SECOND
+        return time.time()
+
+    def rtcNow(self):
+        "The counter in whole seconds, folding the day overflow into the carry flag"
+        if not self.rtc_halt:
+            now = self.clock()
+            self.rtc_seconds += now - self.rtc_stamp
+            self.rtc_stamp = now
+        if self.rtc_seconds >= RTC_DAYS * DAY:
+            self.rtc_seconds %= RTC_DAYS * DAY
+            self.rtc_carry = True
+        return int(self.rtc_seconds)
+
+    def rtcRegisters(self, seconds, carry):
+        "Register values of a counter in whole seconds"
+        days = seconds // DAY
+        return [seconds % 60, seconds // 60 % 60, seconds // 3600 % 24, days & 0xFF,
+            (days >> 8) | (self.rtc_halt << 6) | (carry << 7)]
+
+    def latch(self):
+        self.rtc_latched[:] = bytes(self.rtcRegisters(self.rtcNow(), self.rtc_carry))
+
+    def clockState(self):
+        """
+        (registers, latched registers) as of now for a save file. Leaves the
+        counter alone so the thread saving it doesn't race the emulator.
+        """
+        seconds = self.rtc_seconds
+        if not self.rtc_halt:
+            seconds += self.clock() - self.rtc_stamp
+        seconds = int(seconds)
+        limit = RTC_DAYS * DAY
+        return self.rtcRegisters(seconds % limit, self.rtc_carry or seconds >= limit), list(self.rtc_latched)
+
+    def setClockState(self, registers, latched, elapsed=0):
+        "Restore a clockState() taken elapsed seconds ago, the clock kept running meanwhile unless halted"
+        seconds, minutes, hours, days_low, days_high = (value & 0xFF for value in registers)
+        self.rtc_halt = bool(days_high & 0x40)
+        self.rtc_carry = bool(days_high & 0x80)
+        self.rtc_seconds = seconds + minutes * 60 + hours * 3600 + (days_low | ((days_high & 1) << 8)) * DAY
+        if not self.rtc_halt:
+            self.rtc_seconds += max(0, elapsed)
+        self.rtc_stamp = self.clock()
+        self.rtc_latched[:] = bytes(value & 0xFF for value in latched)
+
+    def writeRTC(self, register, value):
+        seconds = self.rtcNow()
+        fraction = self.rtc_seconds - seconds
+        parts = [seconds % 60, seconds // 60 % 60, seconds // 3600 % 24, seconds // DAY]
+        if register == 0x08:
+            parts[0] = value % 60
+            fraction = 0 # writing the seconds resets the sub-second counter
+        elif register == 0x09:
+            parts[1] = value % 60
+        elif register == 0x0A:
+            parts[2] = value % 24
+        elif register == 0x0B:
+            parts[3] = (parts[3] & 0x100) | value
+        else:
+            parts[3] = (parts[3] & 0xFF) | ((value & 1) << 8)
+            self.rtc_halt = bool(value & 0x40)
+            self.rtc_carry = bool(value & 0x80)
+        self.rtc_seconds = parts[0] + parts[1] * 60 + parts[2] * 3600 + parts[3] * DAY + fraction
+        self.rtc_stamp = self.clock()
+        self.rtc_latched[register - 0x08] = value
+
+    def write(self, location, value):
+        if location < 0x2000:
+            self.enableRAM(value)
+        elif location < 0x4000:
+            self.rom_bank = value & 0x7F or 1
+            self.remap()
+        elif location < 0x6000:
+            if 0x08 <= value <= 0x0C:
+                self.rtc_select = value
+            else:
+                self.rtc_select = None
+                self.ram_bank = value & 0x03
+                self.remap()
+        else:
+            if value == 1 and self.latch_armed:
+                self.latch()
+            self.latch_armed = value == 0
+
+    def readRAM(self, offset):
+        if self.ram_enabled and self.rtc_select is not None:
+            return self.rtc_latched[self.rtc_select - 0x08]
+        return super().readRAM(offset)
+
+    def writeRAM(self, offset, value):
+        if self.ram_enabled and self.rtc_select is not None:
+            self.writeRTC(self.rtc_select, value)
+        else:
+            super().writeRAM(offset, value)
+
+class MBC5(ROMOnly):
+    "Up to 8MB ROM with a 9 bit bank number, which may be 0, and 128KB RAM"
+    ram_gate = True
+
+    def __init__(self, rom, header, scheduler=None):
+        self.ram_mask = 0x07 if header.rumble else 0x0F # bit 3 drives the rumble motor instead
+        super().__init__(rom, header, scheduler)
+
+    def write(self, location, value):
+        if location < 0x2000:
+            self.enableRAM(value)
+        elif location < 0x3000:
+            self.rom_bank = (self.rom_bank & 0x100) | value
+            self.remap()
+        elif location < 0x4000:
+            self.rom_bank = (self.rom_bank & 0xFF) | ((value & 1) << 8)
+            self.remap()
+        elif location < 0x6000:
+            self.ram_bank = value & self.ram_mask
+            self.remap()
+
+CONTROLLERS = {"ROM": ROMOnly, "MBC1": MBC1, "MBC2": MBC2, "MBC3": MBC3, "MBC5": MBC5}
+
+def createMBC(rom, header, scheduler=None):
+    "The bank controller for the cartridge, ROM only behaviour for the types not emulated"
+    return CONTROLLERS.get(header.mbc, ROMOnly)(rom, header, scheduler)
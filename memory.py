@@ -1,61 +1,32 @@
+from mbc import createMBC
+
 class Memory:
-    def __init__(self, rom, header):
+    def __init__(self, rom, header, scheduler=None):
         self.header = header
-        self.rom = rom
-        self.external_ram = [0 for i in range(self.header.ram_size)]
-        self.internal_ram = [0 for i in range(0x4000 * 2)]
-        self.vram = [0 for i in range(0x2000)]
-        self.oam = [0 for i in range(0xA0)]
-        self.hram = [0 for i in range(0x80)]
-        self.rom_bank = 1
-        self.cart_ram_bank = 0
-        self.enable_cart_ram = False
-        self.rom_banking_mode = True
-        
-        if self.header.mbc == "MBC1":
-            self.writeToROM = self.writeToMBC1
-        elif self.header.mbc == "MBC2":
-            self.writeToROM = self.writeToMBC2
-        elif self.header.mbc == "MBC3":
-            self.writeToROM = self.writeToMBC3
-        elif self.header.mbc == "MBC4":
-            self.writeToROM = self.writeToMBC4
-        elif self.header.mbc == "MBC5":
-            self.writeToROM = self.writeToMBC5
+        self.mbc = createMBC(rom, header, scheduler)
+        self.rom = self.mbc.rom # padded to whole banks
+        self.internal_ram = bytearray(0x4000 * 2)
+        self.vram = bytearray(0x2000)
+        self.oam = bytearray(0xA0)
+        self.hram = bytearray(0x80)
+        self.dma_active = False # OAM is unavailable to the CPU during OAM DMA
+
+    @property
+    def rom_bank(self):
+        "Bank mapped to 4000-7FFF"
+        return self.mbc.rom_bank % self.mbc.rom_banks
 
     def setupIO(self, lcdc, interrupts, timer, sound, link, joypad):
+        self.lcdc = lcdc
         self.io_read = {
             0x00: joypad.readJOYP,
-            0x01: link.dummy,
-            0x02: link.dummy,
+            0x01: link.readSB,
+            0x02: link.readSC,
             0x04: timer.readDIV,
             0x05: timer.readTIMA,
             0x06: timer.readTMA,
             0x07: timer.readTAC,
             0x0F: interrupts.readIF,
-            0x10: sound.dummy,
-            0x11: sound.dummy,
-            0x12: sound.dummy,
-            0x13: sound.dummy,
-            0x14: sound.dummy,
-            0x16: sound.dummy,
-            0x17: sound.dummy,
-            0x18: sound.dummy,
-            0x19: sound.dummy,
-            0x1A: sound.dummy,
-            0x1B: sound.dummy,
-            0x1C: sound.dummy,
-            0x1D: sound.dummy,
-            0x1E: sound.dummy,
-            0x20: sound.dummy,
-            0x21: sound.dummy,
-            0x22: sound.dummy,
-            0x23: sound.dummy,
-            0x24: sound.dummy,
-            0x25: sound.dummy,
-            0x26: sound.dummy,
-            0x30: sound.dummy,
-            0x26: sound.readNR52,
             0x40: lcdc.readLCDC,
             0x41: lcdc.readSTAT,
             0x42: lcdc.readSCY,
@@ -72,51 +43,13 @@ class Memory:
 
         self.io_write = {
             0x00: joypad.writeJOYP,
-            0x01: link.dummy,
-            0x02: link.dummy,
+            0x01: link.writeSB,
+            0x02: link.writeSC,
             0x04: timer.writeDIV,
             0x05: timer.writeTIMA,
             0x06: timer.writeTMA,
             0x07: timer.writeTAC,
             0x0F: interrupts.writeIF,
-            0x10: sound.dummy,
-            0x11: sound.dummy,
-            0x12: sound.dummy,
-            0x13: sound.dummy,
-            0x14: sound.dummy,
-            0x16: sound.dummy,
-            0x17: sound.dummy,
-            0x18: sound.dummy,
-            0x19: sound.dummy,
-            0x1A: sound.dummy,
-            0x1B: sound.dummy,
-            0x1C: sound.dummy,
-            0x1D: sound.dummy,
-            0x1E: sound.dummy,
-            0x20: sound.dummy,
-            0x21: sound.dummy,
-            0x22: sound.dummy,
-            0x23: sound.dummy,
-            0x24: sound.dummy,
-            0x25: sound.dummy,
-            0x26: sound.dummy,
-            0x30: sound.dummy,
-            0x31: sound.dummy,
-            0x32: sound.dummy,
-            0x33: sound.dummy,
-            0x34: sound.dummy,
-            0x35: sound.dummy,
-            0x36: sound.dummy,
-            0x37: sound.dummy,
-            0x38: sound.dummy,
-            0x39: sound.dummy,
-            0x3a: sound.dummy,
-            0x3b: sound.dummy,
-            0x3c: sound.dummy,
-            0x3d: sound.dummy,
-            0x3e: sound.dummy,
-            0x3f: sound.dummy,
-            0x26: sound.writeNR52,
             0x40: lcdc.writeLCDC,
             0x41: lcdc.writeSTAT,
             0x42: lcdc.writeSCY,
@@ -133,6 +66,10 @@ class Memory:
             0xFF: interrupts.writeIE,
         }
 
+        for register in range(0x10, 0x40):
+            self.io_read[register] = sound.reader(register)
+            self.io_write[register] = sound.writer(register)
+
         self.loadIOvalues()
 
     def dummy(self, foo=0):
@@ -149,7 +86,7 @@ class Memory:
         self.write(0xFF16, 0x3F)
         self.write(0xFF17, 0x00)
         self.write(0xFF19, 0xBF)
-        self.write(0xFF1A, 0xFF)
+        self.write(0xFF1A, 0x7F)
         self.write(0xFF1B, 0x00)
         self.write(0xFF1C, 0x00)
         self.write(0xFF1E, 0xBF)
@@ -172,19 +109,13 @@ class Memory:
             return self.rom[location]
 
         elif location < 0x8000: # 16KB ROM Bank n
-            bank_offset = self.rom_bank * 0x4000
-            return self.rom[location - 0x4000 + bank_offset]
+            return self.mbc.rom_high[location - 0x4000]
 
         elif location < 0xA000: # 8KB VRAM
             return self.vram[location - 0x8000]
 
         elif location < 0xC000: # 8KB External RAM Bank n
-            bank_offset = self.cart_ram_bank * 0x4000
-            ram_location = location - 0xA000 + bank_offset
-            if ram_location < len(self.external_ram):
-                return self.external_ram[ram_location]
-            else:
-                return 0
+            return self.mbc.readRAM(location - 0xA000)
 
         elif location < 0xE000: # 4KB + 4KB Internal RAM Bank 0 + 1
             return self.internal_ram[location - 0xC000]
@@ -193,6 +124,8 @@ class Memory:
             return self.internal_ram[location - 0xE000]
 
         elif location < 0xFEA0: # 160B Sprite Attribute Table
+            if self.dma_active:
+                return 0xFF
             return self.oam[location - 0xFE00]
 
         elif location < 0xFF00: # Not usable
@@ -211,6 +144,45 @@ class Memory:
         else:
             assert(False)
 
+    def readBlock(self, location, size):
+        """
+        Read size bytes starting at location with a single slice.
+        The block must not cross from one memory region into another.
+        """
+        if location < 0x4000:
+            block = self.rom[location:location + size]
+
+        elif location < 0x8000:
+            start = location - 0x4000
+            block = bytes(self.mbc.rom_high[start:start + size])
+
+        elif location < 0xA000:
+            start = location - 0x8000
+            block = self.vram[start:start + size]
+
+        elif location < 0xC000:
+            start = location - 0xA000
+            mbc = self.mbc
+            if mbc.ram_enabled and mbc.plain_ram and mbc.rtc_select is None:
+                block = bytes(mbc.ram[start:start + size])
+            else: # disabled, clock registers or MBC2 half bytes, read them as the CPU would
+                block = bytes(mbc.readRAM(start + i) for i in range(size))
+
+        elif location < 0xE000:
+            start = location - 0xC000
+            block = self.internal_ram[start:start + size]
+
+        elif location < 0xFE00:
+            start = location - 0xE000
+            block = self.internal_ram[start:start + size]
+
+        else:
+            block = bytes(self.read(location + i) for i in range(size))
+
+        if len(block) < size: # past the end of ROM or cart RAM
+            block += b"\xFF" * (size - len(block))
+        return block
+
     def readSigned(self, location):
         value = self.read(location)
         if value & 0b10000000:
@@ -221,18 +193,13 @@ class Memory:
         assert(value < 0x100)
 
         if location < 0x8000:
-            self.writeToROM(location, value)
+            self.mbc.write(location, value)
 
         elif location < 0xA000:
             self.vram[location - 0x8000] = value
 
         elif location < 0xC000:
-            bank_offset = self.cart_ram_bank * 0x4000
-            ram_location = location - 0xA000 + bank_offset
-            if self.header.ram and ram_location < len(self.external_ram):
-                if self.header.mbc == "MBC2":
-                    value &= 0x0F
-                self.external_ram[location - 0xA000 + bank_offset] = value
+            self.mbc.writeRAM(location - 0xA000, value)
 
         elif location < 0xE000:
             self.internal_ram[location - 0xC000] = value
@@ -241,7 +208,11 @@ class Memory:
             self.internal_ram[location - 0xE000] = value
 
         elif location < 0xFEA0:
-            self.oam[location - 0xFE00] = value
+            if self.dma_active:
+                return
+            offset = location - 0xFE00
+            self.oam[offset] = value
+            self.lcdc.decodeSprite(offset >> 2)
 
         elif location < 0xFF00:
             pass
@@ -259,58 +230,12 @@ class Memory:
         else:
             assert(False)
 
-    def writeToROM(self, location, value):
-        pass
-
-    def writeToMBC1(self, location, value):
-        if location < 0x2000: # Enable ram
-            self.enable_cart_ram = (value & 0x0F) == 0x0A
-
-        elif location < 0x4000: # ROM bank lower bits
-            bit_mask = 0b00011111
-            lower_bits = value & bit_mask
-            if lower_bits == 0:
-                lower_bits = 1
-            self.rom_bank = (self.rom_bank & ~bit_mask) | lower_bits
-
-        elif location < 0x6000:
-            bit_mask = 0b00000011
-            if self.rom_banking_mode: # ROM bank higher bits
-                higher_bits = value & bit_mask
-                self.rom_bank = (self.rom_bank & 0b10011111) | (higher_bits << 5)
-            else: #RAM bank
-                bits = value & bit_mask
-                self.ram_bank = (self.ram_bank & ~bit_mask) | bits
-
-        elif location < 0x8000: # ROM/RAM mode select
-            bit = bool(value & 1)
-            self.rom_banking_mode = not bit
-
-    def writeToMBC2(self, location, value):
-        if location < 0x2000: # Enable ram
-            if location & 0b0000000100000000 == 0:
-                self.enable_cart_ram = (location & 0x0F) == 0x0A
-
-        elif location < 0x4000: # ROM bank lower bits
-            if location & 0b0000000100000000:
-                self.rom_bank = value & 0x0F
-
-    def writeToMBC3(self, location, value):
-        assert(False)
-
-    def writeToMBC4(self, location, value):
-        assert(False)
-
-    def writeToMBC5(self, location, value):
-        assert(False)
-
     def display(self):
         print("------------------------------------------------")
         print("Memory dump:")
         print("ROM bank:", self.rom_bank)
-        print("Cart RAM bank:", self.cart_ram_bank)
-        print("Cart RAM enabled:", self.enable_cart_ram)
-        print("Banking mode:", "ROM" if self.rom_banking_mode else "RAM")
+        print("Cart RAM bank:", self.mbc.ram_bank)
+        print("Cart RAM enabled:", self.mbc.ram_enabled)
         for line_number in range(0x0, 0x10000, 0x10):
             line = hex(line_number)[2:].zfill(4) + ": "
             # skip I/O ports until they are all handled
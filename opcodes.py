@@ -0,0 +1,392 @@
+# Declarative description of the instruction set.
+# gen_cpu.py turns this into cpu_fast.py (the interpreter) and opinfo.py
+# (disassembly and cycle tables), edit this file and rerun it instead of
+# editing those.
+#
+# Every instruction is (opcode, mnemonic, operands, length, cycles, flags, semantics)
+#   operands  - tuple of operand names as written in assembly, see OPERAND KINDS below
+#   length    - bytes including the opcode (and the $CB prefix)
+#   cycles    - machine cycles, or (taken, not taken) for conditional instructions
+#   flags     - effect on Z N H C: a flag name if set from the result,
+#               0 or 1 if forced, - if unchanged
+#   semantics - a key of SEMANTICS
+#
+# OPERAND KINDS
+#   A B C D E H L          - 8 bit registers
+#   AF BC DE HL SP         - 16 bit registers
+#   (BC) (DE) (HL)         - memory at a 16 bit register
+#   (HL+) (HL-)            - memory at HL, HL is incremented/decremented afterwards
+#   (C) (a8)               - memory at $FF00 + C / immediate byte
+#   (a16)                  - memory at an immediate word
+#   d8 d16 a16             - immediate byte / word / address
+#   r8                     - immediate signed byte
+#   NZ Z NC C              - conditions, only used through {cond}
+#   0-7 and $00-$38        - bit numbers and restart vectors
+#
+# SEMANTICS are Python templates run with cpu, mem and next_pc (the address of
+# the following instruction) in scope. In a template:
+#   {op0} {op1}            - the value of an operand, a line "{op0} = x" stores to it
+#   {A} {HL} {SP} {r8} ... - the same, but naming the operand kind directly
+#   {cond}                 - true when the condition in op0 holds
+#   {mask} {inv_mask}      - 1 << bit number in op0, and its inverse
+#   {taken} {not_taken}    - cycles of a conditional instruction
+# Unconditional instructions have their cycles added automatically.
+# ALU tables from alu.py and the helpers push(cpu, value) and pop(cpu) are available.
+
+SEMANTICS = {
+    "NOP": "",
+    "HALT": """
+if cpu.interrupts.getIME():
+    cpu.run_state = "HALT"
+""",
+    "STOP": """
+cpu.run_state = "STOP"
+""",
+    "DI": """
+cpu.interrupts.setIME(False)
+""",
+    "EI": """
+cpu.interrupts.setIME(True)
+""",
+
+    # Loads
+    "LD": """
+{op0} = {op1}
+""",
+    "LD_a16_SP": """
+value = {SP}
+mem.write({a16}, value & 0xFF)
+mem.write(({a16} + 1) & 0xFFFF, value >> 8)
+""",
+    "LD_HL_SPr8": """
+base = {SP}
+cpu.f.value = ((((base & 0xF) + ({r8} & 0xF)) > 0xF) << 5) | ((((base & 0xFF) + ({r8} & 0xFF)) > 0xFF) << 4)
+{HL} = (base + {r8}) & 0xFFFF
+""",
+    "PUSH": """
+push(cpu, {op0})
+""",
+    "POP": """
+{op0} = pop(cpu)
+""",
+
+    # 8-bit arithmetic
+    "ADD": """
+result = ADD[(cpu.a.value << 8) | {op1}]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "ADC": """
+result = ADD[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | {op1}]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "SUB": """
+result = SUB[(cpu.a.value << 8) | {op0}]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "SBC": """
+result = SUB[((cpu.f.value & 0x10) << 12) | (cpu.a.value << 8) | {op1}]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "CP": """
+cpu.f.value = SUB[(cpu.a.value << 8) | {op0}] & 0xFF
+""",
+    "AND": """
+value = cpu.a.value & {op0}
+cpu.a.value = value
+cpu.f.value = 0x20 if value else 0xA0
+""",
+    "OR": """
+value = cpu.a.value | {op0}
+cpu.a.value = value
+cpu.f.value = 0x00 if value else 0x80
+""",
+    "XOR": """
+value = cpu.a.value ^ {op0}
+cpu.a.value = value
+cpu.f.value = 0x00 if value else 0x80
+""",
+    "INC": """
+result = INC[{op0}]
+{op0} = result >> 8
+cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+""",
+    "DEC": """
+result = DEC[{op0}]
+{op0} = result >> 8
+cpu.f.value = (result & 0xE0) | (cpu.f.value & 0x10)
+""",
+    "DAA": """
+result = DAA[((cpu.f.value >> 4) << 8) | cpu.a.value]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "CPL": """
+cpu.a.value ^= 0xFF
+cpu.f.value |= 0x60
+""",
+    "SCF": """
+cpu.f.value = (cpu.f.value & 0x80) | 0x10
+""",
+    "CCF": """
+cpu.f.value = (cpu.f.value & 0x90) ^ 0x10
+""",
+
+    # 16-bit arithmetic
+    "INC16": """
+{op0} = ({op0} + 1) & 0xFFFF
+""",
+    "DEC16": """
+{op0} = ({op0} - 1) & 0xFFFF
+""",
+    "ADD_HL": """
+base = {HL}
+operand = {op1}
+cpu.f.value = (cpu.f.value & 0x80) | ((((base & 0xFFF) + (operand & 0xFFF)) > 0xFFF) << 5) | (((base + operand) > 0xFFFF) << 4)
+{HL} = (base + operand) & 0xFFFF
+""",
+    "ADD_SP": """
+base = {SP}
+cpu.f.value = ((((base & 0xF) + ({r8} & 0xF)) > 0xF) << 5) | ((((base & 0xFF) + ({r8} & 0xFF)) > 0xFF) << 4)
+{SP} = (base + {r8}) & 0xFFFF
+""",
+
+    # Rotates and shifts of A, these always clear Z
+    "RLCA": """
+result = RLC[cpu.a.value]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0x10
+""",
+    "RRCA": """
+result = RRC[cpu.a.value]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0x10
+""",
+    "RLA": """
+result = RL[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0x10
+""",
+    "RRA": """
+result = RR[((cpu.f.value & 0x10) << 4) | cpu.a.value]
+cpu.a.value = result >> 8
+cpu.f.value = result & 0x10
+""",
+
+    # $CB rotates, shifts and bit operations
+    "RLC": """
+result = RLC[{op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "RRC": """
+result = RRC[{op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "RL": """
+result = RL[((cpu.f.value & 0x10) << 4) | {op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "RR": """
+result = RR[((cpu.f.value & 0x10) << 4) | {op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "SLA": """
+result = SLA[{op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "SRA": """
+result = SRA[{op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "SWAP": """
+result = SWAP[{op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "SRL": """
+result = SRL[{op0}]
+{op0} = result >> 8
+cpu.f.value = result & 0xFF
+""",
+    "BIT": """
+cpu.f.value = (cpu.f.value & 0x10) | (0x20 if {op1} & {mask} else 0xA0)
+""",
+    "RES": """
+{op1} = {op1} & {inv_mask}
+""",
+    "SET": """
+{op1} = {op1} | {mask}
+""",
+
+    # Jumps, calls and returns
+    "JP": """
+next_pc = {op0}
+""",
+    "JP_cc": """
+if {cond}:
+    next_pc = {a16}
+    cpu.cycles += {taken}
+else:
+    cpu.cycles += {not_taken}
+""",
+    "JR": """
+next_pc = (next_pc + {r8}) & 0xFFFF
+""",
+    "JR_cc": """
+if {cond}:
+    next_pc = (next_pc + {r8}) & 0xFFFF
+    cpu.cycles += {taken}
+else:
+    cpu.cycles += {not_taken}
+""",
+    "CALL": """
+push(cpu, next_pc)
+next_pc = {a16}
+""",
+    "CALL_cc": """
+if {cond}:
+    push(cpu, next_pc)
+    next_pc = {a16}
+    cpu.cycles += {taken}
+else:
+    cpu.cycles += {not_taken}
+""",
+    "RET": """
+next_pc = pop(cpu)
+""",
+    "RET_cc": """
+if {cond}:
+    next_pc = pop(cpu)
+    cpu.cycles += {taken}
+else:
+    cpu.cycles += {not_taken}
+""",
+    "RETI": """
+next_pc = pop(cpu)
+cpu.interrupts.setIME(True)
+""",
+    "RST": """
+push(cpu, next_pc)
+next_pc = {op0}
+""",
+}
+
+R8 = ["B", "C", "D", "E", "H", "L", "(HL)", "A"] # order of the 3 bit register field
+R16 = ["BC", "DE", "HL", "SP"]
+R16_STACK = ["BC", "DE", "HL", "AF"]
+CONDITIONS = ["NZ", "Z", "NC", "C"]
+ALU = [
+    ("ADD", ("A",), "Z0HC"),
+    ("ADC", ("A",), "Z0HC"),
+    ("SUB", (),     "Z1HC"),
+    ("SBC", ("A",), "Z1HC"),
+    ("AND", (),     "Z010"),
+    ("XOR", (),     "Z000"),
+    ("OR",  (),     "Z000"),
+    ("CP",  (),     "Z1HC"),
+]
+SHIFTS = ["RLC", "RRC", "RL", "RR", "SLA", "SRA", "SWAP", "SRL"]
+
+def buildInstructions():
+    ops = [
+        (0x00, "NOP",  (),              1, 1, "----", "NOP"),
+        (0x08, "LD",   ("(a16)", "SP"), 3, 5, "----", "LD_a16_SP"),
+        (0x10, "STOP", (),              2, 1, "----", "STOP"),
+        (0x18, "JR",   ("r8",),         2, 3, "----", "JR"),
+        (0x07, "RLCA", (),              1, 1, "000C", "RLCA"),
+        (0x0F, "RRCA", (),              1, 1, "000C", "RRCA"),
+        (0x17, "RLA",  (),              1, 1, "000C", "RLA"),
+        (0x1F, "RRA",  (),              1, 1, "000C", "RRA"),
+        (0x27, "DAA",  (),              1, 1, "Z-0C", "DAA"),
+        (0x2F, "CPL",  (),              1, 1, "-11-", "CPL"),
+        (0x37, "SCF",  (),              1, 1, "-001", "SCF"),
+        (0x3F, "CCF",  (),              1, 1, "-00C", "CCF"),
+        (0x02, "LD",   ("(BC)", "A"),   1, 2, "----", "LD"),
+        (0x12, "LD",   ("(DE)", "A"),   1, 2, "----", "LD"),
+        (0x22, "LD",   ("(HL+)", "A"),  1, 2, "----", "LD"),
+        (0x32, "LD",   ("(HL-)", "A"),  1, 2, "----", "LD"),
+        (0x0A, "LD",   ("A", "(BC)"),   1, 2, "----", "LD"),
+        (0x1A, "LD",   ("A", "(DE)"),   1, 2, "----", "LD"),
+        (0x2A, "LD",   ("A", "(HL+)"),  1, 2, "----", "LD"),
+        (0x3A, "LD",   ("A", "(HL-)"),  1, 2, "----", "LD"),
+        (0x76, "HALT", (),              1, 1, "----", "HALT"),
+        (0xC3, "JP",   ("a16",),        3, 4, "----", "JP"),
+        (0xC9, "RET",  (),              1, 4, "----", "RET"),
+        (0xD9, "RETI", (),              1, 4, "----", "RETI"),
+        (0xCD, "CALL", ("a16",),        3, 6, "----", "CALL"),
+        (0xE0, "LDH",  ("(a8)", "A"),   2, 3, "----", "LD"),
+        (0xF0, "LDH",  ("A", "(a8)"),   2, 3, "----", "LD"),
+        (0xE2, "LD",   ("(C)", "A"),    1, 2, "----", "LD"),
+        (0xF2, "LD",   ("A", "(C)"),    1, 2, "----", "LD"),
+        (0xE8, "ADD",  ("SP", "r8"),    2, 4, "00HC", "ADD_SP"),
+        (0xF8, "LD",   ("HL", "SP+r8"), 2, 3, "00HC", "LD_HL_SPr8"),
+        (0xE9, "JP",   ("HL",),         1, 1, "----", "JP"),
+        (0xF9, "LD",   ("SP", "HL"),    1, 2, "----", "LD"),
+        (0xEA, "LD",   ("(a16)", "A"),  3, 4, "----", "LD"),
+        (0xFA, "LD",   ("A", "(a16)"),  3, 4, "----", "LD"),
+        (0xF3, "DI",   (),              1, 1, "----", "DI"),
+        (0xFB, "EI",   (),              1, 1, "----", "EI"),
+    ]
+
+    for i, r in enumerate(R16):
+        ops.append((0x01 + i * 0x10, "LD",  (r, "d16"), 3, 3, "----", "LD"))
+        ops.append((0x03 + i * 0x10, "INC", (r,),       1, 2, "----", "INC16"))
+        ops.append((0x0B + i * 0x10, "DEC", (r,),       1, 2, "----", "DEC16"))
+        ops.append((0x09 + i * 0x10, "ADD", ("HL", r),  1, 2, "-0HC", "ADD_HL"))
+
+    for i, r in enumerate(R16_STACK):
+        ops.append((0xC1 + i * 0x10, "POP",  (r,), 1, 3, "ZNHC" if r == "AF" else "----", "POP"))
+        ops.append((0xC5 + i * 0x10, "PUSH", (r,), 1, 4, "----", "PUSH"))
+
+    for i, r in enumerate(R8):
+        memory = r == "(HL)"
+        ops.append((0x04 + i * 8, "INC", (r,),      1, 3 if memory else 1, "Z0H-", "INC"))
+        ops.append((0x05 + i * 8, "DEC", (r,),      1, 3 if memory else 1, "Z1H-", "DEC"))
+        ops.append((0x06 + i * 8, "LD",  (r, "d8"), 2, 3 if memory else 2, "----", "LD"))
+
+        for j, r2 in enumerate(R8):
+            if memory and r2 == "(HL)": # HALT takes the place of LD (HL),(HL)
+                continue
+            cycles = 2 if memory or r2 == "(HL)" else 1
+            ops.append((0x40 + i * 8 + j, "LD", (r, r2), 1, cycles, "----", "LD"))
+
+    for i, (name, prefix, flags) in enumerate(ALU):
+        for j, r in enumerate(R8):
+            ops.append((0x80 + i * 8 + j, name, prefix + (r,), 1, 2 if r == "(HL)" else 1, flags, name))
+        ops.append((0xC6 + i * 8, name, prefix + ("d8",), 2, 2, flags, name))
+
+    for i, condition in enumerate(CONDITIONS):
+        ops.append((0x20 + i * 8, "JR",   (condition, "r8"),  2, (3, 2), "----", "JR_cc"))
+        ops.append((0xC0 + i * 8, "RET",  (condition,),       1, (5, 2), "----", "RET_cc"))
+        ops.append((0xC2 + i * 8, "JP",   (condition, "a16"), 3, (4, 3), "----", "JP_cc"))
+        ops.append((0xC4 + i * 8, "CALL", (condition, "a16"), 3, (6, 3), "----", "CALL_cc"))
+
+    for i in range(8):
+        ops.append((0xC7 + i * 8, "RST", ("${:02X}".format(i * 8),), 1, 4, "----", "RST"))
+
+    return ops
+
+def buildCBInstructions():
+    ops = []
+    for i, r in enumerate(R8):
+        memory = r == "(HL)"
+        for j, name in enumerate(SHIFTS):
+            flags = "Z000" if name == "SWAP" else "Z00C"
+            ops.append((j * 8 + i, name, (r,), 2, 4 if memory else 2, flags, name))
+        for bit in range(8):
+            ops.append((0x40 + bit * 8 + i, "BIT", (str(bit), r), 2, 3 if memory else 2, "Z01-", "BIT"))
+            ops.append((0x80 + bit * 8 + i, "RES", (str(bit), r), 2, 4 if memory else 2, "----", "RES"))
+            ops.append((0xC0 + bit * 8 + i, "SET", (str(bit), r), 2, 4 if memory else 2, "----", "SET"))
+    return ops
+
+INSTRUCTIONS = buildInstructions()
+CB_INSTRUCTIONS = buildCBInstructions()
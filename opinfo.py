@@ -0,0 +1,636 @@
+# Generated by gen_cpu.py from opcodes.py, do not edit
+
+# Instruction set tables for the disassembler and anything that needs timings.
+# INSTRUCTIONS and CB_INSTRUCTIONS hold (mnemonic, operands, length, cycles, flags, flow)
+# by opcode, or None for invalid opcodes and the $CB prefix.
+#   cycles - machine cycles, (taken, not taken) for conditional instructions
+#   flags  - effect on Z N H C, see opcodes.py
+#   flow   - None, or jump, jump_cc, jump_hl, call, call_cc, ret or ret_cc
+
+INSTRUCTIONS = (
+    ('NOP', (), 1, 1, '----', None), # $00
+    ('LD', ('BC', 'd16'), 3, 3, '----', None), # $01
+    ('LD', ('(BC)', 'A'), 1, 2, '----', None), # $02
+    ('INC', ('BC',), 1, 2, '----', None), # $03
+    ('INC', ('B',), 1, 1, 'Z0H-', None), # $04
+    ('DEC', ('B',), 1, 1, 'Z1H-', None), # $05
+    ('LD', ('B', 'd8'), 2, 2, '----', None), # $06
+    ('RLCA', (), 1, 1, '000C', None), # $07
+    ('LD', ('(a16)', 'SP'), 3, 5, '----', None), # $08
+    ('ADD', ('HL', 'BC'), 1, 2, '-0HC', None), # $09
+    ('LD', ('A', '(BC)'), 1, 2, '----', None), # $0A
+    ('DEC', ('BC',), 1, 2, '----', None), # $0B
+    ('INC', ('C',), 1, 1, 'Z0H-', None), # $0C
+    ('DEC', ('C',), 1, 1, 'Z1H-', None), # $0D
+    ('LD', ('C', 'd8'), 2, 2, '----', None), # $0E
+    ('RRCA', (), 1, 1, '000C', None), # $0F
+    ('STOP', (), 2, 1, '----', None), # $10
+    ('LD', ('DE', 'd16'), 3, 3, '----', None), # $11
+    ('LD', ('(DE)', 'A'), 1, 2, '----', None), # $12
+    ('INC', ('DE',), 1, 2, '----', None), # $13
+    ('INC', ('D',), 1, 1, 'Z0H-', None), # $14
+    ('DEC', ('D',), 1, 1, 'Z1H-', None), # $15
+    ('LD', ('D', 'd8'), 2, 2, '----', None), # $16
+    ('RLA', (), 1, 1, '000C', None), # $17
+    ('JR', ('r8',), 2, 3, '----', 'jump'), # $18
+    ('ADD', ('HL', 'DE'), 1, 2, '-0HC', None), # $19
+    ('LD', ('A', '(DE)'), 1, 2, '----', None), # $1A
+    ('DEC', ('DE',), 1, 2, '----', None), # $1B
+    ('INC', ('E',), 1, 1, 'Z0H-', None), # $1C
+    ('DEC', ('E',), 1, 1, 'Z1H-', None), # $1D
+    ('LD', ('E', 'd8'), 2, 2, '----', None), # $1E
+    ('RRA', (), 1, 1, '000C', None), # $1F
+    ('JR', ('NZ', 'r8'), 2, (3, 2), '----', 'jump_cc'), # $20
+    ('LD', ('HL', 'd16'), 3, 3, '----', None), # $21
+    ('LD', ('(HL+)', 'A'), 1, 2, '----', None), # $22
+    ('INC', ('HL',), 1, 2, '----', None), # $23
+    ('INC', ('H',), 1, 1, 'Z0H-', None), # $24
+    ('DEC', ('H',), 1, 1, 'Z1H-', None), # $25
+    ('LD', ('H', 'd8'), 2, 2, '----', None), # $26
+    ('DAA', (), 1, 1, 'Z-0C', None), # $27
+    ('JR', ('Z', 'r8'), 2, (3, 2), '----', 'jump_cc'), # $28
+    ('ADD', ('HL', 'HL'), 1, 2, '-0HC', None), # $29
+    ('LD', ('A', '(HL+)'), 1, 2, '----', None), # $2A
+    ('DEC', ('HL',), 1, 2, '----', None), # $2B
+    ('INC', ('L',), 1, 1, 'Z0H-', None), # $2C
+    ('DEC', ('L',), 1, 1, 'Z1H-', None), # $2D
+    ('LD', ('L', 'd8'), 2, 2, '----', None), # $2E
+    ('CPL', (), 1, 1, '-11-', None), # $2F
+    ('JR', ('NC', 'r8'), 2, (3, 2), '----', 'jump_cc'), # $30
+    ('LD', ('SP', 'd16'), 3, 3, '----', None), # $31
+    ('LD', ('(HL-)', 'A'), 1, 2, '----', None), # $32
+    ('INC', ('SP',), 1, 2, '----', None), # $33
+    ('INC', ('(HL)',), 1, 3, 'Z0H-', None), # $34
+    ('DEC', ('(HL)',), 1, 3, 'Z1H-', None), # $35
+    ('LD', ('(HL)', 'd8'), 2, 3, '----', None), # $36
+    ('SCF', (), 1, 1, '-001', None), # $37
+    ('JR', ('C', 'r8'), 2, (3, 2), '----', 'jump_cc'), # $38
+    ('ADD', ('HL', 'SP'), 1, 2, '-0HC', None), # $39
+    ('LD', ('A', '(HL-)'), 1, 2, '----', None), # $3A
+    ('DEC', ('SP',), 1, 2, '----', None), # $3B
+    ('INC', ('A',), 1, 1, 'Z0H-', None), # $3C
+    ('DEC', ('A',), 1, 1, 'Z1H-', None), # $3D
+    ('LD', ('A', 'd8'), 2, 2, '----', None), # $3E
+    ('CCF', (), 1, 1, '-00C', None), # $3F
+    ('LD', ('B', 'B'), 1, 1, '----', None), # $40
+    ('LD', ('B', 'C'), 1, 1, '----', None), # $41
+    ('LD', ('B', 'D'), 1, 1, '----', None), # $42
+    ('LD', ('B', 'E'), 1, 1, '----', None), # $43
+    ('LD', ('B', 'H'), 1, 1, '----', None), # $44
+    ('LD', ('B', 'L'), 1, 1, '----', None), # $45
+    ('LD', ('B', '(HL)'), 1, 2, '----', None), # $46
+    ('LD', ('B', 'A'), 1, 1, '----', None), # $47
+    ('LD', ('C', 'B'), 1, 1, '----', None), # $48
+    ('LD', ('C', 'C'), 1, 1, '----', None), # $49
+    ('LD', ('C', 'D'), 1, 1, '----', None), # $4A
+    ('LD', ('C', 'E'), 1, 1, '----', None), # $4B
+    ('LD', ('C', 'H'), 1, 1, '----', None), # $4C
+    ('LD', ('C', 'L'), 1, 1, '----', None), # $4D
+    ('LD', ('C', '(HL)'), 1, 2, '----', None), # $4E
+    ('LD', ('C', 'A'), 1, 1, '----', None), # $4F
+    ('LD', ('D', 'B'), 1, 1, '----', None), # $50
+    ('LD', ('D', 'C'), 1, 1, '----', None), # $51
+    ('LD', ('D', 'D'), 1, 1, '----', None), # $52
+    ('LD', ('D', 'E'), 1, 1, '----', None), # $53
+    ('LD', ('D', 'H'), 1, 1, '----', None), # $54
+    ('LD', ('D', 'L'), 1, 1, '----', None), # $55
+    ('LD', ('D', '(HL)'), 1, 2, '----', None), # $56
+    ('LD', ('D', 'A'), 1, 1, '----', None), # $57
+    ('LD', ('E', 'B'), 1, 1, '----', None), # $58
+    ('LD', ('E', 'C'), 1, 1, '----', None), # $59
+    ('LD', ('E', 'D'), 1, 1, '----', None), # $5A
+    ('LD', ('E', 'E'), 1, 1, '----', None), # $5B
+    ('LD', ('E', 'H'), 1, 1, '----', None), # $5C
+    ('LD', ('E', 'L'), 1, 1, '----', None), # $5D
+    ('LD', ('E', '(HL)'), 1, 2, '----', None), # $5E
+    ('LD', ('E', 'A'), 1, 1, '----', None), # $5F
+    ('LD', ('H', 'B'), 1, 1, '----', None), # $60
+    ('LD', ('H', 'C'), 1, 1, '----', None), # $61
+    ('LD', ('H', 'D'), 1, 1, '----', None), # $62
+    ('LD', ('H', 'E'), 1, 1, '----', None), # $63
+    ('LD', ('H', 'H'), 1, 1, '----', None), # $64
+    ('LD', ('H', 'L'), 1, 1, '----', None), # $65
+    ('LD', ('H', '(HL)'), 1, 2, '----', None), # $66
+    ('LD', ('H', 'A'), 1, 1, '----', None), # $67
+    ('LD', ('L', 'B'), 1, 1, '----', None), # $68
+    ('LD', ('L', 'C'), 1, 1, '----', None), # $69
+    ('LD', ('L', 'D'), 1, 1, '----', None), # $6A
+    ('LD', ('L', 'E'), 1, 1, '----', None), # $6B
+    ('LD', ('L', 'H'), 1, 1, '----', None), # $6C
+    ('LD', ('L', 'L'), 1, 1, '----', None), # $6D
+    ('LD', ('L', '(HL)'), 1, 2, '----', None), # $6E
+    ('LD', ('L', 'A'), 1, 1, '----', None), # $6F
+    ('LD', ('(HL)', 'B'), 1, 2, '----', None), # $70
+    ('LD', ('(HL)', 'C'), 1, 2, '----', None), # $71
+    ('LD', ('(HL)', 'D'), 1, 2, '----', None), # $72
+    ('LD', ('(HL)', 'E'), 1, 2, '----', None), # $73
+    ('LD', ('(HL)', 'H'), 1, 2, '----', None), # $74
+    ('LD', ('(HL)', 'L'), 1, 2, '----', None), # $75
+    ('HALT', (), 1, 1, '----', None), # $76
+    ('LD', ('(HL)', 'A'), 1, 2, '----', None), # $77
+    ('LD', ('A', 'B'), 1, 1, '----', None), # $78
+    ('LD', ('A', 'C'), 1, 1, '----', None), # $79
+    ('LD', ('A', 'D'), 1, 1, '----', None), # $7A
+    ('LD', ('A', 'E'), 1, 1, '----', None), # $7B
+    ('LD', ('A', 'H'), 1, 1, '----', None), # $7C
+    ('LD', ('A', 'L'), 1, 1, '----', None), # $7D
+    ('LD', ('A', '(HL)'), 1, 2, '----', None), # $7E
+    ('LD', ('A', 'A'), 1, 1, '----', None), # $7F
+    ('ADD', ('A', 'B'), 1, 1, 'Z0HC', None), # $80
+    ('ADD', ('A', 'C'), 1, 1, 'Z0HC', None), # $81
+    ('ADD', ('A', 'D'), 1, 1, 'Z0HC', None), # $82
+    ('ADD', ('A', 'E'), 1, 1, 'Z0HC', None), # $83
+    ('ADD', ('A', 'H'), 1, 1, 'Z0HC', None), # $84
+    ('ADD', ('A', 'L'), 1, 1, 'Z0HC', None), # $85
+    ('ADD', ('A', '(HL)'), 1, 2, 'Z0HC', None), # $86
+    ('ADD', ('A', 'A'), 1, 1, 'Z0HC', None), # $87
+    ('ADC', ('A', 'B'), 1, 1, 'Z0HC', None), # $88
+    ('ADC', ('A', 'C'), 1, 1, 'Z0HC', None), # $89
+    ('ADC', ('A', 'D'), 1, 1, 'Z0HC', None), # $8A
+    ('ADC', ('A', 'E'), 1, 1, 'Z0HC', None), # $8B
+    ('ADC', ('A', 'H'), 1, 1, 'Z0HC', None), # $8C
+    ('ADC', ('A', 'L'), 1, 1, 'Z0HC', None), # $8D
+    ('ADC', ('A', '(HL)'), 1, 2, 'Z0HC', None), # $8E
+    ('ADC', ('A', 'A'), 1, 1, 'Z0HC', None), # $8F
+    ('SUB', ('B',), 1, 1, 'Z1HC', None), # $90
+    ('SUB', ('C',), 1, 1, 'Z1HC', None), # $91
+    ('SUB', ('D',), 1, 1, 'Z1HC', None), # $92
+    ('SUB', ('E',), 1, 1, 'Z1HC', None), # $93
+    ('SUB', ('H',), 1, 1, 'Z1HC', None), # $94
+    ('SUB', ('L',), 1, 1, 'Z1HC', None), # $95
+    ('SUB', ('(HL)',), 1, 2, 'Z1HC', None), # $96
+    ('SUB', ('A',), 1, 1, 'Z1HC', None), # $97
+    ('SBC', ('A', 'B'), 1, 1, 'Z1HC', None), # $98
+    ('SBC', ('A', 'C'), 1, 1, 'Z1HC', None), # $99
+    ('SBC', ('A', 'D'), 1, 1, 'Z1HC', None), # $9A
+    ('SBC', ('A', 'E'), 1, 1, 'Z1HC', None), # $9B
+    ('SBC', ('A', 'H'), 1, 1, 'Z1HC', None), # $9C
+    ('SBC', ('A', 'L'), 1, 1, 'Z1HC', None), # $9D
+    ('SBC', ('A', '(HL)'), 1, 2, 'Z1HC', None), # $9E
+    ('SBC', ('A', 'A'), 1, 1, 'Z1HC', None), # $9F
+    ('AND', ('B',), 1, 1, 'Z010', None), # $A0
+    ('AND', ('C',), 1, 1, 'Z010', None), # $A1
+    ('AND', ('D',), 1, 1, 'Z010', None), # $A2
+    ('AND', ('E',), 1, 1, 'Z010', None), # $A3
+    ('AND', ('H',), 1, 1, 'Z010', None), # $A4
+    ('AND', ('L',), 1, 1, 'Z010', None), # $A5
+    ('AND', ('(HL)',), 1, 2, 'Z010', None), # $A6
+    ('AND', ('A',), 1, 1, 'Z010', None), # $A7
+    ('XOR', ('B',), 1, 1, 'Z000', None), # $A8
+    ('XOR', ('C',), 1, 1, 'Z000', None), # $A9
+    ('XOR', ('D',), 1, 1, 'Z000', None), # $AA
+    ('XOR', ('E',), 1, 1, 'Z000', None), # $AB
+    ('XOR', ('H',), 1, 1, 'Z000', None), # $AC
+    ('XOR', ('L',), 1, 1, 'Z000', None), # $AD
+    ('XOR', ('(HL)',), 1, 2, 'Z000', None), # $AE
+    ('XOR', ('A',), 1, 1, 'Z000', None), # $AF
+    ('OR', ('B',), 1, 1, 'Z000', None), # $B0
+    ('OR', ('C',), 1, 1, 'Z000', None), # $B1
+    ('OR', ('D',), 1, 1, 'Z000', None), # $B2
+    ('OR', ('E',), 1, 1, 'Z000', None), # $B3
+    ('OR', ('H',), 1, 1, 'Z000', None), # $B4
+    ('OR', ('L',), 1, 1, 'Z000', None), # $B5
+    ('OR', ('(HL)',), 1, 2, 'Z000', None), # $B6
+    ('OR', ('A',), 1, 1, 'Z000', None), # $B7
+    ('CP', ('B',), 1, 1, 'Z1HC', None), # $B8
+    ('CP', ('C',), 1, 1, 'Z1HC', None), # $B9
+    ('CP', ('D',), 1, 1, 'Z1HC', None), # $BA
+    ('CP', ('E',), 1, 1, 'Z1HC', None), # $BB
+    ('CP', ('H',), 1, 1, 'Z1HC', None), # $BC
+    ('CP', ('L',), 1, 1, 'Z1HC', None), # $BD
+    ('CP', ('(HL)',), 1, 2, 'Z1HC', None), # $BE
+    ('CP', ('A',), 1, 1, 'Z1HC', None), # $BF
+    ('RET', ('NZ',), 1, (5, 2), '----', 'ret_cc'), # $C0
+    ('POP', ('BC',), 1, 3, '----', None), # $C1
+    ('JP', ('NZ', 'a16'), 3, (4, 3), '----', 'jump_cc'), # $C2
+    ('JP', ('a16',), 3, 4, '----', 'jump'), # $C3
+    ('CALL', ('NZ', 'a16'), 3, (6, 3), '----', 'call_cc'), # $C4
+    ('PUSH', ('BC',), 1, 4, '----', None), # $C5
+    ('ADD', ('A', 'd8'), 2, 2, 'Z0HC', None), # $C6
+    ('RST', ('$00',), 1, 4, '----', 'call'), # $C7
+    ('RET', ('Z',), 1, (5, 2), '----', 'ret_cc'), # $C8
+    ('RET', (), 1, 4, '----', 'ret'), # $C9
+    ('JP', ('Z', 'a16'), 3, (4, 3), '----', 'jump_cc'), # $CA
+    None, # $CB
+    ('CALL', ('Z', 'a16'), 3, (6, 3), '----', 'call_cc'), # $CC
+    ('CALL', ('a16',), 3, 6, '----', 'call'), # $CD
+    ('ADC', ('A', 'd8'), 2, 2, 'Z0HC', None), # $CE
+    ('RST', ('$08',), 1, 4, '----', 'call'), # $CF
+    ('RET', ('NC',), 1, (5, 2), '----', 'ret_cc'), # $D0
+    ('POP', ('DE',), 1, 3, '----', None), # $D1
+    ('JP', ('NC', 'a16'), 3, (4, 3), '----', 'jump_cc'), # $D2
+    None, # $D3
+    ('CALL', ('NC', 'a16'), 3, (6, 3), '----', 'call_cc'), # $D4
+    ('PUSH', ('DE',), 1, 4, '----', None), # $D5
+    ('SUB', ('d8',), 2, 2, 'Z1HC', None), # $D6
+    ('RST', ('$10',), 1, 4, '----', 'call'), # $D7
+    ('RET', ('C',), 1, (5, 2), '----', 'ret_cc'), # $D8
+    ('RETI', (), 1, 4, '----', 'ret'), # $D9
+    ('JP', ('C', 'a16'), 3, (4, 3), '----', 'jump_cc'), # $DA
+    None, # $DB
+    ('CALL', ('C', 'a16'), 3, (6, 3), '----', 'call_cc'), # $DC
+    None, # $DD
+    ('SBC', ('A', 'd8'), 2, 2, 'Z1HC', None), # $DE
+    ('RST', ('$18',), 1, 4, '----', 'call'), # $DF
+    ('LDH', ('(a8)', 'A'), 2, 3, '----', None), # $E0
+    ('POP', ('HL',), 1, 3, '----', None), # $E1
+    ('LD', ('(C)', 'A'), 1, 2, '----', None), # $E2
+    None, # $E3
+    None, # $E4
+    ('PUSH', ('HL',), 1, 4, '----', None), # $E5
+    ('AND', ('d8',), 2, 2, 'Z010', None), # $E6
+    ('RST', ('$20',), 1, 4, '----', 'call'), # $E7
+    ('ADD', ('SP', 'r8'), 2, 4, '00HC', None), # $E8
+    ('JP', ('HL',), 1, 1, '----', 'jump_hl'), # $E9
+    ('LD', ('(a16)', 'A'), 3, 4, '----', None), # $EA
+    None, # $EB
+    None, # $EC
+    None, # $ED
+    ('XOR', ('d8',), 2, 2, 'Z000', None), # $EE
+    ('RST', ('$28',), 1, 4, '----', 'call'), # $EF
+    ('LDH', ('A', '(a8)'), 2, 3, '----', None), # $F0
+    ('POP', ('AF',), 1, 3, 'ZNHC', None), # $F1
+    ('LD', ('A', '(C)'), 1, 2, '----', None), # $F2
+    ('DI', (), 1, 1, '----', None), # $F3
+    None, # $F4
+    ('PUSH', ('AF',), 1, 4, '----', None), # $F5
+    ('OR', ('d8',), 2, 2, 'Z000', None), # $F6
+    ('RST', ('$30',), 1, 4, '----', 'call'), # $F7
+    ('LD', ('HL', 'SP+r8'), 2, 3, '00HC', None), # $F8
+    ('LD', ('SP', 'HL'), 1, 2, '----', None), # $F9
+    ('LD', ('A', '(a16)'), 3, 4, '----', None), # $FA
+    ('EI', (), 1, 1, '----', None), # $FB
+    None, # $FC
+    None, # $FD
+    ('CP', ('d8',), 2, 2, 'Z1HC', None), # $FE
+    ('RST', ('$38',), 1, 4, '----', 'call'), # $FF
+)
+
+CB_INSTRUCTIONS = (
+    ('RLC', ('B',), 2, 2, 'Z00C', None), # $00
+    ('RLC', ('C',), 2, 2, 'Z00C', None), # $01
+    ('RLC', ('D',), 2, 2, 'Z00C', None), # $02
+    ('RLC', ('E',), 2, 2, 'Z00C', None), # $03
+    ('RLC', ('H',), 2, 2, 'Z00C', None), # $04
+    ('RLC', ('L',), 2, 2, 'Z00C', None), # $05
+    ('RLC', ('(HL)',), 2, 4, 'Z00C', None), # $06
+    ('RLC', ('A',), 2, 2, 'Z00C', None), # $07
+    ('RRC', ('B',), 2, 2, 'Z00C', None), # $08
+    ('RRC', ('C',), 2, 2, 'Z00C', None), # $09
+    ('RRC', ('D',), 2, 2, 'Z00C', None), # $0A
+    ('RRC', ('E',), 2, 2, 'Z00C', None), # $0B
+    ('RRC', ('H',), 2, 2, 'Z00C', None), # $0C
+    ('RRC', ('L',), 2, 2, 'Z00C', None), # $0D
+    ('RRC', ('(HL)',), 2, 4, 'Z00C', None), # $0E
+    ('RRC', ('A',), 2, 2, 'Z00C', None), # $0F
+    ('RL', ('B',), 2, 2, 'Z00C', None), # $10
+    ('RL', ('C',), 2, 2, 'Z00C', None), # $11
+    ('RL', ('D',), 2, 2, 'Z00C', None), # $12
+    ('RL', ('E',), 2, 2, 'Z00C', None), # $13
+    ('RL', ('H',), 2, 2, 'Z00C', None), # $14
+    ('RL', ('L',), 2, 2, 'Z00C', None), # $15
+    ('RL', ('(HL)',), 2, 4, 'Z00C', None), # $16
+    ('RL', ('A',), 2, 2, 'Z00C', None), # $17
+    ('RR', ('B',), 2, 2, 'Z00C', None), # $18
+    ('RR', ('C',), 2, 2, 'Z00C', None), # $19
+    ('RR', ('D',), 2, 2, 'Z00C', None), # $1A
+    ('RR', ('E',), 2, 2, 'Z00C', None), # $1B
+    ('RR', ('H',), 2, 2, 'Z00C', None), # $1C
+    ('RR', ('L',), 2, 2, 'Z00C', None), # $1D
+    ('RR', ('(HL)',), 2, 4, 'Z00C', None), # $1E
+    ('RR', ('A',), 2, 2, 'Z00C', None), # $1F
+    ('SLA', ('B',), 2, 2, 'Z00C', None), # $20
+    ('SLA', ('C',), 2, 2, 'Z00C', None), # $21
+    ('SLA', ('D',), 2, 2, 'Z00C', None), # $22
+    ('SLA', ('E',), 2, 2, 'Z00C', None), # $23
+    ('SLA', ('H',), 2, 2, 'Z00C', None), # $24
+    ('SLA', ('L',), 2, 2, 'Z00C', None), # $25
+    ('SLA', ('(HL)',), 2, 4, 'Z00C', None), # $26
+    ('SLA', ('A',), 2, 2, 'Z00C', None), # $27
+    ('SRA', ('B',), 2, 2, 'Z00C', None), # $28
+    ('SRA', ('C',), 2, 2, 'Z00C', None), # $29
+    ('SRA', ('D',), 2, 2, 'Z00C', None), # $2A
+    ('SRA', ('E',), 2, 2, 'Z00C', None), # $2B
+    ('SRA', ('H',), 2, 2, 'Z00C', None), # $2C
+    ('SRA', ('L',), 2, 2, 'Z00C', None), # $2D
+    ('SRA', ('(HL)',), 2, 4, 'Z00C', None), # $2E
+    ('SRA', ('A',), 2, 2, 'Z00C', None), # $2F
+    ('SWAP', ('B',), 2, 2, 'Z000', None), # $30
+    ('SWAP', ('C',), 2, 2, 'Z000', None), # $31
+    ('SWAP', ('D',), 2, 2, 'Z000', None), # $32
+    ('SWAP', ('E',), 2, 2, 'Z000', None), # $33
+    ('SWAP', ('H',), 2, 2, 'Z000', None), # $34
+    ('SWAP', ('L',), 2, 2, 'Z000', None), # $35
+    ('SWAP', ('(HL)',), 2, 4, 'Z000', None), # $36
+    ('SWAP', ('A',), 2, 2, 'Z000', None), # $37
+    ('SRL', ('B',), 2, 2, 'Z00C', None), # $38
+    ('SRL', ('C',), 2, 2, 'Z00C', None), # $39
+    ('SRL', ('D',), 2, 2, 'Z00C', None), # $3A
+    ('SRL', ('E',), 2, 2, 'Z00C', None), # $3B
+    ('SRL', ('H',), 2, 2, 'Z00C', None), # $3C
+    ('SRL', ('L',), 2, 2, 'Z00C', None), # $3D
+    ('SRL', ('(HL)',), 2, 4, 'Z00C', None), # $3E
+    ('SRL', ('A',), 2, 2, 'Z00C', None), # $3F
+    ('BIT', ('0', 'B'), 2, 2, 'Z01-', None), # $40
+    ('BIT', ('0', 'C'), 2, 2, 'Z01-', None), # $41
+    ('BIT', ('0', 'D'), 2, 2, 'Z01-', None), # $42
+    ('BIT', ('0', 'E'), 2, 2, 'Z01-', None), # $43
+    ('BIT', ('0', 'H'), 2, 2, 'Z01-', None), # $44
+    ('BIT', ('0', 'L'), 2, 2, 'Z01-', None), # $45
+    ('BIT', ('0', '(HL)'), 2, 3, 'Z01-', None), # $46
+    ('BIT', ('0', 'A'), 2, 2, 'Z01-', None), # $47
+    ('BIT', ('1', 'B'), 2, 2, 'Z01-', None), # $48
+    ('BIT', ('1', 'C'), 2, 2, 'Z01-', None), # $49
+    ('BIT', ('1', 'D'), 2, 2, 'Z01-', None), # $4A
+    ('BIT', ('1', 'E'), 2, 2, 'Z01-', None), # $4B
+    ('BIT', ('1', 'H'), 2, 2, 'Z01-', None), # $4C
+    ('BIT', ('1', 'L'), 2, 2, 'Z01-', None), # $4D
+    ('BIT', ('1', '(HL)'), 2, 3, 'Z01-', None), # $4E
+    ('BIT', ('1', 'A'), 2, 2, 'Z01-', None), # $4F
+    ('BIT', ('2', 'B'), 2, 2, 'Z01-', None), # $50
+    ('BIT', ('2', 'C'), 2, 2, 'Z01-', None), # $51
+    ('BIT', ('2', 'D'), 2, 2, 'Z01-', None), # $52
+    ('BIT', ('2', 'E'), 2, 2, 'Z01-', None), # $53
+    ('BIT', ('2', 'H'), 2, 2, 'Z01-', None), # $54
+    ('BIT', ('2', 'L'), 2, 2, 'Z01-', None), # $55
+    ('BIT', ('2', '(HL)'), 2, 3, 'Z01-', None), # $56
+    ('BIT', ('2', 'A'), 2, 2, 'Z01-', None), # $57
+    ('BIT', ('3', 'B'), 2, 2, 'Z01-', None), # $58
+    ('BIT', ('3', 'C'), 2, 2, 'Z01-', None), # $59
+    ('BIT', ('3', 'D'), 2, 2, 'Z01-', None), # $5A
+    ('BIT', ('3', 'E'), 2, 2, 'Z01-', None), # $5B
+    ('BIT', ('3', 'H'), 2, 2, 'Z01-', None), # $5C
+    ('BIT', ('3', 'L'), 2, 2, 'Z01-', None), # $5D
+    ('BIT', ('3', '(HL)'), 2, 3, 'Z01-', None), # $5E
+    ('BIT', ('3', 'A'), 2, 2, 'Z01-', None), # $5F
+    ('BIT', ('4', 'B'), 2, 2, 'Z01-', None), # $60
+    ('BIT', ('4', 'C'), 2, 2, 'Z01-', None), # $61
+    ('BIT', ('4', 'D'), 2, 2, 'Z01-', None), # $62
+    ('BIT', ('4', 'E'), 2, 2, 'Z01-', None), # $63
+    ('BIT', ('4', 'H'), 2, 2, 'Z01-', None), # $64
+    ('BIT', ('4', 'L'), 2, 2, 'Z01-', None), # $65
+    ('BIT', ('4', '(HL)'), 2, 3, 'Z01-', None), # $66
+    ('BIT', ('4', 'A'), 2, 2, 'Z01-', None), # $67
+    ('BIT', ('5', 'B'), 2, 2, 'Z01-', None), # $68
+    ('BIT', ('5', 'C'), 2, 2, 'Z01-', None), # $69
+    ('BIT', ('5', 'D'), 2, 2, 'Z01-', None), # $6A
+    ('BIT', ('5', 'E'), 2, 2, 'Z01-', None), # $6B
+    ('BIT', ('5', 'H'), 2, 2, 'Z01-', None), # $6C
+    ('BIT', ('5', 'L'), 2, 2, 'Z01-', None), # $6D
+    ('BIT', ('5', '(HL)'), 2, 3, 'Z01-', None), # $6E
+    ('BIT', ('5', 'A'), 2, 2, 'Z01-', None), # $6F
+    ('BIT', ('6', 'B'), 2, 2, 'Z01-', None), # $70
+    ('BIT', ('6', 'C'), 2, 2, 'Z01-', None), # $71
+    ('BIT', ('6', 'D'), 2, 2, 'Z01-', None), # $72
+    ('BIT', ('6', 'E'), 2, 2, 'Z01-', None), # $73
+    ('BIT', ('6', 'H'), 2, 2, 'Z01-', None), # $74
+    ('BIT', ('6', 'L'), 2, 2, 'Z01-', None), # $75
+    ('BIT', ('6', '(HL)'), 2, 3, 'Z01-', None), # $76
+    ('BIT', ('6', 'A'), 2, 2, 'Z01-', None), # $77
+    ('BIT', ('7', 'B'), 2, 2, 'Z01-', None), # $78
+    ('BIT', ('7', 'C'), 2, 2, 'Z01-', None), # $79
+    ('BIT', ('7', 'D'), 2, 2, 'Z01-', None), # $7A
+    ('BIT', ('7', 'E'), 2, 2, 'Z01-', None), # $7B
+    ('BIT', ('7', 'H'), 2, 2, 'Z01-', None), # $7C
+    ('BIT', ('7', 'L'), 2, 2, 'Z01-', None), # $7D
+    ('BIT', ('7', '(HL)'), 2, 3, 'Z01-', None), # $7E
+    ('BIT', ('7', 'A'), 2, 2, 'Z01-', None), # $7F
+    ('RES', ('0', 'B'), 2, 2, '----', None), # $80
+    ('RES', ('0', 'C'), 2, 2, '----', None), # $81
+    ('RES', ('0', 'D'), 2, 2, '----', None), # $82
+    ('RES', ('0', 'E'), 2, 2, '----', None), # $83
+    ('RES', ('0', 'H'), 2, 2, '----', None), # $84
+    ('RES', ('0', 'L'), 2, 2, '----', None), # $85
+    ('RES', ('0', '(HL)'), 2, 4, '----', None), # $86
+    ('RES', ('0', 'A'), 2, 2, '----', None), # $87
+    ('RES', ('1', 'B'), 2, 2, '----', None), # $88
+    ('RES', ('1', 'C'), 2, 2, '----', None), # $89
+    ('RES', ('1', 'D'), 2, 2, '----', None), # $8A
+    ('RES', ('1', 'E'), 2, 2, '----', None), # $8B
+    ('RES', ('1', 'H'), 2, 2, '----', None), # $8C
+    ('RES', ('1', 'L'), 2, 2, '----', None), # $8D
+    ('RES', ('1', '(HL)'), 2, 4, '----', None), # $8E
+    ('RES', ('1', 'A'), 2, 2, '----', None), # $8F
+    ('RES', ('2', 'B'), 2, 2, '----', None), # $90
+    ('RES', ('2', 'C'), 2, 2, '----', None), # $91
+    ('RES', ('2', 'D'), 2, 2, '----', None), # $92
+    ('RES', ('2', 'E'), 2, 2, '----', None), # $93
+    ('RES', ('2', 'H'), 2, 2, '----', None), # $94
+    ('RES', ('2', 'L'), 2, 2, '----', None), # $95
+    ('RES', ('2', '(HL)'), 2, 4, '----', None), # $96
+    ('RES', ('2', 'A'), 2, 2, '----', None), # $97
+    ('RES', ('3', 'B'), 2, 2, '----', None), # $98
+    ('RES', ('3', 'C'), 2, 2, '----', None), # $99
+    ('RES', ('3', 'D'), 2, 2, '----', None), # $9A
+    ('RES', ('3', 'E'), 2, 2, '----', None), # $9B
+    ('RES', ('3', 'H'), 2, 2, '----', None), # $9C
+    ('RES', ('3', 'L'), 2, 2, '----', None), # $9D
+    ('RES', ('3', '(HL)'), 2, 4, '----', None), # $9E
+    ('RES', ('3', 'A'), 2, 2, '----', None), # $9F
+    ('RES', ('4', 'B'), 2, 2, '----', None), # $A0
+    ('RES', ('4', 'C'), 2, 2, '----', None), # $A1
+    ('RES', ('4', 'D'), 2, 2, '----', None), # $A2
+    ('RES', ('4', 'E'), 2, 2, '----', None), # $A3
+    ('RES', ('4', 'H'), 2, 2, '----', None), # $A4
+    ('RES', ('4', 'L'), 2, 2, '----', None), # $A5
+    ('RES', ('4', '(HL)'), 2, 4, '----', None), # $A6
+    ('RES', ('4', 'A'), 2, 2, '----', None), # $A7
+    ('RES', ('5', 'B'), 2, 2, '----', None), # $A8
+    ('RES', ('5', 'C'), 2, 2, '----', None), # $A9
+    ('RES', ('5', 'D'), 2, 2, '----', None), # $AA
+    ('RES', ('5', 'E'), 2, 2, '----', None), # $AB
+    ('RES', ('5', 'H'), 2, 2, '----', None), # $AC
+    ('RES', ('5', 'L'), 2, 2, '----', None), # $AD
+    ('RES', ('5', '(HL)'), 2, 4, '----', None), # $AE
+    ('RES', ('5', 'A'), 2, 2, '----', None), # $AF
+    ('RES', ('6', 'B'), 2, 2, '----', None), # $B0
+    ('RES', ('6', 'C'), 2, 2, '----', None), # $B1
+    ('RES', ('6', 'D'), 2, 2, '----', None), # $B2
+    ('RES', ('6', 'E'), 2, 2, '----', None), # $B3
+    ('RES', ('6', 'H'), 2, 2, '----', None), # $B4
+    ('RES', ('6', 'L'), 2, 2, '----', None), # $B5
+    ('RES', ('6', '(HL)'), 2, 4, '----', None), # $B6
+    ('RES', ('6', 'A'), 2, 2, '----', None), # $B7
+    ('RES', ('7', 'B'), 2, 2, '----', None), # $B8
+    ('RES', ('7', 'C'), 2, 2, '----', None), # $B9
+    ('RES', ('7', 'D'), 2, 2, '----', None), # $BA
+    ('RES', ('7', 'E'), 2, 2, '----', None), # $BB
+    ('RES', ('7', 'H'), 2, 2, '----', None), # $BC
+    ('RES', ('7', 'L'), 2, 2, '----', None), # $BD
+    ('RES', ('7', '(HL)'), 2, 4, '----', None), # $BE
+    ('RES', ('7', 'A'), 2, 2, '----', None), # $BF
+    ('SET', ('0', 'B'), 2, 2, '----', None), # $C0
+    ('SET', ('0', 'C'), 2, 2, '----', None), # $C1
+    ('SET', ('0', 'D'), 2, 2, '----', None), # $C2
+    ('SET', ('0', 'E'), 2, 2, '----', None), # $C3
+    ('SET', ('0', 'H'), 2, 2, '----', None), # $C4
+    ('SET', ('0', 'L'), 2, 2, '----', None), # $C5
+    ('SET', ('0', '(HL)'), 2, 4, '----', None), # $C6
+    ('SET', ('0', 'A'), 2, 2, '----', None), # $C7
+    ('SET', ('1', 'B'), 2, 2, '----', None), # $C8
+    ('SET', ('1', 'C'), 2, 2, '----', None), # $C9
+    ('SET', ('1', 'D'), 2, 2, '----', None), # $CA
+    ('SET', ('1', 'E'), 2, 2, '----', None), # $CB
+    ('SET', ('1', 'H'), 2, 2, '----', None), # $CC
+    ('SET', ('1', 'L'), 2, 2, '----', None), # $CD
+    ('SET', ('1', '(HL)'), 2, 4, '----', None), # $CE
+    ('SET', ('1', 'A'), 2, 2, '----', None), # $CF
+    ('SET', ('2', 'B'), 2, 2, '----', None), # $D0
+    ('SET', ('2', 'C'), 2, 2, '----', None), # $D1
+    ('SET', ('2', 'D'), 2, 2, '----', None), # $D2
+    ('SET', ('2', 'E'), 2, 2, '----', None), # $D3
+    ('SET', ('2', 'H'), 2, 2, '----', None), # $D4
+    ('SET', ('2', 'L'), 2, 2, '----', None), # $D5
+    ('SET', ('2', '(HL)'), 2, 4, '----', None), # $D6
+    ('SET', ('2', 'A'), 2, 2, '----', None), # $D7
+    ('SET', ('3', 'B'), 2, 2, '----', None), # $D8
+    ('SET', ('3', 'C'), 2, 2, '----', None), # $D9
+    ('SET', ('3', 'D'), 2, 2, '----', None), # $DA
+    ('SET', ('3', 'E'), 2, 2, '----', None), # $DB
+    ('SET', ('3', 'H'), 2, 2, '----', None), # $DC
+    ('SET', ('3', 'L'), 2, 2, '----', None), # $DD
+    ('SET', ('3', '(HL)'), 2, 4, '----', None), # $DE
+    ('SET', ('3', 'A'), 2, 2, '----', None), # $DF
+    ('SET', ('4', 'B'), 2, 2, '----', None), # $E0
+    ('SET', ('4', 'C'), 2, 2, '----', None), # $E1
+    ('SET', ('4', 'D'), 2, 2, '----', None), # $E2
+    ('SET', ('4', 'E'), 2, 2, '----', None), # $E3
+    ('SET', ('4', 'H'), 2, 2, '----', None), # $E4
+    ('SET', ('4', 'L'), 2, 2, '----', None), # $E5
+    ('SET', ('4', '(HL)'), 2, 4, '----', None), # $E6
+    ('SET', ('4', 'A'), 2, 2, '----', None), # $E7
+    ('SET', ('5', 'B'), 2, 2, '----', None), # $E8
+    ('SET', ('5', 'C'), 2, 2, '----', None), # $E9
+    ('SET', ('5', 'D'), 2, 2, '----', None), # $EA
+    ('SET', ('5', 'E'), 2, 2, '----', None), # $EB
+    ('SET', ('5', 'H'), 2, 2, '----', None), # $EC
+    ('SET', ('5', 'L'), 2, 2, '----', None), # $ED
+    ('SET', ('5', '(HL)'), 2, 4, '----', None), # $EE
+    ('SET', ('5', 'A'), 2, 2, '----', None), # $EF
+    ('SET', ('6', 'B'), 2, 2, '----', None), # $F0
+    ('SET', ('6', 'C'), 2, 2, '----', None), # $F1
+    ('SET', ('6', 'D'), 2, 2, '----', None), # $F2
+    ('SET', ('6', 'E'), 2, 2, '----', None), # $F3
+    ('SET', ('6', 'H'), 2, 2, '----', None), # $F4
+    ('SET', ('6', 'L'), 2, 2, '----', None), # $F5
+    ('SET', ('6', '(HL)'), 2, 4, '----', None), # $F6
+    ('SET', ('6', 'A'), 2, 2, '----', None), # $F7
+    ('SET', ('7', 'B'), 2, 2, '----', None), # $F8
+    ('SET', ('7', 'C'), 2, 2, '----', None), # $F9
+    ('SET', ('7', 'D'), 2, 2, '----', None), # $FA
+    ('SET', ('7', 'E'), 2, 2, '----', None), # $FB
+    ('SET', ('7', 'H'), 2, 2, '----', None), # $FC
+    ('SET', ('7', 'L'), 2, 2, '----', None), # $FD
+    ('SET', ('7', '(HL)'), 2, 4, '----', None), # $FE
+    ('SET', ('7', 'A'), 2, 2, '----', None), # $FF
+)
+
+# Machine cycles by opcode, CYCLES counts conditional instructions as not taken
+CYCLES = (
+    1, 3, 2, 2, 1, 1, 2, 1, 5, 2, 2, 2, 1, 1, 2, 1,
+    1, 3, 2, 2, 1, 1, 2, 1, 3, 2, 2, 2, 1, 1, 2, 1,
+    2, 3, 2, 2, 1, 1, 2, 1, 2, 2, 2, 2, 1, 1, 2, 1,
+    2, 3, 2, 2, 3, 3, 3, 1, 2, 2, 2, 2, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    2, 2, 2, 2, 2, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    2, 3, 3, 4, 3, 4, 2, 4, 2, 4, 3, 0, 3, 6, 2, 4,
+    2, 3, 3, 0, 3, 4, 2, 4, 2, 4, 3, 0, 3, 0, 2, 4,
+    3, 3, 2, 0, 0, 4, 2, 4, 4, 1, 4, 0, 0, 0, 2, 4,
+    3, 3, 2, 1, 0, 4, 2, 4, 3, 2, 4, 1, 0, 0, 2, 4,
+)
+
+CYCLES_TAKEN = (
+    1, 3, 2, 2, 1, 1, 2, 1, 5, 2, 2, 2, 1, 1, 2, 1,
+    1, 3, 2, 2, 1, 1, 2, 1, 3, 2, 2, 2, 1, 1, 2, 1,
+    3, 3, 2, 2, 1, 1, 2, 1, 3, 2, 2, 2, 1, 1, 2, 1,
+    3, 3, 2, 2, 3, 3, 3, 1, 3, 2, 2, 2, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    2, 2, 2, 2, 2, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+    5, 3, 4, 4, 6, 4, 2, 4, 5, 4, 4, 0, 6, 6, 2, 4,
+    5, 3, 4, 0, 6, 4, 2, 4, 5, 4, 4, 0, 6, 0, 2, 4,
+    3, 3, 2, 0, 0, 4, 2, 4, 4, 1, 4, 0, 0, 0, 2, 4,
+    3, 3, 2, 1, 0, 4, 2, 4, 3, 2, 4, 1, 0, 0, 2, 4,
+)
+
+CB_CYCLES = (
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2, 2, 3, 2,
+    2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2, 2, 3, 2,
+    2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2, 2, 3, 2,
+    2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2, 2, 3, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+    2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 4, 2,
+)
+
+def operandText(operand, mnemonic, address, length, read):
+    "Fill in immediate values of an operand"
+    if "d8" in operand:
+        return operand.replace("d8", "${:02X}".format(read((address + 1) & 0xFFFF)))
+    if "a8" in operand:
+        return operand.replace("a8", "$FF{:02X}".format(read((address + 1) & 0xFFFF)))
+    if "16" in operand:
+        word = read((address + 1) & 0xFFFF) | (read((address + 2) & 0xFFFF) << 8)
+        return operand.replace("d16", "${:04X}".format(word)).replace("a16", "${:04X}".format(word))
+    if "r8" in operand:
+        offset = read((address + 1) & 0xFFFF)
+        offset = offset - 0x100 if offset & 0x80 else offset
+        if mnemonic == "JR": # show where it goes
+            return "${:04X}".format((address + length + offset) & 0xFFFF)
+        return operand.replace("+r8", "{:+d}".format(offset)).replace("r8", "{:d}".format(offset))
+    return operand
+
+def disassemble(read, address):
+    """
+    Returns (text, length) for the instruction at address, read(address) returns a byte.
+
+    >>> code = [0x3E, 0x12, 0xCB, 0x7C, 0x18, 0xFE, 0xFA, 0x00, 0xC0, 0xD3]
+    >>> read = lambda address: code[address]
+    >>> disassemble(read, 0)
+    ('LD A,$12', 2)
+    >>> disassemble(read, 2)
+    ('BIT 7,H', 2)
+    >>> disassemble(read, 4)
+    ('JR $0004', 2)
+    >>> disassemble(read, 6)
+    ('LD A,($C000)', 3)
+    >>> disassemble(read, 9)
+    ('DB $D3', 1)
+    """
+    opcode = read(address)
+    if opcode == 0xCB:
+        info = CB_INSTRUCTIONS[read((address + 1) & 0xFFFF)]
+    else:
+        info = INSTRUCTIONS[opcode]
+    if info is None:
+        return "DB ${:02X}".format(opcode), 1
+
+    mnemonic, operands, length = info[:3]
+    if not operands:
+        return mnemonic, length
+    text = ",".join(operandText(operand, mnemonic, address, length, read) for operand in operands)
+    return mnemonic + " " + text, length
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
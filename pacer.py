@@ -0,0 +1,50 @@
+import time
+
+from lcdc import FRAME_TIME, MAX_LAG
+
+REPORT_INTERVAL = 1.0 # seconds between updates of the achieved speed
+
+class Pacer:
+    "Holds emulation to real time, one call to wait() per emulated frame"
+    def __init__(self, speed=1.0):
+        assert(speed > 0)
+        self.speed = speed # multiple of real hardware speed to aim for
+        self.turbo = False # run as fast as possible while set
+        self.next_frame = None
+
+        self.report_time = None
+        self.report_frames = 0
+        self.achieved = 0.0 # multiple of real hardware speed reached over the last report interval
+
+    def frameTime(self):
+        return FRAME_TIME / self.speed
+
+    def wait(self):
+        """
+        Sleep until the next frame is due.
+        Returns True when self.achieved has just been updated.
+        """
+        now = time.perf_counter()
+        if self.next_frame is None:
+            self.next_frame = now
+            self.report_time = now
+
+        reported = False
+        self.report_frames += 1
+        if now - self.report_time >= REPORT_INTERVAL:
+            self.achieved = self.report_frames * FRAME_TIME / (now - self.report_time)
+            self.report_time = now
+            self.report_frames = 0
+            reported = True
+
+        if self.turbo:
+            self.next_frame = now
+            return reported
+
+        self.next_frame += self.frameTime()
+        delay = self.next_frame - now
+        if delay > 0:
+            time.sleep(delay)
+        elif -delay > MAX_LAG: # too far behind to catch up, carry on from here
+            self.next_frame = now
+        return reported
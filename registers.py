@@ -117,6 +117,42 @@ class RegisterFlag(RegisterByte):
     def getCarry(self):
         return self.getBit(4)
 
+class LazyRegisterFlag(RegisterFlag):
+    """
+    A flag register that can hold a pending ALU result instead of a value.
+    defer() records the lookup table and index of the last ALU operation,
+    the flags are only looked up when something reads the register.
+
+    >>> f = LazyRegisterFlag(0x10)
+    >>> f.defer([0x1280], 0, 0x10)
+    >>> f.getCarry()
+    True
+    >>> hex(int(f))
+    '0x90'
+    >>> f.defer([0x0020], 0)
+    >>> f.setZero(True)
+    >>> hex(int(f))
+    '0xa0'
+    """
+    def defer(self, table, index, keep=0):
+        "keep selects bits of the current flags that the pending operation leaves alone"
+        kept = self.value & keep if keep else 0
+        self.table = table
+        self.index = index
+        self.kept = kept
+
+    @property
+    def value(self):
+        if self.table is not None:
+            self.resolved = (self.table[self.index] & 0xFF) | self.kept
+            self.table = None
+        return self.resolved
+
+    @value.setter
+    def value(self, value):
+        self.table = None
+        self.resolved = value
+
 class RegisterWord:
     def __init__(self, r1, r2, name="Nameless"):
         self.r1 = r1 # Most significant
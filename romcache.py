@@ -0,0 +1,65 @@
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"GTRC"
+FILE_HEADER = struct.Struct("<4sI") # magic, length of the marshalled data after it
+DIRECTORY_VARIABLE = "GAMETOY_CACHE"
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "gametoy")
+
+class ROMCache:
+    """
+    Results of analysing a ROM, or other slow to build data named by a
+    SHA-1 of what it is built from, kept on disk between runs.
+    Entries are named by the SHA-1, the kind of result and its
+    version, and the Python that wrote them since marshal output, code
+    objects especially, is only readable by the same version. A changed
+    ROM or analysis simply looks up another name, nothing is invalidated.
+
+    Any number of processes can share a directory. Readers mmap an entry
+    read-only, writers write a temporary file and rename it into place, so
+    a reader sees either the whole of an entry or nothing. Two writers of
+    the same entry write the same thing and the last rename wins.
+    """
+    def __init__(self, directory=None):
+        self.directory = directory or os.environ.get(DIRECTORY_VARIABLE) or DEFAULT_DIRECTORY
+
+    def path(self, digest, kind, version):
+        name = "{}.{}.{}.{}".format(digest, kind, version, sys.implementation.cache_tag)
+        return os.path.join(self.directory, digest[:2], name)
+
+    def load(self, digest, kind, version):
+        "The stored value, None if there isn't one or it can't be read"
+        try:
+            with open(self.path(digest, kind, version), "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    magic, length = FILE_HEADER.unpack_from(data)
+                    if magic != MAGIC or FILE_HEADER.size + length != len(data):
+                        return None
+                    with memoryview(data)[FILE_HEADER.size:] as view:
+                        return marshal.loads(view)
+        except (OSError, ValueError, EOFError, TypeError, BufferError, struct.error):
+            return None
+
+    def store(self, digest, kind, version, value):
+        "Save value, anything marshal handles. Returns False if the directory can't be written"
+        import tempfile # only writers need it, and it is slow to import
+        path = self.path(digest, kind, version)
+        data = marshal.dumps(value)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp")
+            try:
+                os.fchmod(descriptor, 0o644) # mkstemp makes it private, other workers need to read it
+                with os.fdopen(descriptor, "wb") as f:
+                    f.write(FILE_HEADER.pack(MAGIC, len(data)))
+                    f.write(data)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            return False
+        return True
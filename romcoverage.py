@@ -0,0 +1,197 @@
+#!/bin/env python3
+
+import fcntl
+import hashlib
+import os
+import struct
+import sys
+import zlib
+
+import opinfo
+
+help = """
+Usage: romcoverage report path_to_rom coverage_files...
+       romcoverage merge output_file coverage_files...
+
+report: print how much of each ROM bank the coverage files exercised together
+merge: combine coverage files of the same ROM, e.g. from parallel runs
+"""
+
+BANK_SIZE = 0x4000
+BITMAP_SIZE = BANK_SIZE // 8
+MAGIC = b"GTCV"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sB20sH") # magic, version, ROM SHA-1, banks
+
+class Coverage:
+    """
+    One bit per ROM byte and bank for every executed instruction start
+    (code) and every byte read through the memory bus (data).
+    attach() wraps cpu.run and mem.read of a GameBoy, nothing is recorded
+    or slowed down until then.
+    """
+    def __init__(self, rom=None, digest=None, banks=None):
+        if rom is not None:
+            digest = hashlib.sha1(rom).digest()
+            banks = max(1, (len(rom) + BANK_SIZE - 1) // BANK_SIZE)
+        self.digest = digest
+        self.banks = banks
+        self.code = [bytearray(BITMAP_SIZE) for bank in range(banks)]
+        self.data = [bytearray(BITMAP_SIZE) for bank in range(banks)]
+        self.attached = None
+
+    def attach(self, gameboy):
+        cpu = gameboy.cpu
+        mem = gameboy.mem
+        banks = self.banks
+        code = self.code
+        data = self.data
+        run = cpu.run
+        read = mem.read
+
+        def coveredRun():
+            pc = (cpu.pc.r1.value << 8) | cpu.pc.r2.value
+            if pc < 0x4000:
+                code[0][pc >> 3] |= 1 << (pc & 7)
+            elif pc < 0x8000:
+                offset = pc - 0x4000
+                code[mem.rom_bank % banks][offset >> 3] |= 1 << (offset & 7)
+            run()
+
+        def coveredRead(location):
+            if location < 0x4000:
+                data[0][location >> 3] |= 1 << (location & 7)
+            elif location < 0x8000:
+                offset = location - 0x4000
+                data[mem.rom_bank % banks][offset >> 3] |= 1 << (offset & 7)
+            return read(location)
+
+        # Remember whether run and read were instance attributes so detach() can put them back
+        self.attached = (cpu, mem, cpu.__dict__.get("run"), mem.__dict__.get("read"))
+        cpu.run = coveredRun
+        mem.read = coveredRead
+
+    def detach(self):
+        cpu, mem, run, read = self.attached
+        if run is None:
+            del cpu.run
+        else:
+            cpu.run = run
+        if read is None:
+            del mem.read
+        else:
+            mem.read = read
+        self.attached = None
+
+    def merge(self, other):
+        assert other.digest == self.digest, "coverage of a different ROM"
+        for mine, theirs in zip(self.code + self.data, other.code + other.data):
+            merged = int.from_bytes(mine, "little") | int.from_bytes(theirs, "little")
+            mine[:] = merged.to_bytes(BITMAP_SIZE, "little")
+
+    def toBytes(self):
+        payload = b"".join(self.code) + b"".join(self.data)
+        return FILE_HEADER.pack(MAGIC, VERSION, self.digest, self.banks) + zlib.compress(payload)
+
+    @classmethod
+    def fromBytes(cls, blob):
+        magic, version, digest, banks = FILE_HEADER.unpack_from(blob)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a coverage file")
+        coverage = cls(digest=digest, banks=banks)
+        payload = zlib.decompress(blob[FILE_HEADER.size:])
+        bitmaps = coverage.code + coverage.data
+        for i, bitmap in enumerate(bitmaps):
+            bitmap[:] = payload[i * BITMAP_SIZE:(i + 1) * BITMAP_SIZE]
+        return coverage
+
+    def save(self, path):
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as f:
+            f.write(self.toBytes())
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.fromBytes(f.read())
+
+    def accumulate(self, path):
+        """
+        Save to path, merged with what is already there from earlier runs.
+        Runs finishing together take turns through a lock on a file beside
+        path, so neither loses the other's bits.
+        """
+        with open(path + ".lock", "wb") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX) # released when the file closes
+            if os.path.exists(path):
+                self.merge(Coverage.load(path))
+            self.save(path)
+
+    def instructionBytes(self, rom, bank):
+        "Bitmap of every byte of the executed instructions in a bank, not just their first"
+        base = bank * BANK_SIZE
+        covered = bytearray(BITMAP_SIZE)
+        code = self.code[bank]
+        for index, byte in enumerate(code):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    offset = index * 8 + bit
+                    opcode = rom[base + offset] if base + offset < len(rom) else 0xFF
+                    info = opinfo.INSTRUCTIONS[opcode]
+                    length = 2 if opcode == 0xCB else info[2] if info else 1
+                    for covered_offset in range(offset, min(offset + length, BANK_SIZE)):
+                        covered[covered_offset >> 3] |= 1 << (covered_offset & 7)
+        return covered
+
+    def summary(self, rom):
+        "Lines of a per-bank report"
+        lines = ["{:<6}{:>12}{:>12}{:>12}{:>10}".format("bank", "executed", "code bytes", "data only", "covered")]
+        totals = [0, 0, 0, 0]
+        for bank in range(self.banks):
+            executed = countBits(self.code[bank])
+            if not executed and not any(self.data[bank]):
+                continue
+            code = int.from_bytes(self.instructionBytes(rom, bank), "little")
+            data = int.from_bytes(self.data[bank], "little") & ~code
+            code_bytes = bin(code).count("1")
+            data_bytes = bin(data).count("1")
+            covered = code_bytes + data_bytes
+            lines.append("{:<6}{:>12}{:>12}{:>12}{:>9.1f}%".format(
+                "{:02X}".format(bank), executed, code_bytes, data_bytes, covered * 100 / BANK_SIZE))
+            for i, value in enumerate((executed, code_bytes, data_bytes, covered)):
+                totals[i] += value
+        lines.append("{:<6}{:>12}{:>12}{:>12}{:>9.1f}%".format(
+            "total", totals[0], totals[1], totals[2], totals[3] * 100 / (BANK_SIZE * self.banks)))
+        return lines
+
+def countBits(bitmap):
+    return bin(int.from_bytes(bitmap, "little")).count("1")
+
+def mergeFiles(paths):
+    coverage = Coverage.load(paths[0])
+    for path in paths[1:]:
+        coverage.merge(Coverage.load(path))
+    return coverage
+
+def main():
+    if len(sys.argv) < 4 or sys.argv[1] not in ("report", "merge"):
+        print(help)
+        return
+
+    if sys.argv[1] == "merge":
+        mergeFiles(sys.argv[3:]).save(sys.argv[2])
+        return
+
+    with open(sys.argv[2], "rb") as rom_file:
+        rom = rom_file.read()
+    coverage = mergeFiles(sys.argv[3:])
+    if coverage.digest != hashlib.sha1(rom).digest():
+        print("Coverage was recorded for a different ROM")
+        return
+    print("\n".join(coverage.summary(rom)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import mmap
+import os
+import struct
+import threading
+import time
+
+from mbc import DIRTY_SHIFT
+
+FLUSH_INTERVAL = 5.0 # seconds between saves of whatever changed
+# MBC3 clock after the RAM, laid out as other emulators save it: the five
+# registers, the five latched registers, each in 32 bits, and the UNIX time
+RTC_FOOTER = struct.Struct("<10IQ")
+RTC_FOOTER_OLD = struct.Struct("<10II") # older files with a 32 bit time
+
+class SaveFile:
+    """
+    Battery backed cart RAM kept in an mmap of a .sav file.
+    The bank controller marks the 4KB pages it writes in mbc.dirty. A
+    background thread writes back only those pages, every FLUSH_INTERVAL
+    seconds and whenever the game disables RAM, which games do once they
+    have finished saving. The emulator never waits for the disk.
+    Carts with a clock also get it saved after the RAM on every flush.
+    """
+    def __init__(self, path, mbc):
+        self.path = path
+        self.mbc = mbc
+        self.size = size = len(mbc.ram_data)
+        mode = "r+b" if os.path.exists(path) else "w+b"
+        with open(path, mode) as f:
+            if os.fstat(f.fileno()).st_size < size:
+                f.truncate(size) # pads a new or short file with zeros, anything past the RAM is kept
+            self.map = mmap.mmap(f.fileno(), size) if size else None
+            if mbc.timer:
+                f.seek(size)
+                self.loadClock(f.read(RTC_FOOTER.size))
+        if self.map is not None:
+            mbc.useRAM(self.map)
+        mbc.dirty[:] = bytes(len(mbc.dirty))
+        mbc.on_ram_disable = self.requestFlush
+
+        self.pages_written = 0
+        self.wake = threading.Event()
+        self.running = True
+        self.thread = threading.Thread(target=self.flushLoop, daemon=True)
+        self.thread.start()
+
+    def loadClock(self, footer):
+        "Set the cart's clock from a saved footer, ignoring one that isn't there"
+        if len(footer) == RTC_FOOTER.size:
+            values = RTC_FOOTER.unpack(footer)
+        elif len(footer) == RTC_FOOTER_OLD.size:
+            values = RTC_FOOTER_OLD.unpack(footer)
+        else:
+            return
+        self.mbc.setClockState(values[0:5], values[5:10], time.time() - values[10])
+
+    def saveClock(self):
+        registers, latched = self.mbc.clockState()
+        with open(self.path, "r+b") as f:
+            f.seek(self.size)
+            f.write(RTC_FOOTER.pack(*registers, *latched, int(time.time())))
+
+    def requestFlush(self):
+        "Save soon, without holding up the caller"
+        self.wake.set()
+
+    def flushLoop(self):
+        while self.running:
+            self.wake.wait(FLUSH_INTERVAL)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        """
+        Write back the pages written since the last flush.
+        Marks are cleared before the pages are written and the controller
+        only marks a page once its write is done, so a write racing a
+        flush is either saved now or left marked for the next one.
+        """
+        dirty = self.mbc.dirty
+        pages = [page for page in range(len(dirty)) if dirty[page]]
+        for page in pages:
+            dirty[page] = 0
+        for start, end in runs(pages):
+            offset = (start << DIRTY_SHIFT) // mmap.PAGESIZE * mmap.PAGESIZE
+            size = min(len(self.map), end << DIRTY_SHIFT) - offset
+            self.map.flush(offset, size)
+        self.pages_written += len(pages)
+        if self.mbc.timer:
+            self.saveClock()
+
+    def close(self):
+        "Save what's left and hand the controller a copy of the RAM in memory"
+        self.running = False
+        self.wake.set()
+        self.thread.join()
+        self.flush()
+        self.mbc.on_ram_disable = None
+        if self.map is not None:
+            self.mbc.useRAM(bytearray(self.map))
+            self.map.close()
+
+def runs(pages):
+    """
+    (start, end) of each run of consecutive pages
+
+    >>> list(runs([0, 1, 2, 5, 7, 8]))
+    [(0, 3), (5, 6), (7, 9)]
+    """
+    start = None
+    for page in pages:
+        if start is None:
+            start = end = page
+        elif page != end:
+            yield start, end
+            start = end = page
+        end += 1
+    if start is not None:
+        yield start, end
+
+def savePath(rom_path):
+    return os.path.splitext(rom_path)[0] + ".sav"
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
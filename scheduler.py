@@ -0,0 +1,57 @@
+import heapq
+
+NEVER = float("inf")
+
+class Scheduler:
+    """
+    Keeps the global machine cycle counter and runs callbacks when it
+    reaches the cycle they were scheduled for.
+    Devices use this instead of being updated after every instruction.
+    """
+    def __init__(self):
+        self.cycles = 0 # machine cycles since power on
+        self.events = [] # heap of [cycle, order, callback]
+        self.order = 0 # keeps events scheduled for the same cycle in order
+        self.next_event = NEVER
+
+    def schedule(self, delay, callback):
+        "Run callback once delay more machine cycles have passed"
+        event = [self.cycles + delay, self.order, callback]
+        self.order += 1
+        heapq.heappush(self.events, event)
+        self.next_event = self.events[0][0]
+        return event
+
+    def cancel(self, event):
+        event[2] = None # dropped when it reaches the front of the heap
+
+    def advance(self, cycles):
+        self.cycles += cycles
+        if self.cycles >= self.next_event:
+            self.runEvents()
+
+    def runEvents(self):
+        events = self.events
+        while events and events[0][0] <= self.cycles:
+            event = heapq.heappop(events)
+            callback = event[2]
+            if callback is not None:
+                event[2] = None
+                callback()
+        self.next_event = events[0][0] if events else NEVER
+
+    def loadState(self, source, devices):
+        """
+        Copy the pending events of another scheduler.
+        devices maps each device of the source machine to the matching
+        device of this one, callbacks are rebound to them.
+        """
+        self.cycles = source.cycles
+        self.order = source.order
+        self.events = []
+        for cycle, order, callback in source.events:
+            if callback is not None:
+                callback = getattr(devices[id(callback.__self__)], callback.__name__)
+                self.events.append([cycle, order, callback])
+        heapq.heapify(self.events)
+        self.next_event = self.events[0][0] if self.events else NEVER
@@ -1,21 +1,138 @@
+from array import array
+
+FRAME_CYCLES = 17556 # machine cycles per LCD frame, samples are rendered a frame at a time
+LENGTH_CYCLES = 4096 # machine cycles per length counter tick (256 Hz)
+
+# Bits that always read back as 1, for FF10-FF2F
+READ_MASKS = bytes([
+    0x80, 0x3F, 0x00, 0xFF, 0xBF, # NR10-NR14
+    0xFF, 0x3F, 0x00, 0xFF, 0xBF, # NR20-NR24
+    0x7F, 0xFF, 0x9F, 0xFF, 0xBF, # NR30-NR34
+    0xFF, 0xFF, 0x00, 0x00, 0xBF, # NR40-NR44
+    0x00, 0x00, 0x70, # NR50-NR52
+    0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF,
+])
+
+NR52 = 0x26
+TRIGGERS = {0x14: 0, 0x19: 1, 0x1E: 2, 0x23: 3} # NRx4 register -> channel
+LENGTHS = {0x11: (0, 0x3F), 0x16: (1, 0x3F), 0x1B: (2, 0xFF), 0x20: (3, 0x3F)} # NRx1 -> channel, length mask
+VOLUMES = {0x12: 0, 0x17: 1, 0x21: 3} # NRx2 -> channel
+
 class Sound:
-    def __init__(self):
-        self.enable       = False
-        self.enable_chan4 = False
-        self.enable_chan3 = False
-        self.enable_chan2 = False
-        self.enable_chan1 = False
+    """
+    Sound registers FF10-FF3F.
+    Register values and the NR52 channel status are kept here, making
+    samples is left to synth.Synthesizer. It is only imported, along with
+    NumPy, once a sink wants samples. From then on register writes are
+    logged with their cycle and turned into samples a frame at a time.
+    """
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.registers = bytearray(0x30) # FF10-FF3F
+        self.registers[NR52 - 0x10] = 0x80 # powered on by the boot ROM
+        self.status = bytearray(4) # channels playing, as far as triggers and DACs go
+        self.length_ends = array("q", bytes(8 * 4)) # cycle each channel's length runs out, 0 for never
+
+        self.sinks = []
+        self.synth = None
+        self.events = None # (cycle, register, value) written since the last frame rendered
+        self.flush_event = None
+        self.rendered = 0 # cycle the samples made so far reach
+
+    def reader(self, register):
+        "IO read handler for FFxx"
+        if register == NR52:
+            return self.readNR52
+        index = register - 0x10
+        mask = READ_MASKS[index] if index < len(READ_MASKS) else 0
+        registers = self.registers
+        return lambda: registers[index] | mask
+
+    def writer(self, register):
+        "IO write handler for FFxx"
+        return lambda value: self.write(register, value)
 
     def readNR52(self):
-        value = int(self.enable) << 7
-        value = int(self.enable_chan4) << 3
-        value = int(self.enable_chan3) << 2
-        value = int(self.enable_chan2) << 1
-        value = int(self.enable_chan1)
-
-    def writeNR52(self, value):
-        self.enable = bool(value & 0b10000000)
-        # individual channels are not modified.
-
-    def dummy(self, foo=0):
-        return 0
+        value = self.registers[NR52 - 0x10] & 0x80 | 0x70
+        now = self.scheduler.cycles
+        for channel in range(4):
+            end = self.length_ends[channel]
+            if self.status[channel] and (end == 0 or now < end):
+                value |= 1 << channel
+        return value
+
+    def write(self, register, value):
+        registers = self.registers
+        powered = registers[NR52 - 0x10] & 0x80
+        if not powered and register < NR52:
+            return # ignored while the APU is off
+
+        if register == NR52:
+            registers[NR52 - 0x10] = value & 0x80
+            if not value & 0x80:
+                registers[:NR52 - 0x10] = bytes(NR52 - 0x10)
+                self.status[:] = bytes(4)
+        else:
+            registers[register - 0x10] = value
+            if register in TRIGGERS:
+                channel = TRIGGERS[register]
+                if value & 0x80:
+                    self.status[channel] = self.dacOn(channel)
+                self.updateLength(channel)
+            elif register in LENGTHS:
+                self.updateLength(LENGTHS[register][0])
+            elif register in VOLUMES or register == 0x1A:
+                channel = 2 if register == 0x1A else VOLUMES[register]
+                if not self.dacOn(channel):
+                    self.status[channel] = 0
+
+        if self.events is not None:
+            self.events.append((self.scheduler.cycles, register, value))
+
+    def dacOn(self, channel):
+        if channel == 2:
+            return self.registers[0x0A] >> 7
+        return int(self.registers[0x02 + 5 * channel] & 0xF8 != 0)
+
+    def updateLength(self, channel):
+        "Work out when the channel stops, roughly, as the frame sequencer phase is ignored"
+        registers = self.registers
+        if registers[0x04 + 5 * channel] & 0x40:
+            mask = 0xFF if channel == 2 else 0x3F
+            remaining = (mask + 1) - (registers[0x01 + 5 * channel] & mask)
+            self.length_ends[channel] = self.scheduler.cycles + remaining * LENGTH_CYCLES
+        else:
+            self.length_ends[channel] = 0
+
+    def addSink(self, sink):
+        """
+        Send samples to sink.write() once per frame, as an int16 NumPy
+        array of (left, right) rows at synth.SAMPLE_RATE.
+        """
+        if self.synth is None:
+            import synth
+            self.synth = synth.Synthesizer(self.registers)
+            self.events = []
+            self.rendered = self.scheduler.cycles
+            self.flush_event = self.scheduler.schedule(FRAME_CYCLES, self.flush)
+        self.sinks.append(sink)
+
+    def removeSink(self, sink):
+        self.sinks.remove(sink)
+        if not self.sinks:
+            self.synth = None
+            self.events = None
+            self.scheduler.cancel(self.flush_event)
+            self.flush_event = None
+
+    def flush(self):
+        "Render the samples since the last frame and hand them to the sinks"
+        if self.synth is None:
+            return
+        now = self.scheduler.cycles
+        samples = self.synth.render(self.events, self.rendered, now)
+        self.events = []
+        self.rendered = now
+        for sink in self.sinks:
+            sink.write(samples)
+        self.flush_event = self.scheduler.schedule(FRAME_CYCLES, self.flush)
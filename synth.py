@@ -0,0 +1,275 @@
+import numpy as np
+
+SAMPLE_RATE = 65536 # one sample every 16 machine cycles
+CYCLES_PER_SAMPLE = 16 # machine cycles
+T_PER_SAMPLE = 4 * CYCLES_PER_SAMPLE # channel timers count clock cycles, 4 to a machine cycle
+SEQUENCER_CYCLES = 2048 # machine cycles per frame sequencer step (512 Hz)
+SCALE = 64 # 4 channels of +-15 at master volume 8 stay inside int16
+
+DUTY = np.array([
+    [0, 0, 0, 0, 0, 0, 0, 1], # 12.5%
+    [1, 0, 0, 0, 0, 0, 0, 1], # 25%
+    [1, 0, 0, 0, 0, 1, 1, 1], # 50%
+    [0, 1, 1, 1, 1, 1, 1, 0], # 75%
+], dtype=np.int32)
+
+def lfsrTable(narrow):
+    "The noise channel's output for each step of its shift register from power on"
+    lfsr = 0x7FFF
+    bits = []
+    while True:
+        x = (lfsr ^ (lfsr >> 1)) & 1
+        lfsr = (lfsr >> 1) | (x << 14)
+        if narrow:
+            lfsr = (lfsr & ~0x40) | (x << 6)
+        bits.append(~lfsr & 1)
+        if lfsr == 0x7FFF or (narrow and lfsr & 0x7F == 0x7F):
+            return np.array(bits, dtype=np.int32)
+
+NOISE = [lfsrTable(False), lfsrTable(True)]
+
+class Channel:
+    """
+    State of one channel between register writes and sequencer steps.
+    The waveform position is base steps at clock cycle origin, advancing every period clock cycles.
+    """
+    def __init__(self, number):
+        self.number = number
+        self.on = False
+        self.dac = False
+        self.volume = 0
+        self.envelope_timer = 0
+        self.length = 0
+        self.period = 1
+        self.origin = 0
+        self.base = 0
+
+    def rebase(self, time):
+        "Fold the steps taken up to time into base, before the period changes"
+        elapsed = time - self.origin
+        self.base += elapsed // self.period
+        self.origin = time - elapsed % self.period
+
+    def steps(self, times):
+        return self.base + (times - self.origin) // self.period
+
+class Synthesizer:
+    """
+    Turns a log of sound register writes into samples.
+    Between two writes or frame sequencer steps nothing changes but the
+    waveform positions, so each such segment is generated for all its
+    samples at once with NumPy, from the duty, wave and noise tables.
+    Envelopes, sweep and length counters are only applied at the segment boundaries.
+    """
+    def __init__(self, registers):
+        self.registers = bytearray(registers)
+        self.channels = [Channel(number) for number in range(4)]
+        for channel in self.channels:
+            if channel.number == 2:
+                channel.dac = bool(registers[0x0A] & 0x80)
+            else:
+                channel.dac = registers[0x02 + 5 * channel.number] & 0xF8 != 0
+        self.wave = np.zeros(32, dtype=np.int32)
+        for index in range(16):
+            self.writeWave(index, registers[0x20 + index])
+        self.sweep_timer = 0
+        self.sweep_enabled = False
+        self.shadow = 0
+
+    def render(self, events, start, end):
+        "Samples for machine cycles start to end as an int16 array of (left, right) rows"
+        first = -(-start // CYCLES_PER_SAMPLE)
+        count = -(-end // CYCLES_PER_SAMPLE) - first
+        left = np.zeros(count, dtype=np.int32)
+        right = np.zeros(count, dtype=np.int32)
+
+        time = start
+        index = 0
+        step = (start // SEQUENCER_CYCLES + 1) * SEQUENCER_CYCLES
+        while True:
+            boundary = min(end, step)
+            if index < len(events):
+                boundary = min(boundary, events[index][0])
+            if boundary > time:
+                self.segment(time, boundary, first, left, right)
+                time = boundary
+
+            if index < len(events) and events[index][0] <= time:
+                cycle, register, value = events[index]
+                self.write(register, value, time)
+                index += 1
+            elif step <= time:
+                self.sequencerStep((step // SEQUENCER_CYCLES) % 8, time)
+                step += SEQUENCER_CYCLES
+            elif time >= end:
+                break
+
+        registers = self.registers
+        left *= ((registers[0x14] >> 4) & 7) + 1
+        right *= (registers[0x14] & 7) + 1
+        samples = np.empty((count, 2), dtype=np.int16)
+        samples[:, 0] = left * SCALE
+        samples[:, 1] = right * SCALE
+        return samples
+
+    def segment(self, start, end, first, left, right):
+        "Add the samples between machine cycles start and end"
+        begin = -(-start // CYCLES_PER_SAMPLE)
+        stop = -(-end // CYCLES_PER_SAMPLE)
+        if stop <= begin:
+            return
+        times = np.arange(begin, stop, dtype=np.int64) * T_PER_SAMPLE
+        panning = self.registers[0x15]
+        for channel in self.channels:
+            if not channel.on or not channel.dac:
+                continue
+            number = channel.number
+            if number < 2:
+                if not channel.volume:
+                    continue
+                duty = DUTY[self.registers[0x01 + 5 * number] >> 6]
+                output = duty[channel.steps(times) & 7] * (2 * channel.volume) - channel.volume
+            elif number == 2:
+                shift = (0, 0, 1, 2)[(self.registers[0x0C] >> 5) & 3]
+                if not self.registers[0x0C] & 0x60:
+                    continue
+                output = (self.wave[channel.steps(times) & 31] >> shift) * 2 - (15 >> shift)
+            else:
+                if not channel.volume or (self.registers[0x12] >> 4) >= 14:
+                    continue
+                noise = NOISE[(self.registers[0x12] >> 3) & 1]
+                output = noise[channel.steps(times) % len(noise)] * (2 * channel.volume) - channel.volume
+
+            if panning & (0x10 << number):
+                left[begin - first:stop - first] += output
+            if panning & (0x01 << number):
+                right[begin - first:stop - first] += output
+
+    def write(self, register, value, cycle):
+        time = 4 * cycle
+        registers = self.registers
+        if register == 0x26:
+            registers[0x16] = value & 0x80
+            if not value & 0x80:
+                registers[:0x16] = bytes(0x16)
+                for channel in self.channels:
+                    channel.on = False
+            return
+        if not registers[0x16] & 0x80 and register < 0x26:
+            return
+        registers[register - 0x10] = value
+
+        if register >= 0x30:
+            self.writeWave(register - 0x30, value)
+        elif register == 0x1A:
+            self.channels[2].dac = bool(value & 0x80)
+        elif register in (0x12, 0x17, 0x21):
+            channel = self.channels[(0x12, 0x17, 0x1A, 0x21).index(register)]
+            channel.dac = value & 0xF8 != 0
+        elif register in (0x11, 0x16, 0x1B, 0x20):
+            number = (0x11, 0x16, 0x1B, 0x20).index(register)
+            mask = 0xFF if number == 2 else 0x3F
+            self.channels[number].length = (mask + 1) - (value & mask)
+        elif register in (0x13, 0x18, 0x1D, 0x14, 0x19, 0x1E):
+            number = (0x13, 0x18, 0x1D, 0x14, 0x19, 0x1E).index(register) % 3
+            channel = self.channels[number]
+            channel.rebase(time)
+            channel.period = self.period(number)
+            if register in (0x14, 0x19, 0x1E) and value & 0x80:
+                self.trigger(channel, time)
+        elif register == 0x22:
+            channel = self.channels[3]
+            channel.rebase(time)
+            channel.period = self.period(3)
+        elif register == 0x23 and value & 0x80:
+            self.trigger(self.channels[3], time)
+
+        for channel in self.channels:
+            if not channel.dac:
+                channel.on = False
+
+    def writeWave(self, index, value):
+        self.wave[2 * index] = value >> 4
+        self.wave[2 * index + 1] = value & 0x0F
+
+    def frequency(self, number):
+        registers = self.registers
+        return registers[0x03 + 5 * number] | ((registers[0x04 + 5 * number] & 7) << 8)
+
+    def period(self, number):
+        "Clock cycles per waveform step"
+        if number < 2:
+            return (2048 - self.frequency(number)) * 4
+        if number == 2:
+            return (2048 - self.frequency(2)) * 2
+        nr43 = self.registers[0x12]
+        divisor = 8 if nr43 & 7 == 0 else (nr43 & 7) * 16
+        return divisor << (nr43 >> 4)
+
+    def trigger(self, channel, time):
+        number = channel.number
+        channel.on = channel.dac
+        if channel.length == 0:
+            channel.length = 256 if number == 2 else 64
+        channel.origin = time
+        channel.base = 0
+        channel.period = self.period(number)
+        if number != 2:
+            envelope = self.registers[0x02 + 5 * number]
+            channel.volume = envelope >> 4
+            channel.envelope_timer = envelope & 7
+        if number == 0:
+            nr10 = self.registers[0x00]
+            self.shadow = self.frequency(0)
+            self.sweep_timer = (nr10 >> 4) & 7 or 8
+            self.sweep_enabled = bool(nr10 & 0x77)
+            if nr10 & 7:
+                self.sweepFrequency()
+
+    def sweepFrequency(self):
+        "The next swept frequency, switching channel 1 off when it overflows"
+        nr10 = self.registers[0x00]
+        change = self.shadow >> (nr10 & 7)
+        frequency = self.shadow - change if nr10 & 8 else self.shadow + change
+        if frequency > 2047:
+            self.channels[0].on = False
+        return frequency
+
+    def sequencerStep(self, step, cycle):
+        if step % 2 == 0:
+            for channel in self.channels:
+                if self.registers[0x04 + 5 * channel.number] & 0x40 and channel.length:
+                    channel.length -= 1
+                    if channel.length == 0:
+                        channel.on = False
+        if step in (2, 6):
+            self.sweep(4 * cycle)
+        if step == 7:
+            for channel in (self.channels[0], self.channels[1], self.channels[3]):
+                envelope = self.registers[0x02 + 5 * channel.number]
+                if envelope & 7 and channel.on:
+                    channel.envelope_timer -= 1
+                    if channel.envelope_timer <= 0:
+                        channel.envelope_timer = envelope & 7
+                        if envelope & 8 and channel.volume < 15:
+                            channel.volume += 1
+                        elif not envelope & 8 and channel.volume > 0:
+                            channel.volume -= 1
+
+    def sweep(self, time):
+        nr10 = self.registers[0x00]
+        self.sweep_timer -= 1
+        if self.sweep_timer > 0:
+            return
+        self.sweep_timer = (nr10 >> 4) & 7 or 8
+        if not self.sweep_enabled or not nr10 & 0x70:
+            return
+        frequency = self.sweepFrequency()
+        if frequency <= 2047 and nr10 & 7:
+            self.shadow = frequency
+            self.registers[0x03] = frequency & 0xFF
+            self.registers[0x04] = (self.registers[0x04] & 0xF8) | (frequency >> 8)
+            channel = self.channels[0]
+            channel.rebase(time)
+            channel.period = self.period(0)
+            self.sweepFrequency()
@@ -1,72 +1,110 @@
+PERIODS = [256, 4, 16, 64] # machine cycles per TIMA increment for each TAC clock select
+DIV_SHIFT = 6 # DIV is the divider counter over 64 machine cycles (16384 Hz)
+
 class Timer:
-    def __init__(self, interrupts):
+    """
+    DIV and TIMA aren't counted, they are worked out when read from the
+    cycle the divider was last reset at and the TIMA value last stored.
+    TIMA goes up on each falling edge of one bit of the divider, every
+    period cycles counted from div_base. An event is scheduled for the
+    next overflow, so nothing runs between register accesses otherwise.
+    """
+    def __init__(self, interrupts, scheduler):
         self.interrupts = interrupts
-        self.div          = 0 # FF04
-        self.sub_div      = 0
-        self.tima         = 0 # FF05
-        self.sub_tima     = 0
-        self.tma          = 0 # FF06
+        self.scheduler = scheduler
+        self.div_base = 0 # cycle the divider was last reset
+        self.tima = 0 # FF05, as of cycle tima_stamp
+        self.tima_stamp = 0
+        self.tma = 0 # FF06
+        self.tac = 0 # FF07 bits 2-0
+        self.running = False
+        self.period = PERIODS[0]
+        self.overflow_at = None # cycle the pending overflow event is for
+        self.overflow_event = None
+
+    def ticks(self, start, end):
+        "TIMA increments in the cycles after start up to and including end"
+        return (end - self.div_base) // self.period - (start - self.div_base) // self.period
+
+    def sync(self):
+        "Bring TIMA up to the current cycle, reloading it and raising the interrupt on overflow"
+        now = self.scheduler.cycles
+        if self.running:
+            self.increment(self.ticks(self.tima_stamp, now))
+        self.tima_stamp = now
 
-        # FF07 bits 2-0
-        self.timer_run   = False
-        self.clock_select = 0
+    def increment(self, count):
+        tima = self.tima + count
+        if tima > 0xFF:
+            self.interrupts.callTimer()
+            tima = self.tma + (tima - 0x100) % (0x100 - self.tma)
+        self.tima = tima
 
-        self.clock        = 0
+    def clockHigh(self):
+        "Whether the divider bit TIMA follows is set, a falling edge on it counts"
+        return self.running and (self.scheduler.cycles - self.div_base) % self.period >= self.period // 2
 
-    def update(self, cycles):
-        self.sub_div += cycles
-        if self.sub_div >= 256:
-            self.div = (self.div + 1) % 0x100
+    def reschedule(self):
+        "Make sure an event is waiting for the next overflow"
+        if not self.running:
+            self.overflow_at = None
+            return
+        now = self.scheduler.cycles
+        next_tick = self.div_base + ((now - self.div_base) // self.period + 1) * self.period
+        overflow_at = next_tick + (0xFF - self.tima) * self.period
+        if overflow_at != self.overflow_at:
+            if self.overflow_event is not None:
+                self.scheduler.cancel(self.overflow_event)
+            self.overflow_at = overflow_at
+            self.overflow_event = self.scheduler.schedule(overflow_at - now, self.overflow)
 
-        if self.timer_run:
-            self.sub_tima += cycles
-        else:
-            self.sub_tima = 0 # Assuming timer progress is lost when disabled
-        if self.sub_tima >= self.clock:
-            if self.tima == 0xFF:
-                self.tima = self.tma
-                self.interrupts.callTimer()
-            else:
-                self.tima += 1
+    def overflow(self):
+        self.overflow_event = None
+        if self.overflow_at is None or self.scheduler.cycles < self.overflow_at:
+            return # left over from before a register write moved the overflow
+        self.sync()
+        self.overflow_at = None
+        self.reschedule()
 
     # Divider Register
     def readDIV(self):
-        return self.div
+        return ((self.scheduler.cycles - self.div_base) >> DIV_SHIFT) & 0xFF
 
     def writeDIV(self, value):
-        self.div = 0
+        self.sync()
+        if self.clockHigh(): # resetting the divider drops the bit
+            self.increment(1)
+        self.div_base = self.scheduler.cycles
+        self.reschedule()
 
     # Timer Counter
     def readTIMA(self):
+        self.sync()
         return self.tima
 
     def writeTIMA(self, value):
+        self.sync()
         self.tima = value
+        self.reschedule()
 
     # Timer Modulo
     def readTMA(self):
         return self.tma
 
     def writeTMA(self, value):
+        self.sync()
         self.tma = value
 
     # Timer Controller
     def readTAC(self):
-        value = int(timer_run) << 2
-        value |= clock_select
-        return value
+        return self.tac | 0xF8
 
     def writeTAC(self, value):
-        self.timer_run = bool(value & 0b00000100)
-        self.clock_select =    value & 0b00000011
-        
-        if self.clock_select == 0:
-            self.clock = 1024
-        elif self.clock_select == 1:
-            self.clock = 16
-        elif self.clock_select == 2:
-            self.clock = 64
-        elif self.clock_select == 3:
-            self.clock = 256
-        else:
-            assert(False)
+        self.sync()
+        was_high = self.clockHigh()
+        self.tac = value & 0x07
+        self.running = bool(value & 0x04)
+        self.period = PERIODS[value & 0x03]
+        if was_high and not self.clockHigh():
+            self.increment(1)
+        self.reschedule()
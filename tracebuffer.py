@@ -0,0 +1,192 @@
+#!/bin/env python3
+
+import struct
+import sys
+from array import array
+
+import opinfo
+
+help = """
+Usage: tracebuffer decode trace_file [count]
+       tracebuffer diff trace_file other_trace_file
+
+decode: print the records of a trace, the last [count] only if given
+diff: find the first instruction where two traces of the same ROM differ
+"""
+
+DEFAULT_SIZE = 1 << 20 # records kept, the last million instructions
+WORDS = 3 # array items per record
+MAGIC = b"GTTR"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sBQ") # magic, version, records
+CONTEXT = 5 # records shown before a difference
+
+# A record is three 64 bit words:
+#   pc | bank << 16 | instruction bytes << 32
+#   AF | BC << 16 | DE << 32 | HL << 48
+#   machine cycles since power on | SP << 48
+# RECORD packs the same little endian bytes from the separate values in one call,
+# the cycles as 32 + 16 bits so nothing needs a shift past a machine word
+RECORD = struct.Struct("<HH3sxBBBBBBBBIHBB")
+
+class Trace:
+    """
+    Ring buffer of the last instructions run. attach() switches the
+    generated interpreter to cpu_traced.OPS, which packs a record in place
+    at the start of every instruction, and the classic interpreter calls
+    record(). Turning records into text is left to decode().
+    """
+    def __init__(self, size=DEFAULT_SIZE):
+        self.size = size
+        self.records = array("Q", bytes(8 * WORDS * size))
+        self.count = 0 # records written, the oldest is overwritten once this passes size
+        self.step = RECORD.size # bytes per record, for the generated code
+        self.pack = RECORD.pack_into
+        self.scheduler = None
+        self.read = None
+        self.attached = None
+
+    def attach(self, gameboy):
+        import cpu_traced # only tracing needs it
+        cpu = gameboy.cpu
+        self.scheduler = gameboy.scheduler
+        self.read = gameboy.mem.read # as it is now, a debugger's watches don't see trace reads
+        self.attached = (cpu, cpu.fast_ops)
+        cpu.trace = self
+        cpu.fast_ops = cpu_traced.OPS
+        cpu.fast = cpu.fast # switch tables if the generated interpreter is running
+
+    def detach(self):
+        cpu, fast_ops = self.attached
+        cpu.trace = None
+        cpu.fast_ops = fast_ops
+        cpu.fast = cpu.fast
+        self.attached = None
+
+    def record(self, cpu):
+        "Record the instruction cpu is about to run, what cpu_traced.py does in place"
+        pc = (cpu.pc.r1.value << 8) | cpu.pc.r2.value
+        mem = cpu.mem
+        if pc < 0x3FFE: # bank 0, the instruction bytes can be taken straight from the ROM
+            bank = 0
+            code = mem.rom[pc:pc + 3]
+        elif 0x4000 <= pc < 0x7FFE: # the switchable bank, straight from its view
+            mbc = mem.mbc
+            bank = mbc.rom_bank % mbc.rom_banks
+            code = bytes(mbc.rom_high[pc - 0x4000:pc - 0x3FFD])
+        else:
+            read = self.read
+            bank = 0
+            code = bytes((read(pc), read((pc + 1) & 0xFFFF), read((pc + 2) & 0xFFFF)))
+        cycles = self.scheduler.cycles + cpu.cycles
+        self.pack(self.records, self.count % self.size * self.step, pc, bank, code,
+            cpu.f.value, cpu.a.value, cpu.c.value, cpu.b.value, cpu.e.value, cpu.d.value, cpu.l.value, cpu.h.value,
+            cycles & 0xFFFFFFFF, cycles >> 32, cpu.sp.r2.value, cpu.sp.r1.value)
+        self.count += 1
+
+    def ordered(self):
+        "The kept records, oldest first"
+        kept = min(self.count, self.size) * WORDS
+        start = (self.count * WORDS) % (self.size * WORDS) if self.count > self.size else 0
+        return self.records[start:start + kept] + self.records[:max(0, start + kept - self.size * WORDS)]
+
+    def dump(self, path):
+        records = self.ordered()
+        with open(path, "wb") as f:
+            f.write(FILE_HEADER.pack(MAGIC, VERSION, len(records) // WORDS))
+            records.tofile(f)
+
+def load(path):
+    "The records of a dumped trace as an array"
+    with open(path, "rb") as f:
+        magic, version, count = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(path + " is not a trace")
+        records = array("Q")
+        records.fromfile(f, count * WORDS)
+    return records
+
+def iterate(path, chunk=1 << 16):
+    "Yield the decoded records of a dumped trace, reading chunk records at a time"
+    with open(path, "rb") as f:
+        magic, version, count = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(path + " is not a trace")
+        while count:
+            words = array("Q")
+            words.fromfile(f, min(chunk, count) * WORDS)
+            count -= len(words) // WORDS
+            for record in records(words):
+                yield record
+
+def decode(words):
+    """
+    A record as a dict
+
+    >>> record = decode([0x0150 | (0x0150C3 << 32), 0x014D00D8001301B0, 123 | (0xFFFE << 48)])
+    >>> record["pc"], record["af"], record["hl"], record["sp"], record["cycles"]
+    (336, 432, 333, 65534, 123)
+    >>> formatRecord(record)
+    '00:0150  AF:01B0 BC:0013 DE:00D8 HL:014D SP:FFFE CY:123         JP $0150'
+    """
+    first, registers, last = words
+    return {
+        "pc": first & 0xFFFF,
+        "bank": (first >> 16) & 0xFFFF,
+        "code": first >> 32,
+        "af": registers & 0xFFFF,
+        "bc": (registers >> 16) & 0xFFFF,
+        "de": (registers >> 32) & 0xFFFF,
+        "hl": registers >> 48,
+        "sp": last >> 48,
+        "cycles": last & 0xFFFFFFFFFFFF,
+    }
+
+def formatRecord(record):
+    code = record["code"]
+    text, length = opinfo.disassemble(lambda address: (code >> (8 * (address - record["pc"]))) & 0xFF, record["pc"])
+    return "{:02X}:{:04X}  AF:{:04X} BC:{:04X} DE:{:04X} HL:{:04X} SP:{:04X} CY:{:<10}  {}".format(
+        record["bank"], record["pc"], record["af"], record["bc"], record["de"], record["hl"],
+        record["sp"], record["cycles"], text)
+
+def records(trace):
+    for index in range(0, len(trace), WORDS):
+        yield decode(trace[index:index + WORDS])
+
+def diff(trace, other):
+    """
+    Lines describing the first difference between two traces, matched up
+    from the first cycle count both contain. Empty if they agree.
+    """
+    mine = list(records(trace))
+    theirs = list(records(other))
+    cycles = {record["cycles"]: index for index, record in enumerate(theirs)}
+    start = next((index for index, record in enumerate(mine) if record["cycles"] in cycles), None)
+    if start is None:
+        return ["The traces have no cycle count in common"]
+
+    offset = cycles[mine[start]["cycles"]] - start
+    for index in range(start, min(len(mine), len(theirs) - offset)):
+        if mine[index] != theirs[index + offset]:
+            lines = ["  " + formatRecord(record) for record in mine[max(start, index - CONTEXT):index]]
+            lines.append("< " + formatRecord(mine[index]))
+            lines.append("> " + formatRecord(theirs[index + offset]))
+            return lines
+    return []
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ("decode", "diff"):
+        print(help)
+        return
+
+    trace = load(sys.argv[2])
+    if sys.argv[1] == "decode":
+        count = int(sys.argv[3]) if len(sys.argv) > 3 else len(trace) // WORDS
+        for record in records(trace[-count * WORDS:] if count else array("Q")):
+            print(formatRecord(record))
+    else:
+        lines = diff(trace, load(sys.argv[3]))
+        print("\n".join(lines) if lines else "No differences")
+
+if __name__ == "__main__":
+    main()
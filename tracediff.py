@@ -0,0 +1,137 @@
+#!/bin/env python3
+
+import collections
+import gzip
+import itertools
+import sys
+
+import tracebuffer
+
+help = """
+Usage: tracediff ours reference [--sync=PC] [--fields=A,F,...]
+
+Compares two instruction logs line by line and reports the first
+instruction where the CPU state differs.
+Either log can be a trace written by gametoy --trace or a text log with
+one "A:01 F:B0 B:00 C:13 D:00 E:D8 H:01 L:4D SP:FFFE PC:0100" line per
+instruction, as written by many other emulators. Text logs may be gzipped.
+[--sync=PC]: skip each log to the first instruction at PC (hex) before comparing
+[--fields=...]: only compare these fields, default all of A F B C D E H L SP PC
+"""
+
+FIELDS = ["A", "F", "B", "C", "D", "E", "H", "L", "SP", "PC"]
+CONTEXT = 8 # matching instructions shown before the first difference
+BUFFER_SIZE = 1 << 20
+
+def textStates(path):
+    "Yield a dict of field -> value for each line of a text log"
+    if path.endswith(".gz"):
+        f = gzip.open(path, "rt", errors="replace")
+    else:
+        f = open(path, buffering=BUFFER_SIZE, errors="replace")
+    with f:
+        for line in f:
+            state = {}
+            for token in line.split():
+                name, colon, value = token.partition(":")
+                if colon and name.upper() in FIELDS:
+                    try:
+                        state[name.upper()] = int(value, 16)
+                    except ValueError:
+                        pass
+            if "PC" in state:
+                yield state
+
+def traceStates(path):
+    "Yield a dict of field -> value for each record of one of our traces"
+    for record in tracebuffer.iterate(path):
+        af, bc, de, hl = record["af"], record["bc"], record["de"], record["hl"]
+        yield {
+            "A": af >> 8, "F": af & 0xFF, "B": bc >> 8, "C": bc & 0xFF,
+            "D": de >> 8, "E": de & 0xFF, "H": hl >> 8, "L": hl & 0xFF,
+            "SP": record["sp"], "PC": record["pc"],
+        }
+
+def states(path):
+    with open(path, "rb") as f:
+        binary = f.read(len(tracebuffer.MAGIC)) == tracebuffer.MAGIC
+    return traceStates(path) if binary else textStates(path)
+
+def syncTo(stream, pc):
+    "Drop states before the first one at pc"
+    for state in stream:
+        if state["PC"] == pc:
+            yield state
+            break
+    yield from stream
+
+def formatState(state, fields, different=()):
+    parts = []
+    for name in fields:
+        if name in state:
+            width = 4 if name in ("SP", "PC") else 2
+            mark = "*" if name in different else ""
+            parts.append("{}:{:0{}X}{}".format(name, state[name], width, mark))
+    return " ".join(parts)
+
+def compare(ours, reference, fields=FIELDS, context=CONTEXT):
+    """
+    Walk two streams of states in step.
+    Returns (index, recent matching states, our state, reference state) for the
+    first difference, a state is None if that stream ended first and both are
+    None if the streams agree to the end.
+    Only the last context states are kept, so any length of log takes constant memory.
+
+    >>> same = [{"A": 1, "PC": 0x100}, {"A": 2, "PC": 0x101}]
+    >>> compare(iter(same), iter(same))[0::2]
+    (2, None)
+    >>> index, recent, ours, theirs = compare(iter(same), iter([same[0], {"A": 3, "PC": 0x101}]))
+    >>> index, ours["A"], theirs["A"]
+    (1, 2, 3)
+    """
+    recent = collections.deque(maxlen=context)
+    index = -1
+    for index, (mine, theirs) in enumerate(itertools.zip_longest(ours, reference)):
+        if mine is None or theirs is None:
+            return index, list(recent), mine, theirs
+        for name in fields:
+            if name in mine and name in theirs and mine[name] != theirs[name]:
+                return index, list(recent), mine, theirs
+        recent.append(mine)
+    return index + 1, list(recent), None, None
+
+def report(result, fields=FIELDS):
+    index, recent, mine, theirs = result
+    if mine is None and theirs is None:
+        return ["No differences in {} instructions".format(index)]
+    if mine is None or theirs is None:
+        ended = "our log" if mine is None else "the reference log"
+        lines = ["The logs agree until {} ends after {} instructions".format(ended, index)]
+        lines.extend("  " + formatState(state, fields) for state in recent)
+        return lines
+
+    different = [name for name in fields if name in mine and name in theirs and mine[name] != theirs[name]]
+    lines = ["First difference at instruction {}: {}".format(index, ", ".join(different))]
+    lines.extend("  " + formatState(state, fields) for state in recent)
+    lines.append("< " + formatState(mine, fields, different))
+    lines.append("> " + formatState(theirs, fields, different))
+    return lines
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    options = dict(arg[2:].partition("=")[::2] for arg in sys.argv[1:] if arg.startswith("--"))
+    if len(args) != 2 or any(name not in ("sync", "fields") for name in options):
+        print(help)
+        return
+
+    fields = options["fields"].upper().split(",") if options.get("fields") else FIELDS
+    ours = states(args[0])
+    reference = states(args[1])
+    if options.get("sync"):
+        pc = int(options["sync"], 16)
+        ours = syncTo(ours, pc)
+        reference = syncTo(reference, pc)
+    print("\n".join(report(compare(ours, reference, fields), fields)))
+
+if __name__ == "__main__":
+    main()